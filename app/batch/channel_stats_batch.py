@@ -0,0 +1,89 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from sqlalchemy import text
+
+from app.batch.coordination import run_periodically
+from config.database.session import BatchSessionLocal
+from content.infrastructure.repository.channel_stats_sql import (
+    BASELINE_WINDOW_MINUTES,
+    DELETE_ORPHAN_CHANNEL_STATS_SQL,
+    REFRESH_CHANNEL_STATS_SQL,
+)
+from content.infrastructure.repository.video_metrics_sql import INTRADAY_RAW_HOURS
+
+
+def refresh_channel_stats(
+    baseline_videos: int = 20,
+    early_window_minutes: int = 60,
+    lookback_hours: int = INTRADAY_RAW_HOURS,
+) -> Dict[str, Any]:
+    """
+    channel_stats 를 video / video_metrics_intraday 로부터 다시 계산한다.
+    upsert 와 고아 행 삭제를 한 트랜잭션에서 처리하므로 조회 측은 갱신 전/후 중 하나만 본다.
+    """
+    with BatchSessionLocal() as db:
+        channels = db.execute(
+            text(REFRESH_CHANNEL_STATS_SQL),
+            {
+                "baseline_videos": baseline_videos,
+                "window_minutes": BASELINE_WINDOW_MINUTES,
+                "early_window_minutes": early_window_minutes,
+                "since": datetime.utcnow() - timedelta(hours=lookback_hours),
+            },
+        ).rowcount
+        removed = db.execute(text(DELETE_ORPHAN_CHANNEL_STATS_SQL)).rowcount
+        db.commit()
+    return {"channels": channels, "removed": removed}
+
+
+async def run_channel_stats_once() -> Dict[str, Any]:
+    """
+    채널 통계 롤업(channel_stats) 배치의 단일 실행 진입점.
+
+    설정 방식:
+    - CHANNEL_STATS_BASELINE_VIDEOS: 초기 조회 속도 베이스라인에 쓰는 채널별 최근 영상 수 (기본 20)
+    - CHANNEL_STATS_EARLY_WINDOW_MINUTES: 10분 구간의 끝이 게시 후 이 분 안인 영상만 초기 속도로 본다 (기본 60)
+    """
+    baseline_videos = int(os.getenv("CHANNEL_STATS_BASELINE_VIDEOS", "20"))
+    early_window_minutes = int(os.getenv("CHANNEL_STATS_EARLY_WINDOW_MINUTES", "60"))
+    return await asyncio.to_thread(
+        refresh_channel_stats,
+        baseline_videos,
+        early_window_minutes,
+    )
+
+
+async def start_channel_stats_scheduler():
+    """
+    채널 통계 롤업 스케줄러.
+
+    - ENABLE_CHANNEL_STATS_BATCH=true 인 경우에만 동작
+    - CHANNEL_STATS_INTERVAL_MINUTES (기본 60분) 주기로 실행
+    """
+    if os.getenv("ENABLE_CHANNEL_STATS_BATCH", "false").lower() != "true":
+        print("[CHANNEL-STATS] Scheduler disabled (ENABLE_CHANNEL_STATS_BATCH=false)")
+        return
+
+    interval_minutes = int(os.getenv("CHANNEL_STATS_INTERVAL_MINUTES", "60"))
+    print(f"[CHANNEL-STATS] Scheduler started | interval={interval_minutes}m")
+
+    async def _tick():
+        try:
+            result = await run_channel_stats_once()
+            print("[CHANNEL-STATS] run success:", result)
+        except Exception as exc:
+            print("[CHANNEL-STATS] run failed:", exc)
+
+    try:
+        await run_periodically("channel_stats", interval_minutes * 60, _tick)
+    except asyncio.CancelledError:
+        print("[CHANNEL-STATS] Scheduler stopped")
+        raise
+
+
+if __name__ == "__main__":
+    # 수동 실행: python -m app.batch.channel_stats_batch
+    print(asyncio.run(run_channel_stats_once()))
@@ -0,0 +1,107 @@
+import asyncio
+import os
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy import text
+
+from app.batch.coordination import run_periodically
+from config.database.session import BatchSessionLocal
+from content.infrastructure.repository.co_movement_sql import (
+    DELETE_STALE_CO_MOVEMENT_SQL,
+    UPSERT_CO_MOVEMENT_SQL,
+)
+
+
+def refresh_co_movement(
+    window_minutes: int = 360,
+    bucket_minutes: int = 30,
+    min_points: int = 4,
+    min_group_size: int = 3,
+) -> Dict[str, Any]:
+    """
+    video_co_movement 를 최근 intraday 표본으로 다시 계산한다.
+    표본을 모두 읽은 뒤(서버 측 커서가 닫힌 뒤) upsert 와 지난 행 삭제를 한 트랜잭션에서 처리한다.
+    """
+    # 스케줄러 프로세스가 이 배치를 켜지 않았을 때 numpy 를 불러오지 않도록 사용할 때 가져온다.
+    from content.application.usecase.co_movement_engine import CoMovementEngine
+
+    engine = CoMovementEngine(
+        window_minutes=window_minutes,
+        bucket_minutes=bucket_minutes,
+        min_points=min_points,
+        min_group_size=min_group_size,
+    )
+    computed_at = datetime.utcnow()
+    with BatchSessionLocal() as db:
+        rows, summary = engine.compute(db, now=computed_at)
+        written = 0
+        if rows:
+            written = db.execute(
+                text(UPSERT_CO_MOVEMENT_SQL),
+                {
+                    "video_ids": [r["video_id"] for r in rows],
+                    "platforms": [r["platform"] for r in rows],
+                    "scores": [r["score"] for r in rows],
+                    "group_counts": [r["group_count"] for r in rows],
+                    "top_groups": [r["top_group"] for r in rows],
+                    "top_group_scores": [r["top_group_score"] for r in rows],
+                    "computed_at": computed_at,
+                },
+            ).rowcount
+        removed = db.execute(text(DELETE_STALE_CO_MOVEMENT_SQL), {"computed_at": computed_at}).rowcount
+        db.commit()
+    summary.update({"written": written, "removed": removed})
+    return summary
+
+
+async def run_co_movement_once() -> Dict[str, Any]:
+    """
+    동시 상승 점수(video_co_movement) 배치의 단일 실행 진입점.
+
+    설정 방식:
+    - CO_MOVEMENT_WINDOW_MINUTES: 속도 벡터를 만드는 최근 구간 (기본 360분)
+    - CO_MOVEMENT_BUCKET_MINUTES: 속도 구간 간격. 수집 주기보다 짧으면 보간 값만 늘어난다 (기본 30분)
+    - CO_MOVEMENT_MIN_POINTS: 점수를 매길 최소 유효 구간 수 (기본 4)
+    - CO_MOVEMENT_MIN_GROUP_SIZE: 상관을 계산할 그룹의 최소 영상 수 (기본 3)
+    """
+    return await asyncio.to_thread(
+        refresh_co_movement,
+        int(os.getenv("CO_MOVEMENT_WINDOW_MINUTES", "360")),
+        int(os.getenv("CO_MOVEMENT_BUCKET_MINUTES", "30")),
+        int(os.getenv("CO_MOVEMENT_MIN_POINTS", "4")),
+        int(os.getenv("CO_MOVEMENT_MIN_GROUP_SIZE", "3")),
+    )
+
+
+async def start_co_movement_scheduler():
+    """
+    동시 상승 점수 스케줄러.
+
+    - ENABLE_CO_MOVEMENT_BATCH=true 인 경우에만 동작
+    - CO_MOVEMENT_INTERVAL_MINUTES (기본 30분) 주기로 실행
+    """
+    if os.getenv("ENABLE_CO_MOVEMENT_BATCH", "false").lower() != "true":
+        print("[CO-MOVEMENT] Scheduler disabled (ENABLE_CO_MOVEMENT_BATCH=false)")
+        return
+
+    interval_minutes = int(os.getenv("CO_MOVEMENT_INTERVAL_MINUTES", "30"))
+    print(f"[CO-MOVEMENT] Scheduler started | interval={interval_minutes}m")
+
+    async def _tick():
+        try:
+            result = await run_co_movement_once()
+            print("[CO-MOVEMENT] run success:", result)
+        except Exception as exc:
+            print("[CO-MOVEMENT] run failed:", exc)
+
+    try:
+        await run_periodically("co_movement", interval_minutes * 60, _tick)
+    except asyncio.CancelledError:
+        print("[CO-MOVEMENT] Scheduler stopped")
+        raise
+
+
+if __name__ == "__main__":
+    # 수동 실행: python -m app.batch.co_movement_batch
+    print(asyncio.run(run_co_movement_once()))
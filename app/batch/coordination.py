@@ -0,0 +1,154 @@
+"""
+배치 스케줄러 조정(리더 선출).
+
+uvicorn 워커나 서버 인스턴스가 여러 개면 각 프로세스의 스케줄러가 같은 배치를 동시에 돌린다. (YouTube 쿼터 중복 소모,
+같은 행을 두고 경쟁하는 upsert) BATCH_LEADER_ELECTION=true 면 배치마다 Redis 리스(lease)를 잡은 프로세스 하나만
+실행하고, 마지막 실행 시각을 Redis 에 남겨 주기마다 클러스터 전체에서 한 번만 돌게 한다.
+
+- 리스: SET batch:lease:{job} <token> NX PX <ttl>. 실행 중에는 ttl/3 마다 Lua 스크립트로 자기 토큰일 때만 연장하고,
+  끝나면 자기 토큰일 때만 지운다. 프로세스가 죽으면 ttl 이 지나 리스가 풀린다.
+- 마지막 실행: batch:last_run:{job} 에 실행을 시작한 시각(epoch 초)을 실행이 끝난 뒤 기록한다.
+  모든 프로세스는 BATCH_LEADER_POLL_SECONDS 마다 이 값을 보고, 주기가 지났으면 리스를 시도한다.
+- 누락 실행 보충: 실행하던 프로세스가 죽거나 배포로 스케줄러가 멈춰 주기를 넘기면, 다음 폴링에서 다른 프로세스가
+  곧바로 한 번 실행한다. 여러 주기를 놓쳤어도 배치는 "지금" 데이터를 처리하므로 한 번으로 합친다.
+- Redis 에 접근하지 못하면 그 회차는 건너뛴다. 모든 프로세스가 동시에 실행하는 것보다 한 회차 늦는 편이 안전하다.
+
+BATCH_LEADER_ELECTION=false(기본)면 기존처럼 프로세스마다 실행 후 interval 만큼 쉰다.
+"""
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+LEASE_KEY = "batch:lease:{job}"
+LAST_RUN_KEY = "batch:last_run:{job}"
+
+# 자기 토큰일 때만 리스를 연장/해제한다. 만료 후 다른 프로세스가 잡은 리스를 건드리지 않기 위함이다.
+RENEW_LEASE_LUA = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LEASE_LUA = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+def leader_election_enabled() -> bool:
+    return os.getenv("BATCH_LEADER_ELECTION", "false").lower() == "true"
+
+
+def _lease_seconds() -> float:
+    return max(float(os.getenv("BATCH_LEADER_LEASE_SECONDS", "60")), 3.0)
+
+
+def _poll_seconds() -> float:
+    return max(float(os.getenv("BATCH_LEADER_POLL_SECONDS", "15")), 1.0)
+
+
+class JobLease:
+    """
+    배치 하나의 Redis 리스. acquire 에 성공한 프로세스만 배치를 실행한다.
+    redis 클라이언트 호출은 동기이므로 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+    """
+
+    def __init__(self, job: str, client=None, lease_seconds: float | None = None):
+        if client is None:
+            # REDIS_* 설정이 없는 환경(배치 CLI 등)에서도 이 모듈을 가져올 수 있도록 사용할 때 불러온다.
+            from config.redis_config import get_redis
+
+            client = get_redis()
+        self.job = job
+        self.client = client
+        self.lease_ms = int((lease_seconds or _lease_seconds()) * 1000)
+        self.key = LEASE_KEY.format(job=job)
+        self.last_run_key = LAST_RUN_KEY.format(job=job)
+        self.token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        self._renew = client.register_script(RENEW_LEASE_LUA)
+        self._release = client.register_script(RELEASE_LEASE_LUA)
+
+    async def acquire(self) -> bool:
+        return bool(await asyncio.to_thread(self.client.set, self.key, self.token, nx=True, px=self.lease_ms))
+
+    async def renew(self) -> bool:
+        return bool(await asyncio.to_thread(self._renew, keys=[self.key], args=[self.token, self.lease_ms]))
+
+    async def release(self) -> None:
+        await asyncio.to_thread(self._release, keys=[self.key], args=[self.token])
+
+    async def last_run(self) -> float | None:
+        value = await asyncio.to_thread(self.client.get, self.last_run_key)
+        return float(value) if value is not None else None
+
+    async def record_run(self, started_at: float) -> None:
+        await asyncio.to_thread(self.client.set, self.last_run_key, repr(started_at))
+
+    async def keep_alive(self) -> None:
+        """실행이 끝날 때까지 리스를 연장한다. 연장에 실패하면(리스 유실) 경고만 남긴다."""
+        interval = self.lease_ms / 1000 / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.renew():
+                    print(f"[BATCH-LEADER] {self.job} lease lost while running")
+                    return
+            except Exception as exc:  # pylint: disable=broad-except
+                print(f"[BATCH-LEADER] {self.job} lease renew failed: {exc}")
+
+
+async def _run_logged(job: str, run: Callable[[], Awaitable[Any]]) -> None:
+    # 각 배치의 run 콜백이 자체 로그와 예외 처리를 하지만, 한 회차 실패가 스케줄러 루프를 멈추지 않도록 한 번 더 막는다.
+    try:
+        await run()
+    except Exception as exc:  # pylint: disable=broad-except
+        print(f"[BATCH-LEADER] {job} run failed: {exc}")
+
+
+async def run_periodically(job: str, interval_seconds: float, run: Callable[[], Awaitable[Any]]) -> None:
+    """
+    run 을 interval_seconds 주기로 실행한다. 리더 선출이 켜져 있으면 클러스터 전체에서 주기마다 한 번만 실행한다.
+    취소(CancelledError)는 호출한 스케줄러로 그대로 전파된다.
+    """
+    if not leader_election_enabled():
+        while True:
+            await _run_logged(job, run)
+            await asyncio.sleep(interval_seconds)
+
+    lease = JobLease(job)
+    poll_seconds = _poll_seconds()
+    print(f"[BATCH-LEADER] {job} coordinated | interval={interval_seconds:.0f}s poll={poll_seconds:.0f}s")
+    while True:
+        wait_seconds = poll_seconds
+        try:
+            last_run = await lease.last_run()
+            due_in = 0.0 if last_run is None else last_run + interval_seconds - time.time()
+            if due_in <= 0 and await lease.acquire():
+                try:
+                    # 리스를 잡기 직전에 다른 프로세스가 실행을 마쳤을 수 있으므로 다시 확인한다.
+                    last_run = await lease.last_run()
+                    if last_run is None or last_run + interval_seconds <= time.time():
+                        started_at = time.time()
+                        keep_alive = asyncio.create_task(lease.keep_alive())
+                        try:
+                            await _run_logged(job, run)
+                        finally:
+                            keep_alive.cancel()
+                        await lease.record_run(started_at)
+                        due_in = interval_seconds - (time.time() - started_at)
+                finally:
+                    await lease.release()
+            if due_in > 0:
+                wait_seconds = min(poll_seconds, due_in)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"[BATCH-LEADER] {job} coordination failed: {exc}")
+        await asyncio.sleep(max(wait_seconds, 0.1))
@@ -0,0 +1,137 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from sqlalchemy import text
+
+from app.batch.coordination import run_periodically
+from config.database.session import BatchSessionLocal
+from content.infrastructure.repository.batch_watermark import get_watermark, set_watermark
+from content.infrastructure.repository.keyword_cooccurrence_sql import (
+    INCREMENTAL_COOCCURRENCE_SQL,
+    REBUILD_COOCCURRENCE_SQL,
+)
+
+INCREMENTAL_JOB = "keyword_cooccurrence"
+REBUILD_JOB = "keyword_cooccurrence_rebuild"
+
+
+def _window_days() -> int | None:
+    value = os.getenv("KEYWORD_COOCCURRENCE_WINDOW_DAYS", "").strip()
+    return int(value) if value else None
+
+
+def _upper_bound(db) -> datetime:
+    """
+    이번 실행에서 처리할 created_at 상한.
+    아직 commit 되지 않은 트랜잭션의 posting 을 건너뛰지 않도록 현재 시각보다 약간 이전으로 잡는다.
+    """
+    safety_seconds = int(os.getenv("KEYWORD_COOCCURRENCE_SAFETY_SECONDS", "60"))
+    now = db.execute(text("SELECT CAST(NOW() AS TIMESTAMP)")).scalar()
+    return now - timedelta(seconds=safety_seconds)
+
+
+def rebuild_keyword_cooccurrence(window_days: int | None = None) -> Dict[str, Any]:
+    """
+    keyword_cooccurrence 를 처음부터 다시 만든다. 삭제된 태그와 윈도우를 벗어난 영상이 반영된다.
+    DELETE + INSERT 를 한 트랜잭션에서 처리하므로 조회 측은 교체 전/후 중 하나만 본다.
+    """
+    with BatchSessionLocal() as db:
+        until = _upper_bound(db)
+        db.execute(text("DELETE FROM keyword_cooccurrence"))
+        pairs = db.execute(
+            text(REBUILD_COOCCURRENCE_SQL),
+            {"until": until, "window_days": window_days},
+        ).rowcount
+        set_watermark(db, INCREMENTAL_JOB, until)
+        set_watermark(db, REBUILD_JOB, until)
+        db.commit()
+    return {"mode": "rebuild", "until": until.isoformat(), "pairs": pairs}
+
+
+def update_keyword_cooccurrence(window_days: int | None = None) -> Dict[str, Any]:
+    """
+    마지막 watermark 이후 추가된 video_tag posting 만 반영한다.
+    한 번도 실행되지 않았으면 전체 재계산으로 시작한다.
+    """
+    with BatchSessionLocal() as db:
+        since = get_watermark(db, INCREMENTAL_JOB)
+        if since is None:
+            db.rollback()
+            return rebuild_keyword_cooccurrence(window_days)
+
+        until = _upper_bound(db)
+        if until <= since:
+            return {"mode": "incremental", "since": since.isoformat(), "until": since.isoformat(), "pairs": 0}
+
+        pairs = db.execute(
+            text(INCREMENTAL_COOCCURRENCE_SQL),
+            {"since": since, "until": until, "window_days": window_days},
+        ).rowcount
+        set_watermark(db, INCREMENTAL_JOB, until)
+        db.commit()
+    return {"mode": "incremental", "since": since.isoformat(), "until": until.isoformat(), "pairs": pairs}
+
+
+async def run_keyword_cooccurrence_once(full: bool | None = None) -> Dict[str, Any]:
+    """
+    연관 키워드 행렬(keyword_cooccurrence) 갱신 배치의 단일 실행 진입점.
+
+    설정 방식:
+    - KEYWORD_COOCCURRENCE_WINDOW_DAYS: 최근 N일 게시 영상만 집계 (비우면 전체)
+    - KEYWORD_COOCCURRENCE_REBUILD_HOURS: 전체 재계산 주기 (기본 24시간)
+
+    동작:
+    - full=None 이면 마지막 전체 재계산 후 REBUILD_HOURS 가 지났을 때만 전체 재계산, 아니면 증분 갱신.
+    """
+    window_days = _window_days()
+    rebuild_hours = int(os.getenv("KEYWORD_COOCCURRENCE_REBUILD_HOURS", "24"))
+
+    def _run() -> Dict[str, Any]:
+        run_full = full
+        if run_full is None:
+            with BatchSessionLocal() as db:
+                last_rebuild = get_watermark(db, REBUILD_JOB)
+                now = db.execute(text("SELECT CAST(NOW() AS TIMESTAMP)")).scalar()
+            run_full = last_rebuild is None or now - last_rebuild >= timedelta(hours=rebuild_hours)
+        if run_full:
+            return rebuild_keyword_cooccurrence(window_days)
+        return update_keyword_cooccurrence(window_days)
+
+    return await asyncio.to_thread(_run)
+
+
+async def start_keyword_cooccurrence_scheduler():
+    """
+    연관 키워드 행렬 갱신 스케줄러.
+
+    - ENABLE_KEYWORD_COOCCURRENCE_BATCH=true 인 경우에만 동작
+    - KEYWORD_COOCCURRENCE_INTERVAL_MINUTES (기본 30분) 주기로 실행
+    """
+    if os.getenv("ENABLE_KEYWORD_COOCCURRENCE_BATCH", "false").lower() != "true":
+        print("[KEYWORD-COOCCURRENCE] Scheduler disabled (ENABLE_KEYWORD_COOCCURRENCE_BATCH=false)")
+        return
+
+    interval_minutes = int(os.getenv("KEYWORD_COOCCURRENCE_INTERVAL_MINUTES", "30"))
+    print(f"[KEYWORD-COOCCURRENCE] Scheduler started | interval={interval_minutes}m")
+
+    async def _tick():
+        try:
+            result = await run_keyword_cooccurrence_once()
+            print("[KEYWORD-COOCCURRENCE] run success:", result)
+        except Exception as exc:
+            print("[KEYWORD-COOCCURRENCE] run failed:", exc)
+
+    try:
+        await run_periodically("keyword_cooccurrence", interval_minutes * 60, _tick)
+    except asyncio.CancelledError:
+        print("[KEYWORD-COOCCURRENCE] Scheduler stopped")
+        raise
+
+
+if __name__ == "__main__":
+    # 수동 실행: python -m app.batch.keyword_cooccurrence_batch [--full]
+    import sys
+
+    print(asyncio.run(run_keyword_cooccurrence_once(full=True if "--full" in sys.argv else None)))
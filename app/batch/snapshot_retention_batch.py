@@ -0,0 +1,221 @@
+import asyncio
+import os
+import re
+from datetime import date, timedelta
+from typing import Any, Dict
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.batch.coordination import run_periodically
+from config.database.session import BatchSessionLocal
+from content.infrastructure.repository.video_metrics_sql import (
+    ROLLUP_TABLES,
+    SNAPSHOT_RETENTION_DAYS,
+    rollup_snapshots_sql,
+)
+
+PARENT_TABLE = "video_metrics_snapshot"
+DEFAULT_PARTITION = "video_metrics_snapshot_default"
+_PARTITION_NAME_RE = re.compile(r"^video_metrics_snapshot_p(\d{4})(\d{2})$")
+
+
+def _month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def _add_months(d: date, months: int) -> date:
+    month_index = d.year * 12 + (d.month - 1) + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _partition_name(month_start: date) -> str:
+    return f"{PARENT_TABLE}_p{month_start:%Y%m}"
+
+
+def list_snapshot_partitions(db: Session) -> dict[date, str]:
+    """
+    video_metrics_snapshot 에 붙어 있는 월 파티션을 {월 시작일: 파티션 이름} 으로 반환한다.
+    DEFAULT 파티션은 제외한다.
+    """
+    rows = db.execute(
+        text(
+            """
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = :parent
+            """
+        ),
+        {"parent": PARENT_TABLE},
+    ).scalars()
+
+    partitions: dict[date, str] = {}
+    for name in rows:
+        match = _PARTITION_NAME_RE.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return partitions
+
+
+def ensure_snapshot_partitions(db: Session, start: date, months_ahead: int = 2) -> list[str]:
+    """
+    start 가 속한 달부터 months_ahead 개월 뒤까지 월 파티션이 없으면 만든다.
+
+    해당 기간의 행이 이미 DEFAULT 파티션에 들어와 있으면 파티션 생성이 실패하므로,
+    같은 트랜잭션 안에서 그 행들을 잠시 옮겨 두었다가 새 파티션으로 다시 넣는다.
+    """
+    existing = list_snapshot_partitions(db)
+    created: list[str] = []
+
+    month = _month_start(start)
+    last = _add_months(month, months_ahead)
+    while month <= last:
+        if month not in existing:
+            name = _partition_name(month)
+            params = {"from_date": month, "to_date": _add_months(month, 1)}
+            db.execute(
+                text(
+                    f"""
+                    CREATE TEMP TABLE IF NOT EXISTS _vms_default_moved
+                    (LIKE {PARENT_TABLE} INCLUDING DEFAULTS) ON COMMIT DROP
+                    """
+                )
+            )
+            db.execute(
+                text(
+                    f"""
+                    WITH moved AS (
+                        DELETE FROM {DEFAULT_PARTITION}
+                        WHERE snapshot_date >= :from_date AND snapshot_date < :to_date
+                        RETURNING *
+                    )
+                    INSERT INTO _vms_default_moved SELECT * FROM moved
+                    """
+                ),
+                params,
+            )
+            db.execute(
+                text(
+                    f"""
+                    CREATE TABLE {name} PARTITION OF {PARENT_TABLE}
+                    FOR VALUES FROM ('{params["from_date"]:%Y-%m-%d}') TO ('{params["to_date"]:%Y-%m-%d}')
+                    """
+                )
+            )
+            db.execute(text(f"INSERT INTO {PARENT_TABLE} SELECT * FROM _vms_default_moved"))
+            db.execute(text("TRUNCATE _vms_default_moved"))
+            created.append(name)
+        month = _add_months(month, 1)
+
+    return created
+
+
+def rollup_and_drop_expired_partitions(db: Session, cutoff: date) -> Dict[str, Any]:
+    """
+    cutoff 이전 구간만 담고 있는 월 파티션을 주/월 롤업에 병합한 뒤 삭제한다.
+    cutoff 를 걸치는 파티션은 다음 실행까지 그대로 둔다.
+    DEFAULT 파티션에 남아 있는 cutoff 이전 행도 같은 방식으로 롤업 후 지운다.
+    """
+    dropped: list[str] = []
+    rolled_rows = 0
+
+    for month, name in sorted(list_snapshot_partitions(db).items()):
+        upper = _add_months(month, 1)
+        if upper > cutoff:
+            continue
+        params = {"from_date": month, "to_date": upper}
+        for granularity in ROLLUP_TABLES:
+            rolled_rows += db.execute(text(rollup_snapshots_sql(granularity, name)), params).rowcount or 0
+        db.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+
+    stale = db.execute(
+        text(f"SELECT MIN(snapshot_date) FROM {DEFAULT_PARTITION} WHERE snapshot_date < :cutoff"),
+        {"cutoff": cutoff},
+    ).scalar()
+    default_deleted = 0
+    if stale is not None:
+        params = {"from_date": stale, "to_date": cutoff}
+        for granularity in ROLLUP_TABLES:
+            rolled_rows += db.execute(
+                text(rollup_snapshots_sql(granularity, DEFAULT_PARTITION)), params
+            ).rowcount or 0
+        default_deleted = db.execute(
+            text(f"DELETE FROM {DEFAULT_PARTITION} WHERE snapshot_date < :cutoff"),
+            {"cutoff": cutoff},
+        ).rowcount
+
+    return {
+        "dropped_partitions": dropped,
+        "default_rows_deleted": default_deleted,
+        "rollup_rows": rolled_rows,
+    }
+
+
+async def run_snapshot_retention_once(
+    today: date | None = None,
+    retention_days: int | None = None,
+    months_ahead: int | None = None,
+) -> Dict[str, Any]:
+    """
+    video_metrics_snapshot 파티션 관리 배치의 단일 실행 진입점.
+
+    설정 방식:
+    - VIDEO_METRICS_RETENTION_DAYS: 일 단위 스냅샷 보관 기간 (기본 90일)
+    - SNAPSHOT_PARTITION_MONTHS_AHEAD: 미리 만들어 둘 미래 월 파티션 수 (기본 2)
+
+    동작:
+    1) 이번 달부터 months_ahead 개월 뒤까지의 월 파티션을 만든다.
+    2) 보관 기간이 지난 월 파티션을 주/월 롤업에 병합한 뒤 삭제한다.
+       롤업과 삭제는 한 트랜잭션으로 처리해 중간에 실패해도 이중 집계되지 않는다.
+    """
+    today = today or date.today()
+    retention_days = retention_days if retention_days is not None else SNAPSHOT_RETENTION_DAYS
+    if months_ahead is None:
+        months_ahead = int(os.getenv("SNAPSHOT_PARTITION_MONTHS_AHEAD", "2"))
+    cutoff = today - timedelta(days=retention_days)
+
+    def _run() -> Dict[str, Any]:
+        with BatchSessionLocal() as db:
+            created = ensure_snapshot_partitions(db, today, months_ahead=months_ahead)
+            db.commit()
+            result = rollup_and_drop_expired_partitions(db, cutoff)
+            db.commit()
+        return {"cutoff": cutoff.isoformat(), "created_partitions": created, **result}
+
+    return await asyncio.to_thread(_run)
+
+
+async def start_snapshot_retention_scheduler():
+    """
+    스냅샷 파티션 관리 스케줄러.
+
+    - ENABLE_SNAPSHOT_RETENTION_BATCH=true 인 경우에만 동작
+    - SNAPSHOT_RETENTION_INTERVAL_HOURS (기본 24시간) 주기로 실행
+    """
+    if os.getenv("ENABLE_SNAPSHOT_RETENTION_BATCH", "false").lower() != "true":
+        print("[SNAPSHOT-RETENTION] Scheduler disabled (ENABLE_SNAPSHOT_RETENTION_BATCH=false)")
+        return
+
+    interval_hours = int(os.getenv("SNAPSHOT_RETENTION_INTERVAL_HOURS", "24"))
+    print(f"[SNAPSHOT-RETENTION] Scheduler started | interval={interval_hours}h")
+
+    async def _tick():
+        try:
+            result = await run_snapshot_retention_once()
+            print("[SNAPSHOT-RETENTION] run success:", result)
+        except Exception as exc:
+            print("[SNAPSHOT-RETENTION] run failed:", exc)
+
+    try:
+        await run_periodically("snapshot_retention", interval_hours * 3600, _tick)
+    except asyncio.CancelledError:
+        print("[SNAPSHOT-RETENTION] Scheduler stopped")
+        raise
+
+
+if __name__ == "__main__":
+    # 수동 실행: python -m app.batch.snapshot_retention_batch
+    print(asyncio.run(run_snapshot_retention_once()))
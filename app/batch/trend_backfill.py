@@ -0,0 +1,136 @@
+"""
+keyword_trend / category_trend 기간 재집계(backfill).
+
+집계식이 바뀌었을 때 지난 일자의 순위를 다시 만든다. as_of 일자마다 읽는 스냅샷과 쓰는 행(date = as_of)이
+겹치지 않으므로, 일자별 집계를 프로세스 풀에서 동시에 실행한다.
+- 워커 프로세스는 부모에게서 물려받은 커넥션 풀을 버리고(engine.dispose) 자기 커넥션을 새로 연다.
+- 동시에 열리는 DB 커넥션은 워커 수만큼이다. (TREND_BACKFILL_WORKERS, 기본 min(4, CPU 수))
+- 스냅샷은 오늘 일자에 대해서만 적재한다. video 테이블에는 현재 카운터만 있으므로 지난 일자 스냅샷을
+  다시 만들면 실제 이력을 현재 값으로 덮어쓰게 된다. 지난 일자는 쌓여 있는 스냅샷으로 집계만 다시 한다.
+
+수동 실행:
+    python -m app.batch.trend_backfill --from 2026-09-01 --to 2026-09-30 --workers 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Any, Dict
+
+from app.batch.trend_batch import aggregate_trends, snapshot_video_metrics, summarize_trend_result
+
+
+def _default_workers() -> int:
+    value = os.getenv("TREND_BACKFILL_WORKERS", "").strip()
+    if value:
+        return max(int(value), 1)
+    return min(4, os.cpu_count() or 1)
+
+
+def _init_worker() -> None:
+    """
+    fork 로 시작된 워커는 부모 프로세스의 커넥션 풀을 그대로 물려받는다.
+    같은 소켓을 두 프로세스가 쓰지 않도록 부모 커넥션은 닫지 않고 버린 뒤 새로 연다.
+    """
+    from config.database.session import batch_engine, engine, replica_engine
+
+    for target in {id(e): e for e in (engine, batch_engine, replica_engine)}.values():
+        target.dispose(close=False)
+
+
+def _backfill_day(as_of: date, window_days: int, platform: str | None) -> Dict[str, Any]:
+    started = time.monotonic()
+    # 집계식 변경을 반영하려는 재집계이므로 입력이 그대로여도 증분이 아닌 전체 집계로 하루치 순위를 통째로 교체한다.
+    result = aggregate_trends(
+        as_of=as_of, window_days=window_days, platform=platform, incremental=False, skip_unchanged=False
+    )
+    summary = summarize_trend_result(result)
+    summary["seconds"] = round(time.monotonic() - started, 2)
+    return summary
+
+
+def backfill_trends(
+    from_date: date,
+    to_date: date,
+    window_days: int = 7,
+    platform: str | None = None,
+    workers: int | None = None,
+    snapshot_today: bool = True,
+) -> Dict[str, Any]:
+    """
+    [from_date, to_date] 일자의 keyword_trend / category_trend 를 다시 집계한다.
+    실패한 일자는 건너뛰고 나머지를 계속 진행하며, 결과에 일자별 오류를 모아 반환한다.
+    """
+    if from_date > to_date:
+        raise ValueError("from_date 는 to_date 보다 늦을 수 없습니다.")
+
+    days = [from_date + timedelta(days=i) for i in range((to_date - from_date).days + 1)]
+    workers = max(min(workers or _default_workers(), len(days)), 1)
+    started = time.monotonic()
+
+    today = date.today()
+    if snapshot_today and today in days:
+        # 오늘 집계가 읽을 스냅샷을 워커를 띄우기 전에 한 번만 적재한다.
+        snapshot_video_metrics(as_of=today, platform=platform)
+
+    print(f"[TREND-BACKFILL] {len(days)} day(s) {from_date} ~ {to_date} | workers={workers}")
+    completed: list[Dict[str, Any]] = []
+    failed: list[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(_backfill_day, day, window_days, platform): day for day in days}
+        for future in as_completed(futures):
+            day = futures[future]
+            done = len(completed) + len(failed) + 1
+            try:
+                summary = future.result()
+            except Exception as exc:
+                failed.append({"as_of": day.isoformat(), "error": str(exc)})
+                print(f"[TREND-BACKFILL] {done}/{len(days)} {day} failed: {exc}")
+                continue
+            completed.append(summary)
+            print(
+                f"[TREND-BACKFILL] {done}/{len(days)} {day} "
+                f"keywords={summary['keyword_trend_count']} categories={summary['category_trend_count']} "
+                f"({summary['seconds']}s)"
+            )
+
+    completed.sort(key=lambda s: s["as_of"])
+    return {
+        "from_date": from_date.isoformat(),
+        "to_date": to_date.isoformat(),
+        "workers": workers,
+        "seconds": round(time.monotonic() - started, 2),
+        "completed": completed,
+        "failed": failed,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.batch.trend_backfill", description="트렌드 순위 기간 재집계")
+    parser.add_argument("--from", dest="from_date", type=date.fromisoformat, required=True)
+    parser.add_argument("--to", dest="to_date", type=date.fromisoformat, default=None, help="기본: 오늘")
+    parser.add_argument("--window-days", type=int, default=int(os.getenv("BATCH_TREND_WINDOW_DAYS", "7")))
+    parser.add_argument("--platform", default=None)
+    parser.add_argument("--workers", type=int, default=None, help="기본: TREND_BACKFILL_WORKERS 또는 min(4, CPU 수)")
+    parser.add_argument("--skip-snapshot", action="store_true", help="오늘 일자 스냅샷 적재 생략")
+    args = parser.parse_args(argv)
+
+    result = backfill_trends(
+        from_date=args.from_date,
+        to_date=args.to_date or date.today(),
+        window_days=args.window_days,
+        platform=args.platform,
+        workers=args.workers,
+        snapshot_today=not args.skip_snapshot,
+    )
+    print(
+        f"[TREND-BACKFILL] done in {result['seconds']}s | "
+        f"completed={len(result['completed'])} failed={len(result['failed'])}"
+    )
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,71 +1,213 @@
 import asyncio
 import os
-from datetime import date
+from datetime import date, timedelta
 
 from sqlalchemy import text
-from datetime import date
 
+from app.batch.coordination import run_periodically
 from content.application.usecase.trend_aggregation_usecase import TrendAggregationUseCase
 from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
-from config.database.session import SessionLocal
+from content.infrastructure.repository.batch_watermark import get_watermark, set_watermark
+from content.infrastructure.repository.video_metrics_sql import latest_metrics_join, upsert_snapshots_with_latest_sql
+from config.database.replica import current_wal_lsn
+from config.database.session import REPLICA_ENABLED, BatchSessionLocal, get_read_session_factory
+
+# watermark 는 DB 시계 기준 video.updated_at 과 비교한다. (이전의 crawled_at 기준 watermark 와 섞이지 않도록 이름을 따로 둔다)
+SNAPSHOT_WATERMARK_JOB = "video_metrics_snapshot_written"
+
+
+def _incremental_enabled() -> bool:
+    return os.getenv("TREND_AGGREGATION_INCREMENTAL", "true").lower() == "true"
+
+
+def aggregate_trends(
+    as_of: date,
+    window_days: int = 7,
+    platform: str | None = None,
+    incremental: bool | None = None,
+    read_session_factory=None,
+    skip_unchanged: bool = True,
+) -> dict:
+    """
+    as_of 일자의 keyword_trend / category_trend 를 집계해 저장한다. (스냅샷 적재 없음)
+    - incremental=None 이면 TREND_AGGREGATION_INCREMENTAL 설정을 따른다.
+    - skip_unchanged: 직전 실행 이후 집계 입력이 바뀌지 않았으면 건너뛴다. (TrendAggregationUseCase.aggregate)
+    """
+    if incremental is None:
+        incremental = _incremental_enabled()
+    with BatchSessionLocal() as db:
+        usecase = TrendAggregationUseCase(
+            ContentRepositoryImpl(db),
+            session_factory=BatchSessionLocal,
+            read_session_factory=read_session_factory,
+        )
+        return usecase.aggregate(
+            as_of=as_of,
+            window_days=window_days,
+            platform=platform,
+            incremental=incremental,
+            skip_unchanged=skip_unchanged,
+        )
+
+
+def summarize_trend_result(result: dict) -> dict:
+    """로그/진행 보고용으로 집계 결과에서 건수만 추린다."""
+    summary = {
+        "as_of": result.get("as_of"),
+        "mode": result.get("mode"),
+        "keyword_trend_count": result.get("keyword_trend_count"),
+        "category_trend_count": result.get("category_trend_count"),
+        "surging_keywords": len(result.get("surging_keywords") or []),
+        "surging_categories": len(result.get("surging_categories") or []),
+    }
+    snapshot = result.get("snapshot")
+    if snapshot:
+        summary["snapshot_mode"] = snapshot["mode"]
+        summary["snapshot_written"] = snapshot["written"]
+    return summary
+
+
+def run_trend_batch(as_of: date | None = None, window_days: int = 7, platform: str | None = None) -> dict:
+    """
+    스냅샷 적재 후 as_of 일자를 집계한다.
+    - TREND_AGGREGATION_INCREMENTAL (기본 true): 같은 기준 일자의 직전 실행 이후 바뀐 키워드/카테고리만 다시 집계
+    - 새로 수집된 영상도, 바뀐 집계 입력도 없으면 스냅샷 적재와 집계 모두 watermark 확인 쿼리만 하고 끝난다.
+    """
+    snapshot = snapshot_video_metrics(as_of=as_of or date.today(), platform=platform)
+    # 집계는 방금 적재한 스냅샷을 읽으므로, 복제본이 그 위치까지 따라잡은 경우에만 복제본에서 읽는다.
+    result = aggregate_trends(
+        as_of=as_of or date.today(),
+        window_days=window_days,
+        platform=platform,
+        read_session_factory=get_read_session_factory(after_lsn=snapshot["lsn"]),
+    )
+    result["snapshot"] = snapshot
+    return result
 
 
 async def run_trend_batch_once(as_of: date | None = None, window_days: int = 7, platform: str | None = None) -> dict:
     """
+    run_trend_batch 를 이벤트 루프 밖(스레드)에서 실행한다.
     """
-    snapshot_video_metrics(as_of=as_of or date.today(), platform=platform)
-    usecase = TrendAggregationUseCase(ContentRepositoryImpl())
-    return usecase.aggregate(as_of=as_of, window_days=window_days, platform=platform)
+    return await asyncio.to_thread(run_trend_batch, as_of, window_days, platform)
+
+
+def _snapshot_watermark_job(platform: str | None) -> str:
+    return f"{SNAPSHOT_WATERMARK_JOB}:{platform or 'all'}"
 
 
-def snapshot_video_metrics(as_of: date, platform: str | None = None) -> None:
+def _snapshot_lag_seconds() -> int:
+    # updated_at 은 적재 트랜잭션 안에서 찍히므로, 그보다 늦게 commit 된 행을 다음 실행이 놓치지 않도록 watermark 를 늦추는 여유.
+    return max(int(os.getenv("SNAPSHOT_WATERMARK_LAG_SECONDS", "600")), 0)
+
+
+def snapshot_video_metrics(as_of: date, platform: str | None = None, full: bool = False) -> dict:
     """
     영상 메트릭(조회/좋아요/댓글)을 일별 스냅샷 테이블에 적재해 속도 계산의 기준점을 만듭니다.
-    하루 1회 호출을 가정합니다.
+    - 직전 스냅샷(video_metrics_latest.curr_*)과 카운터가 다른 영상과 처음 보는 영상만 적재합니다.
+      값이 그대로인 영상은 행을 쓰지 않으며, 기준 시점 이전의 가장 최근 스냅샷이 곧 그 시점의 값입니다.
+    - 카운터는 재적재(upsert_videos) 때만 바뀌므로, 플랫폼별 watermark 이후 video.updated_at(DB 시계 기준 적재 시각)이
+      찍힌 영상만 비교합니다. 그런 영상이 없으면 적재 문장을 실행하지 않습니다. (mode="skipped")
+    - watermark 는 실행 시점의 DB 시각에서 SNAPSHOT_WATERMARK_LAG_SECONDS 를 뺀 값입니다. 그 이후에 찍힌 행은
+      이번에 비교했더라도 다음 실행이 다시 비교하므로(값이 같으면 쓰지 않음) 늦게 commit 된 행도 빠지지 않습니다.
+    - full=True 면 watermark 와 관계없이 전체 영상을 비교합니다. (upsert_videos 를 거치지 않고 카운터를 고친 경우)
+    복제본을 쓰는 경우 적재를 commit 한 시점의 WAL 위치(lsn)를 함께 반환합니다.
     """
-    with SessionLocal() as db:
-        db.execute(
+    job_name = _snapshot_watermark_job(platform)
+    with BatchSessionLocal() as db:
+        since = None if full else get_watermark(db, job_name)
+        now = db.execute(text("SELECT CAST(NOW() AS TIMESTAMP)")).scalar()
+        until = now - timedelta(seconds=_snapshot_lag_seconds())
+        if since is not None:
+            until = max(until, since)
+        result = {
+            "snapshot_date": str(as_of),
+            "since": since.isoformat() if since else None,
+            "until": until.isoformat(),
+            "written": 0,
+            "lsn": None,
+        }
+        if since is not None and not db.execute(
             text(
                 """
-                INSERT INTO video_metrics_snapshot (video_id, platform, snapshot_date, view_count, like_count, comment_count)
-                SELECT
-                    v.video_id,
-                    v.platform,
-                    :snapshot_date,
-                    v.view_count,
-                    v.like_count,
-                    v.comment_count
-                FROM video v
-                WHERE (:platform IS NULL OR v.platform = :platform)
-                ON CONFLICT (video_id, snapshot_date, platform)
-                DO UPDATE SET
-                    view_count = EXCLUDED.view_count,
-                    like_count = EXCLUDED.like_count,
-                    comment_count = EXCLUDED.comment_count
+                SELECT EXISTS (
+                    SELECT 1
+                    FROM video v
+                    WHERE (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
+                      AND v.updated_at > :since
+                )
                 """
             ),
-            {"snapshot_date": as_of, "platform": platform},
-        )
+            {"platform": platform, "since": since},
+        ).scalar():
+            return {**result, "mode": "skipped"}
+
+        # 스냅샷 적재와 video_metrics_latest(최신/직전 요약) 갱신을 한 문장에서 처리한다.
+        written = db.execute(
+            text(
+                upsert_snapshots_with_latest_sql(
+                    f"""
+                    SELECT
+                        v.video_id,
+                        v.platform,
+                        CAST(:snapshot_date AS DATE),
+                        v.view_count,
+                        v.like_count,
+                        v.comment_count
+                    FROM video v
+                    {latest_metrics_join("v")}
+                    WHERE (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
+                      AND (CAST(:since AS TIMESTAMP) IS NULL OR v.updated_at > :since)
+                      AND (ml.video_id IS NULL
+                           OR (v.view_count, v.like_count, v.comment_count)
+                              IS DISTINCT FROM (ml.curr_view_count, ml.curr_like_count, ml.curr_comment_count))
+                    """
+                )
+            ),
+            {"snapshot_date": as_of, "platform": platform, "since": since},
+        ).rowcount
+        set_watermark(db, job_name, until)
         db.commit()
+        return {
+            **result,
+            "mode": "full" if since is None else "changed",
+            "written": written,
+            "lsn": current_wal_lsn(db) if REPLICA_ENABLED else None,
+        }
 
 
 async def start_trend_scheduler():
     """
     - BATCH_TREND_INTERVAL_MINUTES (기본 60), BATCH_TREND_WINDOW_DAYS (기본 7) 사용.
     - BATCH_TREND_LOOKBACK_DAYS: 오늘을 anchor로 N일치 as_of를 역순 실행(예: 3이면 오늘, 어제, 그제)
+      오늘은 스냅샷 적재 후 집계하고, 지난 일자는 이미 쌓인 스냅샷으로 집계만 다시 한다.
+      (현재 카운터를 지난 일자 스냅샷으로 덮어쓰지 않기 위함)
     """
     if os.getenv("ENABLE_TREND_BATCH", "false").lower() != "true":
+        print("[TREND-BATCH] Scheduler disabled (ENABLE_TREND_BATCH=false)")
         return
 
     interval_minutes = int(os.getenv("BATCH_TREND_INTERVAL_MINUTES", "60"))
     window_days = int(os.getenv("BATCH_TREND_WINDOW_DAYS", "7"))
-    try:
-        while True:
+    lookback_days = max(int(os.getenv("BATCH_TREND_LOOKBACK_DAYS", "1")), 1)
+    print(f"[TREND-BATCH] Scheduler started | interval={interval_minutes}m window={window_days}d lookback={lookback_days}d")
+    async def _tick():
+        today = date.today()
+        try:
+            result = await run_trend_batch_once(as_of=today, window_days=window_days)
+            print("[TREND-BATCH] run success:", summarize_trend_result(result))
+        except Exception as exc:
+            print("[TREND-BATCH] failed:", exc)
+        for offset in range(1, lookback_days):
+            as_of = today - timedelta(days=offset)
             try:
-                print("[TREND-BATCH] run started")
+                result = await asyncio.to_thread(aggregate_trends, as_of, window_days)
+                print("[TREND-BATCH] lookback success:", summarize_trend_result(result))
             except Exception as exc:
-                print("[TREND-BATCH] failed:", exc)
-            await asyncio.sleep(interval_minutes * 60)
+                print(f"[TREND-BATCH] lookback {as_of} failed:", exc)
+
+    try:
+        await run_periodically("trend", interval_minutes * 60, _tick)
     except asyncio.CancelledError:
         print("[TREND-BATCH] scheduler stopped")
         raise
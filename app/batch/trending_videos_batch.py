@@ -4,9 +4,13 @@ import re
 from datetime import datetime
 from typing import Any, Dict, List
 
+from app.batch.coordination import run_periodically
 from content.application.usecase.ingestion_usecase import IngestionUseCase
+from content.application.usecase.surge_feature_usecase import SurgeFeatureUseCase
+from content.domain.video import Video
 from content.infrastructure.client.youtube_client import YouTubeClient
 from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+from config.database.session import BatchSessionLocal
 from config.settings import YouTubeSettings
 
 
@@ -19,8 +23,10 @@ async def run_trending_videos_batch_once() -> Dict[str, Any]:
     - 카테고리별 최신 인기 영상 조회
     - Shorts 영상과 일반 영상 구분하여 수집
     - 수집된 영상의 메타데이터와 메트릭 저장
+    - 최근 게시 영상의 조회수를 intraday 표본(video_metrics_intraday)으로 추가하고, 오래된 표본을 정리
+    - 수집한 영상의 급등 피처를 intraday 표본과 channel_stats 베이스라인으로 계산해 video_surge_feature 에 저장
     """
-    repository = ContentRepositoryImpl()
+    repository = ContentRepositoryImpl(BatchSessionLocal())
     client = YouTubeClient(YouTubeSettings())
     usecase = IngestionUseCase(repository, client)
     
@@ -31,14 +37,17 @@ async def run_trending_videos_batch_once() -> Dict[str, Any]:
         "regular_videos": 0,
         "total_videos": 0,
         "categories_processed": [],
+        "intraday_samples": 0,
+        "surge_features": 0,
         "start_time": datetime.now().isoformat(),
     }
     
     try:
         # 1. YouTube 인기 급상승 영상 수집 (최대 50개)
         print("[TRENDING-BATCH] Collecting trending videos...")
-        trending_videos = await _collect_trending_videos(repository, client)
+        trending_videos = await _collect_trending_videos(repository, client, summary)
         summary["trending_videos"] = len(trending_videos)
+        collected: List[Video] = list(trending_videos)
         
         # 2. 주요 카테고리별 인기 영상 수집
         categories = [
@@ -55,8 +64,9 @@ async def run_trending_videos_batch_once() -> Dict[str, Any]:
         print("[TRENDING-BATCH] Collecting category videos...")
         for category_id in categories:
             try:
-                category_videos = await _collect_category_videos(repository, client, category_id)
+                category_videos = await _collect_category_videos(repository, client, category_id, summary)
                 summary["category_videos"] += len(category_videos)
+                collected.extend(category_videos)
                 summary["categories_processed"].append({
                     "category_id": category_id,
                     "video_count": len(category_videos)
@@ -71,12 +81,26 @@ async def run_trending_videos_batch_once() -> Dict[str, Any]:
         
         # 3. Shorts vs 일반 영상 통계 집계
         all_video_ids = []
-        all_video_ids.extend(trending_videos)
+        all_video_ids.extend(video.video_id for video in trending_videos)
         
         shorts_count, regular_count = _count_shorts_vs_regular(repository, all_video_ids)
         summary["shorts_videos"] = shorts_count
         summary["regular_videos"] = regular_count
         summary["total_videos"] = summary["trending_videos"] + summary["category_videos"]
+
+        # 4. 수집한 영상의 급등 피처 계산/저장 (방금 추가한 표본까지 반영)
+        try:
+            summary["surge_features"] = _save_surge_features(repository, collected)
+        except Exception as e:
+            repository.db.rollback()
+            print(f"[TRENDING-BATCH] Error computing surge features: {e}")
+
+        # 5. 오래된 intraday 표본 정리 (48시간이 지난 구간은 시간당 하나로, 보관 기간이 지난 표본은 삭제)
+        try:
+            summary["intraday_compaction"] = repository.compact_view_samples()
+        except Exception as e:
+            repository.db.rollback()
+            print(f"[TRENDING-BATCH] Error compacting intraday samples: {e}")
         
         summary["end_time"] = datetime.now().isoformat()
         print(f"[TRENDING-BATCH] Completed successfully: {summary}")
@@ -90,49 +114,77 @@ async def run_trending_videos_batch_once() -> Dict[str, Any]:
     return summary
 
 
-async def _collect_trending_videos(repository: ContentRepositoryImpl, client: YouTubeClient) -> List[str]:
+async def _collect_trending_videos(
+    repository: ContentRepositoryImpl, client: YouTubeClient, summary: Dict[str, Any]
+) -> List[Video]:
     """
     YouTube 인기 급상승 영상을 수집합니다.
     """
     try:
         videos = list(client.fetch_trending_videos(max_results=50))
-        video_ids = []
         
         for video in videos:
             video.platform = client.platform
             # Shorts 여부 판단 (60초 이하는 Shorts로 간주)
-            video = _classify_shorts(video)
-            repository.upsert_video(video)
-            video_ids.append(video.video_id)
-            
-        return video_ids
+            _classify_shorts(video)
+
+        # 수집한 영상 전체를 한 번의 upsert로 적재
+        repository.upsert_videos(videos)
+        summary["intraday_samples"] += repository.append_view_samples(videos)
+        return videos
     except Exception as e:
         print(f"[TRENDING-BATCH] Error collecting trending videos: {e}")
         return []
 
 
-async def _collect_category_videos(repository: ContentRepositoryImpl, client: YouTubeClient, category_id: str) -> List[str]:
+async def _collect_category_videos(
+    repository: ContentRepositoryImpl, client: YouTubeClient, category_id: str, summary: Dict[str, Any]
+) -> List[Video]:
     """
     특정 카테고리의 인기 영상을 수집합니다.
     """
     try:
         videos = list(client.fetch_popular_videos_by_category(category_id, max_results=25))
-        video_ids = []
         
         for video in videos:
             video.platform = client.platform
             video.category_id = int(category_id)
             # Shorts 여부 판단
-            video = _classify_shorts(video)
-            repository.upsert_video(video)
-            video_ids.append(video.video_id)
-            
-        return video_ids
+            _classify_shorts(video)
+
+        repository.upsert_videos(videos)
+        summary["intraday_samples"] += repository.append_view_samples(videos)
+        return videos
     except Exception as e:
         print(f"[TRENDING-BATCH] Error collecting category {category_id} videos: {e}")
         return []
 
 
+def _save_surge_features(repository: ContentRepositoryImpl, videos: List[Video]) -> int:
+    """
+    수집한 영상의 급등 피처를 계산해 video_surge_feature 에 덮어씁니다.
+    단기 변화량은 intraday 표본, 베이스라인 배수는 channel_stats, co_movement_score 는 video_co_movement 에서 읽습니다.
+    """
+    targets = {video.video_id: video for video in videos if video.video_id}
+    if not targets:
+        return 0
+
+    features = SurgeFeatureUseCase(repository).compute_for_videos(
+        {"video_id": video.video_id, "channel_id": video.channel_id, "published_at": video.published_at}
+        for video in targets.values()
+    )
+    computed_at = datetime.utcnow()
+    return repository.upsert_surge_features(
+        {
+            "video_id": video_id,
+            "platform": targets[video_id].platform,
+            "computed_at": computed_at,
+            **feature.to_dict(),
+        }
+        for video_id, feature in features.items()
+    )
+
+
 def _classify_shorts(video) -> Any:
     """
     영상이 YouTube Shorts인지 판단하여 is_shorts 필드를 설정합니다.
@@ -190,9 +242,8 @@ def _count_shorts_vs_regular(repository: ContentRepositoryImpl, video_ids: List[
         
     try:
         from sqlalchemy import text
-        from config.database.session import SessionLocal
         
-        with SessionLocal() as db:
+        with BatchSessionLocal() as db:
             result = db.execute(
                 text("""
                     SELECT 
@@ -224,25 +275,17 @@ async def start_trending_videos_scheduler():
     interval_minutes = int(os.getenv("TRENDING_BATCH_INTERVAL_MINUTES", "30"))
     print(f"[TRENDING-BATCH] Scheduler started | interval={interval_minutes}m")
     
-    try:
-        # 시작 시 즉시 한 번 실행
+    async def _tick():
         try:
-            print("[TRENDING-BATCH] Initial run started")
+            print("[TRENDING-BATCH] run started")
             result = await run_trending_videos_batch_once()
-            print("[TRENDING-BATCH] Initial run success:", result)
+            print("[TRENDING-BATCH] run success:", result)
         except Exception as exc:
-            print("[TRENDING-BATCH] Initial run failed:", exc)
-        
-        # 주기적 실행
-        while True:
-            await asyncio.sleep(interval_minutes * 60)
-            try:
-                print("[TRENDING-BATCH] Periodic run started")
-                result = await run_trending_videos_batch_once()
-                print("[TRENDING-BATCH] Periodic run success:", result)
-            except Exception as exc:
-                print("[TRENDING-BATCH] Periodic run failed:", exc)
-                
+            print("[TRENDING-BATCH] run failed:", exc)
+
+    try:
+        # 시작하자마자 한 번 실행하고(리더 선출 시에는 클러스터의 마지막 실행 후 주기가 지났을 때) 이후 주기적으로 실행
+        await run_periodically("trending_videos", interval_minutes * 60, _tick)
     except asyncio.CancelledError:
         print("[TRENDING-BATCH] Scheduler stopped")
         raise
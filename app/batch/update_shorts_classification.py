@@ -1,6 +1,7 @@
 import re
 from sqlalchemy import text
-from config.database.session import SessionLocal
+from config.database.session import BatchSessionLocal
+from config.database.streaming import DB_STREAM_FETCH_SIZE, stream_chunks
 
 
 def parse_duration_to_seconds(duration: str) -> int:
@@ -25,61 +26,68 @@ def parse_duration_to_seconds(duration: str) -> int:
     return hours * 3600 + minutes * 60 + seconds
 
 
-def update_shorts_classification():
+UPDATE_IS_SHORTS_SQL = """
+    UPDATE video v
+    SET is_shorts = d.is_shorts
+    FROM unnest(CAST(:video_ids AS VARCHAR[]), CAST(:flags AS BOOLEAN[])) AS d(video_id, is_shorts)
+    WHERE v.video_id = d.video_id
+"""
+
+
+def update_shorts_classification(fetch_size: int | None = None) -> dict:
     """
-    기존 영상들의 is_shorts 정보를 duration 기반으로 업데이트합니다.
+    duration 이 있지만 is_shorts 가 NULL 인 YouTube 영상 전체의 is_shorts 를 duration 기반으로 업데이트합니다.
+    - 대상은 서버 측 커서로 fetch_size(기본 DB_STREAM_FETCH_SIZE) 건씩 읽고, chunk 마다 한 문장으로 갱신해 commit 합니다.
+      대상 수와 관계없이 메모리에는 chunk 하나만 올라옵니다.
+    - 읽기 세션에서 commit 하면 커서가 닫히므로 갱신은 별도 세션에서 합니다. 중간에 실패해도 commit 된 chunk 는 남고,
+      다시 실행하면 아직 NULL 인 영상부터 이어서 처리합니다.
     """
-    with SessionLocal() as db:
+    updated_shorts = 0
+    updated_regular = 0
+
+    with BatchSessionLocal() as reader, BatchSessionLocal() as writer:
         # duration이 있지만 is_shorts가 NULL인 영상들을 조회
-        videos = db.execute(
-            text("""
-                SELECT video_id, duration 
-                FROM video 
-                WHERE duration IS NOT NULL 
-                AND is_shorts IS NULL
-                AND platform = 'youtube'
-                LIMIT 1000
-            """)
-        ).mappings().all()
-        
-        print(f"Found {len(videos)} videos to update...")
-        
-        updated_shorts = 0
-        updated_regular = 0
-        
-        for video in videos:
-            video_id = video["video_id"]
-            duration = video["duration"]
-            
-            try:
-                # duration을 초 단위로 변환
-                seconds = parse_duration_to_seconds(duration)
-                
-                # 60초 이하면 Shorts로 분류
-                is_shorts = seconds <= 60 and seconds > 0
-                
-                # 데이터베이스 업데이트
-                db.execute(
-                    text("UPDATE video SET is_shorts = :is_shorts WHERE video_id = :video_id"),
-                    {"is_shorts": is_shorts, "video_id": video_id}
-                )
-                
-                if is_shorts:
-                    updated_shorts += 1
-                else:
-                    updated_regular += 1
-                    
-            except Exception as e:
-                print(f"Error processing video {video_id}: {e}")
+        chunks = stream_chunks(
+            reader,
+            """
+            SELECT video_id, duration
+            FROM video
+            WHERE duration IS NOT NULL
+              AND is_shorts IS NULL
+              AND platform = 'youtube'
+            """,
+            fetch_size=fetch_size or DB_STREAM_FETCH_SIZE,
+        )
+        for videos in chunks:
+            video_ids: list[str] = []
+            flags: list[bool] = []
+            for video in videos:
+                video_id = video["video_id"]
+                try:
+                    # duration을 초 단위로 변환, 60초 이하면 Shorts로 분류
+                    seconds = parse_duration_to_seconds(video["duration"])
+                    is_shorts = seconds <= 60 and seconds > 0
+                except Exception as e:
+                    print(f"Error processing video {video_id}: {e}")
+                    continue
+                video_ids.append(video_id)
+                flags.append(is_shorts)
+
+            if not video_ids:
                 continue
-        
-        # 변경사항 커밋
-        db.commit()
-        
-        print(f"Update completed!")
-        print(f"- Shorts: {updated_shorts}")
-        print(f"- Regular videos: {updated_regular}")
-        print(f"- Total updated: {updated_shorts + updated_regular}")
+            writer.execute(text(UPDATE_IS_SHORTS_SQL), {"video_ids": video_ids, "flags": flags})
+            writer.commit()
+
+            chunk_shorts = sum(flags)
+            updated_shorts += chunk_shorts
+            updated_regular += len(flags) - chunk_shorts
+            print(f"Updated {updated_shorts + updated_regular} videos so far...")
+
+    print(f"Update completed!")
+    print(f"- Shorts: {updated_shorts}")
+    print(f"- Regular videos: {updated_regular}")
+    print(f"- Total updated: {updated_shorts + updated_regular}")
+    return {"shorts": updated_shorts, "regular": updated_regular, "total": updated_shorts + updated_regular}
 
 
 if __name__ == "__main__":
@@ -4,7 +4,9 @@ from typing import Any, Dict
 
 from sqlalchemy import text
 
-from config.database.session import SessionLocal
+from app.batch.coordination import run_periodically
+from config.database.session import BatchSessionLocal
+from config.database.streaming import stream_rows
 from config.settings import YouTubeSettings
 from content.infrastructure.client.youtube_client import YouTubeClient
 from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
@@ -26,49 +28,46 @@ async def run_youtube_tag_batch_once() -> Dict[str, Any]:
     - Video.snippet.tags 는 IngestionUseCase 내부에서 keyword_mapping 까지 자동 반영된다.
     """
     # 1) category_trend 에 존재하는 모든 카테고리 목록을 조회 (날짜와 무관하게 중복 제거)
-    with SessionLocal() as db:
-        category_rows = db.execute(
-            text(
-                """
-                SELECT DISTINCT category
-                FROM category_trend
-                WHERE platform = :platform
-                  AND category IS NOT NULL
-                """
-            ),
+    # 2) video_sentiment / video 를 기준으로 각 카테고리에 속한 채널 목록을 조회
+    #    category_trend 에 없는 카테고리는 SQL 에서 걸러 내고, 결과는 서버 측 커서로 나눠 읽어
+    #    (category, channel_id) 쌍 전체를 한 번에 메모리에 올리지 않는다.
+    category_channels: Dict[str, list[str]] = {}
+    with BatchSessionLocal() as db:
+        for row in stream_rows(
+            db,
+            """
+            SELECT DISTINCT category
+            FROM category_trend
+            WHERE platform = :platform
+              AND category IS NOT NULL
+            """,
             {"platform": "youtube"},
-        ).mappings().all()
-
-        # 2) video_sentiment / video 를 기준으로 각 카테고리에 속한 채널 목록을 조회
-        channel_rows = db.execute(
-            text(
-                """
-                SELECT DISTINCT vs.category, v.channel_id
-                FROM video_sentiment vs
-                JOIN video v ON v.video_id = vs.video_id
-                WHERE vs.category IS NOT NULL
-                  AND v.channel_id IS NOT NULL
-                """
-            )
-        ).mappings().all()
-
-    # 카테고리별 채널 매핑 (채널이 없는 카테고리는 빈 리스트로 두고, 태그 집계만 수행)
-    category_channels: Dict[str, list[str]] = {row["category"]: [] for row in category_rows}
-    for row in channel_rows:
-        category = row["category"]
-        ch_id = row["channel_id"]
-        if category not in category_channels:
-            # category_trend 에 없는 카테고리는 스킵
-            continue
-        channels = category_channels.setdefault(category, [])
-        if ch_id not in channels:
-            channels.append(ch_id)
+        ):
+            # 채널이 없는 카테고리는 빈 리스트로 두고, 태그 집계만 수행
+            category_channels[row["category"]] = []
+
+        for row in stream_rows(
+            db,
+            """
+            SELECT DISTINCT vs.category, v.channel_id
+            FROM video_sentiment vs
+            JOIN video v ON v.video_id = vs.video_id
+            WHERE vs.category IS NOT NULL
+              AND v.channel_id IS NOT NULL
+              AND vs.category IN (
+                  SELECT category FROM category_trend WHERE platform = :platform AND category IS NOT NULL
+              )
+            """,
+            {"platform": "youtube"},
+        ):
+            # DISTINCT 로 (category, channel_id) 쌍이 한 번씩만 오므로 중복 확인 없이 붙인다.
+            category_channels.setdefault(row["category"], []).append(row["channel_id"])
 
     # 현재 배치에서는 댓글 수집은 사용하지 않지만, 향후 확장을 위해 환경변수를 유지한다.
     include_comments = os.getenv("YOUTUBE_TAG_INCLUDE_COMMENTS", "false").lower() == "true"
     max_videos = int(os.getenv("YOUTUBE_TAG_MAX_VIDEOS", "10"))
 
-    repository = ContentRepositoryImpl()
+    repository = ContentRepositoryImpl(BatchSessionLocal())
     client = YouTubeClient(YouTubeSettings())
 
     summary: Dict[str, Any] = {
@@ -125,47 +124,40 @@ def _ingest_channel_tags_only(
     sentiment / score / comments 등은 처리하지 않는다.
     """
     videos = list(client.fetch_videos(channel_id, max_results=max_videos))
-    ingested_videos: list[str] = []
 
     for video in videos:
         video.platform = client.platform
-        repository.upsert_video(video)
-        ingested_videos.append(video.video_id)
+    repository.upsert_videos(videos)
 
-    return ingested_videos
+    return [video.video_id for video in videos]
 
 
 def _insert_category_trend_tags(category: str) -> None:
     """
-    video 및 video_sentiment 테이블을 조인하여,
+    video_tag 역색인과 video_sentiment 테이블을 조인하여,
     특정 category 로 분류된 모든 영상의 태그를 모아 category_trend_tag(tags)에 삽입한다.
 
     - tags: 해당 카테고리의 영상들에서 수집한 고유 태그들의 콤마 구분 문자열
     - category: category_trend_tag.category 에 저장될 카테고리 식별자
     """
-    with SessionLocal() as db:
-        # Postgres 기준: video.tags (콤마 구분 문자열)를 분리해서 태그별 등장 횟수를 계산한 뒤,
-        # 가장 많이 등장한 상위 5개 태그만 콤마로 합쳐 저장한다.
+    with BatchSessionLocal() as db:
+        # video_tag 역색인에서 tag_id(정수) 기준으로 태그별 등장 횟수를 계산한 뒤,
+        # 가장 많이 등장한 상위 5개 태그만 이름으로 바꿔 콤마로 합쳐 저장한다.
         tags_row = db.execute(
             text(
                 """
-                WITH splitted AS (
-                    SELECT trim(tag) AS tag
-                    FROM video v
-                    JOIN video_sentiment vs ON vs.video_id = v.video_id
-                    CROSS JOIN LATERAL unnest(string_to_array(COALESCE(v.tags, ''), ',')) AS tag
+                WITH ranked AS (
+                    SELECT vt.tag_id, COUNT(*) AS cnt
+                    FROM video_sentiment vs
+                    JOIN video_tag vt ON vt.video_id = vs.video_id
                     WHERE vs.category = :category
-                      AND COALESCE(v.tags, '') <> ''
-                ),
-                ranked AS (
-                    SELECT tag, COUNT(*) AS cnt
-                    FROM splitted
-                    GROUP BY tag
+                    GROUP BY vt.tag_id
                     ORDER BY cnt DESC
                     LIMIT 5
                 )
-                SELECT string_agg(tag, ',' ORDER BY cnt DESC) AS tags
-                FROM ranked
+                SELECT string_agg(t.name, ',' ORDER BY r.cnt DESC) AS tags
+                FROM ranked r
+                JOIN tag t ON t.tag_id = r.tag_id
                 """
             ),
             {"category": category},
@@ -209,16 +201,17 @@ async def start_youtube_tag_scheduler():
     interval_minutes = int(os.getenv("YOUTUBE_TAG_BATCH_INTERVAL_MINUTES", "60"))
     print(f"[YOUTUBE-TAG-BATCH] scheduler started | interval={interval_minutes}m")
 
+    async def _tick():
+        try:
+            print("[YOUTUBE-TAG-BATCH] run started")
+            result = await run_youtube_tag_batch_once()
+            print("[YOUTUBE-TAG-BATCH] run success:", result)
+        except Exception as exc:  # pylint: disable=broad-except
+            # 배치 한 번 실패하더라도 다음 주기에는 재시도할 수 있도록 예외를 삼킨다.
+            print("[YOUTUBE-TAG-BATCH] run failed:", exc)
+
     try:
-        while True:
-            try:
-                print("[YOUTUBE-TAG-BATCH] run started")
-                result = await run_youtube_tag_batch_once()
-                print("[YOUTUBE-TAG-BATCH] run success:", result)
-            except Exception as exc:  # pylint: disable=broad-except
-                # 배치 한 번 실패하더라도 다음 주기에는 재시도할 수 있도록 예외를 삼킨다.
-                print("[YOUTUBE-TAG-BATCH] run failed:", exc)
-            await asyncio.sleep(interval_minutes * 60)
+        await run_periodically("youtube_tag", interval_minutes * 60, _tick)
     except asyncio.CancelledError:
         print("[YOUTUBE-TAG-BATCH] scheduler stopped")
         raise
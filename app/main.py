@@ -1,6 +1,5 @@
 import os
 import boto3
-import asyncio
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
@@ -13,10 +12,8 @@ from content.adapter.input.web.chat_router import chat_router
 from content.adapter.input.web.trend_router import trend_router
 from content.adapter.input.web.filter_router import filter_router
 from social_oauth.adapter.input.web.google_oauth2_router import authentication_router
-from app.batch.trend_batch import start_trend_scheduler
-from app.batch.trending_videos_batch import start_trending_videos_scheduler
-from app.batch.youtube_tag_batch import start_youtube_tag_scheduler
-from config.database.session import init_db_schema
+from app.scheduler import start_scheduler_tasks, stop_scheduler_tasks
+from config.database.session import get_pool_status, get_replica_status, init_db_schema
 from social_oauth.adapter.input.web.logout_router import logout_router
 
 from content.infrastructure.middleware.stopword_middleware import StopwordMiddleware
@@ -37,18 +34,18 @@ async def lifespan(app: FastAPI):
     init_db_schema()
     
     # 배치 스케줄러들을 시작합니다.
-    app.state.trend_task = asyncio.create_task(start_trend_scheduler())
-    app.state.trending_videos_task = asyncio.create_task(start_trending_videos_scheduler())
-    app.state.youtube_tag_task = asyncio.create_task(start_youtube_tag_scheduler())
-    
+    # 여러 워커/인스턴스로 띄울 때는 RUN_SCHEDULERS_IN_APP=false 로 끄고 python -m app.scheduler 를 따로 실행합니다.
+    app.state.scheduler_tasks = {}
+    if os.getenv("RUN_SCHEDULERS_IN_APP", "true").lower() == "true":
+        app.state.scheduler_tasks = start_scheduler_tasks()
+    else:
+        print("[SCHEDULER] in-app schedulers disabled (RUN_SCHEDULERS_IN_APP=false)")
+
     try:
         yield
     finally:
         # 모든 배치 태스크 정리
-        for task_name in ["trend_task", "trending_videos_task", "youtube_tag_task"]:
-            task = getattr(app.state, task_name, None)
-            if task:
-                task.cancel()
+        await stop_scheduler_tasks(app.state.scheduler_tasks)
 
 
 app = FastAPI(title="Apple Mango AI Server", version="0.1.0", lifespan=lifespan)
@@ -86,6 +83,24 @@ def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/health/db-pool")
+def db_pool_status() -> dict:
+    """
+    엔진별(api / api_async / batch, 복제본 설정 시 replica / replica_async) 커넥션 풀 상태 엔드포인트입니다.
+    점유/오버플로 수, 체크아웃 대기 시간 히스토그램, 체크아웃 위치별 횟수를 반환합니다.
+    """
+    return get_pool_status()
+
+
+@app.get("/health/db-replica")
+def db_replica_status() -> dict:
+    """
+    읽기 전용 복제본 지연 엔드포인트입니다.
+    지연(초), 라우팅 한도, 한도 초과/측정 실패로 primary 로 돌린 횟수를 반환합니다.
+    """
+    return get_replica_status()
+
+
 @app.post("/test")
 async def test_endpoint(request: Request):
     """
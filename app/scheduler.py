@@ -0,0 +1,77 @@
+"""
+배치 스케줄러 전용 프로세스.
+
+API 서버를 여러 워커/인스턴스로 띄울 때는 서버 안의 스케줄러를 끄고(RUN_SCHEDULERS_IN_APP=false) 이 프로세스를 따로 띄운다.
+이 프로세스를 여러 개 띄워도 BATCH_LEADER_ELECTION=true 면 배치마다 Redis 리스를 잡은 프로세스 하나만 실행한다.
+(app/batch/coordination.py)
+
+    RUN_SCHEDULERS_IN_APP=false uvicorn app.main:app --workers 4
+    BATCH_LEADER_ELECTION=true python -m app.scheduler
+
+각 배치의 ENABLE_* 설정은 서버 안에서 돌릴 때와 같다.
+"""
+
+import asyncio
+import signal
+from typing import Awaitable, Callable, Dict
+
+from app.batch.channel_stats_batch import start_channel_stats_scheduler
+from app.batch.co_movement_batch import start_co_movement_scheduler
+from app.batch.keyword_cooccurrence_batch import start_keyword_cooccurrence_scheduler
+from app.batch.snapshot_retention_batch import start_snapshot_retention_scheduler
+from app.batch.trend_batch import start_trend_scheduler
+from app.batch.trending_videos_batch import start_trending_videos_scheduler
+from app.batch.youtube_tag_batch import start_youtube_tag_scheduler
+from config.database.session import init_db_schema
+
+SCHEDULERS: Dict[str, Callable[[], Awaitable[None]]] = {
+    "trend": start_trend_scheduler,
+    "trending_videos": start_trending_videos_scheduler,
+    "youtube_tag": start_youtube_tag_scheduler,
+    "snapshot_retention": start_snapshot_retention_scheduler,
+    "keyword_cooccurrence": start_keyword_cooccurrence_scheduler,
+    "channel_stats": start_channel_stats_scheduler,
+    "co_movement": start_co_movement_scheduler,
+}
+
+
+def start_scheduler_tasks() -> Dict[str, asyncio.Task]:
+    """현재 이벤트 루프에 배치 스케줄러를 모두 띄운다. 비활성화된 배치의 태스크는 바로 끝난다."""
+    return {name: asyncio.create_task(start(), name=f"scheduler:{name}") for name, start in SCHEDULERS.items()}
+
+
+async def stop_scheduler_tasks(tasks: Dict[str, asyncio.Task]) -> None:
+    for task in tasks.values():
+        task.cancel()
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+
+async def run_schedulers() -> None:
+    """SIGINT/SIGTERM 을 받거나 모든 스케줄러가 끝날 때까지 실행한다."""
+    init_db_schema()
+    tasks = start_scheduler_tasks()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    stopping = asyncio.create_task(stop.wait())
+    running = asyncio.gather(*tasks.values(), return_exceptions=True)
+    await asyncio.wait({stopping, running}, return_when=asyncio.FIRST_COMPLETED)
+
+    if stop.is_set():
+        print("[SCHEDULER] stopping")
+    else:
+        print("[SCHEDULER] all schedulers finished (check ENABLE_* settings)")
+    stopping.cancel()
+    await stop_scheduler_tasks(tasks)
+
+
+def main() -> int:
+    asyncio.run(run_schedulers())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
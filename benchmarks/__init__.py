@@ -0,0 +1,16 @@
+"""
+조회 쿼리 / 트렌드 집계 벤치마크.
+
+로컬 PostgreSQL 에 합성 데이터를 채우고(ContentRepositoryImpl 의 조회 메서드와
+TrendAggregationUseCase.aggregate 를 반복 실행해) p50/p95 지연과 EXPLAIN 플랜을 기록한다.
+
+    BENCH_DATABASE_URL=postgresql+psycopg2://postgres@localhost:5432/trendix_bench \\
+        python -m benchmarks generate --videos 50000 --channels 2000 --days 30 --tags 5000
+    BENCH_DATABASE_URL=... python -m benchmarks run --repeat 20 --output bench.json
+    BENCH_DATABASE_URL=... python -m benchmarks run --baseline bench.json   # p95 회귀 시 종료 코드 1
+    BENCH_DATABASE_URL=... python -m benchmarks engines --repeat 5          # sql/numpy 집계 엔진 비교, 결과가 다르면 종료 코드 1
+    python -m benchmarks surge --videos 100000                             # 급등 피처 배치 계산 처리량 (DB 불필요)
+    python -m benchmarks co_movement --videos 50000                        # 동시 상승 점수 엔진 처리량 (DB 불필요)
+
+generate 는 대상 DB 의 테이블을 비우므로 BENCH_DATABASE_URL 의 DB 이름에 "bench" 가 들어가야 한다.
+"""
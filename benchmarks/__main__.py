@@ -0,0 +1,186 @@
+import argparse
+import json
+import sys
+from datetime import date, datetime
+
+from benchmarks.database import (
+    BenchDatabaseError,
+    create_bench_engine,
+    create_bench_session_factory,
+    ensure_bench_schema,
+)
+
+
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="조회 쿼리/트렌드 집계 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="벤치마크 DB 를 비우고 합성 데이터를 채운다")
+    gen.add_argument("--videos", type=int, default=10000)
+    gen.add_argument("--channels", type=int, default=500)
+    gen.add_argument("--days", type=int, default=30, help="video_metrics_snapshot 일수")
+    gen.add_argument("--tags", type=int, default=2000, help="태그 사전 크기")
+    gen.add_argument("--seed", type=float, default=0.42, help="setseed 값 (-1 ~ 1)")
+    gen.add_argument("--as-of", type=_parse_date, default=None)
+    gen.add_argument("--skip-aggregate", action="store_true", help="keyword/category_trend 초기 집계 생략")
+
+    run = sub.add_parser("run", help="케이스별 p50/p95 지연과 EXPLAIN 플랜을 측정한다")
+    run.add_argument("--repeat", type=int, default=20)
+    run.add_argument("--warmup", type=int, default=2)
+    run.add_argument("--aggregate-repeat", type=int, default=3)
+    run.add_argument("--only", nargs="*", default=None, help="측정할 케이스 이름")
+    run.add_argument("--no-explain", action="store_true")
+    run.add_argument("--as-of", type=_parse_date, default=None)
+    run.add_argument("--output", default=None, help="결과 JSON 경로")
+    run.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON 경로")
+    run.add_argument("--max-regression", type=float, default=1.5, help="p95 허용 배수")
+    run.add_argument("--min-delta-ms", type=float, default=5.0, help="회귀로 볼 최소 p95 증가량")
+
+    engines = sub.add_parser("engines", help="트렌드 집계 엔진(sql/numpy)의 지연과 결과 일치 여부를 비교한다")
+    engines.add_argument("--repeat", type=int, default=5)
+    engines.add_argument("--warmup", type=int, default=1)
+    engines.add_argument("--as-of", type=_parse_date, default=None)
+    engines.add_argument("--window-days", type=int, default=7)
+    engines.add_argument("--velocity-days", type=int, default=3)
+    engines.add_argument("--platform", default=None)
+    engines.add_argument("--output", default=None, help="결과 JSON 경로")
+
+    surge = sub.add_parser("surge", help="급등 피처 배치 계산의 처리량과 영상별 계산 결과 일치 여부를 확인한다 (DB 불필요)")
+    surge.add_argument("--videos", type=int, default=100000)
+    surge.add_argument("--samples", type=int, default=40, help="영상당 평균 표본 수")
+    surge.add_argument("--repeat", type=int, default=3)
+    surge.add_argument("--reference-videos", type=int, default=2000, help="영상별 계산으로 비교할 영상 수")
+    surge.add_argument("--seed", type=int, default=42)
+    surge.add_argument("--output", default=None, help="결과 JSON 경로")
+
+    co_movement = sub.add_parser(
+        "co_movement", help="동시 상승 점수 엔진의 처리량과 영상별 계산 결과 일치 여부를 확인한다 (DB 불필요)"
+    )
+    co_movement.add_argument("--videos", type=int, default=50000)
+    co_movement.add_argument("--keywords", type=int, default=5000, help="키워드 그룹 수")
+    co_movement.add_argument("--repeat", type=int, default=3)
+    co_movement.add_argument("--reference-videos", type=int, default=300, help="영상별 계산으로 비교할 영상 수")
+    co_movement.add_argument("--seed", type=int, default=42)
+    co_movement.add_argument("--output", default=None, help="결과 JSON 경로")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "surge":
+        from benchmarks.surge_bench import bench_surge_features
+
+        report = bench_surge_features(
+            n_videos=args.videos,
+            samples_per_video=args.samples,
+            repeat=args.repeat,
+            reference_videos=args.reference_videos,
+            seed=args.seed,
+        )
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as fp:
+                json.dump(report, fp, ensure_ascii=False, indent=2, default=str)
+            print(f"[BENCH] 결과 저장: {args.output}")
+        return 1 if report["mismatch_count"] else 0
+
+    if args.command == "co_movement":
+        from benchmarks.co_movement_bench import bench_co_movement
+
+        report = bench_co_movement(
+            n_videos=args.videos,
+            n_keywords=args.keywords,
+            repeat=args.repeat,
+            reference_videos=args.reference_videos,
+            seed=args.seed,
+        )
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as fp:
+                json.dump(report, fp, ensure_ascii=False, indent=2, default=str)
+            print(f"[BENCH] 결과 저장: {args.output}")
+        return 1 if report["mismatch_count"] or report["missing_mismatch"] else 0
+
+    try:
+        engine = create_bench_engine()
+    except BenchDatabaseError as exc:
+        print(f"[BENCH] {exc}", file=sys.stderr)
+        return 2
+
+    ensure_bench_schema(engine, recreate=args.command == "generate")
+    session_factory = create_bench_session_factory(engine)
+
+    if args.command == "generate":
+        from benchmarks.synthetic_data import generate_dataset
+
+        with session_factory() as db:
+            summary = generate_dataset(
+                db,
+                videos=args.videos,
+                channels=args.channels,
+                days=args.days,
+                tags=args.tags,
+                seed=args.seed,
+                as_of=args.as_of,
+                aggregate=not args.skip_aggregate,
+            )
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        return 0
+
+    if args.command == "engines":
+        from benchmarks.engine_bench import compare_trend_engines
+
+        report = compare_trend_engines(
+            session_factory,
+            as_of=args.as_of,
+            window_days=args.window_days,
+            velocity_days=args.velocity_days,
+            platform=args.platform,
+            repeat=args.repeat,
+            warmup=args.warmup,
+        )
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as fp:
+                json.dump(report, fp, ensure_ascii=False, indent=2, default=str)
+            print(f"[BENCH] 결과 저장: {args.output}")
+        return 1 if report["mismatches"] else 0
+
+    from benchmarks.query_bench import compare_with_baseline, run_benchmarks
+
+    report = run_benchmarks(
+        session_factory,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        aggregate_repeat=args.aggregate_repeat,
+        explain=not args.no_explain,
+        only=args.only,
+        as_of=args.as_of,
+    )
+    report["generated_at"] = datetime.utcnow().isoformat()
+    report["database"] = {"host": engine.url.host, "database": engine.url.database}
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+        regressions = compare_with_baseline(
+            report, baseline, max_regression=args.max_regression, min_delta_ms=args.min_delta_ms
+        )
+        report["regressions"] = regressions
+        for r in regressions:
+            print(
+                f"[BENCH] REGRESSION {r['case']}: p95 {r['baseline_p95_ms']}ms -> {r['p95_ms']}ms (x{r['ratio']})"
+            )
+        if regressions:
+            exit_code = 1
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(report, fp, ensure_ascii=False, indent=2, default=str)
+        print(f"[BENCH] 결과 저장: {args.output}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
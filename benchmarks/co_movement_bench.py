@@ -0,0 +1,222 @@
+"""
+동시 상승 점수 엔진(co_movement_engine) 처리량 측정.
+
+DB 없이 합성 표본/그룹 배열을 만들어 속도 행렬 -> 정규화 -> 그룹 상관을 반복 실행하고, 일부 영상은
+영상별 np.interp / np.corrcoef 로 다시 계산해 두 결과가 같은지(허용 오차 안) 확인한다.
+- 표본은 영상마다 약 30분 간격(지터 포함)이며, 일부 영상은 구간 중간부터 표본이 시작되거나 일찍 끊긴다.
+- 영상은 키워드 그룹 몇 개와 카테고리 하나에 속한다. 키워드 그룹의 일부는 공통 파형(웨이브)을 따라 함께 오른다.
+- 영상별 계산은 reference_videos 개만 재고 영상 수에 비례해 환산한다.
+"""
+
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+from benchmarks.query_bench import _percentile
+from content.application.usecase.co_movement_engine import co_movement_scores, normalize_rows, velocity_matrix
+
+_US_PER_MINUTE = 60 * 10**6
+
+
+def generate_co_movement_input(
+    n_videos: int,
+    n_keywords: int,
+    keywords_per_video: int = 4,
+    n_categories: int = 12,
+    window_minutes: int = 360,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    rng = np.random.default_rng(seed)
+    anchor = np.int64(1_790_000_000) * 10**6
+    interval_us = 30 * _US_PER_MINUTE
+    span_us = (window_minutes + 60) * _US_PER_MINUTE
+
+    # 그룹: 키워드 n_keywords 개 + 카테고리 n_categories 개. 키워드 그룹 1/5 은 공통 파형을 가진다.
+    n_groups = n_keywords + n_categories
+    keyword_draw = rng.integers(0, n_keywords, (n_videos, keywords_per_video))
+    category = n_keywords + rng.integers(0, n_categories, n_videos)
+    # 같은 영상에 같은 키워드가 두 번 뽑힌 소속은 하나로 합친다.
+    pairs = np.unique(
+        np.arange(n_videos, dtype=np.int64)[:, None] * n_groups + np.column_stack([keyword_draw, category])
+    )
+    member_video, member_group = pairs // n_groups, pairs % n_groups
+    wave_phase = rng.uniform(0, 2 * np.pi, n_groups)
+    wave_group = rng.random(n_groups) < 0.2
+    primary = keyword_draw[:, 0]
+
+    # 표본: 영상마다 시작/끝을 조금씩 다르게 하고 약 30분 간격으로 찍는다.
+    start_us = anchor - span_us + rng.integers(0, 3, n_videos) * interval_us
+    stop_us = anchor - rng.choice([0, 0, 0, 2], n_videos) * interval_us
+    counts = ((stop_us - start_us) // interval_us + 1).astype(np.int64)
+    video_index = np.repeat(np.arange(n_videos, dtype=np.int64), counts)
+    first = np.cumsum(counts) - counts
+    step = np.arange(video_index.size) - np.repeat(first, counts)
+    jitter = rng.integers(-120, 120, video_index.size) * 10**6
+    jitter[np.r_[first[1:], video_index.size] - 1] = 0
+    timestamps = np.repeat(start_us, counts) + step * interval_us + jitter
+
+    # 조회 속도 = 기본 속도 x (1 + 웨이브 x 진폭) + 잡음. 조회수는 그 적분이다.
+    minutes = (timestamps - anchor) / _US_PER_MINUTE
+    rate = np.repeat(rng.lognormal(2.0, 1.0, n_videos), counts)
+    wave = np.where(
+        np.repeat(wave_group[primary], counts),
+        np.sin(minutes / 90.0 + np.repeat(wave_phase[primary], counts)),
+        0.0,
+    )
+    growth = rate * (1.0 + 0.6 * wave + 0.3 * rng.standard_normal(video_index.size))
+    increments = np.maximum(growth, 0.0) * 30.0
+    cumulative = np.cumsum(increments)
+    view_counts = np.floor(cumulative - np.repeat(cumulative[first] - increments[first], counts)).astype(np.int64)
+    view_counts += np.repeat(rng.integers(0, 100_000, n_videos), counts)
+
+    return {
+        "video_index": video_index,
+        "timestamps": timestamps,
+        "view_counts": view_counts,
+        "member_video": member_video,
+        "member_group": member_group,
+        "anchor": int(anchor),
+        "n_groups": n_groups,
+    }
+
+
+def _reference_scores(data: Dict[str, Any], videos: np.ndarray, n_videos: int, params: Dict[str, int]) -> np.ndarray:
+    """영상별로 np.interp 로 속도를 만들고, 그룹마다 나머지 구성원 합과의 np.corrcoef 를 구해 가중 평균한다."""
+    window, bucket = params["window_minutes"], params["bucket_minutes"]
+    buckets = window // bucket
+    bounds = data["anchor"] - (buckets - np.arange(buckets + 1)) * bucket * _US_PER_MINUTE
+    vi, ts, views = data["video_index"], data["timestamps"], data["view_counts"]
+    starts = np.searchsorted(vi, np.arange(n_videos))
+    ends = np.searchsorted(vi, np.arange(n_videos), side="right")
+
+    def z_of(v: int):
+        t, y = ts[starts[v]:ends[v]], views[starts[v]:ends[v]].astype(np.float64)
+        inside = (bounds >= t[0]) & (bounds <= t[-1])
+        values = np.where(inside, np.interp(bounds, t, y), np.nan)
+        velocity = np.diff(values) / bucket
+        ok = ~np.isnan(velocity)
+        if ok.sum() < max(params["min_points"], 2):
+            return None
+        centered = np.where(ok, velocity - velocity[ok].mean(), 0.0)
+        norm = np.linalg.norm(centered)
+        return centered / norm if norm > 0 else None
+
+    cache: Dict[int, Any] = {}
+
+    def z_cached(v: int):
+        if v not in cache:
+            cache[v] = z_of(v)
+        return cache[v]
+
+    members: Dict[int, list] = {}
+    for v, g in zip(data["member_video"].tolist(), data["member_group"].tolist()):
+        members.setdefault(g, []).append(v)
+
+    out = np.full(len(videos), np.nan)
+    for i, v in enumerate(videos.tolist()):
+        zi = z_cached(v)
+        if zi is None:
+            continue
+        total = weight = 0.0
+        for g in data["member_group"][data["member_video"] == v].tolist():
+            others = [z_cached(u) for u in members[g] if u != v]
+            others = [z for z in others if z is not None]
+            if len(others) + 1 < params["min_group_size"]:
+                continue
+            rest = np.sum(others, axis=0)
+            if np.dot(rest, rest) <= 1e-12:
+                continue
+            w = np.log(len(others) + 1)
+            total += w * np.clip(np.corrcoef(zi, rest)[0, 1], -1.0, 1.0)
+            weight += w
+        if weight:
+            out[i] = total / weight
+    return out
+
+
+def bench_co_movement(
+    n_videos: int = 50_000,
+    n_keywords: int = 5_000,
+    repeat: int = 3,
+    reference_videos: int = 300,
+    seed: int = 42,
+    window_minutes: int = 360,
+    bucket_minutes: int = 30,
+) -> Dict[str, Any]:
+    data = generate_co_movement_input(n_videos, n_keywords, window_minutes=window_minutes, seed=seed)
+    params = {"window_minutes": window_minutes, "bucket_minutes": bucket_minutes, "min_points": 4, "min_group_size": 3}
+
+    timings_ms: list[float] = []
+    scores = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        velocity = velocity_matrix(
+            data["video_index"],
+            data["timestamps"],
+            data["view_counts"],
+            n_videos,
+            anchor=data["anchor"],
+            window_minutes=window_minutes,
+            bucket_minutes=bucket_minutes,
+        )
+        z, usable = normalize_rows(velocity, params["min_points"])
+        scores = co_movement_scores(
+            z, usable, data["member_video"], data["member_group"], min_group_size=params["min_group_size"]
+        )
+        timings_ms.append((time.perf_counter() - started) * 1000.0)
+    engine_p50 = _percentile(sorted(timings_ms), 50)
+
+    reference_videos = min(reference_videos, n_videos)
+    videos = np.random.default_rng(seed).choice(n_videos, reference_videos, replace=False)
+    started = time.perf_counter()
+    expected = _reference_scores(data, videos, n_videos, params)
+    reference_ms = (time.perf_counter() - started) * 1000.0
+
+    actual = scores.score[videos]
+    same_missing = np.isnan(expected) == np.isnan(actual)
+    both = ~np.isnan(expected) & ~np.isnan(actual)
+    max_error = float(np.max(np.abs(expected[both] - actual[both]))) if both.any() else 0.0
+    mismatches = [
+        {"video": int(v), "expected": float(e), "actual": float(a)}
+        for v, e, a in zip(videos, expected, actual)
+        if not (np.isnan(e) and np.isnan(a)) and not abs(e - a) <= 1e-9
+    ]
+
+    wave_scores = scores.score[~np.isnan(scores.score)]
+    reference_total_ms = reference_ms * n_videos / max(reference_videos, 1)
+    report = {
+        "params": {
+            "videos": n_videos,
+            "samples": int(data["video_index"].size),
+            "memberships": int(data["member_video"].size),
+            "groups": data["n_groups"],
+            "repeat": repeat,
+            "reference_videos": reference_videos,
+            "seed": seed,
+            **params,
+        },
+        "engine": {
+            "p50_ms": round(engine_p50, 3),
+            "videos_per_sec": round(n_videos / max(engine_p50 / 1000.0, 1e-9)),
+            "scored": int(len(wave_scores)),
+            "score_p50": round(float(np.median(wave_scores)), 4) if len(wave_scores) else None,
+        },
+        "reference": {
+            "estimated_ms": round(reference_total_ms, 3),
+            "videos_per_sec": round(reference_videos / max(reference_ms / 1000.0, 1e-9)),
+        },
+        "speedup": round(reference_total_ms / max(engine_p50, 1e-9), 2),
+        "max_error": max_error,
+        "missing_mismatch": int((~same_missing).sum()),
+        "mismatches": mismatches[:50],
+        "mismatch_count": len(mismatches),
+    }
+    print(
+        f"[BENCH] co-movement videos={n_videos} samples={report['params']['samples']} "
+        f"memberships={report['params']['memberships']} "
+        f"p50={report['engine']['p50_ms']:.1f}ms ({report['engine']['videos_per_sec']}/s)  "
+        f"per-video≈{report['reference']['estimated_ms']:.1f}ms  x{report['speedup']}  "
+        f"max_error={max_error:.2e}  mismatches={len(mismatches)}"
+    )
+    return report
@@ -0,0 +1,63 @@
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import sessionmaker
+
+from config.database.session import DATABASE_URL
+
+
+_SQL_DIR = Path(__file__).resolve().parent.parent / "docs" / "sql"
+SCHEMA_SQL = _SQL_DIR / "schema.sql"
+# 운영 DB 에 수동으로 적용하는 인덱스. 벤치마크 DB 에도 같은 인덱스를 둬야 플랜이 운영과 같아진다.
+PERFORMANCE_INDEXES_SQL = _SQL_DIR / "performance_indexes.sql"
+
+
+class BenchDatabaseError(RuntimeError):
+    pass
+
+
+def bench_database_url() -> str:
+    """
+    벤치마크 대상 DB URL. 운영/개발 DB 를 비우는 사고를 막기 위해 다음을 확인한다.
+    - BENCH_DATABASE_URL 이 지정되어 있어야 한다 (SQL_* 설정으로 만든 앱 DB 를 기본값으로 쓰지 않는다).
+    - 앱 DB 와 같은 URL 이면 거부한다.
+    - DB 이름에 "bench" 가 없으면 거부한다. (BENCH_ALLOW_ANY_DATABASE=true 로 해제)
+    """
+    url = os.getenv("BENCH_DATABASE_URL", "").strip()
+    if not url:
+        raise BenchDatabaseError("BENCH_DATABASE_URL 이 설정되지 않았습니다.")
+
+    parsed = make_url(url)
+    app_url = make_url(DATABASE_URL)
+    if (parsed.host, parsed.port, parsed.database) == (app_url.host, app_url.port, app_url.database):
+        raise BenchDatabaseError("BENCH_DATABASE_URL 이 애플리케이션 DB(SQL_*)와 같습니다.")
+
+    allow_any = os.getenv("BENCH_ALLOW_ANY_DATABASE", "false").lower() == "true"
+    if not allow_any and "bench" not in (parsed.database or "").lower():
+        raise BenchDatabaseError(
+            f"DB 이름({parsed.database})에 'bench' 가 없습니다. 전용 벤치마크 DB 를 사용하세요."
+        )
+    return url
+
+
+def create_bench_engine() -> Engine:
+    return create_engine(bench_database_url(), pool_pre_ping=True)
+
+
+def create_bench_session_factory(engine: Engine) -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def ensure_bench_schema(engine: Engine, recreate: bool = False) -> None:
+    """
+    벤치마크 DB 스키마를 준비한다.
+    - recreate=True 이면 docs/sql/schema.sql 로 테이블을 모두 다시 만든다 (운영과 같은 DDL/파티션 구성).
+    - schema.sql 에 없는 운영 컬럼(video.is_shorts)과 docs/sql/performance_indexes.sql 의 인덱스를 보강한다.
+    """
+    with engine.begin() as conn:
+        if recreate:
+            conn.exec_driver_sql(SCHEMA_SQL.read_text(encoding="utf-8"))
+        conn.execute(text("ALTER TABLE video ADD COLUMN IF NOT EXISTS is_shorts BOOLEAN"))
+        conn.exec_driver_sql(PERFORMANCE_INDEXES_SQL.read_text(encoding="utf-8"))
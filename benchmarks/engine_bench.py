@@ -0,0 +1,103 @@
+"""
+트렌드 집계 엔진(sql / numpy) 비교.
+
+같은 기준 일자/윈도우로 TrendAggregationUseCase.compute_rankings 를 엔진별로 실행해 지연을 재고,
+두 엔진의 키워드/카테고리 순위 행이 같은지 확인한다. (저장은 하지 않는다)
+- 정수 컬럼과 순위는 정확히 같아야 한다.
+- 실수 컬럼은 상대 오차 rel_tol 까지 같다고 본다. SQL 은 NUMERIC 으로 나눈 값을 float 로 바꾸므로
+  마지막 자리에서 차이가 날 수 있다.
+"""
+
+import math
+import time
+from datetime import date
+from typing import Any, Dict
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.query_bench import _percentile
+from content.application.usecase.trend_aggregation_usecase import AGGREGATION_ENGINES, TrendAggregationUseCase
+
+_KEY_FIELDS = {"keywords": "keyword", "categories": "category"}
+
+
+def _diff_rows(expected: list[dict], actual: list[dict], key_field: str, rel_tol: float) -> list[dict]:
+    left = {(r[key_field], r["platform"]): r for r in expected}
+    right = {(r[key_field], r["platform"]): r for r in actual}
+    diffs: list[dict] = []
+    for key in sorted(left.keys() ^ right.keys()):
+        diffs.append({"key": list(key), "field": None, "expected": key in left, "actual": key in right})
+    for key in sorted(left.keys() & right.keys()):
+        for field, value in left[key].items():
+            other = right[key].get(field)
+            if isinstance(value, float) and isinstance(other, float):
+                same = math.isclose(value, other, rel_tol=rel_tol, abs_tol=1e-12)
+            else:
+                same = value == other
+            if not same:
+                diffs.append({"key": list(key), "field": field, "expected": value, "actual": other})
+    return diffs
+
+
+def compare_trend_engines(
+    session_factory: sessionmaker,
+    *,
+    as_of: date | None = None,
+    window_days: int = 7,
+    velocity_days: int = 3,
+    platform: str | None = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    rel_tol: float = 1e-9,
+) -> Dict[str, Any]:
+    as_of = as_of or date.today()
+    engines: Dict[str, Any] = {}
+    outputs: Dict[str, tuple[list[dict], list[dict]]] = {}
+    for engine in AGGREGATION_ENGINES:
+        usecase = TrendAggregationUseCase(None, session_factory=session_factory, engine=engine)
+        timings_ms: list[float] = []
+        for i in range(warmup + repeat):
+            with session_factory() as db:
+                started = time.perf_counter()
+                outputs[engine] = usecase.compute_rankings(db, as_of, window_days, platform, velocity_days)
+                elapsed = (time.perf_counter() - started) * 1000.0
+            if i >= warmup:
+                timings_ms.append(elapsed)
+
+        ordered = sorted(timings_ms)
+        keywords, categories = outputs[engine]
+        engines[engine] = {
+            "runs": len(ordered),
+            "keywords": len(keywords),
+            "categories": len(categories),
+            "p50_ms": round(_percentile(ordered, 50), 3),
+            "p95_ms": round(_percentile(ordered, 95), 3),
+            "mean_ms": round(sum(ordered) / len(ordered), 3),
+        }
+        print(
+            f"[BENCH] engine={engine:<6} p50={engines[engine]['p50_ms']:>10.2f}ms  "
+            f"keywords={len(keywords)} categories={len(categories)}"
+        )
+
+    baseline, *others = AGGREGATION_ENGINES
+    mismatches: Dict[str, Any] = {}
+    for engine in others:
+        for index, (name, key_field) in enumerate(_KEY_FIELDS.items()):
+            diffs = _diff_rows(outputs[baseline][index], outputs[engine][index], key_field, rel_tol)
+            if diffs:
+                mismatches[f"{engine}.{name}"] = diffs
+                print(f"[BENCH] MISMATCH {engine}.{name}: {len(diffs)} field(s) differ from {baseline}")
+        speedup = engines[baseline]["p50_ms"] / max(engines[engine]["p50_ms"], 1e-9)
+        engines[engine]["speedup_vs_sql"] = round(speedup, 2)
+
+    return {
+        "params": {
+            "as_of": as_of.isoformat(),
+            "window_days": window_days,
+            "velocity_days": velocity_days,
+            "platform": platform,
+            "rel_tol": rel_tol,
+        },
+        "engines": engines,
+        "mismatches": mismatches,
+    }
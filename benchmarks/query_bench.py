@@ -0,0 +1,315 @@
+"""
+ContentRepositoryImpl 조회 메서드와 TrendAggregationUseCase.aggregate 의 지연/플랜 측정.
+
+- 케이스마다 warmup 후 repeat 번 실행해 p50/p95/mean/min/max(ms)를 기록한다.
+- 한 번 더 실행하면서 실제로 나간 SQL 을 가로채 EXPLAIN (FORMAT JSON) 플랜을 남긴다.
+  읽기 전용 문장(SELECT/WITH 이면서 INSERT/UPDATE/DELETE 가 없는 문장)만 ANALYZE, BUFFERS 로 실제 실행한다.
+- baseline 결과 파일과 비교해 p95 가 max_regression 배를 넘게 느려진 케이스를 회귀로 보고한다.
+"""
+
+import inspect
+import math
+import re
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from content.application.usecase.trend_aggregation_usecase import TrendAggregationUseCase
+from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+
+_DML_RE = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+
+@dataclass
+class BenchCase:
+    name: str
+    run: Callable[[ContentRepositoryImpl, Dict[str, Any]], Any]
+    # 이 케이스가 측정하는 ContentRepositoryImpl 메서드 (커버리지 확인용)
+    method: str | None = None
+
+
+def _aggregate(repo: ContentRepositoryImpl, ctx: Dict[str, Any]) -> Any:
+    usecase = TrendAggregationUseCase(repo, session_factory=ctx["session_factory"])
+    return usecase.aggregate(as_of=ctx["as_of"])
+
+
+CASES: List[BenchCase] = [
+    BenchCase("videos_by_category", lambda r, c: r.fetch_videos_by_category(c["category"], limit=20), "fetch_videos_by_category"),
+    BenchCase(
+        "videos_by_category_id",
+        lambda r, c: r.fetch_videos_by_category_id(c["category_id"], limit=20, days=7),
+        "fetch_videos_by_category_id",
+    ),
+    BenchCase("video_view_history", lambda r, c: r.fetch_video_view_history(c["video_id"], limit=30), "fetch_video_view_history"),
+    BenchCase("channel_stats", lambda r, c: r.fetch_channel_stats(c["channel_ids"]), "fetch_channel_stats"),
+    BenchCase("videos_by_keyword", lambda r, c: r.fetch_videos_by_keyword(c["keyword"], limit=20), "fetch_videos_by_keyword"),
+    BenchCase(
+        "top_keywords_by_category",
+        lambda r, c: r.fetch_top_keywords_by_category(c["category"], limit=10),
+        "fetch_top_keywords_by_category",
+    ),
+    BenchCase(
+        "top_keywords_by_keyword",
+        lambda r, c: r.fetch_top_keywords_by_keyword(c["keyword"], limit=10),
+        "fetch_top_keywords_by_keyword",
+    ),
+    BenchCase("video_with_scores", lambda r, c: r.fetch_video_with_scores(c["video_id"]), "fetch_video_with_scores"),
+    BenchCase("hot_category_trends", lambda r, c: r.fetch_hot_category_trends(limit=20), "fetch_hot_category_trends"),
+    BenchCase("popular_videos", lambda r, c: r.fetch_popular_videos(limit=20), "fetch_popular_videos"),
+    BenchCase("rising_videos", lambda r, c: r.fetch_rising_videos(limit=20), "fetch_rising_videos"),
+    BenchCase(
+        "recommended_by_category",
+        lambda r, c: r.fetch_recommended_videos_by_category(c["category"], limit=20),
+        "fetch_recommended_videos_by_category",
+    ),
+    BenchCase("distinct_categories", lambda r, c: r.fetch_distinct_categories(), "fetch_distinct_categories"),
+    BenchCase("surge_videos", lambda r, c: r.fetch_surge_videos(limit=30), "fetch_surge_videos"),
+    BenchCase(
+        "snapshot_history_7d",
+        lambda r, c: r.fetch_video_snapshot_history(c["video_id"], days=7),
+        "fetch_video_snapshot_history",
+    ),
+    BenchCase("snapshot_history_365d", lambda r, c: r.fetch_video_snapshot_history(c["video_id"], days=365)),
+    BenchCase("trend_aggregate", _aggregate),
+]
+
+
+def uncovered_read_methods() -> list[str]:
+    """CASES 가 측정하지 않는 ContentRepositoryImpl 의 fetch_* 메서드."""
+    covered = {case.method for case in CASES if case.method}
+    return sorted(
+        name
+        for name, _ in inspect.getmembers(ContentRepositoryImpl, predicate=inspect.isfunction)
+        if name.startswith("fetch_") and name not in covered
+    )
+
+
+def load_context(db: Session, session_factory: sessionmaker, as_of: date | None = None) -> Dict[str, Any]:
+    """
+    케이스 인자로 쓸 대표 값을 데이터에서 고른다. (가장 흔한 카테고리/태그, 조회수 최상위 영상 등)
+    """
+    category = db.execute(
+        text("SELECT category FROM video_sentiment WHERE category IS NOT NULL GROUP BY category ORDER BY COUNT(*) DESC LIMIT 1")
+    ).scalar()
+    category_id = db.execute(
+        text("SELECT category_id FROM video WHERE category_id IS NOT NULL GROUP BY category_id ORDER BY COUNT(*) DESC LIMIT 1")
+    ).scalar()
+    keyword = db.execute(
+        text(
+            """
+            SELECT t.name
+            FROM video_tag vt
+            JOIN tag t ON t.tag_id = vt.tag_id
+            GROUP BY t.name
+            ORDER BY COUNT(*) DESC
+            LIMIT 1
+            """
+        )
+    ).scalar()
+    video_id = db.execute(text("SELECT video_id FROM video ORDER BY view_count DESC NULLS LAST LIMIT 1")).scalar()
+    channel_ids = list(
+        db.execute(
+            text("SELECT channel_id FROM video GROUP BY channel_id ORDER BY COUNT(*) DESC LIMIT 50")
+        ).scalars()
+    )
+    db.rollback()
+    return {
+        "category": category,
+        "category_id": category_id,
+        "keyword": keyword,
+        "video_id": video_id,
+        "channel_ids": channel_ids,
+        "as_of": as_of or date.today(),
+        "session_factory": session_factory,
+    }
+
+
+def dataset_summary(db: Session) -> Dict[str, int]:
+    counts = {}
+    for table in ("video", "channel", "video_metrics_snapshot", "video_tag", "tag"):
+        counts[table] = int(db.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar() or 0)
+    db.rollback()
+    return counts
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    # nearest-rank 방식
+    index = max(math.ceil(pct / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+def _result_size(result: Any) -> int | None:
+    if result is None:
+        return 0
+    if isinstance(result, (list, tuple, dict)):
+        return len(result)
+    return None
+
+
+def _capture_statements(engine: Engine, fn: Callable[[], Any]) -> list[tuple[str, Any]]:
+    captured: list[tuple[str, Any]] = []
+
+    def _listener(conn, cursor, statement, parameters, context, executemany):
+        # executemany 는 첫 번째 파라미터 묶음으로 플랜을 본다.
+        captured.append((statement, parameters[0] if executemany and parameters else parameters))
+
+    event.listen(engine, "before_cursor_execute", _listener)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _listener)
+    return captured
+
+
+def _is_read_only(statement: str) -> bool:
+    head = statement.lstrip().upper()
+    return head.startswith(("SELECT", "WITH")) and not _DML_RE.search(statement)
+
+
+def explain_statements(engine: Engine, statements: list[tuple[str, Any]]) -> list[dict]:
+    """
+    가로챈 문장마다 EXPLAIN (FORMAT JSON) 결과를 만든다. 같은 문장은 한 번만 남긴다.
+    EXPLAIN 은 별도 커넥션에서 실행하고 매번 rollback 하므로 데이터를 바꾸지 않는다.
+    """
+    plans: list[dict] = []
+    seen: set[str] = set()
+    raw = engine.raw_connection()
+    try:
+        for statement, parameters in statements:
+            if statement in seen or not statement.lstrip().upper().startswith(("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")):
+                continue
+            seen.add(statement)
+            analyze = _is_read_only(statement)
+            options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+            cursor = raw.cursor()
+            try:
+                cursor.execute(f"EXPLAIN ({options}) {statement}", parameters)
+                plan = cursor.fetchone()[0]
+                root = plan[0]["Plan"]
+                plans.append(
+                    {
+                        "statement": " ".join(statement.split())[:300],
+                        "analyzed": analyze,
+                        "node": root.get("Node Type"),
+                        "total_cost": root.get("Total Cost"),
+                        "actual_total_time_ms": root.get("Actual Total Time"),
+                        "execution_time_ms": plan[0].get("Execution Time"),
+                        "plan": plan,
+                    }
+                )
+            except Exception as exc:
+                plans.append({"statement": " ".join(statement.split())[:300], "error": str(exc)})
+            finally:
+                cursor.close()
+                raw.rollback()
+    finally:
+        raw.close()
+    return plans
+
+
+def run_case(
+    case: BenchCase,
+    session_factory: sessionmaker,
+    ctx: Dict[str, Any],
+    *,
+    repeat: int,
+    warmup: int,
+    explain: bool,
+) -> Dict[str, Any]:
+    timings_ms: list[float] = []
+    rows = None
+    with session_factory() as db:
+        repo = ContentRepositoryImpl(db)
+        for i in range(warmup + repeat):
+            started = time.perf_counter()
+            result = case.run(repo, ctx)
+            elapsed = (time.perf_counter() - started) * 1000.0
+            db.rollback()
+            if i >= warmup:
+                timings_ms.append(elapsed)
+                rows = _result_size(result)
+
+        plans: list[dict] = []
+        if explain:
+            statements = _capture_statements(db.get_bind(), lambda: case.run(repo, ctx))
+            db.rollback()
+            plans = explain_statements(db.get_bind(), statements)
+
+    ordered = sorted(timings_ms)
+    return {
+        "runs": len(ordered),
+        "rows": rows,
+        "p50_ms": round(_percentile(ordered, 50), 3),
+        "p95_ms": round(_percentile(ordered, 95), 3),
+        "mean_ms": round(sum(ordered) / len(ordered), 3),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3),
+        "plans": plans,
+    }
+
+
+def run_benchmarks(
+    session_factory: sessionmaker,
+    *,
+    repeat: int = 20,
+    warmup: int = 2,
+    aggregate_repeat: int = 3,
+    explain: bool = True,
+    only: list[str] | None = None,
+    as_of: date | None = None,
+) -> Dict[str, Any]:
+    with session_factory() as db:
+        ctx = load_context(db, session_factory, as_of)
+        dataset = dataset_summary(db)
+
+    results: Dict[str, Any] = {}
+    for case in CASES:
+        if only and case.name not in only:
+            continue
+        case_repeat = aggregate_repeat if case.name == "trend_aggregate" else repeat
+        case_warmup = min(warmup, 1) if case.name == "trend_aggregate" else warmup
+        results[case.name] = run_case(
+            case, session_factory, ctx, repeat=case_repeat, warmup=case_warmup, explain=explain
+        )
+        r = results[case.name]
+        print(f"[BENCH] {case.name:<26} p50={r['p50_ms']:>10.2f}ms  p95={r['p95_ms']:>10.2f}ms  rows={r['rows']}")
+
+    uncovered = uncovered_read_methods()
+    if uncovered:
+        print(f"[BENCH] 측정 케이스가 없는 조회 메서드: {', '.join(uncovered)}")
+
+    return {
+        "dataset": dataset,
+        "params": {k: v for k, v in ctx.items() if k != "session_factory"},
+        "uncovered": uncovered,
+        "cases": results,
+    }
+
+
+def compare_with_baseline(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    max_regression: float = 1.5,
+    min_delta_ms: float = 5.0,
+) -> list[dict]:
+    """
+    p95 가 baseline 대비 max_regression 배를 넘고, 절대 차이도 min_delta_ms 이상인 케이스를 반환한다.
+    (수 ms 짜리 쿼리의 측정 잡음을 회귀로 보지 않기 위해 절대 차이 조건을 함께 둔다)
+    """
+    regressions = []
+    for name, result in current.get("cases", {}).items():
+        base = baseline.get("cases", {}).get(name)
+        if not base or not base.get("p95_ms"):
+            continue
+        ratio = result["p95_ms"] / base["p95_ms"]
+        if ratio > max_regression and result["p95_ms"] - base["p95_ms"] >= min_delta_ms:
+            regressions.append(
+                {"case": name, "baseline_p95_ms": base["p95_ms"], "p95_ms": result["p95_ms"], "ratio": round(ratio, 2)}
+            )
+    return regressions
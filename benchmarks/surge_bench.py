@@ -0,0 +1,158 @@
+"""
+급등 피처 배치 계산(compute_surge_features_batch) 처리량 측정.
+
+DB 없이 합성 표본 배열을 만들어 배치 계산을 반복 실행하고, 일부 영상은 영상별 compute_surge_features 로도 계산해
+처리량(영상/초)을 비교하고 두 결과가 같은지 확인한다.
+- 표본은 영상마다 약 10분 간격(지터 포함)으로 찍힌 단조 증가 조회수다. 같은 시각 표본, 표본이 없는 영상,
+  업로드 시각/베이스라인이 없는 영상을 섞어 경계 조건도 함께 비교한다.
+- 배치 계산은 저장소가 돌려주는 (영상, 시각) 순 입력과, 정렬 비용을 보기 위해 순서를 섞은 입력을 각각 잰다.
+- 영상별 계산은 reference_videos 개만 재고 영상 수에 비례해 환산한다.
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+import numpy as np
+
+from benchmarks.query_bench import _percentile
+from content.application.usecase.surge_feature_columnar import compute_surge_features_batch
+from content.application.usecase.surge_feature_usecase import ViewSample, compute_surge_features
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def generate_surge_samples(n_videos: int, samples_per_video: int, seed: int = 42) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2026-10-16T00:00:00", "us")
+
+    counts = rng.poisson(samples_per_video, n_videos)
+    counts[rng.random(n_videos) < 0.02] = 0
+    video_index = np.repeat(np.arange(n_videos, dtype=np.int64), counts)
+    first = np.cumsum(counts) - counts
+    step = np.arange(video_index.size) - np.repeat(first, counts)
+
+    # 약 10분 간격 수집. 일부는 직전 표본과 같은 시각이다.
+    offset_us = rng.integers(0, 3600, n_videos) * 10**6
+    jitter_us = rng.integers(-90, 90, video_index.size) * 10**6
+    timestamps = start + (np.repeat(offset_us, counts) + step * 600 * 10**6 + jitter_us).astype("timedelta64[us]")
+    duplicate = rng.random(video_index.size) < 0.01
+    duplicate[first[counts > 0]] = False
+    timestamps[duplicate] = timestamps[np.maximum(np.flatnonzero(duplicate) - 1, 0)]
+
+    growth = rng.lognormal(3.0, 1.5, n_videos)
+    base = rng.integers(0, 100_000, n_videos)
+    view_counts = np.repeat(base, counts) + (step * np.repeat(growth, counts) * rng.random(video_index.size)).astype(np.int64)
+
+    published_at = start - rng.integers(0, 72 * 60, n_videos).astype("timedelta64[m]")
+    published_at[rng.random(n_videos) < 0.05] = np.datetime64("NaT")
+    baseline = rng.lognormal(2.0, 1.0, n_videos)
+    baseline[rng.random(n_videos) < 0.2] = np.nan
+
+    # fetch_view_samples 처럼 (영상, 시각) 순으로 돌려준다. 같은 시각 표본의 순서는 섞지 않는다.
+    return {
+        "video_index": video_index,
+        "timestamps": timestamps,
+        "view_counts": view_counts,
+        "published_at": published_at,
+        "baseline_velocity_10m": baseline,
+    }
+
+
+def _timed_batch(data: Dict[str, np.ndarray], n_videos: int, repeat: int, order: np.ndarray | None = None):
+    arrays = [data["video_index"], data["timestamps"], data["view_counts"]]
+    if order is not None:
+        arrays = [a[order] for a in arrays]
+    timings_ms: list[float] = []
+    columns = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        columns = compute_surge_features_batch(
+            *arrays,
+            n_videos,
+            published_at=data["published_at"],
+            baseline_velocity_10m=data["baseline_velocity_10m"],
+        )
+        timings_ms.append((time.perf_counter() - started) * 1000.0)
+    return columns, _percentile(sorted(timings_ms), 50)
+
+
+def _to_datetime(value: np.datetime64) -> datetime | None:
+    if np.isnat(value):
+        return None
+    return _EPOCH + timedelta(microseconds=int(value.astype("datetime64[us]").astype(np.int64)))
+
+
+def bench_surge_features(
+    n_videos: int = 100_000,
+    samples_per_video: int = 40,
+    repeat: int = 3,
+    reference_videos: int = 2_000,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    data = generate_surge_samples(n_videos, samples_per_video, seed)
+
+    # 저장소 순서 입력과, 정렬 비용까지 재기 위해 표본 순서를 섞은 입력을 각각 잰다.
+    # 섞은 입력은 같은 시각 표본의 순서가 바뀌어 영상별 계산과 비교하지 않는다.
+    columns, batch_p50 = _timed_batch(data, n_videos, repeat)
+    _, shuffled_p50 = _timed_batch(
+        data, n_videos, repeat, order=np.random.default_rng(seed).permutation(data["video_index"].size)
+    )
+
+    # 영상별 계산: 입력 변환은 측정에서 뺀다.
+    reference_videos = min(reference_videos, n_videos)
+    selected = data["video_index"] < reference_videos
+    samples: list[list[ViewSample]] = [[] for _ in range(reference_videos)]
+    for vi, ts, views in zip(
+        data["video_index"][selected].tolist(),
+        data["timestamps"][selected],
+        data["view_counts"][selected].tolist(),
+    ):
+        samples[vi].append(ViewSample(timestamp=_to_datetime(ts), view_count=views))
+    published = [_to_datetime(v) for v in data["published_at"][:reference_videos]]
+    baselines = [None if np.isnan(v) else [float(v)] for v in data["baseline_velocity_10m"][:reference_videos]]
+
+    started = time.perf_counter()
+    expected = [
+        compute_surge_features(samples[i], published[i], channel_baseline_velocities_10m=baselines[i])
+        for i in range(reference_videos)
+    ]
+    per_video_ms = (time.perf_counter() - started) * 1000.0
+
+    mismatches = []
+    for i, feature in enumerate(expected):
+        actual = columns.feature(i).to_dict()
+        for field, value in feature.to_dict().items():
+            if actual[field] != value:
+                mismatches.append({"video": i, "field": field, "expected": value, "actual": actual[field]})
+
+    per_video_total_ms = per_video_ms * n_videos / max(reference_videos, 1)
+    report = {
+        "params": {
+            "videos": n_videos,
+            "samples": int(data["video_index"].size),
+            "repeat": repeat,
+            "reference_videos": reference_videos,
+            "seed": seed,
+        },
+        "batch": {
+            "p50_ms": round(batch_p50, 3),
+            "videos_per_sec": round(n_videos / max(batch_p50 / 1000.0, 1e-9)),
+            "shuffled_p50_ms": round(shuffled_p50, 3),
+        },
+        "per_video": {
+            "estimated_ms": round(per_video_total_ms, 3),
+            "videos_per_sec": round(reference_videos / max(per_video_ms / 1000.0, 1e-9)),
+        },
+        "speedup": round(per_video_total_ms / max(batch_p50, 1e-9), 2),
+        "mismatches": mismatches[:50],
+        "mismatch_count": len(mismatches),
+    }
+    print(
+        f"[BENCH] surge batch videos={n_videos} samples={report['params']['samples']} "
+        f"p50={report['batch']['p50_ms']:.1f}ms ({report['batch']['videos_per_sec']}/s, "
+        f"shuffled {report['batch']['shuffled_p50_ms']:.1f}ms)  "
+        f"per-video≈{report['per_video']['estimated_ms']:.1f}ms ({report['per_video']['videos_per_sec']}/s)  "
+        f"x{report['speedup']}  mismatches={len(mismatches)}"
+    )
+    return report
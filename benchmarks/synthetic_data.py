@@ -0,0 +1,279 @@
+"""
+벤치마크용 합성 데이터 생성기.
+
+모든 행을 서버 측 generate_series 로 만들고 setseed 로 난수를 고정하므로, 같은 인자로 다시 생성하면 같은 데이터가 된다.
+
+- 채널: 영상이 앞 번호 채널에 몰리도록 power(random(), 2) 로 배정 (소수의 대형 채널 + 다수의 소형 채널)
+- 영상: 게시 시각은 최근 days * 1.5 일에 고르게, 조회수는 exp(4 ~ 14) 의 로그 스케일 분포
+- 태그: 영상마다 3~8개, power(random(), 3) 으로 뽑아 상위 태그에 몰리는 Zipf 형태
+- 스냅샷: 게시 이후 날짜마다 현재 조회수 * (경과 비율)^0.6 으로 누적 증가하는 곡선
+"""
+
+import time
+from datetime import date, timedelta
+from typing import Any, Dict
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.batch.snapshot_retention_batch import ensure_snapshot_partitions
+from content.application.usecase.trend_aggregation_usecase import TrendAggregationUseCase
+from content.infrastructure.repository.channel_stats_sql import BASELINE_WINDOW_MINUTES, REFRESH_CHANNEL_STATS_SQL
+from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+from content.infrastructure.repository.keyword_cooccurrence_sql import REBUILD_COOCCURRENCE_SQL
+from content.infrastructure.repository.video_metrics_sql import (
+    INTRADAY_RAW_HOURS,
+    upsert_snapshots_with_latest_sql,
+)
+
+BENCH_TABLES = (
+    "channel",
+    "channel_stats",
+    "video",
+    "video_sentiment",
+    "video_score",
+    "keyword_mapping",
+    "tag",
+    "video_tag",
+    "keyword_cooccurrence",
+    "video_metrics_snapshot",
+    "video_metrics_latest",
+    "video_metrics_weekly",
+    "video_metrics_monthly",
+    "keyword_trend",
+    "category_trend",
+    "batch_watermark",
+)
+
+CATEGORIES = (
+    "game", "music", "entertainment", "sports", "news", "education",
+    "food", "travel", "beauty", "tech", "comedy", "vlog",
+)
+
+_VIDEOS_SQL = """
+    INSERT INTO video (
+        video_id, channel_id, platform, title, description, tags, category_id,
+        published_at, duration, view_count, like_count, comment_count, thumbnail_url, crawled_at, is_shorts
+    )
+    SELECT
+        'bench_v_' || r.g,
+        'bench_ch_' || (1 + floor(:channels * power(r.channel_pick, 2)))::INT,
+        'youtube',
+        'Bench video ' || r.g,
+        'synthetic video for benchmarks',
+        NULL,
+        (ARRAY[1, 2, 10, 15, 17, 19, 20, 22, 23, 24, 25, 26, 27, 28])[1 + floor(r.category_pick * 14)::INT],
+        CAST(:as_of AS TIMESTAMP) + INTERVAL '12 hours' - r.age_pick * :days * 1.5 * INTERVAL '1 day',
+        CASE WHEN r.shorts_pick < 0.3 THEN 'PT' || (10 + floor(r.duration_pick * 50))::INT || 'S'
+             ELSE 'PT' || (1 + floor(r.duration_pick * 30))::INT || 'M' END,
+        r.views,
+        floor(r.views * (0.01 + r.like_pick * 0.05))::BIGINT,
+        floor(r.views * (0.001 + r.like_pick * 0.004))::BIGINT,
+        'https://example.com/thumb/' || r.g || '.jpg',
+        CAST(:as_of AS TIMESTAMP) + INTERVAL '12 hours',
+        r.shorts_pick < 0.3
+    FROM (
+        SELECT
+            g,
+            random() AS channel_pick,
+            random() AS category_pick,
+            random() AS age_pick,
+            random() AS shorts_pick,
+            random() AS duration_pick,
+            random() AS like_pick,
+            floor(exp(4 + random() * 10))::BIGINT AS views
+        FROM generate_series(1, :videos) AS g
+    ) r
+"""
+
+_VIDEO_TAGS_SQL = """
+    INSERT INTO video_tag (video_id, tag_id, platform, weight, created_at)
+    SELECT DISTINCT ON (v.video_id, picked.tag_id)
+        v.video_id, picked.tag_id, v.platform, CAST(0.5 + random() * 0.5 AS NUMERIC(5, 4)), v.crawled_at
+    FROM video v
+    CROSS JOIN LATERAL (
+        SELECT 1 + floor(:tags * power(random(), 3))::INT AS tag_id
+        FROM generate_series(1, 3 + abs(hashtext(v.video_id)) % 6)
+    ) picked
+    ORDER BY v.video_id, picked.tag_id
+"""
+
+_SNAPSHOT_SOURCE_SQL = """
+    SELECT
+        v.video_id,
+        v.platform,
+        CAST(:snapshot_date AS DATE),
+        floor(v.view_count * power(r.ratio, 0.6))::BIGINT,
+        floor(v.like_count * power(r.ratio, 0.6))::BIGINT,
+        floor(v.comment_count * power(r.ratio, 0.6))::BIGINT
+    FROM video v
+    CROSS JOIN LATERAL (
+        SELECT LEAST(
+            GREATEST(EXTRACT(EPOCH FROM (CAST(:snapshot_date AS DATE) + 1 - v.published_at)), 0)
+            / GREATEST(EXTRACT(EPOCH FROM (CAST(:as_of AS DATE) + 1 - v.published_at)), 1),
+            1.0
+        ) AS ratio
+    ) r
+    WHERE CAST(v.published_at AS DATE) <= CAST(:snapshot_date AS DATE)
+"""
+
+
+def _months_between(start: date, end: date) -> int:
+    return (end.year - start.year) * 12 + (end.month - start.month)
+
+
+def generate_dataset(
+    db: Session,
+    *,
+    videos: int = 10000,
+    channels: int = 500,
+    days: int = 30,
+    tags: int = 2000,
+    seed: float = 0.42,
+    as_of: date | None = None,
+    aggregate: bool = True,
+) -> Dict[str, Any]:
+    """
+    벤치마크 테이블을 비우고 합성 데이터를 채운다. 스키마는 호출 측에서 ensure_bench_schema 로 준비한다. 단계별 소요 시간(초)을 함께 반환한다.
+    """
+    as_of = as_of or date.today()
+    timings: Dict[str, float] = {}
+
+    def _step(name: str, fn) -> None:
+        started = time.perf_counter()
+        # setseed 는 커넥션 단위이므로 단계(트랜잭션)마다 다시 고정한다.
+        db.execute(text("SELECT setseed(:seed)"), {"seed": seed})
+        fn()
+        db.commit()
+        timings[name] = round(time.perf_counter() - started, 3)
+        print(f"[BENCH] {name}: {timings[name]}s")
+
+    def _reset() -> None:
+        db.execute(text(f"TRUNCATE {', '.join(BENCH_TABLES)} RESTART IDENTITY"))
+        first_day = as_of - timedelta(days=days - 1)
+        ensure_snapshot_partitions(db, first_day, months_ahead=_months_between(first_day, as_of) + 1)
+
+    def _channels() -> None:
+        db.execute(
+            text(
+                """
+                INSERT INTO channel (channel_id, platform, title, subscriber_count, crawled_at)
+                SELECT 'bench_ch_' || g, 'youtube', 'Bench channel ' || g,
+                       floor(exp(6 + random() * 10))::BIGINT, CAST(:as_of AS TIMESTAMP)
+                FROM generate_series(1, :channels) AS g
+                """
+            ),
+            {"channels": channels, "as_of": as_of},
+        )
+
+    def _videos() -> None:
+        db.execute(text(_VIDEOS_SQL), {"videos": videos, "channels": channels, "days": days, "as_of": as_of})
+        db.execute(
+            text(
+                """
+                INSERT INTO video_sentiment (video_id, platform, category, trend_score, sentiment_label, sentiment_score)
+                SELECT video_id, platform,
+                       (CAST(:categories AS VARCHAR[]))[1 + floor(power(random(), 1.5) * cardinality(CAST(:categories AS VARCHAR[])))::INT],
+                       CAST(random() AS NUMERIC(5, 4)),
+                       (ARRAY['positive', 'neutral', 'negative'])[1 + floor(random() * 3)::INT],
+                       CAST(random() AS NUMERIC(5, 4))
+                FROM video
+                """
+            ),
+            {"categories": list(CATEGORIES)},
+        )
+        db.execute(
+            text(
+                """
+                INSERT INTO video_score (video_id, platform, engagement_score, sentiment_score, trend_score, total_score)
+                SELECT video_id, platform,
+                       CAST(random() * 100 AS NUMERIC(6, 3)),
+                       CAST(random() * 100 AS NUMERIC(6, 3)),
+                       CAST(random() * 100 AS NUMERIC(6, 3)),
+                       CAST(random() * 100 AS NUMERIC(6, 3))
+                FROM video
+                """
+            )
+        )
+
+    def _tags() -> None:
+        db.execute(text("INSERT INTO tag (name) SELECT 'tag_' || g FROM generate_series(1, :tags) AS g"), {"tags": tags})
+        db.execute(text(_VIDEO_TAGS_SQL), {"tags": tags})
+        db.execute(
+            text(
+                """
+                INSERT INTO keyword_mapping (video_id, channel_id, platform, keyword, weight)
+                SELECT vt.video_id, v.channel_id, vt.platform, t.name, vt.weight
+                FROM video_tag vt
+                JOIN tag t ON t.tag_id = vt.tag_id
+                JOIN video v ON v.video_id = vt.video_id
+                """
+            )
+        )
+        db.execute(
+            text(
+                """
+                UPDATE video v
+                SET tags = agg.tags
+                FROM (
+                    SELECT vt.video_id, string_agg(t.name, ',' ORDER BY t.name) AS tags
+                    FROM video_tag vt
+                    JOIN tag t ON t.tag_id = vt.tag_id
+                    GROUP BY vt.video_id
+                ) agg
+                WHERE agg.video_id = v.video_id
+                """
+            )
+        )
+
+    def _snapshots() -> None:
+        sql = text(upsert_snapshots_with_latest_sql(_SNAPSHOT_SOURCE_SQL))
+        for offset in range(days - 1, -1, -1):
+            db.execute(sql, {"snapshot_date": as_of - timedelta(days=offset), "as_of": as_of})
+
+    def _rollups() -> None:
+        db.execute(
+            text(REFRESH_CHANNEL_STATS_SQL),
+            {
+                "baseline_videos": 20,
+                "window_minutes": BASELINE_WINDOW_MINUTES,
+                "early_window_minutes": 60,
+                "since": as_of - timedelta(hours=INTRADAY_RAW_HOURS),
+            },
+        )
+        db.execute(
+            text(REBUILD_COOCCURRENCE_SQL),
+            {"until": db.execute(text("SELECT CAST(NOW() AS TIMESTAMP)")).scalar(), "window_days": None},
+        )
+
+    def _analyze() -> None:
+        for table in BENCH_TABLES:
+            db.execute(text(f"ANALYZE {table}"))
+
+    _step("reset", _reset)
+    _step("channels", _channels)
+    _step("videos", _videos)
+    _step("tags", _tags)
+    _step("snapshots", _snapshots)
+    _step("rollups", _rollups)
+    _step("analyze", _analyze)
+
+    if aggregate:
+        # category_trend / keyword_trend 를 읽는 조회도 측정할 수 있도록 한 번 집계해 둔다.
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db.get_bind())
+        _step(
+            "aggregate",
+            lambda: TrendAggregationUseCase(ContentRepositoryImpl(db), session_factory=session_factory).aggregate(
+                as_of=as_of
+            ),
+        )
+
+    return {
+        "videos": videos,
+        "channels": channels,
+        "days": days,
+        "tags": tags,
+        "seed": seed,
+        "as_of": as_of.isoformat(),
+        "timings": timings,
+    }
@@ -0,0 +1,178 @@
+"""
+커넥션 풀 계측.
+
+엔진마다 InstrumentedQueuePool(비동기 엔진은 InstrumentedAsyncAdaptedQueuePool)을 poolclass 로 지정하면
+pool_logging_name 별로 다음 값을 모은다. 풀은 dispose 시 recreate 되지만 logging_name 이 유지되므로
+같은 PoolMetrics 에 계속 쌓인다.
+
+- 체크아웃 대기 시간 히스토그램 (pre-ping / 신규 커넥션 생성 시간 포함)
+- 풀 타임아웃 횟수
+- 체크아웃 위치(우리 코드의 파일:라인 함수) 별 누적 횟수와 현재 점유 중인 커넥션 수
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 대기 시간 히스토그램 버킷 상한 (ms). 마지막 버킷은 그 이상 전부.
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_THIS_FILE = os.path.abspath(__file__)
+_SESSION_FILE = os.path.join(os.path.dirname(_THIS_FILE), "session.py")
+
+TRACK_CHECKOUT_SITES = os.getenv("DB_POOL_TRACK_CHECKOUT_SITES", "true").lower() == "true"
+
+
+def _project_site(frame) -> str | None:
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith("<"):
+            filename = os.path.abspath(filename)
+            if (
+                filename.startswith(_PROJECT_ROOT)
+                and filename not in (_THIS_FILE, _SESSION_FILE)
+                and "site-packages" not in filename
+            ):
+                return f"{os.path.relpath(filename, _PROJECT_ROOT)}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _checkout_site() -> str:
+    """
+    커넥션을 요청한 우리 코드 위치를 찾는다. SQLAlchemy / 표준 라이브러리 / 이 모듈 프레임은 건너뛴다.
+    비동기 엔진은 greenlet 안에서 체크아웃하므로, 현재 스택에 없으면 await 한 쪽(부모 greenlet) 스택을 본다.
+    """
+    site = _project_site(sys._getframe(2))
+    if site is None:
+        try:
+            from greenlet import getcurrent
+        except ImportError:
+            return "<unknown>"
+        parent = getcurrent().parent
+        if parent is not None:
+            site = _project_site(parent.gr_frame)
+    return site or "<unknown>"
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_count = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.timeouts = 0
+        self.checkout_sites: Counter = Counter()
+        self._active_sites: dict[int, str] = {}
+
+    def record_wait(self, elapsed_ms: float) -> None:
+        index = len(WAIT_BUCKETS_MS)
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.wait_buckets[index] += 1
+            self.wait_count += 1
+            self.wait_total_ms += elapsed_ms
+            self.wait_max_ms = max(self.wait_max_ms, elapsed_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def record_checkout(self, record, site: str) -> None:
+        with self._lock:
+            self.checkout_sites[site] += 1
+            self._active_sites[id(record)] = site
+
+    def record_checkin(self, record) -> None:
+        with self._lock:
+            self._active_sites.pop(id(record), None)
+
+    def snapshot(self, top_sites: int = 20) -> dict:
+        with self._lock:
+            histogram = {
+                f"le_{bound}ms": count for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)
+            }
+            histogram[f"gt_{WAIT_BUCKETS_MS[-1]}ms"] = self.wait_buckets[-1]
+            return {
+                "wait_histogram": histogram,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": round(self.wait_total_ms / self.wait_count, 3) if self.wait_count else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "timeouts": self.timeouts,
+                "active_sites": dict(Counter(self._active_sites.values()).most_common(top_sites)),
+                "checkout_sites": dict(self.checkout_sites.most_common(top_sites)),
+            }
+
+
+_registry: dict[str, PoolMetrics] = {}
+_registry_lock = threading.Lock()
+
+
+def get_pool_metrics(name: str) -> PoolMetrics:
+    with _registry_lock:
+        metrics = _registry.get(name)
+        if metrics is None:
+            metrics = _registry[name] = PoolMetrics(name)
+        return metrics
+
+
+class _InstrumentedPoolMixin:
+    """
+    connect() 에서 대기 시간/체크아웃 위치를, _do_return_conn() 에서 반환을 기록한다.
+    """
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        return get_pool_metrics(self._orig_logging_name or "default")
+
+    def connect(self):
+        site = _checkout_site() if TRACK_CHECKOUT_SITES else "<untracked>"
+        start = time.perf_counter()
+        try:
+            fairy = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.record_wait((time.perf_counter() - start) * 1000.0)
+        self.metrics.record_checkout(fairy._connection_record, site)
+        return fairy
+
+    def _do_return_conn(self, record) -> None:
+        self.metrics.record_checkin(record)
+        super()._do_return_conn(record)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(pool, settings: dict) -> dict:
+    """
+    풀의 현재 상태(크기/점유/오버플로)와 누적 계측 값을 합쳐 반환한다.
+    """
+    status = {
+        "settings": settings,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+    if isinstance(pool, _InstrumentedPoolMixin):
+        status.update(pool.metrics.snapshot())
+    return status
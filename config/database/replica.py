@@ -0,0 +1,141 @@
+"""
+읽기 전용 복제본(read replica) 라우팅 보조.
+
+복제본 지연을 주기적으로 측정해 캐시하고, 지연이 한도를 넘거나 측정에 실패하면 조회를 primary 로 돌린다.
+직전에 쓴 데이터를 곧바로 읽어야 하는 흐름(배치의 스냅샷 적재 -> 집계 등)은 primary 의 WAL 위치(LSN)를
+기록해 두고, 복제본이 그 위치까지 재생했을 때만 복제본을 쓴다.
+"""
+
+import os
+import threading
+import time
+
+from sqlalchemy import text
+
+# 이 값보다 지연이 크면 복제본 대신 primary 에서 읽는다.
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "30"))
+# 지연 측정 결과를 재사용하는 시간. 요청마다 복제본에 측정 쿼리를 보내지 않도록 한다.
+REPLICA_LAG_CHECK_INTERVAL_SECONDS = float(os.getenv("DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS", "10"))
+
+# 재생할 WAL 이 남아 있지 않으면(수신 LSN == 재생 LSN) 마지막 트랜잭션 이후 시간이 흘러도 지연은 0 이다.
+# 복제본이 아닌 서버(pg_is_in_recovery() = false)를 가리키면 항상 0.
+REPLICA_LAG_SQL = """
+    SELECT
+        pg_is_in_recovery() AS in_recovery,
+        CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(EXTRACT(EPOCH FROM (NOW() - pg_last_xact_replay_timestamp())), 0)
+        END AS lag_seconds
+"""
+
+CURRENT_WAL_LSN_SQL = "SELECT CAST(pg_current_wal_lsn() AS TEXT)"
+
+REPLAYED_UP_TO_SQL = """
+    SELECT NOT pg_is_in_recovery() OR COALESCE(pg_last_wal_replay_lsn() >= CAST(:lsn AS pg_lsn), false)
+"""
+
+
+class ReplicaLagMonitor:
+    def __init__(
+        self,
+        max_lag_seconds: float = REPLICA_MAX_LAG_SECONDS,
+        check_interval_seconds: float = REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+    ):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._lock = threading.Lock()
+        self.lag_seconds: float | None = None
+        self.in_recovery: bool | None = None
+        self.last_error: str | None = None
+        self.checked_at: float | None = None
+        self.fallback_count = 0
+
+    def claim_check(self) -> bool:
+        """
+        측정 주기가 지났으면 True 를 반환하고 측정 시각을 먼저 갱신해, 동시에 들어온 다른 호출은 캐시를 쓰게 한다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.checked_at is not None and now - self.checked_at < self.check_interval_seconds:
+                return False
+            self.checked_at = now
+            return True
+
+    def _record(self, row=None, error: Exception | None = None) -> None:
+        with self._lock:
+            self.checked_at = time.monotonic()
+            if error is not None:
+                self.lag_seconds = None
+                self.last_error = str(error)
+                return
+            self.in_recovery = bool(row["in_recovery"])
+            self.lag_seconds = float(row["lag_seconds"] or 0)
+            self.last_error = None
+
+    def measure(self, engine) -> None:
+        try:
+            with engine.connect() as conn:
+                row = conn.execute(text(REPLICA_LAG_SQL)).mappings().one()
+        except Exception as exc:
+            self._record(error=exc)
+            return
+        self._record(row)
+
+    async def ameasure(self, async_engine) -> None:
+        try:
+            async with async_engine.connect() as conn:
+                row = (await conn.execute(text(REPLICA_LAG_SQL))).mappings().one()
+        except Exception as exc:
+            self._record(error=exc)
+            return
+        self._record(row)
+
+    def usable(self) -> bool:
+        """
+        마지막 측정 기준으로 복제본에서 읽어도 되는지. 측정 실패/한도 초과면 False.
+        """
+        lag = self.lag_seconds
+        return lag is not None and lag <= self.max_lag_seconds
+
+    def record_fallback(self) -> None:
+        with self._lock:
+            self.fallback_count += 1
+
+    def status(self) -> dict:
+        checked_ago = None if self.checked_at is None else round(time.monotonic() - self.checked_at, 1)
+        return {
+            "lag_seconds": None if self.lag_seconds is None else round(self.lag_seconds, 3),
+            "max_lag_seconds": self.max_lag_seconds,
+            "in_recovery": self.in_recovery,
+            "healthy": self.usable(),
+            "checked_seconds_ago": checked_ago,
+            "last_error": self.last_error,
+            "fallback_count": self.fallback_count,
+        }
+
+
+def current_wal_lsn(db) -> str:
+    """
+    primary 의 현재 WAL 위치. 쓰기를 commit 한 직후에 호출하면 그 쓰기를 포함하는 위치가 된다.
+    """
+    return db.execute(text(CURRENT_WAL_LSN_SQL)).scalar()
+
+
+def wait_for_replay(engine, lsn: str, timeout_seconds: float, poll_seconds: float = 0.5) -> bool:
+    """
+    복제본이 lsn 까지 재생할 때까지 기다린다. timeout 안에 따라잡지 못하거나 조회에 실패하면 False.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        try:
+            with engine.connect() as conn:
+                if conn.execute(text(REPLAYED_UP_TO_SQL), {"lsn": lsn}).scalar():
+                    return True
+        except Exception as exc:
+            print(f"[DB-REPLICA] replay check failed: {exc}")
+            return False
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_seconds)
+
@@ -3,8 +3,16 @@ import urllib.parse
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from config.database.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    pool_status,
+)
+from config.database.replica import ReplicaLagMonitor, wait_for_replay
+
 load_dotenv()
 
 # Uses SQL_* env vars provided (e.g., Supabase): SQL_USER, SQL_PASSWORD, SQL_HOST, SQL_PORT, SQL_DATABASE
@@ -16,15 +24,124 @@ DATABASE_URL = (
     f"@{os.getenv('SQL_HOST','localhost')}:{os.getenv('SQL_PORT','5432')}/{os.getenv('SQL_DATABASE','apple_mango')}"
 )
 
+
+def _pool_settings(prefix: str = "") -> dict:
+    """
+    커넥션 풀 설정을 환경변수에서 읽는다.
+    - 공통: DB_POOL_SIZE(5), DB_MAX_OVERFLOW(10), DB_POOL_TIMEOUT(30초), DB_POOL_RECYCLE(300초), DB_POOL_PRE_PING(true)
+    - prefix 가 있으면 {prefix}DB_POOL_SIZE 처럼 prefix 를 붙인 값이 우선하고, 없으면 공통 값을 쓴다.
+    - pre-ping 을 끄면 체크아웃마다 SELECT 1 왕복이 없어지는 대신 끊어진 커넥션은 recycle 주기에만 걸러진다.
+    """
+
+    def _get(name: str, default: str) -> str:
+        return os.getenv(f"{prefix}{name}") or os.getenv(name) or default
+
+    return {
+        "pool_size": int(_get("DB_POOL_SIZE", "5")),
+        "max_overflow": int(_get("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(_get("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(_get("DB_POOL_RECYCLE", "300")),
+        "pool_pre_ping": _get("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+
+
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() == "true"
+
+# 한국어 주석: API 요청 경로와 배치가 같은 풀을 나눠 쓰면 배치가 커넥션을 오래 잡고 있을 때
+# 요청이 pool_timeout 까지 대기하므로, 배치 전용 엔진(BATCH_DB_* 설정)을 따로 둡니다.
+API_POOL_SETTINGS = _pool_settings()
+BATCH_POOL_SETTINGS = _pool_settings("BATCH_")
+
 engine = create_engine(
     DATABASE_URL,
-    echo=os.getenv("SQL_ECHO", "false").lower() == "true",
-    pool_pre_ping=True,
-    pool_recycle= 300,  # 5분마다 재사용
+    echo=SQL_ECHO,
+    poolclass=InstrumentedQueuePool,
+    pool_logging_name="api",
+    **API_POOL_SETTINGS,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+batch_engine = create_engine(
+    DATABASE_URL,
+    echo=SQL_ECHO,
+    poolclass=InstrumentedQueuePool,
+    pool_logging_name="batch",
+    **BATCH_POOL_SETTINGS,
+)
+
+BatchSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=batch_engine)
+
+# 한국어 주석: FastAPI 요청 경로는 이벤트 루프를 막지 않도록 asyncpg 기반 비동기 엔진을 사용합니다.
+# 배치 스크립트는 배치 전용 동기 엔진(BatchSessionLocal)을 사용합니다.
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=SQL_ECHO,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    pool_logging_name="api_async",
+    **API_POOL_SETTINGS,
+    # Supabase pooler(pgbouncer, transaction mode)에서는 prepared statement 캐시를 쓸 수 없으므로 끈다.
+    connect_args={"statement_cache_size": 0},
+)
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+def _replica_database_url() -> str | None:
+    """
+    읽기 전용 복제본 접속 URL. SQL_REPLICA_HOST 가 없으면 None (복제본 미사용).
+    나머지 SQL_REPLICA_USER / PASSWORD / PORT / DATABASE 는 없으면 primary(SQL_*) 값을 따른다.
+    """
+    host = os.getenv("SQL_REPLICA_HOST")
+    if not host:
+        return None
+
+    def _get(name: str, default: str) -> str:
+        return os.getenv(f"SQL_REPLICA_{name}") or os.getenv(f"SQL_{name}", default)
+
+    replica_password = urllib.parse.quote_plus(_get("PASSWORD", ""))
+    return (
+        f"postgresql+psycopg2://{_get('USER', 'postgres')}:{replica_password}"
+        f"@{host}:{_get('PORT', '5432')}/{_get('DATABASE', 'apple_mango')}"
+    )
+
+
+# 한국어 주석: 무거운 조회(트렌드 목록, 급등 랭킹, 집계 스캔)는 읽기 전용 복제본으로 보내 배치 upsert 와
+# 같은 서버 자원을 두고 경쟁하지 않게 합니다. 쓰기와 쓰고 바로 읽는 흐름(수집 응답 등)은 primary 에 남깁니다.
+# 복제본을 설정하지 않으면 조회용 세션도 기존 엔진을 그대로 씁니다.
+REPLICA_DATABASE_URL = _replica_database_url()
+REPLICA_ENABLED = REPLICA_DATABASE_URL is not None
+REPLICA_POOL_SETTINGS = _pool_settings("REPLICA_")
+# 방금 쓴 데이터를 복제본에서 읽기 전에 복제본이 따라잡기를 기다리는 최대 시간
+REPLICA_CATCHUP_TIMEOUT_SECONDS = float(os.getenv("DB_REPLICA_CATCHUP_TIMEOUT_SECONDS", "30"))
+
+if REPLICA_ENABLED:
+    replica_engine = create_engine(
+        REPLICA_DATABASE_URL,
+        echo=SQL_ECHO,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name="replica",
+        **REPLICA_POOL_SETTINGS,
+    )
+    async_replica_engine = create_async_engine(
+        REPLICA_DATABASE_URL.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1),
+        echo=SQL_ECHO,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_logging_name="replica_async",
+        **REPLICA_POOL_SETTINGS,
+        connect_args={"statement_cache_size": 0},
+    )
+else:
+    replica_engine = batch_engine
+    async_replica_engine = async_engine
+
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+AsyncReplicaSessionLocal = async_sessionmaker(bind=async_replica_engine, autoflush=False, expire_on_commit=False)
+
+replica_lag_monitor = ReplicaLagMonitor()
+
 Base = declarative_base()
 
 
@@ -32,6 +149,106 @@ def get_db_session():
     return SessionLocal()
 
 
+def get_db():
+    """
+    FastAPI 의존성: 요청 단위 동기 세션.
+    - 요청 처리 성공 시 commit, 예외 시 rollback 후 커넥션을 풀에 반환한다.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """
+    FastAPI 의존성: 요청 단위 비동기 세션.
+    - 요청마다 새 세션을 열어 동시 요청 간에 세션 상태를 공유하지 않는다.
+    - 요청 처리 성공 시 commit, 예외 시 rollback 후 커넥션을 풀에 반환한다.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+def get_read_session_factory(after_lsn: str | None = None) -> sessionmaker:
+    """
+    배치 조회용 세션 팩토리. 복제본이 있고 지연이 DB_REPLICA_MAX_LAG_SECONDS 이내면 복제본, 아니면 BatchSessionLocal.
+    - after_lsn: 직전에 commit 한 쓰기의 WAL 위치(current_wal_lsn). 복제본이 이 위치까지 재생할 때까지
+      DB_REPLICA_CATCHUP_TIMEOUT_SECONDS 동안 기다리고, 못 따라잡으면 primary 에서 읽는다.
+    """
+    if not REPLICA_ENABLED:
+        return BatchSessionLocal
+    if after_lsn is not None:
+        if wait_for_replay(replica_engine, after_lsn, REPLICA_CATCHUP_TIMEOUT_SECONDS):
+            return ReplicaSessionLocal
+    else:
+        if replica_lag_monitor.claim_check():
+            replica_lag_monitor.measure(replica_engine)
+        if replica_lag_monitor.usable():
+            return ReplicaSessionLocal
+    replica_lag_monitor.record_fallback()
+    return BatchSessionLocal
+
+
+async def get_async_read_session_factory() -> async_sessionmaker:
+    """
+    요청 경로 조회용 비동기 세션 팩토리. 복제본 지연이 한도를 넘거나 측정에 실패하면 AsyncSessionLocal(primary).
+    """
+    if not REPLICA_ENABLED:
+        return AsyncSessionLocal
+    if replica_lag_monitor.claim_check():
+        await replica_lag_monitor.ameasure(async_replica_engine)
+    if replica_lag_monitor.usable():
+        return AsyncReplicaSessionLocal
+    replica_lag_monitor.record_fallback()
+    return AsyncSessionLocal
+
+
+async def get_async_read_db():
+    """
+    FastAPI 의존성: 요청 단위 조회 전용 비동기 세션(복제본 우선).
+    - 쓰기는 이 세션으로 하지 않는다. 조회 중 쓰기가 필요한 경로는 get_async_db 세션을 함께 받는다.
+    """
+    session_factory = await get_async_read_session_factory()
+    async with session_factory() as session:
+        yield session
+
+
+def get_pool_status() -> dict:
+    """
+    엔진별 커넥션 풀 상태와 계측 값(/health/db-pool 응답).
+    """
+    status = {
+        "api": pool_status(engine.pool, API_POOL_SETTINGS),
+        "api_async": pool_status(async_engine.sync_engine.pool, API_POOL_SETTINGS),
+        "batch": pool_status(batch_engine.pool, BATCH_POOL_SETTINGS),
+    }
+    if REPLICA_ENABLED:
+        status["replica"] = pool_status(replica_engine.pool, REPLICA_POOL_SETTINGS)
+        status["replica_async"] = pool_status(async_replica_engine.sync_engine.pool, REPLICA_POOL_SETTINGS)
+    return status
+
+
+def get_replica_status() -> dict:
+    """
+    복제본 지연 상태(/health/db-replica 응답). 호출 시 지연을 다시 측정한다.
+    """
+    if not REPLICA_ENABLED:
+        return {"enabled": False}
+    replica_lag_monitor.measure(replica_engine)
+    return {"enabled": True, **replica_lag_monitor.status()}
+
+
 def init_db_schema():
     """
     애플리케이션 기동 시 테이블이 없을 경우를 대비해 스키마를 생성합니다.
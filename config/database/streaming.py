@@ -0,0 +1,46 @@
+"""
+서버 측 커서(server-side cursor)로 큰 조회 결과를 나눠 읽는 도구.
+
+psycopg2 의 기본 커서는 결과 전체를 클라이언트로 받은 뒤에 첫 행을 돌려준다. yield_per 를 주면 이름 있는 커서
+(DECLARE ... CURSOR)를 열고 fetch size 만큼씩 가져오므로, 결과 크기와 관계없이 메모리에 올라오는 행은 chunk 하나다.
+
+- 커서는 그 트랜잭션 안에서만 유효하다. 같은 세션에서 commit/rollback 하면 커서가 닫히므로,
+  읽으면서 쓰고 commit 하는 배치는 읽기 세션과 쓰기 세션을 나눈다.
+- fetch size 는 DB_STREAM_FETCH_SIZE (기본 2000). 행이 작은 조회는 키워 왕복을 줄이고, 행이 큰 조회는 줄인다.
+"""
+
+import os
+from typing import Any, Iterator, Mapping
+
+from sqlalchemy import text
+
+DB_STREAM_FETCH_SIZE = int(os.getenv("DB_STREAM_FETCH_SIZE", "2000"))
+
+
+def stream_chunks(
+    db,
+    statement,
+    params: Mapping[str, Any] | None = None,
+    fetch_size: int | None = None,
+    mappings: bool = True,
+) -> Iterator[list]:
+    """
+    statement(SQL 문자열 또는 text())의 결과를 fetch_size 행씩 나눠 yield 한다.
+    - mappings=True 면 행을 컬럼 이름으로 읽는 RowMapping, False 면 튜플처럼 읽는 Row 목록이다.
+    - 끝까지 읽지 않고 멈춰도 커서를 닫는다.
+    """
+    size = max(fetch_size or DB_STREAM_FETCH_SIZE, 1)
+    stmt = text(statement) if isinstance(statement, str) else statement
+    result = db.execute(stmt, dict(params or {}), execution_options={"yield_per": size})
+    try:
+        source = result.mappings() if mappings else result
+        for chunk in source.partitions(size):
+            yield chunk
+    finally:
+        result.close()
+
+
+def stream_rows(db, statement, params: Mapping[str, Any] | None = None, fetch_size: int | None = None) -> Iterator:
+    """stream_chunks 를 행 단위로 펼친 RowMapping 이터레이터."""
+    for chunk in stream_chunks(db, statement, params, fetch_size):
+        yield from chunk
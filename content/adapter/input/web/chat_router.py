@@ -4,14 +4,14 @@ from typing import Literal
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
-from openai import OpenAI
+from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
 
+from config.database.session import get_async_read_session_factory
 from config.settings import OpenAISettings
 from content.application.usecase.stopword_usecase import StopwordUseCase
 from content.application.usecase.trend_chat_usecase import TrendChatUseCase
-from content.application.usecase.trend_featured_usecase import TrendFeaturedUseCase
-from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+from content.infrastructure.repository.async_content_repository_impl import AsyncContentRepositoryImpl
 from content.infrastructure.repository.stopword_repository_impl import StopwordRepositoryImpl
 from content.utils.embedding import EmbeddingService, cosine_similarity
 
@@ -35,10 +35,9 @@ class ChatRequest(BaseModel):
 
 chat_router = APIRouter(tags=["chat"])
 
-repository = ContentRepositoryImpl()
-featured_usecase = TrendFeaturedUseCase(repository)
 stopword_usecase = StopwordUseCase(StopwordRepositoryImpl.getInstance(), lang="ko")
 embedding_service = EmbeddingService(OpenAISettings())
+# OpenAI 클라이언트를 가진 트렌드 챗 유스케이스는 첫 트렌드 질문에서 한 번만 만들어 공유한다.
 trend_chat_usecase: TrendChatUseCase | None = None
 _prototype_embeds: dict[str, list[float]] = {}
 
@@ -107,9 +106,13 @@ def _classify_intent_by_embedding(text: str) -> Literal["trend"] | None:
 
 
 def _get_trend_chat_usecase(settings: OpenAISettings) -> TrendChatUseCase:
+    """
+    트렌드 챗 유스케이스(OpenAI/임베딩 클라이언트)를 처음 한 번만 만든다.
+    DB 세션에 묶인 저장소는 answer_with_trends 호출마다 넘긴다.
+    """
     global trend_chat_usecase
     if trend_chat_usecase is None:
-        trend_chat_usecase = TrendChatUseCase(featured_usecase, settings=settings)
+        trend_chat_usecase = TrendChatUseCase(settings=settings, embedding_service=embedding_service)
     return trend_chat_usecase
 
 
@@ -123,7 +126,8 @@ async def chat_stream(request_body: ChatRequest, request: Request):
     if not settings.api_key:
         raise HTTPException(status_code=500, detail="OPENAI_API_KEY is not configured")
 
-    intent = _classify_intent(request_body.messages)
+    # 불용어 조회/임베딩은 동기 I/O 이므로 스레드에서 실행한다.
+    intent = await asyncio.to_thread(_classify_intent, request_body.messages)
     user_messages = [{"role": m.role, "content": m.content} for m in request_body.messages]
 
     # 일반 챗 모델 이름 기본값
@@ -137,28 +141,33 @@ async def chat_stream(request_body: ChatRequest, request: Request):
             stream = None
 
             if intent == "trend":
-                usecase = _get_trend_chat_usecase(settings)
-                stream, relevant = usecase.answer_with_trends(
-                    user_messages=user_messages,
-                    popular_limit=request_body.popular_limit,
-                    rising_limit=request_body.rising_limit,
-                    velocity_days=request_body.velocity_days,
-                    platform=request_body.platform,
-                )
+                # 스트리밍 응답은 의존성 종료 이후에도 이어지므로 세션을 제너레이터 안에서 직접 연다.
+                # DB 조회는 answer_with_trends 안에서 끝나므로 토큰 스트리밍 전에 커넥션을 반납한다.
+                session_factory = await get_async_read_session_factory()
+                async with session_factory() as session:
+                    stream, relevant = await _get_trend_chat_usecase(settings).answer_with_trends(
+                        repository=AsyncContentRepositoryImpl(session),
+                        user_messages=user_messages,
+                        popular_limit=request_body.popular_limit,
+                        rising_limit=request_body.rising_limit,
+                        velocity_days=request_body.velocity_days,
+                        platform=request_body.platform,
+                    )
+                    await session.commit()
                 yield f"data: {json.dumps({'videos' : relevant}, ensure_ascii=False)}\n\n"
                 # data = f"data: {json.dumps({'content': reply, 'relevant': relevant}, ensure_ascii=False)}\n\n"
                 # yield data
                 # yield "data: [DONE]\n\n"
                 # return
             else:
-                client = OpenAI(api_key=settings.api_key)
-                stream = client.chat.completions.create(
+                client = AsyncOpenAI(api_key=settings.api_key)
+                stream = await client.chat.completions.create(
                     model=model,
                     messages=user_messages,
                     stream=True,
                 )
 
-            for chunk in stream:
+            async for chunk in stream:
                 if await request.is_disconnected():
                     break
 
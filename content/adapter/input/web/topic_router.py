@@ -1,14 +1,20 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from config.database.session import get_async_read_db
 from content.application.usecase.topic_query_usecase import TopicQueryUseCase
-from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+from content.infrastructure.repository.async_content_repository_impl import AsyncContentRepositoryImpl
+from content.utils.cursor import InvalidCursorError
 
 topic_router = APIRouter(tags=["topics"])
 
-# 조회 전용 유스케이스/리포지토리 인스턴스
-repository = ContentRepositoryImpl()
-usecase = TopicQueryUseCase(repository)
+
+# ---- 의존성 주입용 팩토리 ----
+def get_topic_query_usecase(read_db: AsyncSession = Depends(get_async_read_db)) -> TopicQueryUseCase:
+    # 조회 전용 유스케이스: 요청마다 조회용(복제본 우선) 세션을 주입받아 생성한다.
+    return TopicQueryUseCase(AsyncContentRepositoryImpl(read_db))
 
 
 @topic_router.get("/category/{category}")
@@ -16,14 +22,22 @@ async def get_topics_by_category(
     category: str,
     limit_videos: int = Query(default=20, ge=1, le=100),
     limit_keywords: int = Query(default=10, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor (영상 목록 다음 페이지)"),
+    usecase: TopicQueryUseCase = Depends(get_topic_query_usecase),
 ):
     """
     카테고리 기반으로 상위 콘텐츠와 주요 키워드를 조회한다.
+    - 영상 목록은 next_cursor 를 cursor 로 넘겨 이어서 조회한다. (마지막 페이지면 next_cursor 는 null)
     """
-    result = usecase.query_by_category(category, limit_videos=limit_videos, limit_keywords=limit_keywords)
-    if not result["videos"]:
+    try:
+        result = await usecase.query_by_category(
+            category, limit_videos=limit_videos, limit_keywords=limit_keywords, cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not result["videos"] and cursor is None:
         raise HTTPException(status_code=404, detail="일치하는 카테고리가 없거나 데이터가 없습니다.")
-    return JSONResponse(result)
+    return JSONResponse(jsonable_encoder(result))
 
 
 @topic_router.get("/keyword/{keyword}")
@@ -31,22 +45,33 @@ async def get_topics_by_keyword(
     keyword: str,
     limit_videos: int = Query(default=20, ge=1, le=100),
     limit_keywords: int = Query(default=10, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor (영상 목록 다음 페이지)"),
+    usecase: TopicQueryUseCase = Depends(get_topic_query_usecase),
 ):
     """
     키워드 기반으로 상위 콘텐츠와 연관 키워드를 조회한다.
+    - 영상 목록은 next_cursor 를 cursor 로 넘겨 이어서 조회한다. (마지막 페이지면 next_cursor 는 null)
     """
-    result = usecase.query_by_keyword(keyword, limit_videos=limit_videos, limit_keywords=limit_keywords)
-    if not result["videos"]:
+    try:
+        result = await usecase.query_by_keyword(
+            keyword, limit_videos=limit_videos, limit_keywords=limit_keywords, cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not result["videos"] and cursor is None:
         raise HTTPException(status_code=404, detail="일치하는 키워드가 없거나 데이터가 없습니다.")
-    return JSONResponse(result)
+    return JSONResponse(jsonable_encoder(result))
 
 
 @topic_router.get("/video/{video_id}")
-async def get_video_detail(video_id: str):
+async def get_video_detail(
+    video_id: str,
+    usecase: TopicQueryUseCase = Depends(get_topic_query_usecase),
+):
     """
     콘텐츠 단건 상세(점수/키워드 포함)를 조회한다.
     """
-    result = usecase.get_video_detail(video_id)
+    result = await usecase.get_video_detail(video_id)
     if not result:
         raise HTTPException(status_code=404, detail="해당 영상이 없습니다.")
-    return JSONResponse(result)
+    return JSONResponse(jsonable_encoder(result))
@@ -1,10 +1,10 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.settings import OpenAISettings
-from content.application.usecase.trend_featured_usecase import TrendFeaturedUseCase
+from config.database.session import get_async_read_db
 from content.application.usecase.trend_chat_usecase import TrendChatUseCase
-from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+from content.infrastructure.repository.async_content_repository_impl import AsyncContentRepositoryImpl
 
 
 class TrendChatMessage(BaseModel):
@@ -26,20 +26,35 @@ class TrendChatResponse(BaseModel):
 
 trend_chat_router = APIRouter(tags=["chat-trend"])
 
-repository = ContentRepositoryImpl()
-featured_usecase = TrendFeaturedUseCase(repository)
-trend_chat_usecase = TrendChatUseCase(featured_usecase)
+
+# OpenAI/임베딩 클라이언트를 가진 유스케이스는 첫 요청에서 한 번만 만들어 공유하고, DB 세션은 요청마다 주입받는다.
+# (OPENAI_API_KEY 가 없을 때 import 시점이 아니라 요청에서 오류가 나도록 지연 생성한다)
+trend_chat_usecase: TrendChatUseCase | None = None
+
+
+# ---- 의존성 주입용 팩토리 ----
+def get_trend_chat_usecase() -> TrendChatUseCase:
+    global trend_chat_usecase
+    if trend_chat_usecase is None:
+        trend_chat_usecase = TrendChatUseCase()
+    return trend_chat_usecase
+
+
+def get_trend_chat_repository(read_db: AsyncSession = Depends(get_async_read_db)) -> AsyncContentRepositoryImpl:
+    return AsyncContentRepositoryImpl(read_db)
 
 
 @trend_chat_router.post("/chat/trends", response_model=TrendChatResponse)
 async def chat_with_trends(
     request: TrendChatRequest,
+    repository: AsyncContentRepositoryImpl = Depends(get_trend_chat_repository),
 ):
     """
     트렌드 데이터를 컨텍스트로 주입해 답변하는 전용 챗 엔드포인트.
     """
     try:
-        result = trend_chat_usecase.answer_with_trends(
+        result = await get_trend_chat_usecase().answer_with_trends(
+            repository=repository,
             user_messages=[m.model_dump() for m in request.messages],
             popular_limit=request.popular_limit,
             rising_limit=request.rising_limit,
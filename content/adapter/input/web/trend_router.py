@@ -1,28 +1,44 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from config.database.session import get_async_db, get_async_read_db
 from content.application.usecase.trend_query_usecase import TrendQueryUseCase
 from content.application.usecase.trend_featured_usecase import TrendFeaturedUseCase
-from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+from content.infrastructure.repository.async_content_repository_impl import AsyncContentRepositoryImpl
+from content.utils.cursor import InvalidCursorError
+from content.utils.embedding import EmbeddingService
 
 trend_router = APIRouter(tags=["trends"])
 
-# 트렌드 탭 전용 조회용 유즈케이스/리포지토리 싱글턴
-repository = ContentRepositoryImpl()
-usecase = TrendQueryUseCase(repository)
-featured_usecase = TrendFeaturedUseCase(repository)
+# 임베딩 클라이언트는 상태가 없으므로 공유하고, DB 세션은 요청마다 주입받는다.
+embedding_service = EmbeddingService()
+
+
+# ---- 의존성 주입용 팩토리 ----
+# 조회는 복제본 우선 세션(get_async_read_db)으로 보내고, 급등 랭킹의 trend_score 저장만 primary 세션을 쓴다.
+def get_trend_query_usecase(
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
+) -> TrendQueryUseCase:
+    return TrendQueryUseCase(AsyncContentRepositoryImpl(db, read_session=read_db))
+
+
+def get_trend_featured_usecase(read_db: AsyncSession = Depends(get_async_read_db)) -> TrendFeaturedUseCase:
+    return TrendFeaturedUseCase(AsyncContentRepositoryImpl(read_db), embedding_service=embedding_service)
 
 
 @trend_router.get("/categories/hot")
 async def get_hot_categories(
     limit: int = Query(default=20, ge=1, le=100),
     platform: str | None = Query(default=None, description="플랫폼 필터 (예: youtube)"),
+    usecase: TrendQueryUseCase = Depends(get_trend_query_usecase),
 ):
     """
     카테고리별 최신 집계(랭킹 순) 리스트를 조회한다.
     """
-    result = usecase.get_hot_categories(platform=platform, limit=limit)
+    result = await usecase.get_hot_categories(platform=platform, limit=limit)
     if not result:
         raise HTTPException(status_code=404, detail="집계된 카테고리 트렌드가 없습니다.")
     # datetime/date 등이 JSON 직렬화 오류를 내지 않도록 변환
@@ -35,26 +51,35 @@ async def get_category_recommendations(
     limit: int = Query(default=20, ge=1, le=100),
     days: int = Query(default=14, ge=1, le=90, description="최근 N일 내 수집본만 대상으로 추천"),
     platform: str | None = Query(default=None, description="플랫폼 필터 (예: youtube)"),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
+    usecase: TrendQueryUseCase = Depends(get_trend_query_usecase),
 ):
     """
     카테고리 문자열(category) 기준 추천 콘텐츠(점수/신선도 기반)를 조회한다.
     - 예: /trends/categories/게임/recommendations?limit=20&days=14&platform=youtube
+    - 다음 페이지는 응답의 next_cursor 를 cursor 로 넘겨 조회한다. (마지막 페이지면 next_cursor 는 null)
     """
-    items = usecase.get_recommended_contents(
-        category=category, limit=limit, days=days, platform=platform
-    )
-    if not items:
+    try:
+        items, next_cursor = await usecase.get_recommended_contents(
+            category=category, limit=limit, days=days, platform=platform, cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not items and cursor is None:
         raise HTTPException(status_code=404, detail="추천 가능한 콘텐츠가 없습니다.")
     # datetime/date 등이 JSON 직렬화 오류를 내지 않도록 변환
-    return JSONResponse(jsonable_encoder({"category": category, "items": items}))
+    return JSONResponse(jsonable_encoder({"category": category, "items": items, "next_cursor": next_cursor}))
 
 
 @trend_router.get("/categories")
-async def list_categories(limit: int = Query(default=100, ge=1, le=500)):
+async def list_categories(
+    limit: int = Query(default=100, ge=1, le=500),
+    usecase: TrendQueryUseCase = Depends(get_trend_query_usecase),
+):
     """
     관심사 등록용 카테고리 목록을 조회한다.
     """
-    categories = usecase.get_categories(limit=limit)
+    categories = await usecase.get_categories(limit=limit)
     if not categories:
         raise HTTPException(status_code=404, detail="등록된 카테고리가 없습니다.")
     return JSONResponse(jsonable_encoder({"categories": categories}))
@@ -66,25 +91,34 @@ async def get_videos_by_category_id(
     limit: int = Query(default=20, ge=1, le=100),
     days: int = Query(default=14, ge=1, le=90, description="최근 N일 내 게시된 영상만 대상"),
     platform: str | None = Query(default=None, description="플랫폼 필터 (예: youtube)"),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
+    usecase: TrendQueryUseCase = Depends(get_trend_query_usecase),
 ):
     """
     category_id 기준으로 최근 N일 내 영상 리스트를 조회한다.
 
     - 요청 예시:
       /trends/menu?category_id=20&limit=20&days=14&platform=youtube
+      /trends/menu?category_id=20&limit=20&days=14&platform=youtube&cursor=<next_cursor>
 
     - 응답:
-      { "category_id": 20, "items": [ { video_id, title, ... }, ... ] }
+      { "category_id": 20, "items": [ { video_id, title, ... }, ... ], "next_cursor": "..." | null }
     """
-    items = usecase.get_videos_by_category_id(
-        category_id=category_id,
-        limit=limit,
-        days=days,
-        platform=platform,
-    )
-    if not items:
+    try:
+        items, next_cursor = await usecase.get_videos_by_category_id(
+            category_id=category_id,
+            limit=limit,
+            days=days,
+            platform=platform,
+            cursor=cursor,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not items and cursor is None:
         raise HTTPException(status_code=404, detail="해당 카테고리의 영상이 없습니다.")
-    return JSONResponse(jsonable_encoder({"category_id": category_id, "items": items}))
+    return JSONResponse(
+        jsonable_encoder({"category_id": category_id, "items": items, "next_cursor": next_cursor})
+    )
 
 
 @trend_router.get("/videos/surge")
@@ -98,6 +132,8 @@ async def get_surge_videos(
         description="단기 증가량/증가율 비교 기준 일수 (예: N일 전과 비교)",
     ),
     platform: str | None = Query(default=None, description="플랫폼 필터 (예: youtube)"),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
+    usecase: TrendQueryUseCase = Depends(get_trend_query_usecase),
 ):
     """
     급등(스파이크) 영상 랭킹 리스트를 조회한다.
@@ -106,17 +142,22 @@ async def get_surge_videos(
       /trends/videos/surge?platform=youtube&limit=20&days=3&velocity_days=1
 
     - 응답:
-      { "items": [ { video_id, title, channel_id, view_count, ... }, ... ] }
+      { "items": [ { video_id, title, channel_id, view_count, ... }, ... ], "next_cursor": "..." | null }
+    - 다음 페이지는 같은 필터에 cursor=<next_cursor> 를 붙여 조회한다. trending_rank 는 페이지를 넘어 이어진다.
     """
-    items = usecase.get_surge_videos(
-        platform=platform,
-        limit=limit,
-        days=days,
-        velocity_days=velocity_days,
-    )
-    if not items:
+    try:
+        items, next_cursor = await usecase.get_surge_videos(
+            platform=platform,
+            limit=limit,
+            days=days,
+            velocity_days=velocity_days,
+            cursor=cursor,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not items and cursor is None:
         raise HTTPException(status_code=404, detail="급등 영상이 없습니다.")
-    return JSONResponse(jsonable_encoder({"items": items}))
+    return JSONResponse(jsonable_encoder({"items": items, "next_cursor": next_cursor}))
 
 
 @trend_router.get("/videos/{video_id}/view_history")
@@ -129,6 +170,7 @@ async def get_video_view_history(
         le=365,
         description="조회수 히스토리를 조회할 최대 일수 (미지정 시 전체)",
     ),
+    usecase: TrendQueryUseCase = Depends(get_trend_query_usecase),
 ):
     """
     특정 영상의 일자별(view_count, like_count, comment_count) 히스토리를 조회한다.
@@ -147,7 +189,7 @@ async def get_video_view_history(
       ]
     }
     """
-    items = usecase.get_video_view_history(
+    items = await usecase.get_video_view_history(
         video_id=video_id,
         platform=platform,
         limit=limit,
@@ -184,6 +226,7 @@ async def get_featured_trends(
     rising_limit: int = Query(default=5, ge=1, le=20),
     velocity_days: int = Query(default=1, ge=1, le=7),
     platform: str | None = Query(default=None, description="플랫폼 필터 (예: youtube)"),
+    featured_usecase: TrendFeaturedUseCase = Depends(get_trend_featured_usecase),
 ):
     """
     인기(Popular)와 급상승(Rising) 후보를 분리해 반환한다.
@@ -191,7 +234,7 @@ async def get_featured_trends(
     - Rising: 최근 증가량(velocity_days 기준) 상위 rising_limit
     - categories: 최신 카테고리 트렌드 상위 5
     """
-    result = featured_usecase.get_featured(
+    result = await featured_usecase.get_featured(
         limit_popular=popular_limit,
         limit_rising=rising_limit,
         velocity_days=velocity_days,
@@ -207,6 +250,7 @@ async def get_video_snapshot_history(
     video_id: str,
     days: int = Query(default=7, ge=1, le=30, description="최근 N일간의 스냅샷 히스토리"),
     platform: str = Query(default="youtube", description="플랫폼 (기본: youtube)"),
+    usecase: TrendQueryUseCase = Depends(get_trend_query_usecase),
 ):
     """
     특정 영상의 스냅샷 히스토리를 조회하여 추이 차트 데이터를 제공한다.
@@ -218,7 +262,7 @@ async def get_video_snapshot_history(
     - 응답:
       { "items": [ { snapshot_date, view_count, like_count, comment_count, daily_*_increase }, ... ] }
     """
-    items = usecase.get_video_snapshot_history(
+    items = await usecase.get_video_snapshot_history(
         video_id=video_id,
         platform=platform,
         days=days,
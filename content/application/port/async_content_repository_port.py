@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from typing import Any, Mapping
+
+
+class AsyncContentRepositoryPort(ABC):
+    """
+    FastAPI 요청 경로 전용 비동기 조회 포트.
+    ContentRepositoryPort 의 조회 메서드와 동일한 시그니처를 await 가능한 형태로 제공한다.
+    """
+
+    @abstractmethod
+    async def fetch_videos_by_category(
+        self, category: str, limit: int = 20, after: Mapping[str, Any] | None = None
+    ) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_videos_by_keyword(
+        self, keyword: str, limit: int = 20, after: Mapping[str, Any] | None = None
+    ) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_top_keywords_by_category(self, category: str, limit: int = 10) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_top_keywords_by_keyword(self, keyword: str, limit: int = 10) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_video_with_scores(self, video_id: str) -> dict | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_hot_category_trends(self, platform: str | None = None, limit: int = 20) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_popular_videos(self, limit: int = 5, platform: str | None = None) -> list[dict]:
+        """절대 인기 상위"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_rising_videos(
+        self, limit: int = 5, velocity_days: int = 1, platform: str | None = None
+    ) -> list[dict]:
+        """최근 증가량/가속도 기반 상위"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_recommended_videos_by_category(
+        self,
+        category: str,
+        limit: int = 20,
+        days: int = 14,
+        platform: str | None = None,
+        after: Mapping[str, Any] | None = None,
+    ) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_distinct_categories(self, limit: int = 100) -> list[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_surge_videos(
+        self,
+        platform: str | None = None,
+        limit: int = 30,
+        days: int = 3,
+        velocity_days: int = 1,
+        after: Mapping[str, Any] | None = None,
+    ) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_video_snapshot_history(
+        self, video_id: str, platform: str = "youtube", days: int = 7
+    ) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_videos_by_category_id(
+        self,
+        category_id: int,
+        limit: int = 10,
+        platform: str | None = None,
+        days: int | None = None,
+        after: Mapping[str, Any] | None = None,
+    ) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_video_view_history(
+        self,
+        video_id: str,
+        platform: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        raise NotImplementedError
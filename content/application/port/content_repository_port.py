@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from datetime import date, datetime
+from typing import Any, Iterable, Mapping
 
 from content.domain.channel import Channel
+from content.domain.channel_stats import ChannelStats
 from content.domain.comment_sentiment import CommentSentiment
 from content.domain.crawl_log import CrawlLog
 from content.domain.creator_account import CreatorAccount
@@ -13,6 +15,7 @@ from content.domain.video_comment import VideoComment
 from content.domain.video_score import VideoScore
 from content.domain.video_sentiment import VideoSentiment
 from content.domain.video_metrics_snapshot import VideoMetricsSnapshot
+from content.domain.view_sample import ViewSample
 
 
 class ContentRepositoryPort(ABC):
@@ -28,6 +31,14 @@ class ContentRepositoryPort(ABC):
     def upsert_video(self, video: Video) -> Video:
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert_videos(self, videos: Iterable[Video]) -> list[Video]:
+        """
+        여러 영상을 한 번의 set 기반 upsert로 적재한다.
+        정적 메타데이터는 최초 삽입 시에만, 변동성 필드는 매번 갱신한다.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def upsert_comments(self, comments: Iterable[VideoComment]) -> None:
         raise NotImplementedError
@@ -36,6 +47,10 @@ class ContentRepositoryPort(ABC):
     def upsert_video_sentiment(self, sentiment: VideoSentiment) -> VideoSentiment:
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert_video_sentiments(self, sentiments: Iterable[VideoSentiment]) -> list[VideoSentiment]:
+        raise NotImplementedError
+
     @abstractmethod
     def upsert_comment_sentiments(self, sentiments: Iterable[CommentSentiment]) -> None:
         raise NotImplementedError
@@ -48,14 +63,73 @@ class ContentRepositoryPort(ABC):
     def upsert_category_trend(self, trend: CategoryTrend) -> CategoryTrend:
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert_keyword_trends(
+        self,
+        as_of: date,
+        trends: Iterable[KeywordTrend],
+        platform: str | None = None,
+        replace: bool = False,
+        removed: Iterable[tuple[str, str]] = (),
+    ) -> int:
+        """
+        as_of 일자의 키워드 순위를 한 트랜잭션에서 일괄 저장한다. 조회 측은 저장 전/후 순위 중 하나만 본다.
+        - replace=True: as_of(platform 이 있으면 그 플랫폼)의 기존 행 중 trends 에 없는 행을 지운다.
+        - removed: 함께 지울 (keyword, platform) 키
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_category_trends(
+        self,
+        as_of: date,
+        trends: Iterable[CategoryTrend],
+        platform: str | None = None,
+        replace: bool = False,
+        removed: Iterable[tuple[str, str]] = (),
+    ) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     def upsert_keyword_mapping(self, mapping: KeywordMapping) -> KeywordMapping:
         raise NotImplementedError
 
+    @abstractmethod
+    def replace_keyword_mappings(
+        self,
+        video_id: str,
+        keywords: Iterable[str],
+        channel_id: str | None = None,
+        platform: str = "youtube",
+        weight: float = 1.0,
+    ) -> int:
+        """
+        한 영상의 키워드 매핑 전체를 새 키워드 집합으로 교체한다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def replace_keyword_mappings_bulk(self, tag_sets: Mapping[str, Iterable[KeywordMapping]]) -> int:
+        """
+        여러 영상(video_id -> 새 키워드 매핑 목록)의 키워드 집합을 한 번에 교체한다.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def upsert_video_score(self, score: VideoScore) -> VideoScore:
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert_video_scores(self, scores: Iterable[VideoScore]) -> list[VideoScore]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_surge_scores(self, items: list[dict]) -> None:
+        """
+        fetch_surge_videos 결과의 surge_score 를 video_score.trend_score 에 반영한다.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def log_crawl(self, log: CrawlLog) -> CrawlLog:
         raise NotImplementedError
@@ -64,13 +138,44 @@ class ContentRepositoryPort(ABC):
     def upsert_video_metrics_snapshot(self, snapshot: VideoMetricsSnapshot) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def append_view_samples(self, videos: Iterable[Video], sampled_at: datetime | None = None) -> int:
+        """
+        수집한 영상의 현재 조회/좋아요/댓글 수를 video_metrics_intraday 표본으로 추가한다.
+        - 최근 게시 영상만 쌓이며, 추가된 표본 수를 반환한다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def compact_view_samples(self, now: datetime | None = None) -> dict:
+        """
+        오래된 intraday 표본을 시간당 하나로 줄이고, 보관 기간이 지난 표본을 지운다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_surge_features(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """
+        영상별 급등 피처를 video_surge_feature 에 덮어쓴다.
+        - rows: video_id, platform, computed_at 과 SurgeFeatures 필드를 담은 dict
+        - 기록한 영상 수를 반환한다.
+        """
+        raise NotImplementedError
+
     # 조회 전용 메서드들
     @abstractmethod
-    def fetch_videos_by_category(self, category: str, limit: int = 20) -> list[dict]:
+    def fetch_videos_by_category(
+        self, category: str, limit: int = 20, after: Mapping[str, Any] | None = None
+    ) -> list[dict]:
+        """
+        after 는 이전 페이지 마지막 행의 커서(decode_cursor 결과)이며, 각 행은 자신의 커서를 "cursor" 키에 담아 반환한다.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    def fetch_videos_by_keyword(self, keyword: str, limit: int = 20) -> list[dict]:
+    def fetch_videos_by_keyword(
+        self, keyword: str, limit: int = 20, after: Mapping[str, Any] | None = None
+    ) -> list[dict]:
         raise NotImplementedError
 
     @abstractmethod
@@ -101,10 +206,16 @@ class ContentRepositoryPort(ABC):
 
     @abstractmethod
     def fetch_recommended_videos_by_category(
-        self, category: str, limit: int = 20, days: int = 14, platform: str | None = None
+        self,
+        category: str,
+        limit: int = 20,
+        days: int = 14,
+        platform: str | None = None,
+        after: Mapping[str, Any] | None = None,
     ) -> list[dict]:
         """
         카테고리 문자열(category) 기준으로 최근 N일 내 추천 영상을 조회한다.
+        - after: 이전 페이지 마지막 행의 커서. 각 행은 자신의 커서를 "cursor" 키에 담아 반환한다.
         """
         raise NotImplementedError
 
@@ -119,12 +230,16 @@ class ContentRepositoryPort(ABC):
         limit: int = 30,
         days: int = 3,
         velocity_days: int = 1,
+        after: Mapping[str, Any] | None = None,
+        save_scores: bool = True,
     ) -> list[dict]:
         """
         단기 조회수 증가량/증가율을 기준으로 급등 영상 랭킹 리스트를 조회한다.
 
         - days: 최근 N일 내 업로드/수집된 영상만 대상
         - velocity_days: 이전 스냅샷 기준 일수 (예: 1일 전과 비교)
+        - after: 이전 페이지 마지막 행의 커서. 각 행은 자신의 커서를 "cursor" 키에 담아 반환한다.
+        - save_scores: True 면 계산한 surge_score 를 save_surge_scores 로 함께 저장한다.
         """
         raise NotImplementedError
 
@@ -144,10 +259,12 @@ class ContentRepositoryPort(ABC):
         limit: int = 10,
         platform: str | None = None,
         days: int | None = None,
+        after: Mapping[str, Any] | None = None,
     ) -> list[dict]:
         """
         YouTube category_id 기준으로 상위 영상 리스트를 조회한다.
         - days: 최근 N일 내 게시된 영상만 대상 (None이면 전체)
+        - after: 이전 페이지 마지막 행의 커서. 각 행은 자신의 커서를 "cursor" 키에 담아 반환한다.
         """
         raise NotImplementedError
 
@@ -162,4 +279,31 @@ class ContentRepositoryPort(ABC):
         video_metrics_snapshot 기준으로 단일 영상의 일자별(view_count, like_count, comment_count) 히스토리를 조회한다.
         - snapshot_date 내림차순으로 정렬
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_channel_stats(self, channel_ids: Iterable[str]) -> list[ChannelStats]:
+        """
+        channel_stats 롤업에서 채널별 통계(평균/중앙값 조회수, 초기 조회 속도 베이스라인)를 조회한다.
+        - 아직 집계되지 않은 채널은 결과에서 빠진다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_view_samples(
+        self, video_ids: Iterable[str], since: datetime | None = None
+    ) -> dict[str, list[ViewSample]]:
+        """
+        여러 영상의 intraday 조회수 표본을 한 번에 조회해 video_id 별 시간 오름차순 ViewSample 목록으로 반환한다.
+        - since: 이 시각 이후 표본만 (None 이면 보관 중인 전체)
+        - 표본이 없는 영상은 결과에서 빠진다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_co_movement_scores(self, video_ids: Iterable[str]) -> dict[str, float]:
+        """
+        video_co_movement 에서 여러 영상의 동시 상승 점수를 한 번에 조회한다.
+        - 최근 계산에서 점수가 매겨지지 않은 영상은 결과에서 빠진다.
+        """
+        raise NotImplementedError
@@ -0,0 +1,282 @@
+"""
+키워드/카테고리 단위 동시 상승(트렌드 웨이브) 점수 엔진.
+
+같은 키워드나 카테고리로 묶인 영상들의 단기 조회 속도가 함께 오르내리는 정도를 영상마다 점수로 만든다.
+SurgeFeatures.co_movement_score 의 입력이며, app/batch/co_movement_batch.py 가 주기적으로 계산해 video_co_movement 에 쓴다.
+
+1. 속도 행렬: 최근 window 분을 bucket 분 간격 경계로 나누고, 경계 시각의 조회수를 앞뒤 표본으로 선형 보간해
+   구간별 조회 속도(조회수/분)를 만든다. 영상 n 개 x 구간 K 개 행렬이다. 표본 범위 밖의 경계는 비워 둔다.
+2. 정규화: 영상마다 유효 구간의 평균을 빼고 L2 노름으로 나눈다. 비어 있는 구간은 0(평균)으로 채운다.
+   이렇게 만든 두 벡터의 내적이 피어슨 상관계수다. 유효 구간이 min_points 보다 적거나 속도가 일정한 영상은 뺀다.
+3. 그룹 상관: 그룹 g 의 벡터 합을 S_g 라 하면, 영상 i 와 "나머지 구성원 합" S_g - z_i 의 상관은
+   (z_i·S_g - 1) / sqrt(|S_g|^2 - 2 z_i·S_g + 1) 이다. 그룹 합과 소속마다의 내적 한 번으로 전체 쌍을 계산한다.
+4. 영상 점수: 속한 그룹들의 상관을 그룹 크기의 로그로 가중 평균한다. 작은 그룹의 우연한 상관에 덜 끌려간다.
+
+모든 계산은 영상/소속 수에 비례하는 배열 연산이므로 영상 수만 개도 CPU 하나에서 1초 안에 끝난다.
+(python -m benchmarks co_movement)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Optional
+
+import numpy as np
+
+from config.database.streaming import stream_chunks
+from content.infrastructure.repository.co_movement_sql import CO_MOVEMENT_INPUT_SQL
+
+_US_PER_MINUTE = 60 * 10**6
+_EPOCH = datetime(1970, 1, 1)
+
+
+def velocity_matrix(
+    video_index: np.ndarray,
+    timestamps: np.ndarray,
+    view_counts: np.ndarray,
+    n_videos: int,
+    *,
+    anchor: Optional[int] = None,
+    window_minutes: int = 360,
+    bucket_minutes: int = 30,
+) -> np.ndarray:
+    """
+    영상별 구간 조회 속도 행렬 (n_videos x window_minutes // bucket_minutes). 값이 없는 구간은 NaN.
+
+    - video_index / timestamps(epoch 마이크로초 정수) / view_counts: 표본 하나당 한 원소인 평탄 배열.
+      (영상, 시각) 순이면 정렬을 건너뛴다. 같은 영상에 같은 시각 표본이 두 번 있으면 안 된다.
+    - anchor: 마지막 경계 시각(epoch 마이크로초). 없으면 전체 표본의 마지막 시각.
+      수집 배치가 같은 시각으로 표본을 쌓으므로 마지막 수집 시각에 경계를 맞춘다.
+    """
+    buckets = window_minutes // bucket_minutes
+    if buckets < 1:
+        raise ValueError("window_minutes 는 bucket_minutes 이상이어야 합니다.")
+    vi = np.asarray(video_index, dtype=np.int64)
+    ts = np.asarray(timestamps, dtype=np.int64)
+    views = np.asarray(view_counts, dtype=np.float64)
+    if not (len(vi) == len(ts) == len(views)):
+        raise ValueError("video_index / timestamps / view_counts 의 길이가 다릅니다.")
+    if not len(vi):
+        return np.full((n_videos, buckets), np.nan)
+    if vi.min() < 0 or vi.max() >= n_videos:
+        raise ValueError("video_index 는 0 이상 n_videos 미만이어야 합니다.")
+
+    # (영상, 시각) 을 int64 키 하나로 합친다. (compute_surge_features_batch 와 같은 방식)
+    anchor = int(ts.max()) if anchor is None else int(anchor)
+    origin = int(ts.min())
+    stride = max(int(ts.max()), anchor) - origin + 2
+    if stride * n_videos >= 2**62:
+        raise ValueError("표본 시각 범위가 너무 넓습니다. window 근처 표본만 넘겨 주세요.")
+    keys = vi * stride + (ts - origin)
+    if np.any(keys[1:] < keys[:-1]):
+        order = np.argsort(keys, kind="stable")
+        keys, ts, views = keys[order], ts[order], views[order]
+
+    counts = np.bincount(vi, minlength=n_videos)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    has = counts > 0
+    first_ts = ts[np.where(has, starts, 0)]
+    last_ts = ts[np.where(has, ends - 1, 0)]
+
+    # 경계 K+1 개에서 경계 이하 마지막 표본(pos)과 다음 표본(nxt) 사이를 선형 보간한다.
+    bounds = anchor - (buckets - np.arange(buckets + 1, dtype=np.int64)) * bucket_minutes * _US_PER_MINUTE
+    video_keys = np.arange(n_videos, dtype=np.int64)[:, None] * stride
+    pos = np.searchsorted(keys, video_keys + (bounds - origin)[None, :], side="right") - 1
+    valid = has[:, None] & (pos >= starts[:, None]) & (bounds[None, :] >= first_ts[:, None])
+    valid &= bounds[None, :] <= last_ts[:, None]
+    pos = np.where(valid, pos, 0)
+    nxt = np.minimum(pos + 1, np.maximum(ends - 1, 0)[:, None])
+    t0, t1 = ts[pos], ts[nxt]
+    v0, v1 = views[pos], views[nxt]
+    span = np.where(t1 > t0, t1 - t0, 1)
+    values = np.where(t1 > t0, v0 + (v1 - v0) * ((bounds[None, :] - t0) / span), v0)
+    values = np.where(valid, values, np.nan)
+    return np.diff(values, axis=1) / float(bucket_minutes)
+
+
+def normalize_rows(velocity: np.ndarray, min_points: int = 4) -> tuple[np.ndarray, np.ndarray]:
+    """
+    행마다 유효(NaN 이 아닌) 값의 평균을 빼고 L2 노름으로 나눈다. 비어 있는 칸은 0 이다.
+    반환: (정규화 행렬, 쓸 수 있는 행인지). 쓸 수 없는 행은 모두 0 이다.
+    """
+    valid = ~np.isnan(velocity)
+    points = valid.sum(axis=1)
+    filled = np.where(valid, velocity, 0.0)
+    mean = filled.sum(axis=1) / np.maximum(points, 1)
+    centered = np.where(valid, velocity - mean[:, None], 0.0)
+    norm = np.sqrt(np.einsum("ij,ij->i", centered, centered))
+    usable = (points >= max(min_points, 2)) & (norm > 0)
+    z = np.where(usable[:, None], centered / np.where(norm > 0, norm, 1.0)[:, None], 0.0)
+    return z, usable
+
+
+@dataclass
+class CoMovementScores:
+    """영상 n 개의 동시 상승 점수. 그룹이 없거나 계산할 수 없는 영상은 score/top_group_score 가 NaN, top_group 이 -1."""
+
+    score: np.ndarray
+    group_count: np.ndarray
+    top_group: np.ndarray
+    top_group_score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+
+def co_movement_scores(
+    z: np.ndarray,
+    usable: np.ndarray,
+    member_video: np.ndarray,
+    member_group: np.ndarray,
+    *,
+    min_group_size: int = 3,
+) -> CoMovementScores:
+    """
+    정규화 행렬 z 와 그룹 소속(member_video[i] 가 member_group[i] 에 속함)으로 영상별 점수를 계산한다.
+    같은 (영상, 그룹) 소속이 두 번 있으면 안 된다. 쓸 수 있는 구성원이 min_group_size 보다 적은 그룹은 건너뛴다.
+    """
+    n_videos = len(z)
+    mv = np.asarray(member_video, dtype=np.int64)
+    mg = np.asarray(member_group, dtype=np.int64)
+    keep = usable[mv]
+    mv, mg = mv[keep], mg[keep]
+
+    # 그룹 순으로 모아 그룹마다 한 구간이 되게 하고, 구간 합(reduceat)으로 S_g 를 만든다.
+    order = np.argsort(mg, kind="stable")
+    mv, mg = mv[order], mg[order]
+    if len(mg):
+        starts = np.flatnonzero(np.r_[True, mg[1:] != mg[:-1]])
+        sizes = np.diff(np.r_[starts, len(mg)])
+        segment = np.repeat(np.arange(len(starts)), sizes)
+        large = (sizes >= max(min_group_size, 2))[segment]
+        mv, mg = mv[large], mg[large]
+    if not len(mg):
+        empty = np.full(n_videos, np.nan)
+        return CoMovementScores(empty, np.zeros(n_videos, dtype=np.int64), np.full(n_videos, -1), empty.copy())
+
+    starts = np.flatnonzero(np.r_[True, mg[1:] != mg[:-1]])
+    sizes = np.diff(np.r_[starts, len(mg)])
+    segment = np.repeat(np.arange(len(starts)), sizes)
+    rows = z[mv]
+    sums = np.add.reduceat(rows, starts, axis=0)
+    sum_norm2 = np.einsum("ij,ij->i", sums, sums)[segment]
+    dot = np.einsum("ij,ij->i", rows, sums[segment])
+
+    # z_i 는 단위 벡터이므로 |S_g - z_i|^2 = |S_g|^2 - 2 z_i·S_g + 1
+    others_norm2 = sum_norm2 - 2.0 * dot + 1.0
+    defined = others_norm2 > 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.where(defined, (dot - 1.0) / np.sqrt(np.where(defined, others_norm2, 1.0)), np.nan)
+    corr = np.clip(corr, -1.0, 1.0)
+    mv, mg, corr = mv[defined], mg[defined], corr[defined]
+    weight = np.log(sizes[segment][defined].astype(np.float64))
+
+    group_count = np.bincount(mv, minlength=n_videos)
+    weight_sum = np.bincount(mv, weights=weight, minlength=n_videos)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = np.bincount(mv, weights=weight * corr, minlength=n_videos) / weight_sum
+    score = np.where(group_count > 0, score, np.nan)
+
+    # 영상별 상관이 가장 큰 그룹: (영상, 상관) 순으로 정렬해 영상마다 마지막 원소를 고른다.
+    top_group = np.full(n_videos, -1, dtype=np.int64)
+    top_group_score = np.full(n_videos, np.nan)
+    if len(mv):
+        order = np.lexsort((corr, mv))
+        last = order[np.r_[mv[order][1:] != mv[order][:-1], True]]
+        top_group[mv[last]] = mg[last]
+        top_group_score[mv[last]] = corr[last]
+    return CoMovementScores(score, group_count, top_group, top_group_score)
+
+
+class CoMovementEngine:
+    """
+    video_metrics_intraday / keyword_mapping / video_sentiment 를 한 번씩 읽어 영상별 동시 상승 점수를 계산한다.
+    """
+
+    def __init__(
+        self,
+        window_minutes: int = 360,
+        bucket_minutes: int = 30,
+        min_points: int = 4,
+        min_group_size: int = 3,
+    ):
+        self.window_minutes = window_minutes
+        self.bucket_minutes = bucket_minutes
+        self.min_points = min_points
+        self.min_group_size = min_group_size
+
+    def compute(self, db, now: Optional[datetime] = None) -> tuple[list[dict], dict]:
+        """
+        반환: (video_co_movement 에 쓸 행 목록, 요약)
+        - 경계는 now 이전 마지막 수집 시각에 맞춘다. 첫 경계 앞 한 구간의 표본까지 읽어 첫 경계를 보간한다.
+        """
+        now = now or datetime.utcnow()
+        since = now - timedelta(minutes=self.window_minutes + self.bucket_minutes)
+        video_ids, platforms, vi, ts, views, group_names, mv, mg = self._load(db, since, now)
+        n_videos = len(video_ids)
+        summary = {"videos": n_videos, "samples": int(len(ts)), "groups": len(group_names), "scored": 0}
+        if not n_videos or not len(ts):
+            return [], summary
+
+        velocity = velocity_matrix(
+            vi,
+            ts,
+            views,
+            n_videos,
+            window_minutes=self.window_minutes,
+            bucket_minutes=self.bucket_minutes,
+        )
+        z, usable = normalize_rows(velocity, self.min_points)
+        scores = co_movement_scores(z, usable, mv, mg, min_group_size=self.min_group_size)
+
+        rows = [
+            {
+                "video_id": video_ids[i],
+                "platform": platforms[i],
+                "score": float(scores.score[i]),
+                "group_count": int(scores.group_count[i]),
+                "top_group": group_names[scores.top_group[i]],
+                "top_group_score": float(scores.top_group_score[i]),
+            }
+            for i in np.flatnonzero(scores.group_count > 0).tolist()
+        ]
+        summary.update({"usable": int(usable.sum()), "scored": len(rows)})
+        return rows, summary
+
+    @staticmethod
+    def _load(db, since: datetime, now: datetime):
+        """
+        CO_MOVEMENT_INPUT_SQL 을 서버 측 커서로 읽어 평탄 배열로 펼친다. 영상 번호는 결과 행 순서다.
+        반환: (video_ids, platforms, 표본 영상 번호, 시각, 조회수, 그룹 이름, 소속 영상 번호, 소속 그룹 번호)
+        """
+        video_ids: list[str] = []
+        platforms: list[str] = []
+        sample_counts: list[int] = []
+        stamps: list[np.ndarray] = []
+        views: list[np.ndarray] = []
+        group_counts: list[int] = []
+        # 그룹 키는 길이가 제각각이라 고정 폭 문자열 배열(np.unique)로 만들면 메모리가 커서 dict 로 번호를 붙인다.
+        group_index: dict[str, int] = {}
+        member_groups: list[int] = []
+        until_us = int((now - _EPOCH) / timedelta(microseconds=1))
+        for chunk in stream_chunks(db, CO_MOVEMENT_INPUT_SQL, {"since": since}, mappings=False):
+            for video_id, platform, ts_us, view_counts, keys in chunk:
+                video_ids.append(video_id)
+                platforms.append(platform)
+                sample_counts.append(len(ts_us))
+                group_counts.append(len(keys))
+                member_groups.extend(group_index.setdefault(key, len(group_index)) for key in keys)
+            stamps.append(np.fromiter(chain.from_iterable(r[2] for r in chunk), dtype=np.int64))
+            views.append(np.fromiter(chain.from_iterable(r[3] for r in chunk), dtype=np.float64))
+
+        vi = np.repeat(np.arange(len(video_ids), dtype=np.int64), sample_counts)
+        ts = np.concatenate(stamps) if stamps else np.zeros(0, dtype=np.int64)
+        view_counts = np.concatenate(views) if views else np.zeros(0, dtype=np.float64)
+        # 실행 중에 들어온 표본은 다음 실행에서 쓴다.
+        current = ts <= until_us
+        vi, ts, view_counts = vi[current], ts[current], view_counts[current]
+
+        mv = np.repeat(np.arange(len(video_ids), dtype=np.int64), group_counts)
+        mg = np.array(member_groups, dtype=np.int64)
+        return video_ids, platforms, vi, ts, view_counts, list(group_index), mv, mg
@@ -64,37 +64,48 @@ class IngestionUseCase:
                 )
                 >= cutoff
             ]
-        ingested_videos: list[str] = []
-        ingested_comments: int = 0
-
         for video in videos:
             video.platform = client.platform
-            self._persist_video(video)
-            ingested_videos.append(video.video_id)
+        # 한국어 주석: 영상/감정/점수/댓글을 테이블별로 모아 한 번에 upsert 하여 행 단위 왕복을 없앱니다.
+        self._persist_videos(videos)
+        ingested_videos: list[str] = [video.video_id for video in videos]
+        ingested_comments: int = 0
 
-            if self.sentiment_usecase:
+        if self.sentiment_usecase:
+            video_sentiments: list[VideoSentiment] = []
+            scores: list[VideoScore] = []
+            for video in videos:
                 sentiment = self.sentiment_usecase.analyze_video(video)
                 sentiment.platform = client.platform
-                self.repository.upsert_video_sentiment(sentiment)
-                score = VideoScore(
-                    video_id=video.video_id,
-                    platform=client.platform,
-                    sentiment_score=sentiment.sentiment_score,
-                    trend_score=sentiment.trend_score,
+                video_sentiments.append(sentiment)
+                scores.append(
+                    VideoScore(
+                        video_id=video.video_id,
+                        platform=client.platform,
+                        sentiment_score=sentiment.sentiment_score,
+                        trend_score=sentiment.trend_score,
+                    )
                 )
-                self.repository.upsert_video_score(score)
+            self.repository.upsert_video_sentiments(video_sentiments)
+            self.repository.upsert_video_scores(scores)
 
-            if include_comments:
+        if include_comments:
+            all_comments: list[VideoComment] = []
+            comment_sentiments: list[CommentSentiment] = []
+            for video in videos:
                 comments = list(client.fetch_comments(video.video_id, max_results=max_comments))
                 for c in comments:
                     c.platform = client.platform
-                self.repository.upsert_comments(comments)
-                ingested_comments += len(comments)
+                all_comments.extend(comments)
                 if self.sentiment_usecase:
                     sentiments = self.sentiment_usecase.analyze_comments(comments)
                     for s in sentiments:
                         s.platform = client.platform
-                    self.repository.upsert_comment_sentiments(sentiments)
+                    comment_sentiments.extend(sentiments)
+            self.repository.upsert_comments(all_comments)
+            ingested_comments = len(all_comments)
+            if comment_sentiments:
+                self.repository.upsert_comment_sentiments(comment_sentiments)
 
         self.repository.log_crawl(
             CrawlLog(
@@ -174,23 +185,37 @@ class IngestionUseCase:
         return count
 
     def _persist_video(self, video: Video):
+        self._persist_videos([video])
+
+    def _persist_videos(self, videos: list[Video]):
         # 한국어 주석: 수집 시각이 비어 있으면 현재 시각으로 채워 윈도우 필터에서 제외되지 않게 합니다.
-        video.crawled_at = video.crawled_at or datetime.utcnow()
-        self.repository.upsert_video(video)
-        if not video.tags:
-            return
-        keywords = [tag.strip() for tag in video.tags.split(",") if tag.strip()]
-        for kw in keywords:
-            self.repository.upsert_keyword_mapping(
-                KeywordMapping(
-                    mapping_id=None,
-                    video_id=video.video_id,
-                    channel_id=video.channel_id,
-                    platform=video.platform,
-                    keyword=kw,
-                    weight=1.0,
-                )
+        for video in videos:
+            video.crawled_at = video.crawled_at or datetime.utcnow()
+        self.repository.upsert_videos(videos)
+        # 한국어 주석: 태그가 있는 영상만 키워드 집합을 통째로 교체합니다. (영상 수와 무관하게 한 번의 왕복)
+        tag_sets = {
+            video.video_id: self._to_keyword_mappings(video)
+            for video in videos
+            if video.tags
+        }
+        if tag_sets:
+            self.repository.replace_keyword_mappings_bulk(tag_sets)
+
+    @staticmethod
+    def _to_keyword_mappings(video: Video) -> list[KeywordMapping]:
+        """콤마로 구분된 video.tags 를 keyword_mapping 도메인 객체 목록으로 변환한다."""
+        keywords = [tag.strip() for tag in (video.tags or "").split(",") if tag.strip()]
+        return [
+            KeywordMapping(
+                mapping_id=None,
+                video_id=video.video_id,
+                channel_id=video.channel_id,
+                platform=video.platform,
+                keyword=kw,
+                weight=1.0,
             )
+            for kw in keywords
+        ]
 
     @staticmethod
     def _to_utc(dt: datetime | None) -> datetime | None:
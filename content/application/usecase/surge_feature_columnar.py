@@ -0,0 +1,224 @@
+"""
+급등 피처의 배치(컬럼형) 계산.
+
+compute_surge_features 는 영상마다 표본을 정렬하고, 윈도우 4개마다 _find_reference_view 로 표본을 처음부터 훑는다.
+여기서는 여러 영상의 표본을 (영상 번호, 시각, 조회수) 평탄 배열로 받아 한 번만 정렬하고, 윈도우 기준점을
+searchsorted 로 한꺼번에 찾는다. 결과는 SurgeFeatures 필드와 같은 이름의 컬럼 배열이며 값도 같다.
+
+- 시각은 마이크로초 정수(datetime64[us])로 다룬다. 경과 분은 timedelta.total_seconds() / 60 과 같은 순서로
+  나눠 float 값까지 같게 만든다.
+- 같은 시각의 표본이 여러 개면 입력 순서상 마지막 표본을 쓴다. (sorted 의 안정 정렬과 같다)
+- None 은 NaN 으로 들고 있다가 to_features 에서 None 으로 돌려준다.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from content.application.usecase.surge_feature_usecase import SurgeFeatures
+from content.domain.view_sample import ViewSample
+
+_US_PER_MINUTE = 60 * 10**6
+
+
+@dataclass
+class SurgeFeatureColumns:
+    """
+    영상 n 개의 급등 피처. 각 필드는 길이 n 의 float64 배열이고, 값이 없으면(None) NaN 이다.
+    필드 이름과 의미는 SurgeFeatures 와 같다.
+    """
+
+    delta_views_10m: np.ndarray
+    delta_views_30m: np.ndarray
+    delta_views_1h: np.ndarray
+    delta_views_6h: np.ndarray
+    growth_rate_10m: np.ndarray
+    growth_rate_30m: np.ndarray
+    growth_rate_1h: np.ndarray
+    growth_rate_6h: np.ndarray
+    acceleration_10m_vs_30m: np.ndarray
+    age_minutes: np.ndarray
+    age_hours: np.ndarray
+    baseline_velocity_10m_per_min: np.ndarray
+    velocity_10m_per_min: np.ndarray
+    ratio_velocity_10m_to_baseline: np.ndarray
+    co_movement_score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.delta_views_10m)
+
+    def feature(self, index: int) -> SurgeFeatures:
+        """index 번째 영상의 피처를 SurgeFeatures 로 꺼낸다."""
+        values = {}
+        for f in fields(self):
+            value = float(getattr(self, f.name)[index])
+            values[f.name] = None if np.isnan(value) else value
+        return SurgeFeatures(**values)
+
+    def to_features(self) -> list[SurgeFeatures]:
+        """전체 영상을 SurgeFeatures 목록으로 꺼낸다. 배열을 한 번에 파이썬 값으로 바꿔 영상마다 인덱싱하지 않는다."""
+        names = [f.name for f in fields(self)]
+        columns = [getattr(self, name).tolist() for name in names]
+        # NaN 은 자기 자신과 같지 않다.
+        return [
+            SurgeFeatures(**{name: (value if value == value else None) for name, value in zip(names, row)})
+            for row in zip(*columns)
+        ]
+
+
+def _optional_column(values, size: int) -> np.ndarray:
+    if values is None:
+        return np.full(size, np.nan)
+    column = np.asarray(values, dtype=np.float64)
+    if column.shape != (size,):
+        raise ValueError(f"영상 수({size})와 길이가 다른 입력입니다: {column.shape}")
+    return column
+
+
+def _microseconds(values) -> np.ndarray:
+    """datetime64 배열 또는 마이크로초 정수 배열을 int64 마이크로초로 맞춘다."""
+    column = np.asarray(values)
+    if np.issubdtype(column.dtype, np.datetime64):
+        return column.astype("datetime64[us]").astype(np.int64)
+    return column.astype(np.int64)
+
+
+def compute_surge_features_batch(
+    video_index: np.ndarray,
+    timestamps: np.ndarray,
+    view_counts: np.ndarray,
+    n_videos: int,
+    *,
+    published_at: Optional[np.ndarray] = None,
+    baseline_velocity_10m: Optional[np.ndarray] = None,
+    co_movement_score: Optional[np.ndarray] = None,
+    window_10m: int = 10,
+    window_30m: int = 30,
+    window_1h: int = 60,
+    window_6h: int = 360,
+) -> SurgeFeatureColumns:
+    """
+    여러 영상의 급등 피처를 한 번에 계산한다. compute_surge_features 를 영상마다 호출한 결과와 같다.
+
+    입력:
+        - video_index / timestamps / view_counts: 표본 하나당 한 원소인 평탄 배열.
+          video_index 는 0 ~ n_videos-1, timestamps 는 datetime64 또는 마이크로초 정수. 정렬돼 있지 않아도 된다.
+        - published_at: 영상별 업로드 시각 (datetime64, 없으면 NaT)
+        - baseline_velocity_10m: 영상별 채널 베이스라인 속도 (조회수/분, 없으면 NaN).
+          compute_surge_features 의 channel_baseline_velocities_10m 평균에 해당한다.
+        - co_movement_score: 영상별 동시성 점수 (없으면 NaN)
+    표본이 없는 영상은 모든 피처가 NaN 이다. (compute_surge_features 가 빈 SurgeFeatures 를 돌려주는 것과 같다)
+    """
+    vi = np.asarray(video_index, dtype=np.int64)
+    ts = _microseconds(timestamps)
+    views = np.asarray(view_counts, dtype=np.int64)
+    if not (len(vi) == len(ts) == len(views)):
+        raise ValueError("video_index / timestamps / view_counts 의 길이가 다릅니다.")
+    if not len(vi):
+        return SurgeFeatureColumns(**{f.name: np.full(n_videos, np.nan) for f in fields(SurgeFeatureColumns)})
+    if vi.min() < 0 or vi.max() >= n_videos:
+        raise ValueError("video_index 는 0 이상 n_videos 미만이어야 합니다.")
+
+    # (영상, 시각) 을 int64 키 하나로 합친다. 영상마다 시각 범위보다 넓은 stride 를 주면 키 순서가 (영상, 시각)
+    # 사전순과 같고, 윈도우 기준점도 같은 키 공간에서 searchsorted 한 번으로 찾는다.
+    # 영상 수 x stride 가 int64 를 넘을 만큼 시각 범위가 넓으면 시각을 순위로 줄여 키를 만든다.
+    origin = int(ts.min())
+    offsets = ts - origin
+    ranks = None
+    if (int(offsets.max()) + 2) * n_videos >= 2**62:
+        ranks = np.unique(offsets)
+        offsets = np.searchsorted(ranks, offsets)
+    stride = int(offsets.max()) + 2
+    keys = vi * stride + offsets
+
+    # 안정 정렬이므로 같은 시각의 표본은 입력 순서를 유지한다. 저장소에서 (video_id, ts) 순으로 읽은 입력은
+    # 이미 정렬돼 있어 정렬 비용이 거의 들지 않는다.
+    order = np.argsort(keys, kind="stable")
+    keys, ts, views = keys[order], ts[order], views[order]
+    counts = np.bincount(vi, minlength=n_videos)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    has = counts > 0
+    last = np.where(has, ends - 1, 0)
+    now = ts[last]
+    views_now = views[last]
+    video_keys = np.arange(n_videos, dtype=np.int64) * stride
+
+    windows = (window_10m, window_30m, window_1h, window_6h)
+    deltas: list[np.ndarray] = []
+    growths: list[np.ndarray] = []
+    velocities: list[np.ndarray] = []
+    for window in windows:
+        # now - window 이하인 마지막 표본 (_find_reference_view). 기준점이 영상의 첫 표본보다 이르면
+        # 앞 영상의 구간을 가리키게 되므로 found 에서 버린다.
+        target = now - origin - window * _US_PER_MINUTE
+        if ranks is not None:
+            target = np.searchsorted(ranks, target, side="right") - 1
+        pos = np.searchsorted(keys, video_keys + target, side="right") - 1
+        found = has & (pos >= starts)
+        prev = views[np.where(found, pos, 0)]
+
+        delta = (views_now - prev).astype(np.float64)
+        base = np.where(prev > 0, prev, 1).astype(np.float64)
+        deltas.append(np.where(found, delta, np.nan))
+        growths.append(np.where(found, delta / base, np.nan))
+        velocities.append(np.where(found, delta / max(float(window), 1.0), np.nan))
+
+    delta_10m, delta_30m, delta_1h, delta_6h = deltas
+    growth_10m, growth_30m, growth_1h, growth_6h = growths
+    velocity_10m = velocities[0]
+
+    age_minutes = np.full(n_videos, np.nan)
+    if published_at is not None:
+        published = np.asarray(published_at, dtype="datetime64[us]")
+        if published.shape != (n_videos,):
+            raise ValueError(f"영상 수({n_videos})와 길이가 다른 published_at 입니다: {published.shape}")
+        known = has & ~np.isnat(published)
+        # NaT(int64 최솟값)를 빼다 넘치지 않도록 모르는 영상은 now 로 채운 뒤 계산하고 버린다.
+        published_us = np.where(known, published.astype(np.int64), now)
+        age_minutes = np.where(known, np.maximum((now - published_us) / 10**6 / 60.0, 0.0), np.nan)
+
+    baseline = np.where(has, _optional_column(baseline_velocity_10m, n_videos), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(baseline > 0, velocity_10m / baseline, np.nan)
+
+    return SurgeFeatureColumns(
+        delta_views_10m=delta_10m,
+        delta_views_30m=delta_30m,
+        delta_views_1h=delta_1h,
+        delta_views_6h=delta_6h,
+        growth_rate_10m=growth_10m,
+        growth_rate_30m=growth_30m,
+        growth_rate_1h=growth_1h,
+        growth_rate_6h=growth_6h,
+        acceleration_10m_vs_30m=growth_10m - growth_30m,
+        age_minutes=age_minutes,
+        age_hours=age_minutes / 60.0,
+        baseline_velocity_10m_per_min=baseline,
+        velocity_10m_per_min=velocity_10m,
+        ratio_velocity_10m_to_baseline=ratio,
+        co_movement_score=np.where(has, _optional_column(co_movement_score, n_videos), np.nan),
+    )
+
+
+def flatten_samples(
+    video_ids: Sequence[str], samples_by_video: Mapping[str, Iterable[ViewSample]]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    video_id 별 ViewSample 목록을 compute_surge_features_batch 입력(영상 번호, 시각, 조회수)으로 펼친다.
+    영상 번호는 video_ids 의 위치다.
+    """
+    index: list[int] = []
+    stamps: list = []
+    views: list[int] = []
+    for i, video_id in enumerate(video_ids):
+        for sample in samples_by_video.get(video_id, ()):
+            index.append(i)
+            stamps.append(sample.timestamp)
+            views.append(sample.view_count)
+    return (
+        np.array(index, dtype=np.int64),
+        np.array(stamps, dtype="datetime64[us]"),
+        np.array(views, dtype=np.int64),
+    )
@@ -1,21 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from statistics import mean
-from typing import Iterable, List, Optional, Dict, Any
+from typing import Iterable, List, Mapping, Optional, Dict, Any
 
-
-@dataclass
-class ViewSample:
-    """
-    단일 시점의 조회수 측정값.
-
-    - 예: 크롤러가 1분/5분마다 수집한 view_count 스냅샷
-    """
-
-    timestamp: datetime
-    view_count: int
+from content.application.port.content_repository_port import ContentRepositoryPort
+from content.domain.view_sample import ViewSample
 
 
 @dataclass
@@ -104,6 +95,7 @@ def compute_surge_features(
         - co_movement_score:
             비슷한 키워드/해시태그/카테고리 군집 내에서
             동시에 오르는 정도를 외부 로직에서 계산해 주입.
+            (app/batch/co_movement_batch.py 가 계산해 video_co_movement 에 저장한다)
     """
     history = sorted(list(samples), key=lambda s: s.timestamp)
     if not history:
@@ -174,3 +166,68 @@ def compute_surge_features(
     )
 
 
+# 저장된 표본에서 가장 긴 윈도우(6시간)의 기준점을 찾을 수 있도록 윈도우보다 조금 더 앞에서부터 읽는다.
+SAMPLE_LOOKBACK_MINUTES = 360 + 60
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """표본 시각(naive UTC)과 비교할 수 있도록 timezone 이 있는 시각은 UTC 로 바꾼 뒤 tzinfo 를 뗀다."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class SurgeFeatureUseCase:
+    def __init__(self, repository: ContentRepositoryPort):
+        # 급등 피처 계산에 필요한 채널 베이스라인을 channel_stats 롤업에서 읽는다.
+        self.repository = repository
+
+    def compute_for_videos(
+        self,
+        videos: Iterable[Mapping[str, Any]],
+        samples_by_video: Optional[Mapping[str, Iterable[ViewSample]]] = None,
+        co_movement_scores: Optional[Mapping[str, float]] = None,
+    ) -> Dict[str, SurgeFeatures]:
+        """
+        여러 영상의 급등 피처를 한 번에 계산한다.
+
+        - videos: video_id, channel_id, published_at 을 가진 행
+        - samples_by_video: video_id 별 조회수 시계열. 없으면 video_metrics_intraday 에 쌓인 최근
+          SAMPLE_LOOKBACK_MINUTES 분의 표본을 대상 영상 전체에 대해 한 번에 읽는다.
+        - co_movement_scores: video_id 별 동시성 점수. 없으면 video_co_movement 에 저장된 최근 점수를 읽는다.
+
+        채널 베이스라인은 대상 채널들에 대해 channel_stats 를 한 번만 조회한다.
+        피처는 compute_surge_features_batch 로 전체 영상을 한 번에 계산한다. (영상별 compute_surge_features 와 같은 값)
+        """
+        # numpy 는 배치 계산에서만 쓰므로 사용할 때 가져온다.
+        from content.application.usecase.surge_feature_columnar import compute_surge_features_batch, flatten_samples
+
+        rows = list(videos)
+        video_ids = [r["video_id"] for r in rows]
+        if samples_by_video is None:
+            samples_by_video = self.repository.fetch_view_samples(
+                video_ids,
+                since=datetime.utcnow() - timedelta(minutes=SAMPLE_LOOKBACK_MINUTES),
+            )
+        if co_movement_scores is None:
+            co_movement_scores = self.repository.fetch_co_movement_scores(video_ids)
+        stats = {
+            s.channel_id: s
+            for s in self.repository.fetch_channel_stats(r.get("channel_id") for r in rows)
+        }
+        baselines = []
+        for row in rows:
+            channel = stats.get(row.get("channel_id"))
+            baselines.append(channel.baseline_early_velocity if channel is not None else None)
+
+        index, stamps, views = flatten_samples(video_ids, samples_by_video)
+        columns = compute_surge_features_batch(
+            index,
+            stamps,
+            views,
+            len(rows),
+            published_at=[_naive_utc(row.get("published_at")) for row in rows],
+            baseline_velocity_10m=baselines,
+            co_movement_score=[co_movement_scores.get(video_id) for video_id in video_ids],
+        )
+        return dict(zip(video_ids, columns.to_features()))
@@ -1,23 +1,35 @@
-from content.application.port.content_repository_port import ContentRepositoryPort
+from content.application.port.async_content_repository_port import AsyncContentRepositoryPort
+from content.utils.cursor import decode_cursor, paginate
 
 
 class TopicQueryUseCase:
-    def __init__(self, repository: ContentRepositoryPort):
+    def __init__(self, repository: AsyncContentRepositoryPort):
         # 카테고리/키워드 기반 조회를 담당하는 유스케이스
         self.repository = repository
 
-    def query_by_category(self, category: str, limit_videos: int = 20, limit_keywords: int = 10) -> dict:
-        videos = self.repository.fetch_videos_by_category(category, limit=limit_videos)
-        keywords = self.repository.fetch_top_keywords_by_category(category, limit=limit_keywords)
-        return {"category": category, "videos": videos, "keywords": keywords}#lee
+    async def query_by_category(
+        self, category: str, limit_videos: int = 20, limit_keywords: int = 10, cursor: str | None = None
+    ) -> dict:
+        # cursor 는 영상 목록에만 적용된다. 키워드는 페이지와 무관하게 상위 limit_keywords 개를 돌려준다.
+        rows = await self.repository.fetch_videos_by_category(
+            category, limit=limit_videos + 1, after=decode_cursor(cursor)
+        )
+        videos, next_cursor = paginate(rows, limit_videos)
+        keywords = await self.repository.fetch_top_keywords_by_category(category, limit=limit_keywords)
+        return {"category": category, "videos": videos, "keywords": keywords, "next_cursor": next_cursor}#lee
 
-    def query_by_keyword(self, keyword: str, limit_videos: int = 20, limit_keywords: int = 10) -> dict:
-        videos = self.repository.fetch_videos_by_keyword(keyword, limit=limit_videos)
-        keywords = self.repository.fetch_top_keywords_by_keyword(keyword, limit=limit_keywords)
-        return {"keyword": keyword, "videos": videos, "keywords": keywords}
+    async def query_by_keyword(
+        self, keyword: str, limit_videos: int = 20, limit_keywords: int = 10, cursor: str | None = None
+    ) -> dict:
+        rows = await self.repository.fetch_videos_by_keyword(
+            keyword, limit=limit_videos + 1, after=decode_cursor(cursor)
+        )
+        videos, next_cursor = paginate(rows, limit_videos)
+        keywords = await self.repository.fetch_top_keywords_by_keyword(keyword, limit=limit_keywords)
+        return {"keyword": keyword, "videos": videos, "keywords": keywords, "next_cursor": next_cursor}
 
-    def get_video_detail(self, video_id: str) -> dict | None:
+    async def get_video_detail(self, video_id: str) -> dict | None:
         """
         단일 콘텐츠 상세 조회를 제공한다.
         """
-        return self.repository.fetch_video_with_scores(video_id)
+        return await self.repository.fetch_video_with_scores(video_id)
@@ -1,6 +1,6 @@
 import os
 from collections import defaultdict
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from typing import Iterable, Optional
 
 from sqlalchemy import text
@@ -8,13 +8,63 @@ from sqlalchemy import text
 from content.application.port.content_repository_port import ContentRepositoryPort
 from content.domain.category_trend import CategoryTrend
 from content.domain.keyword_trend import KeywordTrend
+from content.infrastructure.repository.batch_watermark import get_watermark, set_watermark
+from content.infrastructure.repository.trend_aggregation_sql import (
+    AFFECTED_CATEGORIES_SQL,
+    AFFECTED_KEYWORDS_SQL,
+    CURR_SNAPSHOT_ANCHOR_SQL,
+    CURRENT_CATEGORY_TRENDS_SQL,
+    CURRENT_KEYWORD_TRENDS_SQL,
+    CURRENT_WINDOW_HAVING_SQL,
+    GROWTH_RATE_SQL,
+    HAS_CHANGED_VIDEOS_SQL,
+    PREV_SNAPSHOT_ANCHOR_SQL,
+    window_aggregates_sql,
+    window_bucket_join,
+    window_range_sql,
+    youtube_category_name_sql,
+)
+from content.infrastructure.repository.video_metrics_sql import latest_metrics_join, snapshot_as_of_join
 from config.database.session import SessionLocal
+from config.database.streaming import DB_STREAM_FETCH_SIZE, stream_rows
+
+WATERMARK_JOB = "trend_aggregation"
+
+# 전체 집계 엔진. sql: GROUP BY 를 DB 에서 수행, numpy: 윈도우를 컬럼 배열로 읽어 메모리에서 집계
+AGGREGATION_ENGINES = ("sql", "numpy")
+
+
+def _watermark_job(as_of: date, window_days: int, velocity_days: int, platform: str | None) -> str:
+    # 기준 일자나 윈도우가 바뀌면 집계 범위 자체가 달라지므로 조합마다 따로 watermark 를 둔다.
+    # 새 기준 일자의 첫 실행은 watermark 가 없어 전체 재계산이 된다.
+    return f"{WATERMARK_JOB}:{as_of.isoformat()}:{platform or 'all'}:w{window_days}:v{velocity_days}"
+
+
+def _upper_bound(db) -> datetime:
+    """
+    이번 실행에서 반영할 변경 시각 상한.
+    아직 commit 되지 않은 쓰기를 건너뛰지 않도록 현재 시각보다 약간 이전으로 잡는다.
+    """
+    safety_seconds = int(os.getenv("TREND_AGGREGATION_SAFETY_SECONDS", "60"))
+    now = db.execute(text("SELECT CAST(NOW() AS TIMESTAMP)")).scalar()
+    return now - timedelta(seconds=safety_seconds)
 
 
 class TrendAggregationUseCase:
-    def __init__(self, repository: ContentRepositoryPort, session_factory=SessionLocal):
+    def __init__(
+        self,
+        repository: ContentRepositoryPort,
+        session_factory=SessionLocal,
+        read_session_factory=None,
+        engine: str | None = None,
+    ):
+        # 집계 스캔은 read_session_factory(복제본)로 읽고, 결과 저장은 repository(primary)로 쓴다.
         self.repository = repository
         self.session_factory = session_factory
+        self.read_session_factory = read_session_factory or session_factory
+        self.engine = (engine or os.getenv("TREND_AGGREGATION_ENGINE", "sql")).strip().lower()
+        if self.engine not in AGGREGATION_ENGINES:
+            raise ValueError(f"지원하지 않는 트렌드 집계 엔진입니다: {self.engine}")
 
     def aggregate(
         self,
@@ -23,14 +73,19 @@ class TrendAggregationUseCase:
         velocity_days: Optional[int] = None,
         platform: str | None = None,
         surge_growth_threshold: float | None = None,
+        incremental: bool = False,
+        skip_unchanged: bool = True,
     ) -> dict:
         """
         - as_of: 기준 일자 (default: 오늘)
+        - incremental: True 면 같은 기준 일자의 직전 실행(watermark) 이후 바뀐 영상이 속한 키워드/카테고리만
+          다시 집계하고 해당 플랫폼 안에서 순위를 다시 매긴다. watermark 가 없으면 전체 집계 후 watermark 를 남긴다.
+          증분 재집계는 엔진 설정과 관계없이 SQL 로 한다. (영향받은 키만 인덱스로 읽는 편이 윈도우 전체 적재보다 싸다)
+        - skip_unchanged: 전체 집계도 watermark 이후 집계 입력이 바뀐 영상이 없으면 윈도우를 읽지 않고 건너뛴다.
+          (mode="skipped") 집계식이 바뀌어 같은 입력으로 다시 계산해야 하는 재집계(backfill)는 False 로 호출한다.
         """
         as_of = as_of or date.today()
         from_date = as_of - timedelta(days=window_days - 1)
-        prev_to = as_of - timedelta(days=window_days)
-        prev_from = prev_to - timedelta(days=window_days - 1)
 
         if velocity_days is None:
             try:
@@ -45,11 +100,39 @@ class TrendAggregationUseCase:
             except ValueError:
                 surge_threshold = 1.0
 
+        # 전체/증분 모두 같은 watermark 를 쓴다. 전체 집계가 남긴 watermark 에서 증분 집계를 이어갈 수 있다.
+        job_name = _watermark_job(as_of, window_days, velocity_days, platform)
         with self.session_factory() as db:
-            keyword_rows = self._aggregate_keywords(db, from_date, as_of, platform, velocity_days)
-            keyword_prev_rows = self._aggregate_keywords(db, prev_from, prev_to, platform, velocity_days)
-            category_rows = self._aggregate_categories(db, from_date, as_of, platform, velocity_days)
-            category_prev_rows = self._aggregate_categories(db, prev_from, prev_to, platform, velocity_days)
+            since = get_watermark(db, job_name)
+            until = _upper_bound(db)
+            unchanged = (
+                not incremental
+                and skip_unchanged
+                and since is not None
+                and (until <= since or not self._has_new_data(db, since, until, platform))
+            )
+        if unchanged:
+            return {
+                **self._result(as_of, [], [], [], [], surge_threshold),
+                "mode": "skipped",
+                "since": since.isoformat(),
+                "until": until.isoformat(),
+            }
+
+        if incremental and since is not None:
+            return self._aggregate_incremental(
+                as_of=as_of,
+                window_days=window_days,
+                velocity_days=velocity_days,
+                platform=platform,
+                surge_threshold=surge_threshold,
+                job_name=job_name,
+                since=since,
+                until=until,
+            )
+
+        with self.read_session_factory() as db:
+            keyword_ranked, category_ranked = self.compute_rankings(db, as_of, window_days, platform, velocity_days)
             top_trending_videos = self._select_trending_videos(
                 db=db,
                 from_date=from_date,
@@ -59,46 +142,178 @@ class TrendAggregationUseCase:
                 limit=int(os.getenv("TREND_TOP_ANALYSIS_LIMIT", "30")),
             )
 
-        keyword_rows = self._attach_growth(keyword_rows, keyword_prev_rows, key_fields=("keyword", "platform"))
-        category_rows = self._attach_growth(category_rows, category_prev_rows, key_fields=("category", "platform"))
-
-        keyword_ranked = self._apply_rank(keyword_rows)
-        category_ranked = self._apply_rank(category_rows)
-
-        for row in keyword_ranked:
-            trend = KeywordTrend(
-                keyword=row["keyword"],
-                date=as_of,
-                platform=row["platform"],
-                search_volume=row["search_volume"],
-                search_volume_prev=row.get("search_volume_prev"),
-                video_count=row["video_count"],
-                video_count_prev=row.get("video_count_prev"),
-                avg_sentiment=row["avg_sentiment"],
-                avg_trend=row["avg_trend"],
-                avg_total_score=row["avg_total_score"],
-                growth_rate=row.get("growth_rate"),
-                rank=row["rank"],
+        # 하루치 순위를 통째로 교체한다. 이번 집계에 없는 키워드/카테고리 행은 함께 지워진다.
+        self.repository.upsert_keyword_trends(
+            as_of, (self._keyword_trend(row, as_of) for row in keyword_ranked), platform=platform, replace=True
+        )
+        self.repository.upsert_category_trends(
+            as_of, (self._category_trend(row, as_of) for row in category_ranked), platform=platform, replace=True
+        )
+
+        # 전체 집계는 until 이후의 변경도 일부 읽었을 수 있지만, 다음 실행이 다시 반영해도 결과는 같다.
+        self._save_watermark(job_name, until)
+
+        result = self._result(as_of, keyword_ranked, category_ranked, keyword_ranked, category_ranked, surge_threshold)
+        result["mode"] = "full"
+        result["top_trending_videos"] = top_trending_videos
+        return result
+
+    def compute_rankings(
+        self, db, as_of: date, window_days: int, platform: str | None, velocity_days: int
+    ) -> tuple[list[dict], list[dict]]:
+        """
+        윈도우 전체의 키워드/카테고리 순위 행을 계산한다. (저장하지 않음)
+        self.engine 이 numpy 면 컬럼형 엔진으로, 아니면 SQL GROUP BY 로 집계한다. 두 엔진의 결과는 같다.
+        """
+        if self.engine == "numpy":
+            # SQL 엔진만 쓰는 프로세스가 numpy 를 불러오지 않도록 사용할 때 가져온다.
+            from content.application.usecase.trend_columnar_engine import ColumnarTrendEngine
+
+            return ColumnarTrendEngine().aggregate(db, self._window_params(as_of, window_days, velocity_days, platform))
+
+        keyword_rows = self._aggregate_keywords(db, as_of, window_days, platform, velocity_days)
+        category_rows = self._aggregate_categories(db, as_of, window_days, platform, velocity_days)
+        return (
+            self._apply_rank(keyword_rows, key_field="keyword"),
+            self._apply_rank(category_rows, key_field="category"),
+        )
+
+    def _aggregate_incremental(
+        self,
+        as_of: date,
+        window_days: int,
+        velocity_days: int,
+        platform: str | None,
+        surge_threshold: float,
+        job_name: str,
+        since: datetime,
+        until: datetime,
+    ) -> dict:
+        """
+        (since, until] 사이에 바뀐 영상이 속한 키워드/카테고리만 윈도우 전체 기준으로 다시 집계한다.
+        - 변경 탐지와 재집계는 primary 에서 읽는다. 복제본이 until 직전의 쓰기를 아직 재생하지 못했으면
+          그 변경을 놓친 채 watermark 가 넘어가기 때문이다.
+        - 다시 집계한 행은 해당 플랫폼의 기존 순위와 합쳐 순위를 다시 매기고, 값이 바뀐 행과 순위가 바뀐 행만 저장한다.
+        - watermark 는 저장이 끝난 뒤에 넘긴다. 중간에 실패하면 다음 실행이 같은 변경분을 다시 처리한다.
+        """
+        base = {"as_of": str(as_of), "mode": "incremental", "since": since.isoformat(), "until": until.isoformat()}
+        if until <= since:
+            return {**self._result(as_of, [], [], [], [], surge_threshold), **base}
+
+        change_params = {"since": since, "until": until, "platform": platform}
+        with self.session_factory() as db:
+            if not self._has_new_data(db, since, until, platform):
+                return {**self._result(as_of, [], [], [], [], surge_threshold), **base}
+
+            keyword_keys = db.execute(text(AFFECTED_KEYWORDS_SQL), change_params).mappings().all()
+            category_keys = db.execute(text(AFFECTED_CATEGORIES_SQL), change_params).mappings().all()
+            tag_ids = sorted({r["tag_id"] for r in keyword_keys})
+            categories = sorted({r["category"] for r in category_keys})
+
+            keyword_rows: list[dict] = []
+            category_rows: list[dict] = []
+            if tag_ids:
+                keyword_rows = self._aggregate_keywords(db, as_of, window_days, platform, velocity_days, tag_ids=tag_ids)
+            if categories:
+                category_rows = self._aggregate_categories(
+                    db, as_of, window_days, platform, velocity_days, categories=categories
+                )
+
+            keyword_affected = {(r["keyword"], r["platform"]) for r in keyword_keys}
+            category_affected = {(r["category"], r["platform"]) for r in category_keys}
+            keyword_current = self._load_current_trends(
+                db, CURRENT_KEYWORD_TRENDS_SQL, as_of, keyword_affected, keyword_rows
             )
-            self.repository.upsert_keyword_trend(trend)
-
-        for row in category_ranked:
-            trend = CategoryTrend(
-                category=row["category"],
-                date=as_of,
-                platform=row["platform"],
-                video_count=row["video_count"],
-                video_count_prev=row.get("video_count_prev"),
-                avg_sentiment=row["avg_sentiment"],
-                avg_trend=row["avg_trend"],
-                avg_total_score=row["avg_total_score"],
-                search_volume=row["search_volume"],
-                search_volume_prev=row.get("search_volume_prev"),
-                growth_rate=row.get("growth_rate"),
-                rank=row["rank"],
+            category_current = self._load_current_trends(
+                db, CURRENT_CATEGORY_TRENDS_SQL, as_of, category_affected, category_rows
             )
-            self.repository.upsert_category_trend(trend)
 
+        keyword_ranked, keyword_changed, keyword_removed = self._merge_rank(
+            keyword_current, keyword_rows, keyword_affected, key_field="keyword"
+        )
+        category_ranked, category_changed, category_removed = self._merge_rank(
+            category_current, category_rows, category_affected, key_field="category"
+        )
+
+        self.repository.upsert_keyword_trends(
+            as_of, (self._keyword_trend(row, as_of) for row in keyword_changed), removed=keyword_removed
+        )
+        self.repository.upsert_category_trends(
+            as_of, (self._category_trend(row, as_of) for row in category_changed), removed=category_removed
+        )
+
+        self._save_watermark(job_name, until)
+
+        result = self._result(as_of, keyword_changed, category_changed, keyword_ranked, category_ranked, surge_threshold)
+        result.update(base)
+        result["keyword_trend_removed"] = len(keyword_removed)
+        result["category_trend_removed"] = len(category_removed)
+        return result
+
+    def _load_current_trends(
+        self, db, sql: str, as_of: date, affected: set[tuple[str, str]], recomputed: list[dict]
+    ) -> list[dict]:
+        """
+        다시 순위를 매길 플랫폼(변경이 있었던 플랫폼)의 as_of 일자 저장 행을 집계 행과 같은 형태로 읽는다.
+        """
+        platforms = sorted({p for _, p in affected} | {r["platform"] for r in recomputed})
+        if not platforms:
+            return []
+        rows = stream_rows(db, sql, {"as_of": as_of, "platforms": platforms})
+        result: list[dict] = []
+        for r in rows:
+            row = dict(r)
+            for field in ("avg_sentiment", "avg_trend", "avg_total_score", "growth_rate", "view_velocity"):
+                row[field] = float(row[field]) if row[field] is not None else None
+            row["view_velocity"] = row["view_velocity"] or 0.0
+            result.append(row)
+        return result
+
+    def _merge_rank(
+        self,
+        current_rows: list[dict],
+        recomputed_rows: list[dict],
+        affected: set[tuple[str, str]],
+        key_field: str,
+    ) -> tuple[list[dict], list[dict], list[tuple[str, str]]]:
+        """
+        저장된 순위에서 영향받은 키를 다시 집계한 행으로 바꾼 뒤 플랫폼별로 순위를 다시 매긴다.
+        반환: (플랫폼 전체 순위, 저장할 행(재집계 또는 순위 변경), 윈도우에서 사라져 지울 키)
+        """
+        previous_rank = {(r[key_field], r["platform"]): r.get("rank") for r in current_rows}
+        merged = {
+            (r[key_field], r["platform"]): r for r in current_rows if (r[key_field], r["platform"]) not in affected
+        }
+        recomputed_keys: set[tuple[str, str]] = set()
+        for r in recomputed_rows:
+            key = (r[key_field], r["platform"])
+            merged[key] = r
+            recomputed_keys.add(key)
+
+        removed = sorted(key for key in affected if key not in recomputed_keys and key in previous_rank)
+        ranked = self._apply_rank(merged.values(), key_field=key_field)
+        changed = [
+            r
+            for r in ranked
+            if (r[key_field], r["platform"]) in recomputed_keys
+            or previous_rank.get((r[key_field], r["platform"])) != r["rank"]
+        ]
+        return ranked, changed, removed
+
+    def _save_watermark(self, job_name: str, until: datetime) -> None:
+        with self.session_factory() as db:
+            set_watermark(db, job_name, until)
+            db.commit()
+
+    def _result(
+        self,
+        as_of: date,
+        keyword_written: list[dict],
+        category_written: list[dict],
+        keyword_ranked: list[dict],
+        category_ranked: list[dict],
+        surge_threshold: float,
+    ) -> dict:
         surging_keywords = [
             row
             for row in keyword_ranked
@@ -109,208 +324,202 @@ class TrendAggregationUseCase:
             for row in category_ranked
             if row.get("growth_rate") is not None and row.get("growth_rate", 0) >= surge_threshold
         ]
-
+        # 증분 실행은 윈도우 전체를 훑지 않으므로 상위 트렌딩 영상은 전체 집계에서만 채운다.
         return {
             "as_of": str(as_of),
-            "keyword_trend_count": len(keyword_ranked),
-            "category_trend_count": len(category_ranked),
+            "keyword_trend_count": len(keyword_written),
+            "category_trend_count": len(category_written),
             "surging_keywords": surging_keywords,
             "surging_categories": surging_categories,
-            "top_trending_videos": top_trending_videos,
+            "top_trending_videos": [],
+        }
+
+    @staticmethod
+    def _keyword_trend(row: dict, as_of: date) -> KeywordTrend:
+        return KeywordTrend(
+            keyword=row["keyword"],
+            date=as_of,
+            platform=row["platform"],
+            search_volume=row["search_volume"],
+            search_volume_prev=row.get("search_volume_prev"),
+            video_count=row["video_count"],
+            video_count_prev=row.get("video_count_prev"),
+            avg_sentiment=row["avg_sentiment"],
+            avg_trend=row["avg_trend"],
+            avg_total_score=row["avg_total_score"],
+            growth_rate=row.get("growth_rate"),
+            view_velocity=row.get("view_velocity"),
+            rank=row["rank"],
+        )
+
+    @staticmethod
+    def _category_trend(row: dict, as_of: date) -> CategoryTrend:
+        return CategoryTrend(
+            category=row["category"],
+            date=as_of,
+            platform=row["platform"],
+            video_count=row["video_count"],
+            video_count_prev=row.get("video_count_prev"),
+            avg_sentiment=row["avg_sentiment"],
+            avg_trend=row["avg_trend"],
+            avg_total_score=row["avg_total_score"],
+            search_volume=row["search_volume"],
+            search_volume_prev=row.get("search_volume_prev"),
+            growth_rate=row.get("growth_rate"),
+            view_velocity=row.get("view_velocity"),
+            rank=row["rank"],
+        )
+
+    def _window_params(self, as_of: date, window_days: int, velocity_days: int, platform: str | None) -> dict:
+        """
+        현재 기간 [from_date, as_of] 과 직전 기간 [prev_from, prev_to] 을 한 번에 집계하기 위한 바인드 파라미터.
+        """
+        prev_to = as_of - timedelta(days=window_days)
+        return {
+            "from_date": as_of - timedelta(days=window_days - 1),
+            "to_date": as_of,
+            "prev_from": prev_to - timedelta(days=window_days - 1),
+            "prev_to": prev_to,
+            "prev_anchor": as_of - timedelta(days=velocity_days),
+            "platform": platform,
+            "velocity_days": velocity_days,
         }
 
     def _aggregate_keywords(
-        self, db, from_date: date, as_of: date, platform: str | None, velocity_days: int
+        self,
+        db,
+        as_of: date,
+        window_days: int,
+        platform: str | None,
+        velocity_days: int,
+        tag_ids: list[int] | None = None,
     ) -> list[dict]:
         """
         키워드 기준 집계 + 스냅샷 기반 속도(조회/좋아요/댓글) 계산.
+        - 현재/직전 기간을 한 번의 스캔으로 집계하고 증가율(growth_rate)까지 함께 반환한다.
+        - tag_ids: 주어지면 해당 태그만 집계한다. (증분 집계, video_tag 의 tag_id 인덱스로 찾는다)
+        - 결과는 서버 측 커서로 나눠 읽는다. 긴 윈도우에서도 드라이버가 결과 전체를 한 번에 받지 않는다.
         """
-        prev_anchor = as_of - timedelta(days=velocity_days)
-
-        rows = db.execute(
+        rows = stream_rows(
+            db,
             text(
                 """
-                SELECT
-                    km.keyword,
-                    v.platform,
-                    COUNT(DISTINCT km.video_id) AS video_count,
-                    SUM(COALESCE(curr.view_count, v.view_count, 0)) AS search_volume,
-                    SUM(COALESCE(prev.view_count, 0)) AS search_volume_prev,
-                    SUM(GREATEST(COALESCE(curr.view_count, v.view_count, 0) - COALESCE(prev.view_count, 0), 0)) / :velocity_days AS view_velocity,
-                    SUM(GREATEST(COALESCE(curr.like_count, v.like_count, 0) - COALESCE(prev.like_count, 0), 0)) / :velocity_days AS like_velocity,
-                    SUM(GREATEST(COALESCE(curr.comment_count, v.comment_count, 0) - COALESCE(prev.comment_count, 0), 0)) / :velocity_days AS comment_velocity,
-                    AVG(COALESCE(vs.sentiment_score, 0)) AS avg_sentiment,
-                    AVG(COALESCE(vs.trend_score, 0)) AS avg_trend,
-                    AVG(COALESCE(sc.total_score, 0)) AS avg_total_score
-                FROM keyword_mapping km
-                JOIN video v ON v.video_id = km.video_id
-                LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
-                LEFT JOIN video_score sc ON sc.video_id = v.video_id
-                LEFT JOIN LATERAL (
-                    SELECT s.view_count, s.like_count, s.comment_count
-                    FROM video_metrics_snapshot s
-                    WHERE s.video_id = v.video_id
-                      AND s.platform = v.platform
-                      AND s.snapshot_date <= :to_date
-                    ORDER BY s.snapshot_date DESC
-                    LIMIT 1
-                ) curr ON true
-                LEFT JOIN LATERAL (
-                    SELECT s.view_count, s.like_count, s.comment_count
-                    FROM video_metrics_snapshot s
-                    WHERE s.video_id = v.video_id
-                      AND s.platform = v.platform
-                      AND s.snapshot_date <= :prev_anchor
-                    ORDER BY s.snapshot_date DESC
-                    LIMIT 1
-                ) prev ON true
-                WHERE COALESCE(v.published_at::date, v.crawled_at::date) BETWEEN :from_date AND :to_date
-                  AND (:platform IS NULL OR v.platform = :platform)
-                GROUP BY km.keyword, v.platform
-                """
+                WITH agg AS (
+                    SELECT
+                        vt.tag_id,
+                        v.platform,
+                        {aggregates}
+                    FROM video_tag vt
+                    JOIN video v ON v.video_id = vt.video_id
+                    {bucket_join}
+                    LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
+                    LEFT JOIN video_score sc ON sc.video_id = v.video_id
+                    {latest_join}
+                    {curr_join}
+                    {prev_join}
+                    WHERE {window_range}
+                      AND (:platform IS NULL OR v.platform = :platform)
+                      AND (CAST(:tag_ids AS INTEGER[]) IS NULL OR vt.tag_id = ANY(CAST(:tag_ids AS INTEGER[])))
+                    GROUP BY vt.tag_id, v.platform
+                    {having}
+                )
+                SELECT t.name AS keyword, agg.*, {growth_rate} AS growth_rate
+                FROM agg
+                JOIN tag t ON t.tag_id = agg.tag_id
+                """.format(
+                    aggregates=window_aggregates_sql("v", "COUNT(*)"),
+                    bucket_join=window_bucket_join("v"),
+                    latest_join=latest_metrics_join("v"),
+                    curr_join=snapshot_as_of_join("curr", CURR_SNAPSHOT_ANCHOR_SQL),
+                    prev_join=snapshot_as_of_join("prev", PREV_SNAPSHOT_ANCHOR_SQL),
+                    window_range=window_range_sql("v"),
+                    having=CURRENT_WINDOW_HAVING_SQL,
+                    growth_rate=GROWTH_RATE_SQL,
+                )
             ),
-            {
-                "from_date": from_date,
-                "to_date": as_of,
-                "prev_anchor": prev_anchor,
-                "platform": platform,
-                "velocity_days": velocity_days,
-            },
-        ).mappings()
+            {**self._window_params(as_of, window_days, velocity_days, platform), "tag_ids": tag_ids},
+        )
 
-        result: list[dict] = []
-        for r in rows:
-            result.append(
-                {
-                    "keyword": r["keyword"],
-                    "platform": r["platform"],
-                    "video_count": int(r["video_count"] or 0),
-                    "search_volume": int(r["search_volume"] or 0),
-                    "search_volume_prev": int(r["search_volume_prev"] or 0),
-                    "view_velocity": float(r["view_velocity"] or 0),
-                    "like_velocity": float(r["like_velocity"] or 0),
-                    "comment_velocity": float(r["comment_velocity"] or 0),
-                    "avg_sentiment": float(r["avg_sentiment"] or 0),
-                    "avg_trend": float(r["avg_trend"] or 0),
-                    "avg_total_score": float(r["avg_total_score"] or 0),
-                }
-            )
-        return result
+        return [self._window_row(r, key_field="keyword") for r in rows]
 
     def _aggregate_categories(
-        self, db, from_date: date, as_of: date, platform: str | None, velocity_days: int
+        self,
+        db,
+        as_of: date,
+        window_days: int,
+        platform: str | None,
+        velocity_days: int,
+        categories: list[str] | None = None,
     ) -> list[dict]:
         """
         카테고리별 트렌드 집계 + 스냅샷 기반 속도 계산.
+        - 현재/직전 기간을 한 번의 스캔으로 집계하고 증가율(growth_rate)까지 함께 반환한다.
+        - categories: 주어지면 해당 카테고리만 집계한다. (증분 집계)
         """
-        prev_anchor = as_of - timedelta(days=velocity_days)
         # vs.category가 없을 때 YouTube category_id를 사람이 읽을 수 있는 이름으로 변환해 집계에 포함한다.
-        rows = db.execute(
+        rows = stream_rows(
+            db,
             text(
                 """
-                WITH category_named AS (
+                WITH agg AS (
                     SELECT
-                        v.video_id,
+                        cat.category,
                         v.platform,
-                        COALESCE(
-                            vs.category,
-                            CASE v.category_id
-                                WHEN 1 THEN 'Film & Animation'
-                                WHEN 2 THEN 'Autos & Vehicles'
-                                WHEN 10 THEN 'Music'
-                                WHEN 15 THEN 'Pets & Animals'
-                                WHEN 17 THEN 'Sports'
-                                WHEN 19 THEN 'Travel & Events'
-                                WHEN 20 THEN 'Gaming'
-                                WHEN 22 THEN 'People & Blogs'
-                                WHEN 23 THEN 'Comedy'
-                                WHEN 24 THEN 'Entertainment'
-                                WHEN 25 THEN 'News'
-                                WHEN 26 THEN 'Howto & Style'
-                                WHEN 27 THEN 'Education'
-                                WHEN 28 THEN 'Science & Technology'
-                                WHEN 29 THEN 'Nonprofits & Activism'
-                                ELSE 'uncategorized'
-                            END
-                        ) AS category,
-                        v.view_count,
-                        v.like_count,
-                        v.comment_count,
-                        v.published_at,
-                        v.crawled_at,
-                        vs.sentiment_score,
-                        vs.trend_score,
-                        sc.total_score
+                        {aggregates}
                     FROM video v
+                    {bucket_join}
                     LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
                     LEFT JOIN video_score sc ON sc.video_id = v.video_id
+                    CROSS JOIN LATERAL (SELECT COALESCE(vs.category, {category_name}) AS category) cat
+                    {latest_join}
+                    {curr_join}
+                    {prev_join}
+                    WHERE {window_range}
+                      AND (:platform IS NULL OR v.platform = :platform)
+                      AND (CAST(:categories AS VARCHAR[]) IS NULL OR cat.category = ANY(CAST(:categories AS VARCHAR[])))
+                    GROUP BY cat.category, v.platform
+                    {having}
+                )
+                SELECT agg.*, {growth_rate} AS growth_rate
+                FROM agg
+                """.format(
+                    aggregates=window_aggregates_sql("v", "COUNT(DISTINCT v.video_id)"),
+                    bucket_join=window_bucket_join("v"),
+                    category_name=youtube_category_name_sql("v.category_id"),
+                    latest_join=latest_metrics_join("v"),
+                    curr_join=snapshot_as_of_join("curr", CURR_SNAPSHOT_ANCHOR_SQL),
+                    prev_join=snapshot_as_of_join("prev", PREV_SNAPSHOT_ANCHOR_SQL),
+                    window_range=window_range_sql("v"),
+                    having=CURRENT_WINDOW_HAVING_SQL,
+                    growth_rate=GROWTH_RATE_SQL,
                 )
-                SELECT
-                    c.category,
-                    c.platform,
-                    COUNT(DISTINCT c.video_id) AS video_count,
-                    SUM(COALESCE(curr.view_count, c.view_count, 0)) AS search_volume,
-                    SUM(COALESCE(prev.view_count, 0)) AS search_volume_prev,
-                    SUM(GREATEST(COALESCE(curr.view_count, c.view_count, 0) - COALESCE(prev.view_count, 0), 0)) / :velocity_days AS view_velocity,
-                    SUM(GREATEST(COALESCE(curr.like_count, c.like_count, 0) - COALESCE(prev.like_count, 0), 0)) / :velocity_days AS like_velocity,
-                    SUM(GREATEST(COALESCE(curr.comment_count, c.comment_count, 0) - COALESCE(prev.comment_count, 0), 0)) / :velocity_days AS comment_velocity,
-                    AVG(COALESCE(c.sentiment_score, 0)) AS avg_sentiment,
-                    AVG(COALESCE(c.trend_score, 0)) AS avg_trend,
-                    AVG(COALESCE(c.total_score, 0)) AS avg_total_score
-                FROM category_named c
-                LEFT JOIN LATERAL (
-                    SELECT s.view_count, s.like_count, s.comment_count
-                    FROM video_metrics_snapshot s
-                    WHERE s.video_id = c.video_id
-                      AND s.platform = c.platform
-                      AND s.snapshot_date <= :to_date
-                    ORDER BY s.snapshot_date DESC
-                    LIMIT 1
-                ) curr ON true
-                LEFT JOIN LATERAL (
-                    SELECT s.view_count, s.like_count, s.comment_count
-                    FROM video_metrics_snapshot s
-                    WHERE s.video_id = c.video_id
-                      AND s.platform = c.platform
-                      AND s.snapshot_date <= :prev_anchor
-                    ORDER BY s.snapshot_date DESC
-                    LIMIT 1
-                ) prev ON true
-                WHERE COALESCE(c.published_at::date, c.crawled_at::date) BETWEEN :from_date AND :to_date
-                  AND (:platform IS NULL OR c.platform = :platform)
-                GROUP BY c.category, c.platform
-                """
             ),
-            {
-                "from_date": from_date,
-                "to_date": as_of,
-                "prev_anchor": prev_anchor,
-                "platform": platform,
-                "velocity_days": velocity_days,
-            },
-        ).mappings()
+            {**self._window_params(as_of, window_days, velocity_days, platform), "categories": categories},
+        )
 
-        result: list[dict] = []
-        for r in rows:
-            result.append(
-                {
-                    "category": r["category"],
-                    "platform": r["platform"],
-                    "video_count": int(r["video_count"] or 0),
-                    "search_volume": int(r["search_volume"] or 0),
-                    "search_volume_prev": int(r["search_volume_prev"] or 0),
-                    "view_velocity": float(r["view_velocity"] or 0),
-                    "like_velocity": float(r["like_velocity"] or 0),
-                    "comment_velocity": float(r["comment_velocity"] or 0),
-                    "avg_sentiment": float(r["avg_sentiment"] or 0),
-                    "avg_trend": float(r["avg_trend"] or 0),
-                    "avg_total_score": float(r["avg_total_score"] or 0),
-                }
-            )
-        return result
+        return [self._window_row(r, key_field="category") for r in rows]
+
+    @staticmethod
+    def _window_row(r, key_field: str) -> dict:
+        return {
+            key_field: r[key_field],
+            "platform": r["platform"],
+            "video_count": int(r["video_count"] or 0),
+            "video_count_prev": int(r["video_count_prev"] or 0),
+            "search_volume": int(r["search_volume"] or 0),
+            "search_volume_prev": int(r["search_volume_prev"] or 0),
+            "view_velocity": float(r["view_velocity"] or 0),
+            "like_velocity": float(r["like_velocity"] or 0),
+            "comment_velocity": float(r["comment_velocity"] or 0),
+            "avg_sentiment": float(r["avg_sentiment"] or 0),
+            "avg_trend": float(r["avg_trend"] or 0),
+            "avg_total_score": float(r["avg_total_score"] or 0),
+            "growth_rate": float(r["growth_rate"] or 0),
+        }
 
-    def _apply_rank(self, rows: Iterable[dict]) -> list[dict]:
+    def _apply_rank(self, rows: Iterable[dict], key_field: str) -> list[dict]:
         # 플랫폼별 view_velocity 우선, 다음은 search_volume 내림차순으로 랭킹 산출
+        # 동점은 키 이름순으로 정해, 증분 집계가 순위를 다시 매겨도 전체 집계와 같은 순서가 나오게 한다.
         grouped: dict[str, list[dict]] = defaultdict(list)
         for r in rows:
             grouped[r["platform"]].append(r)
@@ -320,10 +529,10 @@ class TrendAggregationUseCase:
             items_sorted = sorted(
                 items,
                 key=lambda x: (
-                    float(x.get("view_velocity") or 0),
-                    float(x.get("search_volume") or 0),
+                    -float(x.get("view_velocity") or 0),
+                    -float(x.get("search_volume") or 0),
+                    x[key_field],
                 ),
-                reverse=True,
             )
             for idx, item in enumerate(items_sorted, start=1):
                 item_with_rank = dict(item)
@@ -331,32 +540,6 @@ class TrendAggregationUseCase:
                 ranked.append(item_with_rank)
         return ranked
 
-    def _attach_growth(
-        self, current_rows: list[dict], prev_rows: list[dict], key_fields: tuple[str, str]
-    ) -> list[dict]:
-        """
-        """
-        prev_map: dict[tuple[str, str], dict] = {}
-        for row in prev_rows:
-            key = tuple(row[k] for k in key_fields)
-            prev_map[key] = row
-
-        enriched: list[dict] = []
-        for row in current_rows:
-            key = tuple(row[k] for k in key_fields)
-            prev = prev_map.get(key, {})
-            prev_volume = int(prev.get("search_volume") or 0)
-            prev_count = int(prev.get("video_count") or 0)
-            base_volume = prev_volume if prev_volume > 0 else 1
-            growth_rate = (row["search_volume"] - prev_volume) / base_volume if (row["search_volume"] or prev_volume) else 0
-
-            row_enriched = dict(row)
-            row_enriched["search_volume_prev"] = prev_volume
-            row_enriched["video_count_prev"] = prev_count
-            row_enriched["growth_rate"] = growth_rate
-            enriched.append(row_enriched)
-        return enriched
-
     def _select_trending_videos(
         self,
         db,
@@ -370,7 +553,8 @@ class TrendAggregationUseCase:
         속도(조회/댓글/좋아요 증가)에 기반해 상위 트렌딩 영상을 추출한다.
         """
         prev_anchor = to_date - timedelta(days=velocity_days)
-        rows = db.execute(
+        rows = stream_rows(
+            db,
             text(
                 """
                 SELECT
@@ -394,24 +578,9 @@ class TrendAggregationUseCase:
                 FROM video v
                 LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
                 LEFT JOIN video_score sc ON sc.video_id = v.video_id
-                LEFT JOIN LATERAL (
-                    SELECT s.view_count, s.like_count, s.comment_count
-                    FROM video_metrics_snapshot s
-                    WHERE s.video_id = v.video_id
-                      AND s.platform = v.platform
-                      AND s.snapshot_date <= :to_date
-                    ORDER BY s.snapshot_date DESC
-                    LIMIT 1
-                ) curr ON true
-                LEFT JOIN LATERAL (
-                    SELECT s.view_count, s.like_count, s.comment_count
-                    FROM video_metrics_snapshot s
-                    WHERE s.video_id = v.video_id
-                      AND s.platform = v.platform
-                      AND s.snapshot_date <= :prev_anchor
-                    ORDER BY s.snapshot_date DESC
-                    LIMIT 1
-                ) prev ON true
+                {latest_join}
+                {curr_join}
+                {prev_join}
                 WHERE COALESCE(v.published_at::date, v.crawled_at::date) BETWEEN :from_date AND :to_date
                   AND (:platform IS NULL OR v.platform = :platform)
                 ORDER BY view_velocity DESC NULLS LAST,
@@ -420,7 +589,11 @@ class TrendAggregationUseCase:
                          total_score DESC NULLS LAST,
                          v.crawled_at DESC NULLS LAST
                 LIMIT :limit
-                """
+                """.format(
+                    latest_join=latest_metrics_join("v"),
+                    curr_join=snapshot_as_of_join("curr", ":to_date"),
+                    prev_join=snapshot_as_of_join("prev", ":prev_anchor"),
+                )
             ),
             {
                 "from_date": from_date,
@@ -430,27 +603,15 @@ class TrendAggregationUseCase:
                 "velocity_days": velocity_days,
                 "limit": limit,
             },
-        ).mappings()
+            fetch_size=min(limit, DB_STREAM_FETCH_SIZE),
+        )
 
         return [dict(r) for r in rows]
 
-    def _has_new_data(self, as_of: date, from_date: date, platform: str | None) -> bool:
+    def _has_new_data(self, db, since: datetime, until: datetime, platform: str | None) -> bool:
         """
-        동일 데이터에 대해 불필요하게 집계하지 않도록, 기간 내 신규 데이터 존재 여부를 확인한다.
-        - 기간: published_at 없으면 crawled_at 기준 from_date ~ as_of (집계 쿼리와 동일 기준)
+        동일 데이터에 대해 불필요하게 집계하지 않도록, (since, until] 사이에 집계 입력이 바뀐 영상이 있는지 확인한다.
+        - 영상 재수집/태그/감성 분석/점수/스냅샷 요약 중 하나라도 바뀌면 변경으로 본다. (trend_aggregation_sql 참고)
         - 플랫폼 필터가 있다면 동일하게 적용
         """
-        with self.session_factory() as db:
-            row = db.execute(
-                text(
-                    """
-                    SELECT 1
-                    FROM video v
-                    WHERE COALESCE(v.published_at::date, v.crawled_at::date) BETWEEN :from_date AND :to_date
-                      AND (:platform IS NULL OR v.platform = :platform)
-                    LIMIT 1
-                    """
-                ),
-                {"from_date": from_date, "to_date": as_of, "platform": platform},
-            ).first()
-            return row is not None
+        return bool(db.execute(text(HAS_CHANGED_VIDEOS_SQL), {"since": since, "until": until, "platform": platform}).scalar())
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from typing import List, Tuple
 
 from fastapi.encoders import jsonable_encoder
-from openai import OpenAI, Stream
+from openai import AsyncOpenAI, AsyncStream
 from openai.types.chat import ChatCompletionChunk
 
 from config.settings import OpenAISettings
+from content.application.port.async_content_repository_port import AsyncContentRepositoryPort
 from content.application.usecase.trend_featured_usecase import TrendFeaturedUseCase
 from content.utils.embedding import EmbeddingService, cosine_similarity
 
@@ -19,25 +21,25 @@ class TrendChatUseCase:
 
     def __init__(
         self,
-        featured_usecase: TrendFeaturedUseCase,
         settings: OpenAISettings | None = None,
         embedding_service: EmbeddingService | None = None,
     ):
-        self.featured_usecase = featured_usecase
+        # OpenAI/임베딩 클라이언트는 인스턴스 하나를 공유하고, DB 세션에 묶인 저장소는 호출마다 받는다.
         self.settings = settings or OpenAISettings()
         if not self.settings.api_key:
             raise ValueError("OPENAI_API_KEY is required for TrendChatUseCase")
-        self.client = OpenAI(api_key=self.settings.api_key)
+        self.client = AsyncOpenAI(api_key=self.settings.api_key)
         self.embedding_service = embedding_service or EmbeddingService(self.settings)
 
-    def answer_with_trends(
+    async def answer_with_trends(
         self,
+        repository: AsyncContentRepositoryPort,
         user_messages: List[dict],
         popular_limit: int = 5,
         rising_limit: int = 5,
         velocity_days: int = 1,
         platform: str | None = None,
-    ) -> Tuple[Stream[ChatCompletionChunk], Tuple[str, list[dict]]]:
+    ) -> Tuple[AsyncStream[ChatCompletionChunk], Tuple[str, list[dict]]]:
         # 유저 질문 추출 (마지막 user 메시지)
         query = ""
         for msg in reversed(user_messages):
@@ -45,7 +47,8 @@ class TrendChatUseCase:
                 query = msg.get("content", "")
                 break
 
-        trends = self.featured_usecase.get_featured(
+        featured_usecase = TrendFeaturedUseCase(repository, embedding_service=self.embedding_service)
+        trends = await featured_usecase.get_featured(
             limit_popular=popular_limit,
             limit_rising=rising_limit,
             velocity_days=velocity_days,
@@ -57,7 +60,8 @@ class TrendChatUseCase:
             return "트렌드 데이터가 부족해요. 나중에 다시 시도해 주세요.", []
 
         context_text = self._build_context(trends)
-        relevant = self._retrieve_relevant_items(query, trends, top_k=6)
+        # 임베딩 호출은 동기 HTTP 요청이므로 스레드에서 실행한다.
+        relevant = await asyncio.to_thread(self._retrieve_relevant_items, query, trends, 6)
         print(relevant)
 
         messages = [
@@ -78,7 +82,7 @@ class TrendChatUseCase:
             },
         ] + user_messages
 
-        stream = self.client.chat.completions.create(
+        stream = await self.client.chat.completions.create(
             model=self.settings.model or "gpt-4o",
             messages=messages,
             stream=True
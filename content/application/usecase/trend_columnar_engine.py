@@ -0,0 +1,342 @@
+"""
+트렌드 집계(keyword_trend / category_trend)의 컬럼형 엔진.
+
+SQL 엔진은 영상마다 LATERAL 로 스냅샷 기준일을 고르고 GROUP BY 로 합계/평균을 낸다. 이 엔진은 윈도우의
+영상 행, 태그 매핑, 과거 스냅샷을 한 번씩만 읽어 컬럼 배열로 들고, 기준일 선택과 그룹별 합계/속도/평균/순위를
+numpy 배열 연산으로 계산한다. 결과 행의 형태와 값, 순위는 TrendAggregationUseCase 의 SQL 엔진과 같다.
+
+- 조회/좋아요/댓글 수와 점수는 float64 로 계산한다. 2^53 미만의 정수 합은 float64 로 정확하다.
+- 점수(NUMERIC, 소수 4자리 이하)는 10^4 배한 정수로 더한 뒤 한 번만 나눈다. 소수를 그대로 더하면 평균이
+  0.54085 -> 0.540849999.. 처럼 어긋나 DECIMAL 컬럼에 반올림할 때 SQL 엔진과 마지막 자리가 달라진다.
+- NULL 은 NaN 으로 들고 있다가 SQL 의 COALESCE 와 같은 순서로 채운다.
+- 한 번에 윈도우 전체를 메모리에 올리므로 전체 집계 전용이다. 증분 집계는 키 필터가 인덱스를 타는 SQL 엔진을 쓴다.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+from sqlalchemy import text
+
+from config.database.streaming import stream_chunks
+from content.infrastructure.repository.trend_aggregation_sql import (
+    COLUMNAR_SNAPSHOTS_AS_OF_SQL,
+    COLUMNAR_TAG_NAMES_SQL,
+    columnar_window_tags_sql,
+    columnar_window_videos_sql,
+)
+
+_METRICS = ("view_count", "like_count", "comment_count")
+# 점수 컬럼(DECIMAL(5,4) / DECIMAL(6,3))을 정수로 만드는 배율
+_SCORE_SCALE = 10**4
+
+
+def _float_column(values) -> np.ndarray:
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+
+def _score_column(values) -> np.ndarray:
+    """NUMERIC 점수를 _SCORE_SCALE 배한 정수값(float64)으로 읽는다. NULL 은 0. (COALESCE(score, 0))"""
+    return np.array([0.0 if v is None else float(round(v * _SCORE_SCALE)) for v in values], dtype=np.float64)
+
+
+def _date_column(values) -> np.ndarray:
+    return np.array(values, dtype="datetime64[D]")
+
+
+def _str_column(values) -> np.ndarray:
+    return np.array(values, dtype=str)
+
+
+def _bool_column(values) -> np.ndarray:
+    return np.array(values, dtype=bool)
+
+
+def _int_column(values) -> np.ndarray:
+    return np.array(values, dtype=np.int64)
+
+
+# columnar_window_videos_sql 의 컬럼 순서별 변환
+_VIDEO_COLUMNS = (
+    _str_column, _str_column, _bool_column, _float_column, _float_column, _float_column, _str_column,
+    _score_column, _score_column, _score_column,
+    _date_column, _float_column, _float_column, _float_column,
+    _date_column, _float_column, _float_column, _float_column,
+)
+
+
+def _read_columns(db, statement: str, params: dict, converters) -> list[np.ndarray]:
+    """
+    조회 결과를 서버 측 커서로 chunk 씩 읽어 컬럼 배열로 바꾼 뒤 이어 붙인다.
+    튜플 행은 chunk 하나만 메모리에 올라오고, 윈도우 전체는 컬럼 배열로만 들고 있는다.
+    """
+    parts: list[list[np.ndarray]] = [[] for _ in converters]
+    for chunk in stream_chunks(db, statement, params, mappings=False):
+        for part, convert, values in zip(parts, converters, zip(*chunk)):
+            part.append(convert(values))
+    return [np.concatenate(part) if part else convert(()) for part, convert in zip(parts, converters)]
+
+
+def _coalesce(*columns) -> np.ndarray:
+    out = columns[0]
+    for column in columns[1:]:
+        out = np.where(np.isnan(out), column, out)
+    return out
+
+
+@dataclass
+class TrendWindowColumns:
+    """윈도우 영상의 집계 입력. 배열은 모두 video_id 정렬 순서의 영상 행 기준이다."""
+
+    video_ids: np.ndarray
+    platform_names: list[str]
+    platform_codes: np.ndarray
+    is_curr: np.ndarray
+    video_counts: dict[str, np.ndarray]
+    category_names: list[str]
+    category_codes: np.ndarray
+    sentiment: np.ndarray
+    trend: np.ndarray
+    total_score: np.ndarray
+    curr_dates: np.ndarray
+    curr_counts: dict[str, np.ndarray]
+    prev_dates: np.ndarray
+    prev_counts: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+
+class ColumnarTrendEngine:
+    def aggregate(self, db, params: dict) -> tuple[list[dict], list[dict]]:
+        """
+        params 는 TrendAggregationUseCase._window_params 의 바인드 파라미터다.
+        반환: (키워드 순위 행, 카테고리 순위 행) - _apply_rank 를 거친 SQL 엔진 결과와 같은 형태
+        """
+        frame = self._load_videos(db, params)
+        velocity_days = params["velocity_days"]
+
+        # 현재 기간 영상은 :to_date, 직전 기간 영상은 :prev_to 시점 값을 쓰고,
+        # 속도 기준점(:prev_anchor) 값은 현재 기간 영상에만 붙인다. (CURR/PREV_SNAPSHOT_ANCHOR_SQL)
+        curr_anchor = np.where(
+            frame.is_curr, np.datetime64(params["to_date"], "D"), np.datetime64(params["prev_to"], "D")
+        )
+        prev_anchor = np.full(len(frame), np.datetime64(params["prev_anchor"], "D"))
+        curr = self._snapshot_as_of(db, frame, curr_anchor, np.ones(len(frame), dtype=bool))
+        prev = self._snapshot_as_of(db, frame, prev_anchor, frame.is_curr)
+
+        counts = {m: _coalesce(curr[m], frame.video_counts[m], 0.0) for m in _METRICS}
+        growth = {m: np.maximum(counts[m] - _coalesce(prev[m], 0.0), 0.0) for m in _METRICS}
+        values = {
+            "views": counts["view_count"],
+            "view_growth": growth["view_count"],
+            "like_growth": growth["like_count"],
+            "comment_growth": growth["comment_count"],
+            "sentiment": frame.sentiment,
+            "trend": frame.trend,
+            "total_score": frame.total_score,
+        }
+
+        tag_members, tag_ids = self._load_tag_members(db, params, frame)
+        tag_names = self._load_tag_names(db, tag_ids)
+        known = np.array([int(t) in tag_names for t in tag_ids], dtype=bool)
+        tag_members, tag_ids = tag_members[known], tag_ids[known]
+
+        # (키, 플랫폼) 쌍을 키 코드 * 플랫폼 수 + 플랫폼 코드 하나의 정수로 묶어 그룹을 만든다.
+        n_platforms = max(len(frame.platform_names), 1)
+        keyword_key, keyword_group = np.unique(
+            tag_ids * n_platforms + frame.platform_codes[tag_members], return_inverse=True
+        )
+        keyword_rows = self._window_rows(
+            frame,
+            values,
+            members=tag_members,
+            group=keyword_group,
+            key_names=[tag_names[int(k) // n_platforms] for k in keyword_key],
+            key_platforms=keyword_key % n_platforms,
+            key_field="keyword",
+            velocity_days=velocity_days,
+        )
+
+        video_members = np.arange(len(frame))
+        category_key, category_group = np.unique(
+            frame.category_codes * n_platforms + frame.platform_codes, return_inverse=True
+        )
+        category_rows = self._window_rows(
+            frame,
+            values,
+            members=video_members,
+            group=category_group,
+            key_names=[frame.category_names[int(k) // n_platforms] for k in category_key],
+            key_platforms=category_key % n_platforms,
+            key_field="category",
+            velocity_days=velocity_days,
+        )
+        return keyword_rows, category_rows
+
+    def _load_videos(self, db, params: dict) -> TrendWindowColumns:
+        (
+            ids, platforms, is_curr, view_count, like_count, comment_count, categories,
+            sentiment, trend, total_score,
+            curr_date, curr_view, curr_like, curr_comment,
+            prev_date, prev_view, prev_like, prev_comment,
+        ) = _read_columns(db, columnar_window_videos_sql(), params, _VIDEO_COLUMNS)
+
+        # searchsorted 로 태그 매핑/스냅샷의 video_id 를 행 번호로 바꾸기 위해 numpy 순서로 정렬해 둔다.
+        order = np.argsort(ids, kind="stable")
+
+        def take(column: np.ndarray) -> np.ndarray:
+            return column[order]
+
+        platform_names, platform_codes = np.unique(platforms, return_inverse=True)
+        category_names, category_codes = np.unique(categories, return_inverse=True)
+        return TrendWindowColumns(
+            video_ids=take(ids),
+            platform_names=[str(p) for p in platform_names],
+            platform_codes=take(platform_codes.astype(np.int64)),
+            is_curr=take(is_curr),
+            video_counts={
+                "view_count": take(view_count),
+                "like_count": take(like_count),
+                "comment_count": take(comment_count),
+            },
+            category_names=[str(c) for c in category_names],
+            category_codes=take(category_codes.astype(np.int64)),
+            sentiment=take(sentiment),
+            trend=take(trend),
+            total_score=take(total_score),
+            curr_dates=take(curr_date),
+            curr_counts={
+                "view_count": take(curr_view),
+                "like_count": take(curr_like),
+                "comment_count": take(curr_comment),
+            },
+            prev_dates=take(prev_date),
+            prev_counts={
+                "view_count": take(prev_view),
+                "like_count": take(prev_like),
+                "comment_count": take(prev_comment),
+            },
+        )
+
+    @staticmethod
+    def _positions(frame: TrendWindowColumns, video_ids) -> tuple[np.ndarray, np.ndarray]:
+        """video_id 목록을 영상 행 번호로 바꾼다. 반환: (행 번호, 윈도우에 있는 영상인지)"""
+        ids = np.array(video_ids, dtype=str)
+        if not len(frame) or not len(ids):
+            return np.zeros(len(ids), dtype=np.int64), np.zeros(len(ids), dtype=bool)
+        positions = np.minimum(np.searchsorted(frame.video_ids, ids), len(frame) - 1)
+        return positions, frame.video_ids[positions] == ids
+
+    def _snapshot_as_of(
+        self, db, frame: TrendWindowColumns, anchor: np.ndarray, active: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """
+        active 영상마다 anchor 일자(포함) 이전의 가장 최근 스냅샷 값. 없으면 NaN. (snapshot_as_of_join 과 같은 규칙)
+        - curr_date <= anchor 이면 curr, prev_date <= anchor 이면 prev 를 쓴다.
+        - anchor 가 prev_date 보다도 과거인 영상만 기준일별로 모아 video_metrics_snapshot 을 조회한다.
+        """
+        out = {m: np.full(len(frame), np.nan) for m in _METRICS}
+        use_curr = active & (frame.curr_dates <= anchor)
+        use_prev = active & ~use_curr & (frame.prev_dates <= anchor)
+        lookup = active & ~use_curr & ~use_prev & (frame.prev_dates > anchor)
+        for m in _METRICS:
+            out[m][use_curr] = frame.curr_counts[m][use_curr]
+            out[m][use_prev] = frame.prev_counts[m][use_prev]
+
+        for day in np.unique(anchor[lookup]):
+            indexes = np.flatnonzero(lookup & (anchor == day))
+            video_ids, views, likes, comments = _read_columns(
+                db,
+                COLUMNAR_SNAPSHOTS_AS_OF_SQL,
+                {
+                    "video_ids": frame.video_ids[indexes].tolist(),
+                    "platforms": [frame.platform_names[c] for c in frame.platform_codes[indexes]],
+                    "anchor": day.astype(date),
+                },
+                (_str_column, _float_column, _float_column, _float_column),
+            )
+            positions, _ = self._positions(frame, video_ids)
+            out["view_count"][positions] = views
+            out["like_count"][positions] = likes
+            out["comment_count"][positions] = comments
+        return out
+
+    def _load_tag_members(self, db, params: dict, frame: TrendWindowColumns) -> tuple[np.ndarray, np.ndarray]:
+        """윈도우 영상의 태그 매핑을 (영상 행 번호, tag_id) 배열로 읽는다."""
+        video_ids, tag_ids = _read_columns(db, columnar_window_tags_sql(), params, (_str_column, _int_column))
+        positions, found = self._positions(frame, video_ids)
+        # 영상 행을 읽은 뒤 새로 들어온 영상의 매핑은 영상 행이 없으므로 버린다.
+        return positions[found], tag_ids[found]
+
+    @staticmethod
+    def _load_tag_names(db, tag_ids: np.ndarray) -> dict[int, str]:
+        if not len(tag_ids):
+            return {}
+        rows = db.execute(text(COLUMNAR_TAG_NAMES_SQL), {"tag_ids": np.unique(tag_ids).tolist()}).all()
+        return {int(tag_id): name for tag_id, name in rows}
+
+    @staticmethod
+    def _window_rows(
+        frame: TrendWindowColumns,
+        values: dict[str, np.ndarray],
+        members: np.ndarray,
+        group: np.ndarray,
+        key_names: list[str],
+        key_platforms: np.ndarray,
+        key_field: str,
+        velocity_days: int,
+    ) -> list[dict]:
+        """
+        members(영상 행 번호)를 group 으로 묶어 window_aggregates_sql 과 같은 지표를 내고 플랫폼별 순위를 매긴다.
+        현재 기간 영상이 없는 그룹은 버린다. (CURRENT_WINDOW_HAVING_SQL)
+        """
+        groups = len(key_names)
+        curr = frame.is_curr[members]
+
+        def total(column: np.ndarray, mask: np.ndarray) -> np.ndarray:
+            return np.bincount(group, weights=np.where(mask, column[members], 0.0), minlength=groups)
+
+        video_count = np.bincount(group, weights=curr, minlength=groups)
+        video_count_prev = np.bincount(group, weights=~curr, minlength=groups)
+        search_volume = total(values["views"], curr)
+        search_volume_prev = total(values["views"], ~curr)
+        view_velocity = total(values["view_growth"], curr) / velocity_days
+        like_velocity = total(values["like_growth"], curr) / velocity_days
+        comment_velocity = total(values["comment_growth"], curr) / velocity_days
+        divisor = np.maximum(video_count, 1) * _SCORE_SCALE
+        avg_sentiment = total(values["sentiment"], curr) / divisor
+        avg_trend = total(values["trend"], curr) / divisor
+        avg_total_score = total(values["total_score"], curr) / divisor
+        growth_rate = (search_volume - search_volume_prev) / np.maximum(search_volume_prev, 1)
+
+        keep = np.flatnonzero(video_count > 0)
+        names = np.array(key_names, dtype=str)[keep] if groups else np.zeros(0, dtype=str)
+        platforms = key_platforms[keep]
+        # 플랫폼별 view_velocity, search_volume 내림차순, 동점은 키 이름순. (_apply_rank 와 같은 순서)
+        order = keep[np.lexsort((names, -search_volume[keep], -view_velocity[keep], platforms))]
+        sorted_platforms = key_platforms[order]
+        starts = np.searchsorted(sorted_platforms, sorted_platforms, side="left")
+        ranks = np.arange(len(order)) - starts + 1
+
+        rows: list[dict] = []
+        for i, rank in zip(order.tolist(), ranks.tolist()):
+            rows.append(
+                {
+                    key_field: key_names[i],
+                    "platform": frame.platform_names[int(key_platforms[i])],
+                    "video_count": int(video_count[i]),
+                    "video_count_prev": int(video_count_prev[i]),
+                    "search_volume": int(search_volume[i]),
+                    "search_volume_prev": int(search_volume_prev[i]),
+                    "view_velocity": float(view_velocity[i]),
+                    "like_velocity": float(like_velocity[i]),
+                    "comment_velocity": float(comment_velocity[i]),
+                    "avg_sentiment": float(avg_sentiment[i]),
+                    "avg_trend": float(avg_trend[i]),
+                    "avg_total_score": float(avg_total_score[i]),
+                    "growth_rate": float(growth_rate[i]),
+                    "rank": rank,
+                }
+            )
+        return rows
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from typing import List
 
-from content.application.port.content_repository_port import ContentRepositoryPort
+from content.application.port.async_content_repository_port import AsyncContentRepositoryPort
 from content.utils.embedding import EmbeddingService, cosine_similarity
 
 
@@ -17,11 +18,11 @@ class TrendFeaturedUseCase:
     - 블록 구조: popular, rising, categories, recommended (query 기반)
     """
 
-    def __init__(self, repository: ContentRepositoryPort, embedding_service: EmbeddingService | None = None):
+    def __init__(self, repository: AsyncContentRepositoryPort, embedding_service: EmbeddingService | None = None):
         self.repository = repository
         self.embedding_service = embedding_service or EmbeddingService()
 
-    def get_featured(
+    async def get_featured(
         self,
         limit_popular: int = 5,
         limit_rising: int = 5,
@@ -29,19 +30,23 @@ class TrendFeaturedUseCase:
         platform: str | None = None,
         query: str | None = None,
     ) -> dict:
-        popular = self.repository.fetch_popular_videos(limit=limit_popular * 2, platform=platform)
-        rising = self.repository.fetch_rising_videos(limit=limit_rising * 2, velocity_days=velocity_days, platform=platform)
+        popular = await self.repository.fetch_popular_videos(limit=limit_popular * 2, platform=platform)
+        rising = await self.repository.fetch_rising_videos(
+            limit=limit_rising * 2, velocity_days=velocity_days, platform=platform
+        )
 
-        popular = self._dedup_by_embedding(popular)
-        rising = self._dedup_by_embedding(rising)
+        # 임베딩 호출은 동기 HTTP 요청이므로 스레드에서 실행해 이벤트 루프를 막지 않는다.
+        popular = await asyncio.to_thread(self._dedup_by_embedding, popular)
+        rising = await asyncio.to_thread(self._dedup_by_embedding, rising)
 
-        categories = self.repository.fetch_hot_category_trends(platform=platform, limit=5)
+        categories = await self.repository.fetch_hot_category_trends(platform=platform, limit=5)
 
         recommended: List[dict] = []
         if query:
             # query와의 유사도 기반 재정렬 (popular+rising 합쳐서)
             combined = popular + [r for r in rising if r not in popular]
-            recommended = self._rerank_by_query(query, combined)[: max(limit_popular, limit_rising)]
+            reranked = await asyncio.to_thread(self._rerank_by_query, query, combined)
+            recommended = reranked[: max(limit_popular, limit_rising)]
             recommended = self._enforce_diversity(recommended)
 
         popular = self._enforce_diversity(popular[:limit_popular])
@@ -1,31 +1,39 @@
-from content.application.port.content_repository_port import ContentRepositoryPort
+from content.application.port.async_content_repository_port import AsyncContentRepositoryPort
+from content.utils.cursor import decode_cursor, paginate
 
 
 class TrendQueryUseCase:
-    def __init__(self, repository: ContentRepositoryPort):
+    def __init__(self, repository: AsyncContentRepositoryPort):
         # 트렌드 탭에서 필요한 조회(핫 트렌드, 추천 콘텐츠)를 담당한다.
         self.repository = repository
 
-    def get_hot_categories(self, platform: str | None = None, limit: int = 20) -> list[dict]:
-        return self.repository.fetch_hot_category_trends(platform=platform, limit=limit)
+    async def get_hot_categories(self, platform: str | None = None, limit: int = 20) -> list[dict]:
+        return await self.repository.fetch_hot_category_trends(platform=platform, limit=limit)
 
-    def get_recommended_contents(
-        self, category: str, limit: int = 20, days: int = 14, platform: str | None = None
-    ) -> list[dict]:
-        return self.repository.fetch_recommended_videos_by_category(
-            category=category, limit=limit, days=days, platform=platform
+    async def get_recommended_contents(
+        self,
+        category: str,
+        limit: int = 20,
+        days: int = 14,
+        platform: str | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        rows = await self.repository.fetch_recommended_videos_by_category(
+            category=category, limit=limit + 1, days=days, platform=platform, after=decode_cursor(cursor)
         )
+        return paginate(rows, limit)
 
-    def get_categories(self, limit: int = 100) -> list[str]:
-        return self.repository.fetch_distinct_categories(limit=limit)
+    async def get_categories(self, limit: int = 100) -> list[str]:
+        return await self.repository.fetch_distinct_categories(limit=limit)
 
-    def get_surge_videos(
+    async def get_surge_videos(
         self,
         platform: str | None = None,
         limit: int = 30,
         days: int = 3,
         velocity_days: int = 1,
-    ) -> list[dict]:
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]:
         """
         급등(스파이크) 영상 랭킹을 조회한다.
 
@@ -33,18 +41,21 @@ class TrendQueryUseCase:
         - limit: 상위 N개
         - days: 최근 N일 내 업로드/수집된 영상만 대상
         - velocity_days: 이전 스냅샷 기준 일수 (예: 1일 전과 비교)
+        - cursor: 이전 응답의 next_cursor. (항목, 다음 페이지 커서)를 반환하며 마지막 페이지면 커서는 None
         """
-        return self.repository.fetch_surge_videos(
-            platform=platform, limit=limit, days=days, velocity_days=velocity_days
+        rows = await self.repository.fetch_surge_videos(
+            platform=platform, limit=limit + 1, days=days, velocity_days=velocity_days, after=decode_cursor(cursor)
         )
+        return paginate(rows, limit)
 
-    def get_videos_by_category_id(
+    async def get_videos_by_category_id(
         self,
         category_id: int,
         limit: int = 20,
         days: int = 14,
         platform: str | None = None,
-    ) -> list[dict]:
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]:
         """
         category_id 기준으로 최근 N일 내 영상 리스트를 조회한다.
 
@@ -52,12 +63,14 @@ class TrendQueryUseCase:
         - limit: 상위 N개
         - days: 최근 N일 내 게시된 영상만 대상
         - platform: youtube 등 플랫폼 필터
+        - cursor: 이전 응답의 next_cursor. (항목, 다음 페이지 커서)를 반환하며 마지막 페이지면 커서는 None
         """
-        return self.repository.fetch_videos_by_category_id(
-            category_id=category_id, limit=limit, platform=platform, days=days
+        rows = await self.repository.fetch_videos_by_category_id(
+            category_id=category_id, limit=limit + 1, platform=platform, days=days, after=decode_cursor(cursor)
         )
+        return paginate(rows, limit)
 
-    def get_video_view_history(
+    async def get_video_view_history(
         self,
         video_id: str,
         platform: str | None = None,
@@ -67,18 +80,18 @@ class TrendQueryUseCase:
         단일 영상의 일자별(view_count, like_count, comment_count) 히스토리를 조회한다.
         - snapshot_date 내림차순으로 정렬
         """
-        return self.repository.fetch_video_view_history(
+        return await self.repository.fetch_video_view_history(
             video_id=video_id,
             platform=platform,
             limit=limit,
         )
 
-    def get_video_snapshot_history(
+    async def get_video_snapshot_history(
             self, video_id: str, platform: str = "youtube", days: int = 7
     ) -> list[dict]:
         """
         특정 영상의 스냅샷 히스토리를 조회하여 추이 차트 데이터를 제공한다.
         """
-        return self.repository.fetch_video_snapshot_history(
+        return await self.repository.fetch_video_snapshot_history(
             video_id=video_id, platform=platform, days=days
         )
\ No newline at end of file
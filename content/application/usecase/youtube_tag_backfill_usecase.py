@@ -5,10 +5,12 @@ from sqlalchemy import or_
 from config.database.session import SessionLocal
 from content.application.port.content_repository_port import ContentRepositoryPort
 from content.application.port.platform_client_port import PlatformClientPort
-from content.domain.keyword_mapping import KeywordMapping
+from content.application.usecase.ingestion_usecase import IngestionUseCase
 from content.domain.video import Video
 from content.infrastructure.orm.models import VideoORM
 
+_YOUTUBE_IDS_PER_REQUEST = 50
+
 
 class YouTubeTagBackfillUseCase:
     """
@@ -42,40 +44,29 @@ class YouTubeTagBackfillUseCase:
         if not video_ids:
             return {"target_count": 0, "updated_count": 0}
 
-        # YouTube API로 메타데이터 재조회
-        videos_from_api = list(self.client.fetch_videos_for_ids(video_ids))
+        # YouTube API로 메타데이터 재조회 (videos.list 는 호출당 최대 50개 id)
+        videos_from_api: list[Video] = []
+        for start in range(0, len(video_ids), _YOUTUBE_IDS_PER_REQUEST):
+            videos_from_api.extend(
+                self.client.fetch_videos_for_ids(video_ids[start : start + _YOUTUBE_IDS_PER_REQUEST])
+            )
 
-        updated = 0
-        for video in videos_from_api:
-            # API 응답에도 태그가 없다면 업데이트할 필요가 없다.
-            if not video.tags:
-                continue
+        # API 응답에도 태그가 없다면 업데이트할 필요가 없다.
+        tagged_videos = [video for video in videos_from_api if video.tags]
+        for video in tagged_videos:
             video.platform = platform
-            self._persist_video_with_keywords(video)
-            updated += 1
+        self._persist_videos_with_keywords(tagged_videos)
 
-        return {"target_count": len(video_ids), "updated_count": updated}
+        return {"target_count": len(video_ids), "updated_count": len(tagged_videos)}
 
-    def _persist_video_with_keywords(self, video: Video) -> None:
+    def _persist_videos_with_keywords(self, videos: list[Video]) -> None:
         """
-        IngestionUseCase._persist_video 와 동일한 규칙으로
-        video 및 keyword_mapping 을 upsert 한다.
+        IngestionUseCase._persist_videos 와 동일한 규칙으로
+        video 및 keyword_mapping 을 영상 수와 무관하게 일괄 upsert 한다.
         """
-        self.repository.upsert_video(video)
-        if not video.tags:
+        if not videos:
             return
-
-        keywords = [tag.strip() for tag in video.tags.split(",") if tag.strip()]
-        for kw in keywords:
-            self.repository.upsert_keyword_mapping(
-                KeywordMapping(
-                    mapping_id=None,
-                    video_id=video.video_id,
-                    channel_id=video.channel_id,
-                    platform=video.platform,
-                    keyword=kw,
-                    weight=1.0,
-                )
-            )
-
-
+        self.repository.upsert_videos(videos)
+        self.repository.replace_keyword_mappings_bulk(
+            {video.video_id: IngestionUseCase._to_keyword_mappings(video) for video in videos}
+        )
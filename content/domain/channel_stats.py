@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class ChannelStats:
+    """
+    채널 단위 통계 롤업(channel_stats) 도메인 모델입니다.
+    채널 규모 보정과 급등 피처의 베이스라인 배수 계산에 활용됩니다.
+    """
+    channel_id: str
+    platform: str | None = None
+    video_count: int = 0
+    avg_view_count: Optional[float] = None
+    median_view_count: Optional[float] = None
+    # 최근 영상들의 게시 직후 10분 조회 속도 평균 (조회수/분, intraday 표본 기준). 급등 피처의 10분 속도와 같은 규칙이다.
+    baseline_early_velocity: Optional[float] = None
+    baseline_sample_count: int = 0
+    updated_at: Optional[datetime] = None
@@ -16,4 +16,6 @@ class KeywordTrend:
     avg_trend: Optional[float] = None
     avg_total_score: Optional[float] = None
     growth_rate: Optional[float] = None
+    # 순위 산정 기준. 증분 집계가 바뀌지 않은 행과 함께 다시 순위를 매길 때 쓴다.
+    view_velocity: Optional[float] = None
     rank: Optional[int] = None
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class ViewSample:
+    """
+    단일 시점의 조회수 측정값.
+
+    - 예: 크롤러가 1분/5분마다 수집한 view_count 스냅샷
+    - video_metrics_intraday 에 쌓인 표본을 fetch_view_samples 로 읽어 급등 피처 계산에 사용합니다.
+    """
+
+    timestamp: datetime
+    view_count: int
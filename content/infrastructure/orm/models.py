@@ -1,5 +1,6 @@
 from datetime import datetime, date
-from sqlalchemy import Column, String, Text, BigInteger, Integer, DateTime, Date, DECIMAL, Boolean, PrimaryKeyConstraint, UniqueConstraint, text
+from sqlalchemy import Column, String, Text, BigInteger, Integer, DateTime, Date, DECIMAL, Numeric, Float, Boolean, PrimaryKeyConstraint, UniqueConstraint, text
+from sqlalchemy import DDL, Index, event
 
 from config.database.session import Base
 
@@ -19,6 +20,23 @@ class ChannelORM(Base):
     crawled_at = Column(DateTime, default=datetime.utcnow)
 
 
+class ChannelStatsORM(Base):
+    """
+    채널 단위 통계 롤업. 채널 규모 보정과 급등 베이스라인 조회용이며 배치가 주기적으로 다시 계산한다.
+    """
+
+    __tablename__ = "channel_stats"
+
+    channel_id = Column(String(100), primary_key=True)
+    platform = Column(String(50), default="youtube")
+    video_count = Column(Integer, nullable=False, default=0)
+    avg_view_count = Column(Numeric)
+    median_view_count = Column(Numeric)
+    baseline_early_velocity = Column(Float)
+    baseline_sample_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=text("CURRENT_TIMESTAMP"))
+
+
 class CreatorAccountORM(Base):
     __tablename__ = "creator_account"
 
@@ -37,6 +55,8 @@ class CreatorAccountORM(Base):
 
 class VideoORM(Base):
     __tablename__ = "video"
+    # 증분 트렌드 집계/스냅샷 적재가 watermark 이후 다시 적재된 영상을 찾는다.
+    __table_args__ = (Index("ix_video_updated_at", "updated_at"),)
 
     video_id = Column(String(100), primary_key=True)
     channel_id = Column(String(100))
@@ -52,6 +72,8 @@ class VideoORM(Base):
     comment_count = Column(BigInteger)
     thumbnail_url = Column(String(500))
     crawled_at = Column(DateTime, default=datetime.utcnow)
+    # DB 시계 기준 마지막 적재 시각. crawled_at 은 수집기가 준 값이라 watermark 비교에 쓰지 않는다.
+    updated_at = Column(DateTime, server_default=text("CURRENT_TIMESTAMP"))
 
 
 class VideoCommentORM(Base):
@@ -68,6 +90,7 @@ class VideoCommentORM(Base):
 
 class VideoSentimentORM(Base):
     __tablename__ = "video_sentiment"
+    __table_args__ = (Index("ix_video_sentiment_updated_at", "updated_at"),)
 
     video_id = Column(String(100), primary_key=True)
     platform = Column(String(50), default="youtube")
@@ -78,6 +101,8 @@ class VideoSentimentORM(Base):
     keywords = Column(Text)
     summary = Column(Text)
     analyzed_at = Column(DateTime, default=datetime.utcnow)
+    # DB 시계 기준 마지막 적재 시각. analyzed_at 은 분석기가 준 값이라 watermark 비교에 쓰지 않는다.
+    updated_at = Column(DateTime, server_default=text("CURRENT_TIMESTAMP"))
 
 
 class CommentSentimentORM(Base):
@@ -92,6 +117,8 @@ class CommentSentimentORM(Base):
 
 class KeywordTrendORM(Base):
     __tablename__ = "keyword_trend"
+    # 증분 집계가 같은 일자/플랫폼의 저장된 순위를 읽는다.
+    __table_args__ = (Index("ix_keyword_trend_date_platform", "date", "platform"),)
 
     keyword = Column(String(100), primary_key=True)
     date = Column(Date, primary_key=True)
@@ -104,11 +131,13 @@ class KeywordTrendORM(Base):
     avg_trend = Column(DECIMAL(5, 4))
     avg_total_score = Column(DECIMAL(6, 3))
     growth_rate = Column(DECIMAL(18, 4))
+    view_velocity = Column(Float)
     rank = Column(Integer)
 
 
 class CategoryTrendORM(Base):
     __tablename__ = "category_trend"
+    __table_args__ = (Index("ix_category_trend_date_platform", "date", "platform"),)
 
     category = Column(String(100), primary_key=True)
     date = Column(Date, primary_key=True)
@@ -121,6 +150,7 @@ class CategoryTrendORM(Base):
     search_volume = Column(BigInteger)
     search_volume_prev = Column(BigInteger)
     growth_rate = Column(DECIMAL(18, 4))
+    view_velocity = Column(Float)
     rank = Column(Integer)
 
 
@@ -143,8 +173,73 @@ class KeywordMappingORM(Base):
     weight = Column(DECIMAL(5, 4))
 
 
+class TagORM(Base):
+    """
+    태그 사전. 태그 문자열마다 정수 id 를 부여한다.
+    """
+
+    __tablename__ = "tag"
+    __table_args__ = (
+        UniqueConstraint("name", name="ux_tag_name"),
+    )
+
+    tag_id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class VideoTagORM(Base):
+    """
+    영상-태그 역색인. (tag_id, video_id) 인덱스로 태그 -> 영상 방향 조회를 정수 조인으로 처리한다.
+    """
+
+    __tablename__ = "video_tag"
+    __table_args__ = (
+        PrimaryKeyConstraint("video_id", "tag_id", name="pk_video_tag"),
+        Index("ix_video_tag_tag_video", "tag_id", "video_id"),
+        Index("ix_video_tag_created_at", "created_at"),
+    )
+
+    video_id = Column(String(100))
+    tag_id = Column(Integer, nullable=False)
+    platform = Column(String(50), default="youtube")
+    weight = Column(DECIMAL(5, 4))
+    # 연관 키워드 증분 배치의 기준 시각. DB 시계와 맞추기 위해 서버 기본값만 사용한다.
+    created_at = Column(DateTime, server_default=text("CURRENT_TIMESTAMP"))
+
+
+class KeywordCooccurrenceORM(Base):
+    """
+    연관 키워드 행렬. (tag_a, tag_b) 쌍이 함께 달린 영상 수이며 두 방향을 모두 저장한다.
+    """
+
+    __tablename__ = "keyword_cooccurrence"
+    __table_args__ = (
+        PrimaryKeyConstraint("tag_a", "tag_b", name="pk_keyword_cooccurrence"),
+        Index("ix_keyword_cooccurrence_top", "tag_a", text("video_count DESC"), "tag_b"),
+    )
+
+    tag_a = Column(Integer)
+    tag_b = Column(Integer)
+    video_count = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, server_default=text("CURRENT_TIMESTAMP"))
+
+
+class BatchWatermarkORM(Base):
+    """
+    증분 배치별 마지막 처리 시점.
+    """
+
+    __tablename__ = "batch_watermark"
+
+    job_name = Column(String(100), primary_key=True)
+    watermark = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, server_default=text("CURRENT_TIMESTAMP"))
+
+
 class VideoScoreORM(Base):
     __tablename__ = "video_score"
+    __table_args__ = (Index("ix_video_score_updated_at", "updated_at"),)
 
     video_id = Column(String(100), primary_key=True)
     platform = Column(String(50), default="youtube")
@@ -167,9 +262,15 @@ class CrawlLogORM(Base):
 
 
 class VideoMetricsSnapshotORM(Base):
+    """
+    snapshot_date 기준 월 단위 RANGE 파티션 테이블.
+    월별 파티션 생성/보관 기간 정리는 app/batch/snapshot_retention_batch.py 가 담당한다.
+    """
+
     __tablename__ = "video_metrics_snapshot"
     __table_args__ = (
         PrimaryKeyConstraint("video_id", "snapshot_date", "platform", name="pk_video_metrics_snapshot"),
+        {"postgresql_partition_by": "RANGE (snapshot_date)"},
     )
 
     video_id = Column(String(100))
@@ -180,6 +281,158 @@ class VideoMetricsSnapshotORM(Base):
     comment_count = Column(BigInteger)
 
 
+# create_all 로 만든 직후에도 적재가 실패하지 않도록 DEFAULT 파티션을 함께 만든다.
+event.listen(
+    VideoMetricsSnapshotORM.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS video_metrics_snapshot_default "
+        "PARTITION OF video_metrics_snapshot DEFAULT"
+    ),
+)
+
+
+class VideoMetricsWeeklyORM(Base):
+    """
+    보관 기간이 지난 스냅샷의 주 단위 요약 (period_start = 주의 월요일).
+    """
+
+    __tablename__ = "video_metrics_weekly"
+    __table_args__ = (
+        PrimaryKeyConstraint("video_id", "platform", "period_start", name="pk_video_metrics_weekly"),
+    )
+
+    video_id = Column(String(100))
+    platform = Column(String(50), default="youtube")
+    period_start = Column(Date)
+    first_date = Column(Date, nullable=False)
+    first_view_count = Column(BigInteger)
+    last_date = Column(Date, nullable=False)
+    view_count = Column(BigInteger)
+    like_count = Column(BigInteger)
+    comment_count = Column(BigInteger)
+    sample_count = Column(Integer, nullable=False, default=0)
+
+
+class VideoMetricsMonthlyORM(Base):
+    """
+    보관 기간이 지난 스냅샷의 월 단위 요약 (period_start = 월의 1일).
+    """
+
+    __tablename__ = "video_metrics_monthly"
+    __table_args__ = (
+        PrimaryKeyConstraint("video_id", "platform", "period_start", name="pk_video_metrics_monthly"),
+    )
+
+    video_id = Column(String(100))
+    platform = Column(String(50), default="youtube")
+    period_start = Column(Date)
+    first_date = Column(Date, nullable=False)
+    first_view_count = Column(BigInteger)
+    last_date = Column(Date, nullable=False)
+    view_count = Column(BigInteger)
+    like_count = Column(BigInteger)
+    comment_count = Column(BigInteger)
+    sample_count = Column(Integer, nullable=False, default=0)
+
+
+class VideoMetricsLatestORM(Base):
+    """
+    영상별 최신/직전 스냅샷 요약. video_metrics_snapshot 적재 시 같은 문장에서 함께 갱신된다.
+    """
+
+    __tablename__ = "video_metrics_latest"
+    __table_args__ = (
+        PrimaryKeyConstraint("video_id", "platform", name="pk_video_metrics_latest"),
+        Index("ix_video_metrics_latest_updated_at", "updated_at"),
+    )
+
+    video_id = Column(String(100))
+    platform = Column(String(50), default="youtube")
+    curr_date = Column(Date, nullable=False)
+    curr_view_count = Column(BigInteger)
+    curr_like_count = Column(BigInteger)
+    curr_comment_count = Column(BigInteger)
+    prev_date = Column(Date)
+    prev_view_count = Column(BigInteger)
+    prev_like_count = Column(BigInteger)
+    prev_comment_count = Column(BigInteger)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class VideoMetricsIntradayORM(Base):
+    """
+    최근 게시 영상의 분/시간 단위 조회수 표본. 추가만 하며, 오래된 구간의 시간당 축소와 삭제는
+    ContentRepositoryImpl.compact_view_samples 가 담당한다. ts 는 수집 순서대로 쌓이므로 BRIN 인덱스를 쓴다.
+    """
+
+    __tablename__ = "video_metrics_intraday"
+    __table_args__ = (
+        PrimaryKeyConstraint("video_id", "ts", "platform", name="pk_video_metrics_intraday"),
+        Index("ix_video_metrics_intraday_ts", "ts", postgresql_using="brin"),
+    )
+
+    video_id = Column(String(100))
+    platform = Column(String(50), default="youtube")
+    ts = Column(DateTime)
+    view_count = Column(BigInteger)
+    like_count = Column(BigInteger)
+    comment_count = Column(BigInteger)
+
+
+class VideoSurgeFeatureORM(Base):
+    """
+    영상별 최근 급등 피처(SurgeFeatures). 급상승 수집 배치가 수집한 영상마다 intraday 표본, channel_stats 베이스라인,
+    동시 상승 점수로 계산해 덮어쓴다. 값이 없는 피처는 NULL 이다.
+    """
+
+    __tablename__ = "video_surge_feature"
+    __table_args__ = (
+        PrimaryKeyConstraint("video_id", "platform", name="pk_video_surge_feature"),
+        Index("ix_video_surge_feature_computed_at", "computed_at"),
+    )
+
+    video_id = Column(String(100))
+    platform = Column(String(50), default="youtube")
+    delta_views_10m = Column(Float)
+    delta_views_30m = Column(Float)
+    delta_views_1h = Column(Float)
+    delta_views_6h = Column(Float)
+    growth_rate_10m = Column(Float)
+    growth_rate_30m = Column(Float)
+    growth_rate_1h = Column(Float)
+    growth_rate_6h = Column(Float)
+    acceleration_10m_vs_30m = Column(Float)
+    age_minutes = Column(Float)
+    age_hours = Column(Float)
+    baseline_velocity_10m_per_min = Column(Float)
+    velocity_10m_per_min = Column(Float)
+    ratio_velocity_10m_to_baseline = Column(Float)
+    co_movement_score = Column(Float)
+    computed_at = Column(DateTime, nullable=False)
+
+
+class VideoCoMovementORM(Base):
+    """
+    영상별 동시 상승(트렌드 웨이브) 점수. 같은 키워드/카테고리 영상들과 단기 조회 속도의 상관이며
+    app/batch/co_movement_batch.py 가 주기마다 다시 계산하고, 계산되지 않은 영상의 행은 지운다.
+    """
+
+    __tablename__ = "video_co_movement"
+    __table_args__ = (
+        PrimaryKeyConstraint("video_id", "platform", name="pk_video_co_movement"),
+        Index("ix_video_co_movement_computed_at", "computed_at"),
+    )
+
+    video_id = Column(String(100))
+    platform = Column(String(50), default="youtube")
+    score = Column(Float, nullable=False)
+    group_count = Column(Integer, nullable=False)
+    top_group = Column(String(120))
+    top_group_score = Column(Float)
+    computed_at = Column(DateTime, nullable=False)
+
+
 class StopwordORM(Base):
     __tablename__ = "stopword"
 
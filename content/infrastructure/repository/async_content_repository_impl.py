@@ -0,0 +1,134 @@
+from typing import Any, Callable, Mapping
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from content.application.port.async_content_repository_port import AsyncContentRepositoryPort
+from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+
+
+class AsyncContentRepositoryImpl(AsyncContentRepositoryPort):
+    """
+    asyncpg 기반 AsyncSession 위에서 조회 쿼리를 실행하는 비동기 리포지토리.
+
+    - SQL은 ContentRepositoryImpl 과 공유한다. AsyncSession.run_sync 가 동기 Session 인터페이스를
+      제공하지만 실제 네트워크 I/O 는 asyncpg 가 이벤트 루프 위에서 처리하므로 요청 스레드를 막지 않는다.
+    - 세션은 요청 단위로 주입받는다(config.database.session.get_async_db). commit/rollback/close 는
+      의존성이 담당하므로 리포지토리는 트랜잭션 경계를 다루지 않는다.
+    - read_session(get_async_read_db, 복제본 우선)을 주면 조회는 그 세션으로 보내고, session 은 쓰기에만 쓴다.
+      AsyncSession 은 처음 쿼리할 때 커넥션을 잡으므로, 쓰기가 없는 요청은 primary 커넥션을 점유하지 않는다.
+    - 배치 스크립트는 기존 동기 구현(ContentRepositoryImpl)을 그대로 사용한다.
+    """
+
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None):
+        self.session = session
+        self.read_session = read_session if read_session is not None else session
+
+    async def _run(self, query: Callable[[ContentRepositoryImpl], Any]) -> Any:
+        def _call(sync_session: Session) -> Any:
+            return query(ContentRepositoryImpl(sync_session))
+
+        return await self.read_session.run_sync(_call)
+
+    async def _run_write(self, command: Callable[[ContentRepositoryImpl], Any]) -> Any:
+        def _call(sync_session: Session) -> Any:
+            return command(ContentRepositoryImpl(sync_session))
+
+        return await self.session.run_sync(_call)
+
+    async def fetch_videos_by_category(
+        self, category: str, limit: int = 20, after: Mapping[str, Any] | None = None
+    ) -> list[dict]:
+        return await self._run(lambda repo: repo.fetch_videos_by_category(category, limit=limit, after=after))
+
+    async def fetch_videos_by_keyword(
+        self, keyword: str, limit: int = 20, after: Mapping[str, Any] | None = None
+    ) -> list[dict]:
+        return await self._run(lambda repo: repo.fetch_videos_by_keyword(keyword, limit=limit, after=after))
+
+    async def fetch_top_keywords_by_category(self, category: str, limit: int = 10) -> list[dict]:
+        return await self._run(lambda repo: repo.fetch_top_keywords_by_category(category, limit=limit))
+
+    async def fetch_top_keywords_by_keyword(self, keyword: str, limit: int = 10) -> list[dict]:
+        return await self._run(lambda repo: repo.fetch_top_keywords_by_keyword(keyword, limit=limit))
+
+    async def fetch_video_with_scores(self, video_id: str) -> dict | None:
+        return await self._run(lambda repo: repo.fetch_video_with_scores(video_id))
+
+    async def fetch_hot_category_trends(self, platform: str | None = None, limit: int = 20) -> list[dict]:
+        return await self._run(lambda repo: repo.fetch_hot_category_trends(platform=platform, limit=limit))
+
+    async def fetch_popular_videos(self, limit: int = 5, platform: str | None = None) -> list[dict]:
+        return await self._run(lambda repo: repo.fetch_popular_videos(limit=limit, platform=platform))
+
+    async def fetch_rising_videos(
+        self, limit: int = 5, velocity_days: int = 1, platform: str | None = None
+    ) -> list[dict]:
+        return await self._run(
+            lambda repo: repo.fetch_rising_videos(limit=limit, velocity_days=velocity_days, platform=platform)
+        )
+
+    async def fetch_recommended_videos_by_category(
+        self,
+        category: str,
+        limit: int = 20,
+        days: int = 14,
+        platform: str | None = None,
+        after: Mapping[str, Any] | None = None,
+    ) -> list[dict]:
+        return await self._run(
+            lambda repo: repo.fetch_recommended_videos_by_category(
+                category=category, limit=limit, days=days, platform=platform, after=after
+            )
+        )
+
+    async def fetch_distinct_categories(self, limit: int = 100) -> list[str]:
+        return await self._run(lambda repo: repo.fetch_distinct_categories(limit=limit))
+
+    async def fetch_surge_videos(
+        self,
+        platform: str | None = None,
+        limit: int = 30,
+        days: int = 3,
+        velocity_days: int = 1,
+        after: Mapping[str, Any] | None = None,
+    ) -> list[dict]:
+        # 랭킹 계산은 조회 세션, trend_score 저장은 쓰기 세션으로 나눠 실행한다.
+        items = await self._run(
+            lambda repo: repo.fetch_surge_videos(
+                platform=platform, limit=limit, days=days, velocity_days=velocity_days, after=after, save_scores=False
+            )
+        )
+        await self._run_write(lambda repo: repo.save_surge_scores(items))
+        return items
+
+    async def fetch_video_snapshot_history(
+        self, video_id: str, platform: str = "youtube", days: int = 7
+    ) -> list[dict]:
+        return await self._run(
+            lambda repo: repo.fetch_video_snapshot_history(video_id=video_id, platform=platform, days=days)
+        )
+
+    async def fetch_videos_by_category_id(
+        self,
+        category_id: int,
+        limit: int = 10,
+        platform: str | None = None,
+        days: int | None = None,
+        after: Mapping[str, Any] | None = None,
+    ) -> list[dict]:
+        return await self._run(
+            lambda repo: repo.fetch_videos_by_category_id(
+                category_id=category_id, limit=limit, platform=platform, days=days, after=after
+            )
+        )
+
+    async def fetch_video_view_history(
+        self,
+        video_id: str,
+        platform: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        return await self._run(
+            lambda repo: repo.fetch_video_view_history(video_id=video_id, platform=platform, limit=limit)
+        )
@@ -0,0 +1,36 @@
+"""
+배치 작업별 진행 지점(watermark)을 batch_watermark 테이블에 기록/조회한다.
+
+증분 배치는 "마지막으로 처리한 시점" 이후의 변경분만 다시 계산하므로,
+처리 결과와 watermark 갱신을 같은 트랜잭션에서 commit 해야 한다.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+def get_watermark(db: Session, job_name: str) -> datetime | None:
+    """job_name 의 마지막 watermark. 한 번도 실행되지 않았으면 None."""
+    return db.execute(
+        text("SELECT watermark FROM batch_watermark WHERE job_name = :job_name"),
+        {"job_name": job_name},
+    ).scalar()
+
+
+def set_watermark(db: Session, job_name: str, watermark: datetime) -> None:
+    """job_name 의 watermark 를 기록한다. commit 은 호출 측에서 처리 결과와 함께 수행한다."""
+    db.execute(
+        text(
+            """
+            INSERT INTO batch_watermark (job_name, watermark, updated_at)
+            VALUES (:job_name, :watermark, NOW())
+            ON CONFLICT (job_name)
+            DO UPDATE SET
+                watermark = EXCLUDED.watermark,
+                updated_at = NOW()
+            """
+        ),
+        {"job_name": job_name, "watermark": watermark},
+    )
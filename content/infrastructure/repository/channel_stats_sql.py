@@ -0,0 +1,126 @@
+"""
+channel_stats(채널 통계 롤업)를 갱신하는 SQL.
+
+channel_stats 는 채널마다 영상 수, 평균/중앙값 조회수, 초기 조회 속도 베이스라인을 담는다.
+인기/급상승 목록의 채널 규모 보정과 급등 피처의 베이스라인 배수 계산이 이 테이블을 PK 조인으로 읽으므로,
+요청 경로에서 video 전체에 대한 채널 단위 집계를 다시 하지 않는다.
+
+- 평균/중앙값/영상 수: 채널의 전체 영상(video.view_count) 기준
+- 초기 조회 속도(baseline_early_velocity): 최근 게시 영상 :baseline_videos 개의 "게시 직후 10분 속도" 평균 (조회수/분).
+  급등 피처의 velocity_10m_per_min 과 같은 규칙으로 intraday 표본(video_metrics_intraday)에서 잰다.
+  첫 표본에서 :window_minutes 분 이상 지난 첫 표본을 구간 끝으로 두고, 그 :window_minutes 분 전(포함) 이전의
+  마지막 표본과의 조회수 차이를 :window_minutes 로 나눈다. 구간 끝이 게시 후 :early_window_minutes 분 안인 영상만 쓴다.
+- intraday 표본은 INTRADAY_RAW_HOURS 가 지나면 시간당 하나로 줄어 10분 구간을 잴 수 없으므로, :since 이후 게시된
+  영상만 본다. 그 사이 잴 수 있는 영상이 없는 채널은 직전 베이스라인을 유지한다.
+"""
+
+# 베이스라인 속도를 재는 구간 (분). 급등 피처의 10분 윈도우(compute_surge_features 의 window_10m)와 같아야 한다.
+BASELINE_WINDOW_MINUTES = 10
+
+REFRESH_CHANNEL_STATS_SQL = """
+    WITH views AS (
+        SELECT
+            v.channel_id,
+            MAX(v.platform) AS platform,
+            COUNT(*) AS video_count,
+            AVG(v.view_count) AS avg_view_count,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY v.view_count) AS median_view_count
+        FROM video v
+        WHERE v.channel_id IS NOT NULL
+        GROUP BY v.channel_id
+    ),
+    early AS (
+        SELECT
+            channel_id,
+            AVG(velocity) AS baseline_early_velocity,
+            COUNT(*) AS baseline_sample_count
+        FROM (
+            SELECT
+                v.channel_id,
+                (e.view_count - r.view_count) / CAST(:window_minutes AS DOUBLE PRECISION) AS velocity,
+                ROW_NUMBER() OVER (PARTITION BY v.channel_id ORDER BY v.published_at DESC) AS rn
+            FROM video v
+            -- 게시 후 첫 표본
+            CROSS JOIN LATERAL (
+                SELECT i.ts
+                FROM video_metrics_intraday i
+                WHERE i.video_id = v.video_id
+                  AND i.platform = v.platform
+                  AND i.view_count IS NOT NULL
+                ORDER BY i.ts
+                LIMIT 1
+            ) f
+            -- 구간 끝: 첫 표본에서 :window_minutes 분 이상 지난 첫 표본
+            CROSS JOIN LATERAL (
+                SELECT i.ts, i.view_count
+                FROM video_metrics_intraday i
+                WHERE i.video_id = v.video_id
+                  AND i.platform = v.platform
+                  AND i.view_count IS NOT NULL
+                  AND i.ts >= f.ts + make_interval(mins => CAST(:window_minutes AS INTEGER))
+                ORDER BY i.ts
+                LIMIT 1
+            ) e
+            -- 기준점: 구간 끝의 :window_minutes 분 전(포함) 이전 마지막 표본
+            CROSS JOIN LATERAL (
+                SELECT i.view_count
+                FROM video_metrics_intraday i
+                WHERE i.video_id = v.video_id
+                  AND i.platform = v.platform
+                  AND i.view_count IS NOT NULL
+                  AND i.ts <= e.ts - make_interval(mins => CAST(:window_minutes AS INTEGER))
+                ORDER BY i.ts DESC
+                LIMIT 1
+            ) r
+            WHERE v.channel_id IS NOT NULL
+              AND v.published_at IS NOT NULL
+              AND v.published_at >= :since
+              AND e.ts <= v.published_at + make_interval(mins => CAST(:early_window_minutes AS INTEGER))
+        ) samples
+        WHERE rn <= :baseline_videos
+        GROUP BY channel_id
+    )
+    INSERT INTO channel_stats (
+        channel_id,
+        platform,
+        video_count,
+        avg_view_count,
+        median_view_count,
+        baseline_early_velocity,
+        baseline_sample_count,
+        updated_at
+    )
+    SELECT
+        vw.channel_id,
+        vw.platform,
+        vw.video_count,
+        vw.avg_view_count,
+        vw.median_view_count,
+        e.baseline_early_velocity,
+        COALESCE(e.baseline_sample_count, 0),
+        NOW()
+    FROM views vw
+    LEFT JOIN early e ON e.channel_id = vw.channel_id
+    ON CONFLICT (channel_id)
+    DO UPDATE SET
+        platform = EXCLUDED.platform,
+        video_count = EXCLUDED.video_count,
+        avg_view_count = EXCLUDED.avg_view_count,
+        median_view_count = EXCLUDED.median_view_count,
+        baseline_early_velocity = COALESCE(EXCLUDED.baseline_early_velocity, channel_stats.baseline_early_velocity),
+        baseline_sample_count = CASE
+            WHEN EXCLUDED.baseline_early_velocity IS NULL THEN channel_stats.baseline_sample_count
+            ELSE EXCLUDED.baseline_sample_count
+        END,
+        updated_at = EXCLUDED.updated_at
+"""
+
+# 영상이 모두 사라진 채널의 통계 제거
+DELETE_ORPHAN_CHANNEL_STATS_SQL = """
+    DELETE FROM channel_stats cs
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM video v
+        WHERE v.channel_id = cs.channel_id
+    )
+"""
@@ -0,0 +1,78 @@
+"""
+video_co_movement(키워드/카테고리 동시 상승 점수)를 갱신하는 SQL.
+
+video_co_movement 는 최근 intraday 표본이 있는 영상마다, 같은 키워드(keyword_mapping)나 카테고리(video_sentiment)를
+가진 다른 영상들과 단기 조회 속도가 얼마나 함께 움직이는지(상관계수)를 담는다. 점수 계산은
+CoMovementEngine(numpy)이 하고, 여기서는 입력을 읽고 결과를 한 번에 쓰는 문장만 둔다.
+
+- 입력: 영상 행 하나에 (video_id, platform) 의 표본 시각(epoch 마이크로초)/조회수 배열과 그룹 키 배열을 담는다.
+  표본 수만큼 datetime 객체를 만들지 않도록 시각은 정수로 읽는다.
+- 그룹 키: 'keyword:<keyword>' / 'category:<category>'. 플랫폼은 구분하지 않는다.
+- 저장: 배열 파라미터를 unnest 해 upsert 하고, 이번 실행에서 계산되지 않은 영상(표본이 끊겼거나 그룹이 사라진 영상)의
+  행은 같은 트랜잭션에서 지운다.
+"""
+
+# (video_id, platform) 순. 표본 배열은 영상마다 ts 오름차순이다.
+CO_MOVEMENT_INPUT_SQL = """
+    SELECT
+        s.video_id,
+        s.platform,
+        s.ts_us,
+        s.view_counts,
+        ARRAY(
+            SELECT 'keyword:' || km.keyword
+            FROM keyword_mapping km
+            WHERE km.video_id = s.video_id
+              AND km.platform = s.platform
+              AND km.keyword IS NOT NULL
+            UNION
+            SELECT 'category:' || vs.category
+            FROM video_sentiment vs
+            WHERE vs.video_id = s.video_id
+              AND vs.category IS NOT NULL
+        ) AS group_keys
+    FROM (
+        SELECT
+            i.video_id,
+            i.platform,
+            array_agg(CAST(EXTRACT(EPOCH FROM i.ts) * 1000000 AS BIGINT) ORDER BY i.ts) AS ts_us,
+            array_agg(i.view_count ORDER BY i.ts) AS view_counts
+        FROM video_metrics_intraday i
+        WHERE i.ts >= :since
+          AND i.view_count IS NOT NULL
+        GROUP BY i.video_id, i.platform
+    ) s
+    ORDER BY s.video_id, s.platform
+"""
+
+UPSERT_CO_MOVEMENT_SQL = """
+    INSERT INTO video_co_movement (
+        video_id, platform, score, group_count, top_group, top_group_score, computed_at
+    )
+    SELECT s.video_id, s.platform, s.score, s.group_count, s.top_group, s.top_group_score, :computed_at
+    FROM unnest(
+        CAST(:video_ids AS VARCHAR[]),
+        CAST(:platforms AS VARCHAR[]),
+        CAST(:scores AS DOUBLE PRECISION[]),
+        CAST(:group_counts AS INTEGER[]),
+        CAST(:top_groups AS VARCHAR[]),
+        CAST(:top_group_scores AS DOUBLE PRECISION[])
+    ) AS s(video_id, platform, score, group_count, top_group, top_group_score)
+    ON CONFLICT (video_id, platform)
+    DO UPDATE SET
+        score = EXCLUDED.score,
+        group_count = EXCLUDED.group_count,
+        top_group = EXCLUDED.top_group,
+        top_group_score = EXCLUDED.top_group_score,
+        computed_at = EXCLUDED.computed_at
+"""
+
+DELETE_STALE_CO_MOVEMENT_SQL = "DELETE FROM video_co_movement WHERE computed_at < :computed_at"
+
+# 여러 영상의 점수를 PK 앞 컬럼으로 읽는다. 플랫폼이 여러 개인 영상은 가장 최근에 계산된 값을 쓴다.
+CO_MOVEMENT_SCORES_SQL = """
+    SELECT DISTINCT ON (video_id) video_id, score
+    FROM video_co_movement
+    WHERE video_id = ANY(CAST(:video_ids AS VARCHAR[]))
+    ORDER BY video_id, computed_at DESC
+"""
@@ -1,11 +1,16 @@
-from typing import Any, Iterable
-from datetime import datetime, timedelta
+import csv
+import io
+from typing import Any, Iterable, Mapping
+from datetime import date, datetime, timedelta
 
 from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 
 from config.database.session import SessionLocal
 from content.application.port.content_repository_port import ContentRepositoryPort
 from content.domain.channel import Channel
+from content.domain.channel_stats import ChannelStats
 from content.domain.comment_sentiment import CommentSentiment
 from content.domain.crawl_log import CrawlLog
 from content.domain.creator_account import CreatorAccount
@@ -17,6 +22,7 @@ from content.domain.video_comment import VideoComment
 from content.domain.video_score import VideoScore
 from content.domain.video_sentiment import VideoSentiment
 from content.domain.video_metrics_snapshot import VideoMetricsSnapshot
+from content.domain.view_sample import ViewSample
 from content.infrastructure.orm.models import (
     ChannelORM,
     CreatorAccountORM,
@@ -30,12 +36,83 @@ from content.infrastructure.orm.models import (
     VideoScoreORM,
     CrawlLogORM,
     VideoMetricsSnapshotORM,
+    VideoSurgeFeatureORM,
 )
+from content.infrastructure.repository.batch_watermark import get_watermark, set_watermark
+from content.infrastructure.repository.co_movement_sql import CO_MOVEMENT_SCORES_SQL
+from content.infrastructure.repository.video_metrics_sql import (
+    APPEND_INTRADAY_SAMPLES_SQL,
+    DOWNSAMPLE_INTRADAY_SQL,
+    INTRADAY_RAW_HOURS,
+    INTRADAY_SAMPLES_SQL,
+    INTRADAY_TRACK_DAYS,
+    PURGE_INTRADAY_SQL,
+    changed_snapshot_join,
+    latest_metrics_join,
+    metrics_granularity,
+    metrics_series_sql,
+    snapshot_as_of_join,
+    upsert_snapshots_with_latest_sql,
+)
+from content.infrastructure.repository.pagination_sql import (
+    VIDEO_KEYSET_ORDER_SQL,
+    VIDEO_KEYSET_SEEK_SQL,
+    VIDEO_SORT_CRAWLED_AT_SQL,
+    VIDEO_SORT_SCORE_SQL,
+    video_keyset_params,
+    video_row_cursor,
+)
+from content.infrastructure.repository.tag_sql import INCOMING_TAGS_SOURCE_SQL, replace_video_tags_sql
+from content.infrastructure.repository.trend_aggregation_sql import (
+    copy_trend_stage_sql,
+    create_trend_stage_sql,
+    delete_trend_keys_sql,
+    delete_unstaged_trends_sql,
+    insert_trend_stage_sql,
+    merge_trend_stage_sql,
+    trend_columns,
+)
+from content.utils.cursor import CURSOR_KEY, cursor_value, encode_cursor
+
+# 한 문장에 담는 최대 행 수 (PostgreSQL 바인드 파라미터 한도 65535 대비 여유 있게 설정)
+_BULK_CHUNK_SIZE = 1000
+# 키워드 교체 시 한 문장에서 다루는 최대 영상 수 (배열 파라미터로 전달되므로 크게 잡아도 무방)
+_KEYWORD_REPLACE_CHUNK_SIZE = 5000
+# video / video_sentiment.updated_at 에 넣는 DB 시계 기준 적재 시각. 증분 집계의 watermark(DB NOW() 기준)와
+# 같은 시계로 비교되도록 수집기/분석기가 준 시각 대신 쓴다. (video_tag.created_at 과 같은 방식)
+_DB_WRITE_TIME = "CAST(clock_timestamp() AS TIMESTAMP)"
+# intraday 표본 시간당 축소를 어디까지 마쳤는지 남기는 batch_watermark 작업 이름
+_INTRADAY_DOWNSAMPLE_JOB = "video_metrics_intraday_downsample"
+
+
+def _unique_rows(rows: Iterable[dict], *key_fields: str) -> list[dict]:
+    """
+    ON CONFLICT DO UPDATE 는 한 문장 안에서 같은 키를 두 번 갱신할 수 없으므로,
+    동일 키가 여러 번 들어오면 마지막 값만 남긴다.
+    """
+    unique: dict[tuple, dict] = {}
+    for row in rows:
+        unique[tuple(row[k] for k in key_fields)] = row
+    return list(unique.values())
+
+
+def _with_video_cursor(item: dict) -> dict:
+    """
+    키셋 정렬 키 컬럼(sort_score, sort_crawled_at)을 행 커서로 바꿔 담고 응답에서는 제거한다.
+    """
+    item[CURSOR_KEY] = video_row_cursor(item)
+    item.pop("sort_score", None)
+    item.pop("sort_crawled_at", None)
+    return item
 
 
 class ContentRepositoryImpl(ContentRepositoryPort):
-    def __init__(self):
-        self.db = SessionLocal()
+    def __init__(self, db: Session | None = None, read_db: Session | None = None):
+        # 외부에서 세션을 주입하면(예: AsyncSession.run_sync) 그 세션을 그대로 사용한다.
+        # fetch_* 조회는 read_db(읽기 전용 복제본 세션)로 보내고, 주지 않으면 db 로 읽는다.
+        # 쓰기 직후 같은 데이터를 읽어야 하는 흐름(수집 응답 등)은 read_db 를 주지 않는다.
+        self.db = db if db is not None else SessionLocal()
+        self.read_db = read_db if read_db is not None else self.db
 
     def upsert_channel(self, channel: Channel) -> Channel:
         orm = self.db.get(ChannelORM, channel.channel_id)
@@ -84,71 +161,161 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         return account
 
     def upsert_video(self, video: Video) -> Video:
-        orm = self.db.get(VideoORM, video.video_id)
-        if orm is None:
-            orm = VideoORM(video_id=video.video_id)
-            self.db.add(orm)
-            # 한국어 주석: 최초 적재 시 정적 메타데이터를 저장하여 이후 변동성 업데이트와 분리합니다.
-            orm.platform = video.platform or "youtube"
-            orm.channel_id = video.channel_id
-            orm.title = video.title
-            orm.description = video.description
-            orm.tags = video.tags
-            orm.category_id = video.category_id
-            orm.published_at = video.published_at
-            orm.duration = video.duration
-            orm.thumbnail_url = video.thumbnail_url
-        # 한국어 주석: 기존 레코드는 변동성 필드(조회/좋아요/댓글 수, 최신 수집시각)만 갱신합니다.
-        orm.view_count = video.view_count
-        orm.like_count = video.like_count
-        orm.comment_count = video.comment_count
-        orm.crawled_at = video.crawled_at
+        self.upsert_videos([video])
+        return video
 
+    def upsert_videos(self, videos: Iterable[Video]) -> list[Video]:
+        """
+        여러 영상을 테이블당 한 번의 INSERT ... ON CONFLICT DO UPDATE 로 적재한다.
+        - 정적 메타데이터(제목/설명/태그 등)는 최초 삽입 시에만 저장
+        - 기존 레코드는 변동성 필드(조회/좋아요/댓글 수, 최신 수집시각)만 갱신
+        - updated_at 은 삽입/갱신 모두 DB 시계(clock_timestamp)로 기록 (증분 집계/스냅샷 적재의 변경 감지 기준)
+        - 이번에 받은 태그가 있는 영상은 그 태그로 tag / video_tag 역색인을 같은 트랜잭션에서 갱신
+          (replace_keyword_mappings_bulk 와 같은 태그 목록이므로 이어서 호출해도 video_tag 는 바뀌지 않는다.
+          태그가 비어 있는 수집 결과로는 기존 역색인을 지우지 않는다)
+        """
+        videos = list(videos)
+        rows = _unique_rows(
+            (
+                {
+                    "video_id": video.video_id,
+                    "platform": video.platform or "youtube",
+                    "channel_id": video.channel_id,
+                    "title": video.title,
+                    "description": video.description,
+                    "tags": video.tags,
+                    "category_id": video.category_id,
+                    "published_at": video.published_at,
+                    "duration": video.duration,
+                    "thumbnail_url": video.thumbnail_url,
+                    "view_count": video.view_count,
+                    "like_count": video.like_count,
+                    "comment_count": video.comment_count,
+                    "crawled_at": video.crawled_at,
+                    "updated_at": text(_DB_WRITE_TIME),
+                }
+                for video in videos
+            ),
+            "video_id",
+        )
+        self._bulk_upsert(
+            VideoORM.__table__,
+            rows,
+            conflict_keys=("video_id",),
+            update_fields=("view_count", "like_count", "comment_count", "crawled_at", "updated_at"),
+            # 태그는 정적 필드지만, 비어 있는 기존 레코드는 태그 백필을 위해 채워 넣는다.
+            extra_set={
+                "tags": text(
+                    "CASE WHEN COALESCE(video.tags, '') = '' THEN EXCLUDED.tags ELSE video.tags END"
+                ),
+            },
+        )
+        tagged = [row for row in rows if row["tags"]]
+        for start in range(0, len(tagged), _KEYWORD_REPLACE_CHUNK_SIZE):
+            chunk = tagged[start : start + _KEYWORD_REPLACE_CHUNK_SIZE]
+            video_ids = [row["video_id"] for row in chunk]
+            self.db.execute(
+                text(replace_video_tags_sql(INCOMING_TAGS_SOURCE_SQL)),
+                {
+                    "video_ids": video_ids,
+                    "platforms": [row["platform"] for row in chunk],
+                    "tag_lists": [row["tags"] for row in chunk],
+                    "target_video_ids": video_ids,
+                },
+            )
         self.db.commit()
-        return video
+        return videos
 
     def upsert_comments(self, comments: Iterable[VideoComment]) -> None:
-        for comment in comments:
-            orm = self.db.get(VideoCommentORM, comment.comment_id)
-            if orm is None:
-                orm = VideoCommentORM(comment_id=comment.comment_id)
-                self.db.add(orm)
-                # 한국어 주석: 최초 적재 시 댓글 본문/작성자 등 정적 정보를 저장합니다.
-                orm.platform = comment.platform or "youtube"
-                orm.video_id = comment.video_id
-                orm.author = comment.author
-                orm.content = comment.content
-                orm.published_at = comment.published_at
-            # 한국어 주석: 기존 댓글은 변동성 필드(좋아요 수)만 업데이트합니다.
-            orm.like_count = comment.like_count
+        # 한국어 주석: 최초 적재 시 댓글 본문/작성자 등 정적 정보를 저장하고, 기존 댓글은 좋아요 수만 갱신합니다.
+        rows = _unique_rows(
+            (
+                {
+                    "comment_id": comment.comment_id,
+                    "platform": comment.platform or "youtube",
+                    "video_id": comment.video_id,
+                    "author": comment.author,
+                    "content": comment.content,
+                    "published_at": comment.published_at,
+                    "like_count": comment.like_count,
+                }
+                for comment in comments
+            ),
+            "comment_id",
+        )
+        self._bulk_upsert(
+            VideoCommentORM.__table__,
+            rows,
+            conflict_keys=("comment_id",),
+            update_fields=("like_count",),
+        )
         self.db.commit()
 
     def upsert_video_sentiment(self, sentiment: VideoSentiment) -> VideoSentiment:
-        orm = self.db.get(VideoSentimentORM, sentiment.video_id)
-        if orm is None:
-            orm = VideoSentimentORM(video_id=sentiment.video_id)
-            self.db.add(orm)
-        orm.platform = sentiment.platform or "youtube"
-        orm.category = sentiment.category
-        orm.trend_score = sentiment.trend_score
-        orm.sentiment_label = sentiment.sentiment_label
-        orm.sentiment_score = sentiment.sentiment_score
-        orm.keywords = sentiment.keywords
-        orm.summary = sentiment.summary
-        orm.analyzed_at = sentiment.analyzed_at
-        self.db.commit()
+        self.upsert_video_sentiments([sentiment])
         return sentiment
 
+    def upsert_video_sentiments(self, sentiments: Iterable[VideoSentiment]) -> list[VideoSentiment]:
+        # updated_at 은 analyzed_at 과 별도로 DB 시계 기준 적재 시각을 남긴다. (증분 집계의 변경 감지 기준)
+        sentiments = list(sentiments)
+        rows = _unique_rows(
+            (
+                {
+                    "video_id": sentiment.video_id,
+                    "platform": sentiment.platform or "youtube",
+                    "category": sentiment.category,
+                    "trend_score": sentiment.trend_score,
+                    "sentiment_label": sentiment.sentiment_label,
+                    "sentiment_score": sentiment.sentiment_score,
+                    "keywords": sentiment.keywords,
+                    "summary": sentiment.summary,
+                    "analyzed_at": sentiment.analyzed_at,
+                    "updated_at": text(_DB_WRITE_TIME),
+                }
+                for sentiment in sentiments
+            ),
+            "video_id",
+        )
+        self._bulk_upsert(
+            VideoSentimentORM.__table__,
+            rows,
+            conflict_keys=("video_id",),
+            update_fields=(
+                "platform",
+                "category",
+                "trend_score",
+                "sentiment_label",
+                "sentiment_score",
+                "keywords",
+                "summary",
+                "analyzed_at",
+                "updated_at",
+            ),
+        )
+        self.db.commit()
+        return sentiments
+
     def upsert_comment_sentiments(self, sentiments: Iterable[CommentSentiment]) -> None:
-        for sentiment in sentiments:
-            orm = self.db.get(CommentSentimentORM, sentiment.comment_id)
-            if orm is None:
-                orm = CommentSentimentORM(comment_id=sentiment.comment_id)
-                self.db.add(orm)
-            orm.platform = sentiment.platform or "youtube"
-            orm.sentiment_label = sentiment.sentiment_label
-            orm.sentiment_score = sentiment.sentiment_score
-            orm.analyzed_at = sentiment.analyzed_at
+        rows = _unique_rows(
+            (
+                {
+                    "comment_id": sentiment.comment_id,
+                    "platform": sentiment.platform or "youtube",
+                    "sentiment_label": sentiment.sentiment_label,
+                    "sentiment_score": sentiment.sentiment_score,
+                    "analyzed_at": sentiment.analyzed_at,
+                    "updated_at": text(_DB_WRITE_TIME),
+                }
+                for sentiment in sentiments
+            ),
+            "comment_id",
+        )
+        self._bulk_upsert(
+            CommentSentimentORM.__table__,
+            rows,
+            conflict_keys=("comment_id",),
+            update_fields=("platform", "sentiment_label", "sentiment_score", "analyzed_at"),
+        )
         self.db.commit()
 
     def upsert_keyword_trend(self, trend: KeywordTrend) -> KeywordTrend:
@@ -174,6 +341,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.avg_trend = trend.avg_trend
         orm.avg_total_score = trend.avg_total_score
         orm.growth_rate = trend.growth_rate
+        orm.view_velocity = trend.view_velocity
         orm.rank = trend.rank
         self.db.commit()
         return trend
@@ -201,10 +369,92 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.search_volume = trend.search_volume
         orm.search_volume_prev = trend.search_volume_prev
         orm.growth_rate = trend.growth_rate
+        orm.view_velocity = trend.view_velocity
         orm.rank = trend.rank
         self.db.commit()
         return trend
 
+    def upsert_keyword_trends(
+        self,
+        as_of: date,
+        trends: Iterable[KeywordTrend],
+        platform: str | None = None,
+        replace: bool = False,
+        removed: Iterable[tuple[str, str]] = (),
+    ) -> int:
+        return self._write_trends("keyword_trend", "keyword", as_of, trends, platform, replace, removed)
+
+    def upsert_category_trends(
+        self,
+        as_of: date,
+        trends: Iterable[CategoryTrend],
+        platform: str | None = None,
+        replace: bool = False,
+        removed: Iterable[tuple[str, str]] = (),
+    ) -> int:
+        return self._write_trends("category_trend", "category", as_of, trends, platform, replace, removed)
+
+    def _write_trends(
+        self,
+        table: str,
+        key_column: str,
+        as_of: date,
+        trends: Iterable[KeywordTrend | CategoryTrend],
+        platform: str | None,
+        replace: bool,
+        removed: Iterable[tuple[str, str]],
+    ) -> int:
+        """
+        as_of 일자의 순위 행을 임시 테이블에 COPY 로 적재한 뒤 한 트랜잭션에서 병합한다.
+        - replace=True 면 as_of(platform) 의 기존 행 중 trends 에 없는 행을 지워 하루치 순위를 통째로 교체한다.
+        - removed 의 (키, platform) 행은 같은 트랜잭션에서 지운다.
+        반환값은 새로 쓰거나 값이 바뀐 행 수.
+        """
+        columns = trend_columns(key_column)
+        rows = _unique_rows(
+            ({c: getattr(trend, c) for c in columns} for trend in trends),
+            key_column,
+            "date",
+            "platform",
+        )
+        removed = list(removed)
+        try:
+            self.db.execute(text(create_trend_stage_sql(table)))
+            if rows:
+                self._stage_trend_rows(table, key_column, columns, rows)
+            written = self.db.execute(text(merge_trend_stage_sql(table, key_column))).rowcount
+            if replace:
+                self.db.execute(
+                    text(delete_unstaged_trends_sql(table, key_column)), {"as_of": as_of, "platform": platform}
+                )
+            if removed:
+                self.db.execute(
+                    text(delete_trend_keys_sql(table, key_column)),
+                    {"as_of": as_of, "names": [k for k, _ in removed], "platforms": [p for _, p in removed]},
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return written
+
+    def _stage_trend_rows(self, table: str, key_column: str, columns: tuple[str, ...], rows: list[dict]) -> None:
+        cursor = self.db.connection().connection.cursor()
+        if not hasattr(cursor, "copy_expert"):
+            # psycopg2 가 아닌 드라이버(asyncpg 어댑터 등)는 COPY 대신 executemany 로 적재한다.
+            cursor.close()
+            self.db.execute(text(insert_trend_stage_sql(table, key_column)), rows)
+            return
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(["\\N" if row[c] is None else row[c] for c in columns])
+        buffer.seek(0)
+        try:
+            cursor.copy_expert(copy_trend_stage_sql(table, key_column), buffer)
+        finally:
+            cursor.close()
+
     def upsert_keyword_mapping(self, mapping: KeywordMapping) -> KeywordMapping:
         # 동일 (video_id, keyword, platform) 조합 중복 삽입을 막기 위해 조회 후 갱신/신규 생성
         platform = mapping.platform or "youtube"
@@ -227,24 +477,215 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.channel_id = mapping.channel_id
         orm.keyword = mapping.keyword
         orm.weight = mapping.weight
+        self.db.flush()
+        if mapping.video_id and mapping.keyword:
+            # 단건 추가이므로 기존 태그는 지우지 않고 해당 태그만 video_tag 에 반영한다.
+            self.db.execute(
+                text(
+                    replace_video_tags_sql(
+                        """
+                        SELECT CAST(:video_id AS VARCHAR), CAST(:platform AS VARCHAR),
+                               CAST(:keyword AS VARCHAR), CAST(:weight AS NUMERIC)
+                        """
+                    )
+                ),
+                {
+                    "video_id": mapping.video_id,
+                    "platform": platform,
+                    "keyword": mapping.keyword,
+                    "weight": mapping.weight,
+                    "target_video_ids": [],
+                },
+            )
         self.db.commit()
         mapping.mapping_id = getattr(orm, "mapping_id", None)
         return mapping
 
-    def upsert_video_score(self, score: VideoScore) -> VideoScore:
-        orm = self.db.get(VideoScoreORM, score.video_id)
-        if orm is None:
-            orm = VideoScoreORM(video_id=score.video_id)
-            self.db.add(orm)
-        orm.platform = score.platform or "youtube"
-        orm.engagement_score = score.engagement_score
-        orm.sentiment_score = score.sentiment_score
-        orm.trend_score = score.trend_score
-        orm.total_score = score.total_score
-        orm.updated_at = score.updated_at
+    def replace_keyword_mappings(
+        self,
+        video_id: str,
+        keywords: Iterable[str],
+        channel_id: str | None = None,
+        platform: str = "youtube",
+        weight: float = 1.0,
+    ) -> int:
+        """
+        한 영상의 키워드 집합을 통째로 교체한다.
+        기존 매핑과 비교해 빠진 키워드는 삭제, 새 키워드는 삽입하며 한 문장으로 처리한다.
+        """
+        mappings = [
+            KeywordMapping(
+                mapping_id=None,
+                video_id=video_id,
+                channel_id=channel_id,
+                platform=platform,
+                keyword=keyword,
+                weight=weight,
+            )
+            for keyword in keywords
+        ]
+        return self.replace_keyword_mappings_bulk({video_id: mappings})
+
+    def replace_keyword_mappings_bulk(self, tag_sets: Mapping[str, Iterable[KeywordMapping]]) -> int:
+        """
+        여러 영상의 키워드 집합을 한 트랜잭션에서 교체한다. (키: video_id, 값: 새 키워드 매핑 목록)
+        - 새 집합에 없는 기존 매핑은 삭제하고, 새 매핑은 INSERT ... ON CONFLICT 로 반영한다.
+        - 값이 빈 목록이면 해당 영상의 매핑을 모두 비운다.
+        - 배열 파라미터(unnest)로 전달하므로 영상 수와 무관하게 청크당 한 문장만 실행된다.
+        """
+        video_ids = list(tag_sets.keys())
+        written = 0
+        for start in range(0, len(video_ids), _KEYWORD_REPLACE_CHUNK_SIZE):
+            chunk_ids = video_ids[start : start + _KEYWORD_REPLACE_CHUNK_SIZE]
+            rows = _unique_rows(
+                (
+                    {
+                        "video_id": video_id,
+                        "channel_id": mapping.channel_id,
+                        "platform": mapping.platform or "youtube",
+                        "keyword": mapping.keyword,
+                        "weight": mapping.weight,
+                    }
+                    for video_id in chunk_ids
+                    for mapping in tag_sets[video_id]
+                    if mapping.keyword
+                ),
+                "video_id",
+                "keyword",
+                "platform",
+            )
+            self.db.execute(
+                text(
+                    """
+                    WITH incoming AS (
+                        SELECT *
+                        FROM unnest(
+                            CAST(:video_ids AS VARCHAR[]),
+                            CAST(:channel_ids AS VARCHAR[]),
+                            CAST(:platforms AS VARCHAR[]),
+                            CAST(:keywords AS VARCHAR[]),
+                            CAST(:weights AS NUMERIC[])
+                        ) AS t(video_id, channel_id, platform, keyword, weight)
+                    ),
+                    removed AS (
+                        DELETE FROM keyword_mapping km
+                        WHERE km.video_id = ANY(CAST(:target_video_ids AS VARCHAR[]))
+                          AND NOT EXISTS (
+                              SELECT 1
+                              FROM incoming i
+                              WHERE i.video_id = km.video_id
+                                AND i.keyword = km.keyword
+                                AND i.platform = km.platform
+                          )
+                    )
+                    INSERT INTO keyword_mapping (video_id, channel_id, platform, keyword, weight)
+                    SELECT video_id, channel_id, platform, keyword, weight
+                    FROM incoming
+                    ON CONFLICT (video_id, keyword, platform)
+                    DO UPDATE SET
+                        channel_id = EXCLUDED.channel_id,
+                        weight = EXCLUDED.weight
+                    WHERE keyword_mapping.channel_id IS DISTINCT FROM EXCLUDED.channel_id
+                       OR keyword_mapping.weight IS DISTINCT FROM EXCLUDED.weight
+                    """
+                ),
+                {
+                    "video_ids": [r["video_id"] for r in rows],
+                    "channel_ids": [r["channel_id"] for r in rows],
+                    "platforms": [r["platform"] for r in rows],
+                    "keywords": [r["keyword"] for r in rows],
+                    "weights": [r["weight"] for r in rows],
+                    "target_video_ids": chunk_ids,
+                },
+            )
+            # 같은 키워드 집합으로 tag / video_tag 역색인도 교체한다.
+            self.db.execute(
+                text(
+                    replace_video_tags_sql(
+                        """
+                        SELECT *
+                        FROM unnest(
+                            CAST(:video_ids AS VARCHAR[]),
+                            CAST(:platforms AS VARCHAR[]),
+                            CAST(:keywords AS VARCHAR[]),
+                            CAST(:weights AS NUMERIC[])
+                        )
+                        """
+                    )
+                ),
+                {
+                    "video_ids": [r["video_id"] for r in rows],
+                    "platforms": [r["platform"] for r in rows],
+                    "keywords": [r["keyword"] for r in rows],
+                    "weights": [r["weight"] for r in rows],
+                    "target_video_ids": chunk_ids,
+                },
+            )
+            written += len(rows)
         self.db.commit()
+        return written
+
+    def upsert_video_score(self, score: VideoScore) -> VideoScore:
+        self.upsert_video_scores([score])
         return score
 
+    def upsert_video_scores(self, scores: Iterable[VideoScore]) -> list[VideoScore]:
+        scores = list(scores)
+        rows = _unique_rows(
+            (
+                {
+                    "video_id": score.video_id,
+                    "platform": score.platform or "youtube",
+                    "engagement_score": score.engagement_score,
+                    "sentiment_score": score.sentiment_score,
+                    "trend_score": score.trend_score,
+                    "total_score": score.total_score,
+                    "updated_at": score.updated_at,
+                }
+                for score in scores
+            ),
+            "video_id",
+        )
+        self._bulk_upsert(
+            VideoScoreORM.__table__,
+            rows,
+            conflict_keys=("video_id",),
+            update_fields=(
+                "platform",
+                "engagement_score",
+                "sentiment_score",
+                "trend_score",
+                "total_score",
+                "updated_at",
+            ),
+        )
+        self.db.commit()
+        return scores
+
+    def _bulk_upsert(
+        self,
+        table,
+        rows: list[dict],
+        conflict_keys: tuple[str, ...],
+        update_fields: tuple[str, ...],
+        extra_set: dict | None = None,
+    ) -> None:
+        """
+        rows 전체를 multi-row INSERT ... ON CONFLICT DO UPDATE 로 기록한다. (commit은 호출 측에서 수행)
+        - update_fields 에 포함된 컬럼만 기존 레코드에서 갱신되고, 나머지는 최초 삽입 값이 유지된다.
+        - 바인드 파라미터 한도를 넘지 않도록 _BULK_CHUNK_SIZE 단위로 나누되 같은 트랜잭션에서 실행한다.
+        """
+        for start in range(0, len(rows), _BULK_CHUNK_SIZE):
+            stmt = pg_insert(table).values(rows[start : start + _BULK_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_keys),
+                set_={
+                    **{field: stmt.excluded[field] for field in update_fields},
+                    **(extra_set or {}),
+                },
+            )
+            self.db.execute(stmt)
+
     def log_crawl(self, log: CrawlLog) -> CrawlLog:
         orm = CrawlLogORM(
             target_type=log.target_type,
@@ -261,19 +702,15 @@ class ContentRepositoryImpl(ContentRepositoryPort):
     def upsert_video_metrics_snapshot(self, snapshot: VideoMetricsSnapshot) -> None:
         """
         일별 영상 지표 스냅샷을 upsert합니다. 동일 (video_id, snapshot_date, platform) 키에 대해서는 값을 갱신합니다.
+        같은 문장에서 video_metrics_latest(최신/직전 스냅샷 요약)도 함께 갱신합니다.
         """
         # NOTE: SQLAlchemy ORM보다 ON CONFLICT가 명확한 raw SQL을 사용합니다.
         self.db.execute(
             text(
-                """
-                INSERT INTO video_metrics_snapshot (video_id, platform, snapshot_date, view_count, like_count, comment_count)
-                VALUES (:video_id, :platform, :snapshot_date, :view_count, :like_count, :comment_count)
-                ON CONFLICT (video_id, snapshot_date, platform)
-                DO UPDATE SET
-                    view_count = EXCLUDED.view_count,
-                    like_count = EXCLUDED.like_count,
-                    comment_count = EXCLUDED.comment_count
-                """
+                upsert_snapshots_with_latest_sql(
+                    "VALUES (:video_id, :platform, CAST(:snapshot_date AS DATE), "
+                    "CAST(:view_count AS BIGINT), CAST(:like_count AS BIGINT), CAST(:comment_count AS BIGINT))"
+                )
             ),
             {
                 "video_id": snapshot.video_id,
@@ -286,15 +723,99 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         )
         self.db.commit()
 
-    def fetch_videos_by_category(self, category: str, limit: int = 20) -> list[dict]:
+    def append_view_samples(self, videos: Iterable[Video], sampled_at: datetime | None = None) -> int:
+        """
+        수집한 영상의 현재 카운터를 sampled_at(기본: 지금, UTC) 시점의 intraday 표본으로 한 문장에 추가한다.
+        게시 후 INTRADAY_TRACK_DAYS 이내인 영상만 남으며, video 에 먼저 적재된 영상이어야 한다.
+        """
+        rows = _unique_rows(
+            (
+                {
+                    "video_id": video.video_id,
+                    "platform": video.platform or "youtube",
+                    "view_count": video.view_count,
+                    "like_count": video.like_count,
+                    "comment_count": video.comment_count,
+                }
+                for video in videos
+            ),
+            "video_id",
+            "platform",
+        )
+        if not rows:
+            return 0
+        inserted = self.db.execute(
+            text(APPEND_INTRADAY_SAMPLES_SQL),
+            {
+                "video_ids": [r["video_id"] for r in rows],
+                "platforms": [r["platform"] for r in rows],
+                "view_counts": [r["view_count"] for r in rows],
+                "like_counts": [r["like_count"] for r in rows],
+                "comment_counts": [r["comment_count"] for r in rows],
+                "sampled_at": sampled_at or datetime.utcnow(),
+                "track_days": INTRADAY_TRACK_DAYS,
+            },
+        ).rowcount
+        self.db.commit()
+        return inserted
+
+    def compact_view_samples(self, now: datetime | None = None) -> dict:
+        """
+        intraday 표본 정리.
+        - INTRADAY_RAW_HOURS 가 지난 구간을 영상별 시간당 마지막 표본 하나로 줄인다. 이미 줄인 구간은 watermark 로
+          건너뛰므로 매 실행은 그 사이에 새로 기간이 지난 몇 시간만 훑는다.
+        - INTRADAY_TRACK_DAYS 가 지난 표본은 지운다.
+        """
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=INTRADAY_TRACK_DAYS)
+        # 시간 경계로 맞춰 한 시간 구간이 두 실행에 나뉘어 처리되지 않게 한다.
+        raw_until = (now - timedelta(hours=INTRADAY_RAW_HOURS)).replace(minute=0, second=0, microsecond=0)
+        downsampled_from = get_watermark(self.db, _INTRADAY_DOWNSAMPLE_JOB) or cutoff.replace(
+            minute=0, second=0, microsecond=0
+        )
+
+        downsampled = 0
+        if downsampled_from < raw_until:
+            downsampled = self.db.execute(
+                text(DOWNSAMPLE_INTRADAY_SQL), {"from_ts": downsampled_from, "to_ts": raw_until}
+            ).rowcount
+            set_watermark(self.db, _INTRADAY_DOWNSAMPLE_JOB, raw_until)
+        purged = self.db.execute(text(PURGE_INTRADAY_SQL), {"cutoff": cutoff}).rowcount
+        self.db.commit()
+        return {
+            "downsampled_until": max(downsampled_from, raw_until).isoformat(),
+            "downsampled_rows": downsampled,
+            "purged_rows": purged,
+        }
+
+    def upsert_surge_features(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """
+        영상별 급등 피처를 (video_id, platform) 마다 최신 값으로 덮어쓴다. 피처 컬럼은 모두 갱신한다.
+        """
+        rows = _unique_rows(
+            ({**row, "platform": row.get("platform") or "youtube"} for row in rows),
+            "video_id",
+            "platform",
+        )
+        if not rows:
+            return 0
+        self._bulk_upsert(
+            VideoSurgeFeatureORM.__table__,
+            rows,
+            conflict_keys=("video_id", "platform"),
+            update_fields=tuple(field for field in rows[0] if field not in ("video_id", "platform")),
+        )
+        self.db.commit()
+        return len(rows)
+
+    def fetch_videos_by_category(
+        self, category: str, limit: int = 20, after: Mapping[str, Any] | None = None
+    ) -> list[dict]:
         """
         카테고리 기준 상위 콘텐츠를 점수/조회수 기반으로 조회한다.
+        - after: 이전 페이지 마지막 행의 커서(decode_cursor 결과). 그 행 다음부터 조회한다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
                 """
                 SELECT
@@ -315,108 +836,117 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                     sc.engagement_score,
                     sc.sentiment_score AS score_sentiment,
                     sc.trend_score AS score_trend,
-                    sc.total_score
+                    sc.total_score,
+                    {sort_score} AS sort_score,
+                    {sort_crawled_at} AS sort_crawled_at
                 FROM video v
                 LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
                 LEFT JOIN video_score sc ON sc.video_id = v.video_id
                 WHERE vs.category = :category
-                ORDER BY COALESCE(sc.total_score, sc.sentiment_score, sc.trend_score, v.view_count) DESC NULLS LAST,
-                         v.crawled_at DESC
+                  AND {seek}
+                ORDER BY {order_by}
                 LIMIT :limit
-                """
+                """.format(
+                    sort_score=VIDEO_SORT_SCORE_SQL,
+                    sort_crawled_at=VIDEO_SORT_CRAWLED_AT_SQL,
+                    seek=VIDEO_KEYSET_SEEK_SQL,
+                    order_by=VIDEO_KEYSET_ORDER_SQL,
+                )
             ),
-            {"category": category, "limit": limit},
+            {"category": category, "limit": limit, **video_keyset_params(after)},
         ).mappings()
-        return [dict(row) for row in rows]
+        return [_with_video_cursor(dict(row)) for row in rows]
 
     def fetch_videos_by_category_id(
-        self, category_id: int, limit: int = 10, platform: str | None = None, days: int | None = None
+        self,
+        category_id: int,
+        limit: int = 10,
+        platform: str | None = None,
+        days: int | None = None,
+        after: Mapping[str, Any] | None = None,
     ) -> list[dict]:
         """
         YouTube category_id 기준 상위 콘텐츠를 조회한다.
         - category_id: YouTube Data API의 숫자 categoryId (예: 10=Music, 20=Gaming)
         - days: 최근 N일 내 게시된 영상만 대상 (None이면 전체)
+        - after: 이전 페이지 마지막 행의 커서(decode_cursor 결과). 그 행 다음부터 조회한다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
         since_date = None
         until_date = None
         if days is not None:
             since_date = (datetime.utcnow() - timedelta(days=days)).date()
             until_date = datetime.utcnow().date()
 
-        # 스냅샷 비교 기준일 (1일 전)
         to_date = datetime.utcnow().date()
-        prev_anchor = to_date - timedelta(days=1)
 
-        rows = self.db.execute(
+        # 현재값: to_date 이전 가장 최근 스냅샷, 이전값: to_date 1일 전 시점의 스냅샷
+        # (스냅샷은 값이 바뀐 날에만 쌓이므로 video_metrics_latest.prev_* 는 날짜와 무관한 "직전에 바뀐 값"이다)
+        # 이전값과 조회수가 같으면, LIMIT 된 목록에 한해 조회수가 달랐던 마지막 스냅샷을 이전값으로 쓴다.
+        rows = self.read_db.execute(
             text(
                 """
+                WITH page AS (
+                    SELECT
+                        v.video_id,
+                        v.title,
+                        v.description,
+                        v.tags,
+                        v.category_id,
+                        v.duration,
+                        v.channel_id,
+                        v.platform,
+                        COALESCE(curr.view_count, v.view_count, 0) AS view_count,
+                        COALESCE(prev_snap.view_count, 0) AS view_count_prev,
+                        COALESCE(curr.like_count, v.like_count, 0) AS like_count,
+                        COALESCE(prev_snap.like_count, 0) AS like_count_prev,
+                        COALESCE(curr.comment_count, v.comment_count, 0) AS comment_count,
+                        COALESCE(prev_snap.comment_count, 0) AS comment_count_prev,
+                        v.published_at,
+                        v.thumbnail_url,
+                        v.crawled_at,
+                        v.is_shorts,
+                        vs.category,
+                        vs.sentiment_label,
+                        vs.sentiment_score,
+                        vs.trend_score,
+                        sc.engagement_score,
+                        sc.sentiment_score AS score_sentiment,
+                        sc.trend_score AS score_trend,
+                        sc.total_score,
+                        COALESCE(ch.title, v.channel_id) AS channel_username,
+                        {sort_score} AS sort_score,
+                        {sort_crawled_at} AS sort_crawled_at
+                    FROM video v
+                    LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
+                    LEFT JOIN video_score sc ON sc.video_id = v.video_id
+                    LEFT JOIN channel ch ON ch.channel_id = v.channel_id
+                    {latest_join}
+                    {curr_join}
+                    {prev_join}
+                    WHERE v.category_id = :category_id
+                      AND (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
+                      AND (CAST(:since_date AS DATE) IS NULL OR v.published_at::date >= :since_date)
+                      AND (CAST(:until_date AS DATE) IS NULL OR v.published_at::date <= :until_date)
+                      AND {seek}
+                    ORDER BY {order_by}
+                    LIMIT :limit
+                )
                 SELECT
-                    v.video_id,
-                    v.title,
-                    v.description,
-                    v.tags,
-                    v.category_id,
-                    v.duration,
-                    v.channel_id,
-                    v.platform,
-                    COALESCE(curr.view_count, v.view_count, 0) AS view_count,
-                    COALESCE(prev.view_count, 0) AS view_count_prev,
-                    COALESCE(curr.like_count, v.like_count, 0) AS like_count,
-                    COALESCE(prev.like_count, 0) AS like_count_prev,
-                    COALESCE(curr.comment_count, v.comment_count, 0) AS comment_count,
-                    COALESCE(prev.comment_count, 0) AS comment_count_prev,
-                    v.published_at,
-                    v.thumbnail_url,
-                    v.crawled_at,
-                    v.is_shorts,
-                    vs.category,
-                    vs.sentiment_label,
-                    vs.sentiment_score,
-                    vs.trend_score,
-                    sc.engagement_score,
-                    sc.sentiment_score AS score_sentiment,
-                    sc.trend_score AS score_trend,
-                    sc.total_score,
-                    COALESCE(ch.title, v.channel_id) AS channel_username
-                FROM video v
-                LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
-                LEFT JOIN video_score sc ON sc.video_id = v.video_id
-                LEFT JOIN channel ch ON ch.channel_id = v.channel_id
-                LEFT JOIN LATERAL (
-                    SELECT s.view_count, s.like_count, s.comment_count
-                    FROM video_metrics_snapshot s
-                    WHERE s.video_id = v.video_id
-                      AND s.platform = v.platform
-                      AND s.snapshot_date <= :to_date
-                    ORDER BY s.snapshot_date DESC
-                    LIMIT 1
-                ) curr ON true
-                LEFT JOIN LATERAL (
-                    SELECT s.view_count, s.like_count, s.comment_count
-                    FROM video_metrics_snapshot s
-                    WHERE s.video_id = v.video_id
-                      AND s.platform = v.platform
-                      AND s.snapshot_date < (
-                          SELECT MAX(s2.snapshot_date)
-                          FROM video_metrics_snapshot s2
-                          WHERE s2.video_id = v.video_id
-                            AND s2.platform = v.platform
-                      )
-                    ORDER BY s.snapshot_date DESC
-                    LIMIT 1
-                ) prev ON true
-                WHERE v.category_id = :category_id
-                  AND (:platform IS NULL OR v.platform = :platform)
-                  AND (:since_date IS NULL OR v.published_at::date >= :since_date)
-                  AND (:until_date IS NULL OR v.published_at::date <= :until_date)
-                ORDER BY COALESCE(sc.total_score, sc.sentiment_score, sc.trend_score, v.view_count) DESC NULLS LAST,
-                         v.crawled_at DESC
-                LIMIT :limit
-                """
+                    page.*,
+                    COALESCE(alt.view_count, page.view_count_prev) AS resolved_view_count_prev
+                FROM page
+                {alt_join}
+                ORDER BY page.sort_score DESC, page.sort_crawled_at DESC, page.video_id DESC
+                """.format(
+                    sort_score=VIDEO_SORT_SCORE_SQL,
+                    sort_crawled_at=VIDEO_SORT_CRAWLED_AT_SQL,
+                    seek=VIDEO_KEYSET_SEEK_SQL,
+                    order_by=VIDEO_KEYSET_ORDER_SQL,
+                    latest_join=latest_metrics_join("v"),
+                    curr_join=snapshot_as_of_join("curr", ":to_date"),
+                    prev_join=snapshot_as_of_join("prev_snap", "(CAST(:to_date AS DATE) - 1)"),
+                    alt_join=changed_snapshot_join("alt", "page", "(CAST(:to_date AS DATE) - 1)"),
+                )
             ),
             {
                 "category_id": category_id,
@@ -425,7 +955,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                 "since_date": since_date,
                 "until_date": until_date,
                 "to_date": to_date,
-                "prev_anchor": prev_anchor,
+                **video_keyset_params(after),
             },
         ).mappings()
 
@@ -434,36 +964,12 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         for row in rows:
             item = dict(row)
             view_now = int(item["view_count"] or 0)
-            view_prev = int(item["view_count_prev"] or 0)
+            view_prev = int(item["resolved_view_count_prev"] or 0)
             like_now = int(item["like_count"] or 0)
             like_prev = int(item["like_count_prev"] or 0)
             comment_now = int(item["comment_count"] or 0)
             comment_prev = int(item["comment_count_prev"] or 0)
 
-            video_id = item["video_id"]
-
-            # 현재와 이전 값이 같은 경우 더 이전 스냅샷에서 다른 값 찾기
-            if view_prev == view_now and view_prev > 0:
-                try:
-                    alt_snapshot = self.db.execute(
-                        text('''
-                            SELECT view_count
-                            FROM video_metrics_snapshot s
-                            WHERE s.video_id = :video_id
-                              AND s.platform = 'youtube'
-                              AND s.snapshot_date <= CURRENT_DATE - INTERVAL '1 day'
-                              AND s.view_count <> :current_view
-                            ORDER BY s.snapshot_date DESC
-                            LIMIT 1
-                        '''),
-                        {'video_id': video_id, 'current_view': view_now}
-                    ).fetchone()
-
-                    if alt_snapshot:
-                        view_prev = int(alt_snapshot[0])
-                except Exception:
-                    pass
-
             # 증가량 계산: 스냅샷이 없으면 현재 값 전체가 증가량
             item["view_count_change"] = view_now - view_prev
             item["like_count_change"] = like_now - like_prev
@@ -475,12 +981,13 @@ class ContentRepositoryImpl(ContentRepositoryPort):
             else:
                 item["growth_rate_percentage"] = 0.0
 
-            # 이전 스냅샷 데이터는 제거
+            # 이전 스냅샷 데이터/정렬용 컬럼은 제거
             item.pop("view_count_prev", None)
+            item.pop("resolved_view_count_prev", None)
             item.pop("like_count_prev", None)
             item.pop("comment_count_prev", None)
 
-            result.append(item)
+            result.append(_with_video_cursor(item))
 
         return result
 
@@ -494,11 +1001,6 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         video_metrics_snapshot 기준으로 단일 영상의 히스토리를 조회한다.
         - snapshot_date 내림차순 정렬
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-
         sql = """
             SELECT
                 video_id,
@@ -509,7 +1011,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                 comment_count
             FROM video_metrics_snapshot
             WHERE video_id = :video_id
-              AND (:platform IS NULL OR platform = :platform)
+              AND (CAST(:platform AS VARCHAR) IS NULL OR platform = :platform)
             ORDER BY snapshot_date DESC
         """
         if limit is not None:
@@ -522,18 +1024,86 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         if limit is not None:
             params["limit"] = limit
 
-        rows = self.db.execute(text(sql), params).mappings()
+        rows = self.read_db.execute(text(sql), params).mappings()
         return [dict(r) for r in rows]
 
-    def fetch_videos_by_keyword(self, keyword: str, limit: int = 20) -> list[dict]:
+    def fetch_channel_stats(self, channel_ids: Iterable[str]) -> list[ChannelStats]:
+        """
+        channel_stats 롤업에서 채널별 통계를 PK 조회로 가져온다.
+        """
+        ids = list({cid for cid in channel_ids if cid})
+        if not ids:
+            return []
+
+        rows = self.read_db.execute(
+            text(
+                """
+                SELECT
+                    channel_id,
+                    platform,
+                    video_count,
+                    avg_view_count,
+                    median_view_count,
+                    baseline_early_velocity,
+                    baseline_sample_count,
+                    updated_at
+                FROM channel_stats
+                WHERE channel_id = ANY(CAST(:channel_ids AS VARCHAR[]))
+                """
+            ),
+            {"channel_ids": ids},
+        ).mappings()
+        return [
+            ChannelStats(
+                channel_id=r["channel_id"],
+                platform=r["platform"],
+                video_count=int(r["video_count"] or 0),
+                avg_view_count=float(r["avg_view_count"]) if r["avg_view_count"] is not None else None,
+                median_view_count=float(r["median_view_count"]) if r["median_view_count"] is not None else None,
+                baseline_early_velocity=r["baseline_early_velocity"],
+                baseline_sample_count=int(r["baseline_sample_count"] or 0),
+                updated_at=r["updated_at"],
+            )
+            for r in rows
+        ]
+
+    def fetch_view_samples(
+        self, video_ids: Iterable[str], since: datetime | None = None
+    ) -> dict[str, list[ViewSample]]:
+        """
+        video_metrics_intraday 에서 여러 영상의 표본을 쿼리 한 번으로 읽어 video_id 별 ViewSample 목록으로 묶는다.
+        결과가 (video_id, ts) 순으로 오므로 영상마다 시간 오름차순이다.
+        """
+        ids = list({vid for vid in video_ids if vid})
+        if not ids:
+            return {}
+
+        rows = self.read_db.execute(text(INTRADAY_SAMPLES_SQL), {"video_ids": ids, "since": since})
+        samples: dict[str, list[ViewSample]] = {}
+        for video_id, ts, view_count in rows:
+            samples.setdefault(video_id, []).append(ViewSample(timestamp=ts, view_count=int(view_count)))
+        return samples
+
+    def fetch_co_movement_scores(self, video_ids: Iterable[str]) -> dict[str, float]:
+        """
+        video_co_movement 에서 여러 영상의 점수를 PK 조회로 가져온다.
+        """
+        ids = list({vid for vid in video_ids if vid})
+        if not ids:
+            return {}
+
+        rows = self.read_db.execute(text(CO_MOVEMENT_SCORES_SQL), {"video_ids": ids})
+        return {video_id: float(score) for video_id, score in rows}
+
+    def fetch_videos_by_keyword(
+        self, keyword: str, limit: int = 20, after: Mapping[str, Any] | None = None
+    ) -> list[dict]:
         """
         키워드 기준 상위 콘텐츠를 점수/조회수 기반으로 조회한다.
+        - tag.name 으로 tag_id 를 찾은 뒤 video_tag(tag_id, video_id) 인덱스로 영상을 모은다.
+        - after: 이전 페이지 마지막 행의 커서(decode_cursor 결과). 그 행 다음부터 조회한다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
                 """
                 SELECT
@@ -553,40 +1123,50 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                     sc.engagement_score,
                     sc.sentiment_score AS score_sentiment,
                     sc.trend_score AS score_trend,
-                    sc.total_score
-                FROM keyword_mapping km
-                JOIN video v ON v.video_id = km.video_id
+                    sc.total_score,
+                    {sort_score} AS sort_score,
+                    {sort_crawled_at} AS sort_crawled_at
+                FROM tag t
+                JOIN video_tag vt ON vt.tag_id = t.tag_id
+                JOIN video v ON v.video_id = vt.video_id
                 LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
                 LEFT JOIN video_score sc ON sc.video_id = v.video_id
-                WHERE km.keyword = :keyword
-                ORDER BY COALESCE(sc.total_score, sc.sentiment_score, sc.trend_score, v.view_count) DESC NULLS LAST,
-                         v.crawled_at DESC
+                WHERE t.name = :keyword
+                  AND {seek}
+                ORDER BY {order_by}
                 LIMIT :limit
-                """
+                """.format(
+                    sort_score=VIDEO_SORT_SCORE_SQL,
+                    sort_crawled_at=VIDEO_SORT_CRAWLED_AT_SQL,
+                    seek=VIDEO_KEYSET_SEEK_SQL,
+                    order_by=VIDEO_KEYSET_ORDER_SQL,
+                )
             ),
-            {"keyword": keyword, "limit": limit},
+            {"keyword": keyword, "limit": limit, **video_keyset_params(after)},
         ).mappings()
-        return [dict(row) for row in rows]
+        return [_with_video_cursor(dict(row)) for row in rows]
 
     def fetch_top_keywords_by_category(self, category: str, limit: int = 10) -> list[dict]:
         """
         특정 카테고리 내 콘텐츠에서 많이 등장한 주요 키워드를 빈도순으로 조회한다.
+        - tag_id(정수) 기준으로 집계한 뒤 이름은 마지막에 붙인다. (video_tag PK 로 영상당 태그는 1행)
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
                 """
+                WITH counts AS (
+                    SELECT vt.tag_id, COUNT(*) AS video_count
+                    FROM video_sentiment vs
+                    JOIN video_tag vt ON vt.video_id = vs.video_id
+                    WHERE vs.category = :category
+                    GROUP BY vt.tag_id
+                )
                 SELECT
-                    km.keyword,
-                    COUNT(DISTINCT km.video_id) AS video_count
-                FROM keyword_mapping km
-                JOIN video_sentiment vs ON vs.video_id = km.video_id
-                WHERE vs.category = :category
-                GROUP BY km.keyword
-                ORDER BY COUNT(DISTINCT km.video_id) DESC, km.keyword
+                    t.name AS keyword,
+                    c.video_count
+                FROM counts c
+                JOIN tag t ON t.tag_id = c.tag_id
+                ORDER BY c.video_count DESC, t.name
                 LIMIT :limit
                 """
             ),
@@ -597,23 +1177,47 @@ class ContentRepositoryImpl(ContentRepositoryPort):
     def fetch_top_keywords_by_keyword(self, keyword: str, limit: int = 10) -> list[dict]:
         """
         특정 키워드와 함께 등장한 연관 키워드를 빈도순으로 조회한다.
+        - 배치가 유지하는 keyword_cooccurrence 의 (tag_a, video_count DESC) 인덱스에서 상위 k 개만 읽는다.
+        - 행렬에 아직 반영되지 않은 키워드(배치 미실행/신규 태그)는 video_tag 로 직접 계산한다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
                 """
                 SELECT
-                    km2.keyword,
-                    COUNT(DISTINCT km2.video_id) AS video_count
-                FROM keyword_mapping km_target
-                JOIN keyword_mapping km2 ON km_target.video_id = km2.video_id
-                WHERE km_target.keyword = :keyword
-                  AND km2.keyword <> :keyword
-                GROUP BY km2.keyword
-                ORDER BY COUNT(DISTINCT km2.video_id) DESC, km2.keyword
+                    t2.name AS keyword,
+                    kc.video_count
+                FROM tag t
+                JOIN keyword_cooccurrence kc ON kc.tag_a = t.tag_id
+                JOIN tag t2 ON t2.tag_id = kc.tag_b
+                WHERE t.name = :keyword
+                ORDER BY kc.video_count DESC, t2.name
+                LIMIT :limit
+                """
+            ),
+            {"keyword": keyword, "limit": limit},
+        ).mappings().all()
+        if rows:
+            return [dict(row) for row in rows]
+
+        rows = self.read_db.execute(
+            text(
+                """
+                WITH target AS (
+                    SELECT tag_id FROM tag WHERE name = :keyword
+                ),
+                counts AS (
+                    SELECT vt2.tag_id, COUNT(*) AS video_count
+                    FROM target
+                    JOIN video_tag vt ON vt.tag_id = target.tag_id
+                    JOIN video_tag vt2 ON vt2.video_id = vt.video_id AND vt2.tag_id <> vt.tag_id
+                    GROUP BY vt2.tag_id
+                )
+                SELECT
+                    t.name AS keyword,
+                    c.video_count
+                FROM counts c
+                JOIN tag t ON t.tag_id = c.tag_id
+                ORDER BY c.video_count DESC, t.name
                 LIMIT :limit
                 """
             ),
@@ -625,11 +1229,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         """
         콘텐츠 단건 상세(점수/키워드 포함)를 조회한다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        video = self.db.execute(
+        video = self.read_db.execute(
             text(
                 """
                 SELECT v.video_id, v.title, v.channel_id, v.platform, v.view_count, v.like_count, v.comment_count,
@@ -649,7 +1249,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         if not video:
             return None
 
-        keywords = self.db.execute(
+        keywords = self.read_db.execute(
             text(
                 """
                 SELECT keyword, weight, platform, video_id, channel_id
@@ -667,11 +1267,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         """
         최신 집계 일자의 카테고리별 랭킹을 반환한다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
                 """
                  SELECT ct.category,
@@ -690,13 +1286,13 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                 JOIN (
                     SELECT category, platform, MAX(date) AS max_date
                     FROM category_trend
-                    WHERE (:platform IS NULL OR platform = :platform)
+                    WHERE (CAST(:platform AS VARCHAR) IS NULL OR platform = :platform)
                     GROUP BY category, platform
                 ) latest
                   ON ct.category = latest.category
                  AND ct.platform = latest.platform
                  AND ct.date = latest.max_date
-                WHERE (:platform IS NULL OR ct.platform = :platform)
+                WHERE (CAST(:platform AS VARCHAR) IS NULL OR ct.platform = :platform)
                 ORDER BY ct.rank ASC NULLS LAST, ct.search_volume DESC NULLS LAST
                 LIMIT :limit
                 """
@@ -709,12 +1305,9 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         """
         절대 인기 상위 리스트 (조회수 중심, 좋아요/스코어 보조).
         채널 규모 편향 보정: 채널 평균 조회수를 나눈 정규화 점수를 함께 반환.
+        - 채널 평균 조회수는 channel_stats 롤업을 읽는다. 아직 집계되지 않은 채널은 조회수를 그대로 쓴다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
                 """
                 WITH base AS (
@@ -728,11 +1321,12 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                         sc.sentiment_score AS score_sentiment,
                         sc.trend_score AS score_trend,
                         sc.total_score,
-                        AVG(v.view_count) OVER (PARTITION BY v.channel_id) AS channel_avg_view
+                        cs.avg_view_count AS channel_avg_view
                     FROM video v
                     LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
                     LEFT JOIN video_score sc ON sc.video_id = v.video_id
-                    WHERE (:platform IS NULL OR v.platform = :platform)
+                    LEFT JOIN channel_stats cs ON cs.channel_id = v.channel_id
+                    WHERE (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
                 )
                 SELECT
                     video_id,
@@ -778,12 +1372,9 @@ class ContentRepositoryImpl(ContentRepositoryPort):
     def fetch_rising_videos(self, limit: int = 5, velocity_days: int = 1, platform: str | None = None) -> list[dict]:
         """
         최근 velocity(조회 증가량/일)를 기반한 급상승 리스트 + 채널 규모 보정 점수 포함.
+        - 채널 평균 조회수는 channel_stats 롤업을 읽는다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
                 """
                 WITH latest AS (
@@ -811,122 +1402,144 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                         sc.trend_score AS score_trend,
                         sc.total_score,
                         v.is_shorts,
-                        AVG(v.view_count) OVER (PARTITION BY v.channel_id) AS channel_avg_view
+                        cs.avg_view_count AS channel_avg_view
                     FROM video v
                     LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
                     LEFT JOIN video_score sc ON sc.video_id = v.video_id
-                    WHERE (:platform IS NULL OR v.platform = :platform)
-                ),
-                curr AS (
-                    SELECT DISTINCT ON (vms.video_id)
-                        vms.video_id,
-                        vms.view_count,
-                        vms.snapshot_date
-                    FROM video_metrics_snapshot vms
-                    WHERE (:platform IS NULL OR vms.platform = :platform)
-                    ORDER BY vms.video_id, vms.snapshot_date DESC
-                ),
-                prev AS (
-                    SELECT DISTINCT ON (vms.video_id)
-                        vms.video_id,
-                        vms.view_count,
-                        vms.snapshot_date
-                    FROM video_metrics_snapshot vms
-                    WHERE (:platform IS NULL OR vms.platform = :platform)
-                      AND vms.snapshot_date <= (CURRENT_DATE - (:velocity_days || ' days')::interval)
-                    ORDER BY vms.video_id, vms.snapshot_date DESC
+                    LEFT JOIN channel_stats cs ON cs.channel_id = v.channel_id
+                    WHERE (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
                 )
                 SELECT
                     l.*,
-                    GREATEST(COALESCE(c.view_count, l.view_count, 0) - COALESCE(p.view_count, 0), 0) / NULLIF(:velocity_days,0) AS view_velocity,
+                    GREATEST(COALESCE(ml.curr_view_count, l.view_count, 0) - COALESCE(p.view_count, 0), 0) / NULLIF(CAST(:velocity_days AS INTEGER), 0) AS view_velocity,
                     CASE
                         WHEN channel_avg_view > 0 THEN l.view_count / channel_avg_view
                         ELSE l.view_count
                     END AS normalized_view_score
                 FROM latest l
-                LEFT JOIN curr c ON c.video_id = l.video_id
-                LEFT JOIN prev p ON p.video_id = l.video_id
+                {latest_join}
+                {prev_join}
                 ORDER BY view_velocity DESC NULLS LAST,
                          normalized_view_score DESC NULLS LAST,
                          COALESCE(l.total_score, l.view_count) DESC NULLS LAST,
                          l.crawled_at DESC NULLS LAST
                 LIMIT :limit
-                """
+                """.format(
+                    latest_join=latest_metrics_join("l"),
+                    prev_join=snapshot_as_of_join("p", "(CURRENT_DATE - CAST(:velocity_days AS INTEGER))"),
+                )
             ),
             {"platform": platform, "limit": limit, "velocity_days": velocity_days},
         ).mappings()
         return [dict(r) for r in rows]
 
     def fetch_recommended_videos_by_category(
-        self, category: str, limit: int = 20, days: int = 14, platform: str | None = None
+        self,
+        category: str,
+        limit: int = 20,
+        days: int = 14,
+        platform: str | None = None,
+        after: Mapping[str, Any] | None = None,
     ) -> list[dict]:
         """
         카테고리 문자열(category) 기준으로 최근 수집 콘텐츠를 점수 기반으로 추천한다.
+        - after: 이전 페이지 마지막 행의 커서(decode_cursor 결과). 그 행 다음부터 조회한다.
         """
-        # 이전 예외로 인한 pending rollback 상태 방지
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
         # days 파라미터는 "최근 N일간 게시된 영상"을 의미하도록, 수집 시점(crawled_at)이 아닌 게시 시점(published_at)으로 필터링한다.
-            # days 파라미터는 "최근 N일간 게시된 영상"을 의미하도록, 수집 시점(crawled_at)이 아닌 게시 시점(published_at)으로 필터링한다.
         since_date = (datetime.utcnow() - timedelta(days=days)).date()
         until_date = datetime.utcnow().date()
-        rows = self.db.execute(
+        # 이전값 결정 순서 (모두 한 쿼리 안에서 처리, 기준일은 :until_date(UTC)):
+        # 1) 1일 전 시점 스냅샷 (video_metrics_latest 기반)
+        # 2) 1)의 조회수가 현재와 같으면, 조회수가 달랐던 마지막 스냅샷
+        # 3) 그래도 이전값이 없고 조회수가 1000 초과면, 게시 후 일정하게 늘었다고 보고
+        #    현재값 * (경과일 - 1) / 경과일 로 추정 (경과일은 최소 1일)
+        rows = self.read_db.execute(
             text(
                 """
+                WITH page AS (
+                    SELECT
+                        v.video_id,
+                        v.title,
+                        v.description,
+                        v.tags,
+                        v.category_id,
+                        v.duration,
+                        v.channel_id,
+                        v.platform,
+                        v.view_count,
+                        v.like_count,
+                        v.comment_count,
+                        v.published_at,
+                        v.thumbnail_url,
+                        v.crawled_at,
+                        v.is_shorts,
+                        vs.category,
+                        vs.sentiment_label,
+                        vs.sentiment_score,
+                        vs.trend_score,
+                        sc.engagement_score,
+                        sc.sentiment_score AS score_sentiment,
+                        sc.trend_score AS score_trend,
+                        sc.total_score,
+                        -- 채널명: channel.title 우선 사용
+                        COALESCE(ch.title, ca.username, ca.display_name, v.channel_id) AS channel_username,
+                        -- 1일 전 스냅샷과의 비교 (video_metrics_latest 기반)
+                        prev_snap.view_count AS view_count_prev,
+                        prev_snap.like_count AS like_count_prev,
+                        prev_snap.comment_count AS comment_count_prev,
+                        {sort_score} AS sort_score,
+                        {sort_crawled_at} AS sort_crawled_at
+                    FROM video v
+                    LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
+                    LEFT JOIN video_score sc ON sc.video_id = v.video_id
+                    LEFT JOIN creator_account ca ON ca.account_id = v.channel_id AND ca.platform = v.platform
+                    LEFT JOIN channel ch ON ch.channel_id = v.channel_id
+                    {latest_join}
+                    {prev_join}
+                    WHERE vs.category = :category
+                      AND v.published_at::date BETWEEN :since_date AND :until_date
+                      AND (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
+                      AND {seek}
+                    ORDER BY {order_by}
+                    LIMIT :limit
+                )
                 SELECT
-                    v.video_id,
-                    v.title,
-                    v.description,
-                    v.tags,
-                    v.category_id,
-                    v.duration,
-                    v.channel_id,
-                    v.platform,
-                    v.view_count,
-                    v.like_count,
-                    v.comment_count,
-                    v.published_at,
-                    v.thumbnail_url,
-                    v.crawled_at,
-                    v.is_shorts,
-                    vs.category,
-                    vs.sentiment_label,
-                    vs.sentiment_score,
-                    vs.trend_score,
-                    sc.engagement_score,
-                    sc.sentiment_score AS score_sentiment,
-                    sc.trend_score AS score_trend,
-                    sc.total_score,
-                    -- 채널명: channel.title 우선 사용
-                    COALESCE(ch.title, ca.username, ca.display_name, v.channel_id) AS channel_username,
-                    -- 1일 전 스냅샷과의 비교를 위한 LATERAL JOIN
-                    prev_snap.view_count AS view_count_prev,
-                    prev_snap.like_count AS like_count_prev,
-                    prev_snap.comment_count AS comment_count_prev
-                FROM video v
-                LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
-                LEFT JOIN video_score sc ON sc.video_id = v.video_id
-                LEFT JOIN creator_account ca ON ca.account_id = v.channel_id AND ca.platform = v.platform
-                LEFT JOIN channel ch ON ch.channel_id = v.channel_id
-                WHERE vs.category = :category
-                LEFT JOIN LATERAL (
-                    SELECT view_count, like_count, comment_count
-                    FROM video_metrics_snapshot vms
-                    WHERE vms.video_id = v.video_id 
-                      AND vms.platform = v.platform
-                      AND vms.snapshot_date <= (CURRENT_DATE - INTERVAL '1 day')
-                    ORDER BY vms.snapshot_date DESC
-                    LIMIT 1
-                ) prev_snap ON true
-                WHERE v.category_id = :category_id
-                  AND v.published_at::date BETWEEN :since_date AND :until_date
-                  AND (:platform IS NULL OR v.platform = :platform)
-                ORDER BY COALESCE(sc.total_score, sc.sentiment_score, sc.trend_score, v.view_count) DESC NULLS LAST,
-                         v.crawled_at DESC
-                LIMIT :limit
-                """
+                    page.*,
+                    CASE WHEN r.view_prev = 0 AND page.view_count > 1000
+                         THEN CAST(FLOOR(page.view_count * est.prev_ratio) AS BIGINT)
+                         ELSE r.view_prev END AS resolved_view_count_prev,
+                    CASE WHEN r.view_prev = 0 AND page.view_count > 1000
+                         THEN CAST(FLOOR(COALESCE(page.like_count, 0) * est.prev_ratio) AS BIGINT)
+                         ELSE r.like_prev END AS resolved_like_count_prev,
+                    CASE WHEN r.view_prev = 0 AND page.view_count > 1000
+                         THEN CAST(FLOOR(COALESCE(page.comment_count, 0) * est.prev_ratio) AS BIGINT)
+                         ELSE r.comment_prev END AS resolved_comment_count_prev
+                FROM page
+                {alt_join}
+                CROSS JOIN LATERAL (
+                    SELECT
+                        COALESCE(alt.view_count, page.view_count_prev, 0) AS view_prev,
+                        CASE WHEN alt.view_count IS NOT NULL THEN COALESCE(alt.like_count, 0)
+                             ELSE COALESCE(page.like_count_prev, 0) END AS like_prev,
+                        CASE WHEN alt.view_count IS NOT NULL THEN COALESCE(alt.comment_count, 0)
+                             ELSE COALESCE(page.comment_count_prev, 0) END AS comment_prev
+                ) r
+                CROSS JOIN LATERAL (
+                    SELECT GREATEST(EXTRACT(EPOCH FROM (NOW() - page.published_at)) / 86400.0, 1.0) AS age_days
+                ) age
+                CROSS JOIN LATERAL (
+                    SELECT (age.age_days - 1) / age.age_days AS prev_ratio
+                ) est
+                ORDER BY page.sort_score DESC, page.sort_crawled_at DESC, page.video_id DESC
+                """.format(
+                    sort_score=VIDEO_SORT_SCORE_SQL,
+                    sort_crawled_at=VIDEO_SORT_CRAWLED_AT_SQL,
+                    seek=VIDEO_KEYSET_SEEK_SQL,
+                    order_by=VIDEO_KEYSET_ORDER_SQL,
+                    latest_join=latest_metrics_join("v"),
+                    prev_join=snapshot_as_of_join("prev_snap", "(CAST(:until_date AS DATE) - 1)"),
+                    alt_join=changed_snapshot_join("alt", "page", "(CAST(:until_date AS DATE) - 1)"),
+                )
             ),
             {
                 "category": category,
@@ -934,6 +1547,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                 "until_date": until_date,
                 "platform": platform,
                 "limit": limit,
+                **video_keyset_params(after),
             },
         ).mappings()
 
@@ -944,44 +1558,11 @@ class ContentRepositoryImpl(ContentRepositoryPort):
 
             # 조회수, 좋아요, 댓글 증가량 계산
             view_now = int(item["view_count"] or 0)
-            view_prev = int(item.get("view_count_prev") or 0)
+            view_prev = int(item["resolved_view_count_prev"] or 0)
             like_now = int(item["like_count"] or 0)
-            like_prev = int(item.get("like_count_prev") or 0)
+            like_prev = int(item["resolved_like_count_prev"] or 0)
             comment_now = int(item["comment_count"] or 0)
-            comment_prev = int(item.get("comment_count_prev") or 0)
-            video_id = item["video_id"]
-
-            # 현재와 이전 값이 같은 경우 더 이전 스냅샷에서 다른 값 찾기
-            if view_prev == view_now and view_prev > 0:
-                try:
-                    alt_snapshot = self.db.execute(
-                        text('''
-                            SELECT view_count, like_count, comment_count
-                            FROM video_metrics_snapshot s
-                            WHERE s.video_id = :video_id
-                              AND s.platform = 'youtube'
-                              AND s.snapshot_date <= CURRENT_DATE - INTERVAL '1 day'
-                              AND s.view_count <> :current_view
-                            ORDER BY s.snapshot_date DESC
-                            LIMIT 1
-                        '''),
-                        {'video_id': video_id, 'current_view': view_now}
-                    ).fetchone()
-
-                    if alt_snapshot:
-                        view_prev = int(alt_snapshot[0])
-                        like_prev = int(alt_snapshot[1] or 0)
-                        comment_prev = int(alt_snapshot[2] or 0)
-                except Exception:
-                    pass
-
-            # 스냅샷 데이터 부족 시 대체 로직
-            if view_prev == 0 and view_now > 1000:
-                import random
-                # 현재 값의 70-90% 범위에서 이전값 추정
-                view_prev = int(view_now * random.uniform(0.7, 0.9))
-                like_prev = int(like_now * random.uniform(0.7, 0.9))
-                comment_prev = int(comment_now * random.uniform(0.7, 0.9))
+            comment_prev = int(item["resolved_comment_count_prev"] or 0)
 
             delta_views = view_now - view_prev
             delta_likes = like_now - like_prev
@@ -999,12 +1580,18 @@ class ContentRepositoryImpl(ContentRepositoryPort):
             item["comment_count_change"] = int(delta_comments)
             item["growth_rate_percentage"] = round(growth_rate * 100, 1) if growth_rate != 0 else 0.0
 
-            # 이전 스냅샷 데이터는 프론트에서 불필요하므로 제거
-            item.pop("view_count_prev", None)
-            item.pop("like_count_prev", None)
-            item.pop("comment_count_prev", None)
+            # 이전 스냅샷 데이터/정렬용 컬럼은 프론트에서 불필요하므로 제거
+            for key in (
+                "view_count_prev",
+                "like_count_prev",
+                "comment_count_prev",
+                "resolved_view_count_prev",
+                "resolved_like_count_prev",
+                "resolved_comment_count_prev",
+            ):
+                item.pop(key, None)
 
-            result.append(item)
+            result.append(_with_video_cursor(item))
 
         return result
 
@@ -1012,11 +1599,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         """
         등록된 카테고리 목록만 조회(관심사 등록용).
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
                 """
                 SELECT category FROM (
@@ -1038,72 +1621,50 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         limit: int = 30,
         days: int = 3,
         velocity_days: int = 1,
+        after: Mapping[str, Any] | None = None,
+        save_scores: bool = True,
     ) -> list[dict]:
         """
         단기 조회수 증가량/증가율(일 단위 스냅샷 기반)을 활용해 급등 영상 랭킹을 계산한다.
         
         최적화 내용:
-        1. LATERAL JOIN → CTE로 변경: 각 비디오마다 서브쿼리를 실행하지 않고 한번에 처리
-        2. DISTINCT ON 활용: 최신/이전 스냅샷을 효율적으로 가져오기
+        1. 대상 필터와 지표 계산을 한 CTE 에서 처리
+        2. video_metrics_latest 활용: 현재값/기준값을 snapshot_as_of_join 으로 가져온다. 대부분 PK 조인 한 번으로 끝나고,
+           기준일이 prev_date 보다 과거인 영상만 스냅샷을 조회한다.
         3. Python loop 내 추가 쿼리 제거: alt_snapshot 조회 로직 제거
         4. SQL에서 surge_score 계산: Python 연산 최소화
         5. 배치 upsert: video_score 업데이트를 루프에서 한 번에 처리
         
         - days: 최근 N일 내 업로드/수집된 영상만 대상
-        - velocity_days: 이전 스냅샷 기준 일수 (예: 1일 전과 비교)
+        - velocity_days: 기준일까지의 일수. :to_date 시점 값과 velocity_days 일 전 시점 값(그 시점 이전 마지막 스냅샷)을 비교한다.
+          스냅샷은 값이 바뀐 날에만 쌓이므로, 기준일 이후 바뀐 적이 없는 영상은 두 값이 같아 증가량이 0 이다.
+        - after: 이전 페이지 마지막 행의 커서(decode_cursor 결과). 그 행 다음부터 조회한다.
+        - save_scores: False 면 video_score 갱신을 생략한다. (호출 측이 save_surge_scores 를 primary 세션으로 따로 호출)
+
+        정렬은 (증가량 있음, surge_score, video_id) 내림차순이다. surge_score 의 신선도 항은 기준 시각(now)에
+        따라 달라지므로, 커서에 첫 페이지의 기준 시각과 순위를 함께 담아 다음 페이지도 같은 시각으로 계산한다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-        
-        to_date = datetime.utcnow().date()
+        if after is not None:
+            now = cursor_value(after, "n", datetime.fromisoformat)
+            rank_offset = cursor_value(after, "r", int)
+            seek_params = {
+                "after_has_growth": cursor_value(after, "g", int),
+                "after_surge_score": cursor_value(after, "s", float),
+                "after_video_id": cursor_value(after, "v", str),
+            }
+        else:
+            now = datetime.utcnow()
+            rank_offset = 0
+            seek_params = {"after_has_growth": None, "after_surge_score": None, "after_video_id": None}
+        to_date = now.date()
         from_date = to_date - timedelta(days=days - 1)
-        now = datetime.utcnow()
 
         # 최적화된 SQL: CTE를 사용해 스냅샷 조회를 한 번에 처리
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
                 """
-                WITH 
-                -- 1단계: 대상 비디오 필터링 (최근 N일)
-                target_videos AS (
-                    SELECT video_id, platform
-                    FROM video v
-                    WHERE COALESCE(v.published_at::date, v.crawled_at::date) BETWEEN :from_date AND :to_date
-                      AND (:platform IS NULL OR v.platform = :platform)
-                ),
-                -- 2단계: 최신 스냅샷 (DISTINCT ON으로 최적화)
-                latest_snapshot AS (
-                    SELECT DISTINCT ON (vms.video_id, vms.platform)
-                        vms.video_id,
-                        vms.platform,
-                        vms.view_count AS curr_view,
-                        vms.like_count AS curr_like,
-                        vms.comment_count AS curr_comment,
-                        vms.snapshot_date AS curr_date
-                    FROM video_metrics_snapshot vms
-                    INNER JOIN target_videos tv ON vms.video_id = tv.video_id AND vms.platform = tv.platform
-                    WHERE vms.snapshot_date <= :to_date
-                    ORDER BY vms.video_id, vms.platform, vms.snapshot_date DESC
-                ),
-                -- 3단계: 이전 스냅샷 (최신보다 이전 것 중 가장 최근 것)
-                prev_snapshot AS (
-                    SELECT DISTINCT ON (vms.video_id, vms.platform)
-                        vms.video_id,
-                        vms.platform,
-                        vms.view_count AS prev_view,
-                        vms.like_count AS prev_like,
-                        vms.comment_count AS prev_comment
-                    FROM video_metrics_snapshot vms
-                    INNER JOIN latest_snapshot ls 
-                        ON vms.video_id = ls.video_id 
-                        AND vms.platform = ls.platform
-                    WHERE vms.snapshot_date < ls.curr_date
-                      AND vms.snapshot_date >= :to_date - INTERVAL '30 days'
-                    ORDER BY vms.video_id, vms.platform, vms.snapshot_date DESC
-                ),
-                -- 4단계: 메인 데이터 조합 및 surge 지표 계산
+                WITH
+                -- 1단계: 최근 N일 영상의 현재값(:to_date 시점)과 기준값(:to_date - velocity_days 시점) 조합 및 surge 지표 계산
                 surge_calc AS (
                     SELECT
                         v.video_id,
@@ -1122,27 +1683,27 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                         COALESCE(ch.title, v.channel_id) AS channel_username,
                         
                         -- 현재 및 이전 지표
-                        COALESCE(ls.curr_view, v.view_count, 0)::BIGINT AS view_count,
-                        COALESCE(ps.prev_view, 0)::BIGINT AS view_count_prev,
-                        COALESCE(ls.curr_like, v.like_count, 0)::BIGINT AS like_count,
-                        COALESCE(ps.prev_like, 0)::BIGINT AS like_count_prev,
-                        COALESCE(ls.curr_comment, v.comment_count, 0)::BIGINT AS comment_count,
-                        COALESCE(ps.prev_comment, 0)::BIGINT AS comment_count_prev,
+                        COALESCE(c.view_count, v.view_count, 0)::BIGINT AS view_count,
+                        COALESCE(p.view_count, 0)::BIGINT AS view_count_prev,
+                        COALESCE(c.like_count, v.like_count, 0)::BIGINT AS like_count,
+                        COALESCE(p.like_count, 0)::BIGINT AS like_count_prev,
+                        COALESCE(c.comment_count, v.comment_count, 0)::BIGINT AS comment_count,
+                        COALESCE(p.comment_count, 0)::BIGINT AS comment_count_prev,
                         
                         -- 증가량
-                        (COALESCE(ls.curr_view, v.view_count, 0) - COALESCE(ps.prev_view, 0))::BIGINT AS delta_views,
-                        (COALESCE(ls.curr_like, v.like_count, 0) - COALESCE(ps.prev_like, 0))::BIGINT AS delta_likes,
-                        (COALESCE(ls.curr_comment, v.comment_count, 0) - COALESCE(ps.prev_comment, 0))::BIGINT AS delta_comments,
+                        (COALESCE(c.view_count, v.view_count, 0) - COALESCE(p.view_count, 0))::BIGINT AS delta_views,
+                        (COALESCE(c.like_count, v.like_count, 0) - COALESCE(p.like_count, 0))::BIGINT AS delta_likes,
+                        (COALESCE(c.comment_count, v.comment_count, 0) - COALESCE(p.comment_count, 0))::BIGINT AS delta_comments,
                         
                         -- Velocity (일 단위 증가량)
-                        (COALESCE(ls.curr_view, v.view_count, 0) - COALESCE(ps.prev_view, 0))::FLOAT / NULLIF(:velocity_days, 0) AS view_velocity,
-                        (COALESCE(ls.curr_like, v.like_count, 0) - COALESCE(ps.prev_like, 0))::FLOAT / NULLIF(:velocity_days, 0) AS like_velocity,
-                        (COALESCE(ls.curr_comment, v.comment_count, 0) - COALESCE(ps.prev_comment, 0))::FLOAT / NULLIF(:velocity_days, 0) AS comment_velocity,
+                        (COALESCE(c.view_count, v.view_count, 0) - COALESCE(p.view_count, 0))::FLOAT / NULLIF(:velocity_days, 0) AS view_velocity,
+                        (COALESCE(c.like_count, v.like_count, 0) - COALESCE(p.like_count, 0))::FLOAT / NULLIF(:velocity_days, 0) AS like_velocity,
+                        (COALESCE(c.comment_count, v.comment_count, 0) - COALESCE(p.comment_count, 0))::FLOAT / NULLIF(:velocity_days, 0) AS comment_velocity,
                         
                         -- 증가율
                         CASE 
-                            WHEN COALESCE(ps.prev_view, 0) > 0 THEN 
-                                (COALESCE(ls.curr_view, v.view_count, 0) - COALESCE(ps.prev_view, 0))::FLOAT / ps.prev_view
+                            WHEN COALESCE(p.view_count, 0) > 0 THEN 
+                                (COALESCE(c.view_count, v.view_count, 0) - COALESCE(p.view_count, 0))::FLOAT / p.view_count
                             ELSE 0.0
                         END AS growth_rate,
                         
@@ -1165,53 +1726,67 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                         COALESCE(sc.total_score, sc.sentiment_score, sc.trend_score, 0) AS total_score
                         
                     FROM video v
-                    INNER JOIN target_videos tv ON v.video_id = tv.video_id AND v.platform = tv.platform
-                    LEFT JOIN latest_snapshot ls ON ls.video_id = v.video_id AND ls.platform = v.platform
-                    LEFT JOIN prev_snapshot ps ON ps.video_id = v.video_id AND ps.platform = v.platform
                     LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
                     LEFT JOIN video_score sc ON sc.video_id = v.video_id
                     LEFT JOIN channel ch ON ch.channel_id = v.channel_id
+                    {latest_join}
+                    {curr_join}
+                    {prev_join}
+                    WHERE COALESCE(v.published_at::date, v.crawled_at::date) BETWEEN :from_date AND :to_date
+                      AND (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
+                ),
+                -- 2단계: Surge Score 계산
+                ranked AS (
+                    SELECT
+                        *,
+                        -- velocity가 있는 영상 우선
+                        CASE WHEN delta_views > 0 THEN 1 ELSE 0 END AS has_growth,
+                        -- Surge Score 계산 (SQL에서 직접 수행)
+                        COALESCE(
+                            (growth_rate * 100) +                                    -- growth_factor
+                            (view_velocity / 1000.0) +                               -- velocity_factor
+                            (LN(GREATEST(view_count, 1) + 10) * 0.1) +              -- popularity_factor
+                            (freshness_score_with_bonus * 50),                      -- freshness_factor
+                            0
+                        ) AS surge_score,
+
+                        -- 증가율 퍼센트
+                        ROUND((growth_rate * 100)::NUMERIC, 1) AS growth_rate_percentage
+
+                    FROM surge_calc
+                    WHERE view_count > 0  -- 조회수가 0인 영상 제외
+                )
+                -- 3단계: 정렬 및 커서 위치부터 조회
+                SELECT *
+                FROM ranked
+                WHERE CAST(:after_video_id AS VARCHAR) IS NULL
+                   OR (has_growth, surge_score, video_id) < (
+                        CAST(:after_has_growth AS INTEGER),
+                        CAST(:after_surge_score AS DOUBLE PRECISION),
+                        CAST(:after_video_id AS VARCHAR)
+                   )
+                ORDER BY has_growth DESC, surge_score DESC, video_id DESC
+                LIMIT :limit
+                """.format(
+                    latest_join=latest_metrics_join("v"),
+                    curr_join=snapshot_as_of_join("c", "CAST(:to_date AS DATE)"),
+                    prev_join=snapshot_as_of_join("p", "(CAST(:to_date AS DATE) - CAST(:velocity_days AS INTEGER))"),
                 )
-                -- 5단계: Surge Score 계산 및 정렬
-                SELECT
-                    *,
-                    -- Surge Score 계산 (SQL에서 직접 수행)
-                    (
-                        (growth_rate * 100) +                                    -- growth_factor
-                        (view_velocity / 1000.0) +                               -- velocity_factor
-                        (LN(GREATEST(view_count, 1) + 10) * 0.1) +              -- popularity_factor
-                        (freshness_score_with_bonus * 50)                       -- freshness_factor
-                    ) AS surge_score,
-                    
-                    -- 증가율 퍼센트
-                    ROUND((growth_rate * 100)::NUMERIC, 1) AS growth_rate_percentage
-                    
-                FROM surge_calc
-                WHERE view_count > 0  -- 조회수가 0인 영상 제외
-                ORDER BY 
-                    -- velocity가 있는 영상 우선
-                    CASE WHEN delta_views > 0 THEN 1 ELSE 0 END DESC,
-                    -- Surge Score 기준 정렬
-                    surge_score DESC NULLS LAST,
-                    view_velocity DESC NULLS LAST,
-                    view_count DESC
-                LIMIT :limit_fetch
-                """
             ),
             {
                 "from_date": from_date,
                 "to_date": to_date,
                 "platform": platform,
                 "velocity_days": velocity_days,
-                "limit_fetch": limit * 2,  # 여유있게 가져온 후 재정렬
+                "limit": limit,
                 "now": now,
+                **seek_params,
             },
         ).mappings()
 
         import math
 
         result: list[dict] = []
-        video_scores_to_upsert = []
 
         # SQL 결과를 Python에서 추가 가공 (최소화)
         for r in rows:
@@ -1253,9 +1828,19 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                 item["freshness_score"] = round(freshness_with_bonus, 4)
                 item["freshness_bonus"] = 1.0
             
-            # Surge score 반올림
+            # Surge score 반올림 (커서에는 정렬에 쓴 원래 값을 담는다)
             surge_score = float(item.get("surge_score") or 0.0)
             item["surge_score"] = round(surge_score, 2)
+            item["trending_rank"] = rank_offset + len(result) + 1
+            item[CURSOR_KEY] = encode_cursor(
+                {
+                    "g": item.pop("has_growth"),
+                    "s": surge_score,
+                    "v": item["video_id"],
+                    "n": now,
+                    "r": item["trending_rank"],
+                }
+            )
             
             # 디버깅용 세부 점수
             growth_factor = (item["growth_rate"] or 0.0) * 100
@@ -1276,48 +1861,45 @@ class ContentRepositoryImpl(ContentRepositoryPort):
             item.pop("comment_count_prev", None)
             
             result.append(item)
-            
-            # 배치 upsert를 위한 데이터 수집
-            video_scores_to_upsert.append({
-                "video_id": item["video_id"],
-                "platform": item.get("platform") or "youtube",
-                "trend_score": item["surge_score"],
-                "updated_at": now,
-            })
-        
-        # Surge score 기준으로 최종 정렬 및 limit 적용
-        result_sorted = sorted(
-            result,
-            key=lambda x: x.get("surge_score") or 0.0,
-            reverse=True,
-        )[:limit]
-        
-        # Ranking 부여
-        for idx, item in enumerate(result_sorted, 1):
-            item["trending_rank"] = idx
-        
-        # 배치 upsert: 한 번의 트랜잭션으로 모든 video_score 업데이트
-        if video_scores_to_upsert:
-            try:
-                # limit만큼만 upsert
-                self.db.execute(
-                    text(
-                        """
-                        INSERT INTO video_score (video_id, platform, trend_score, updated_at)
-                        VALUES (:video_id, :platform, :trend_score, :updated_at)
-                        ON CONFLICT (video_id) DO UPDATE SET
-                            trend_score = EXCLUDED.trend_score,
-                            updated_at = EXCLUDED.updated_at
-                        """
-                    ),
-                    video_scores_to_upsert[:limit],
-                )
-                self.db.commit()
-            except Exception as e:
-                self.db.rollback()
-                print(f"Error batch upserting trend_scores: {e}")
 
-        return result_sorted
+        # 계산한 surge_score 를 video_score.trend_score 에 반영한다. (조회는 복제본, 쓰기는 primary)
+        if save_scores:
+            self.save_surge_scores(result)
+
+        return result
+
+    def save_surge_scores(self, items: list[dict]) -> None:
+        """
+        급등 랭킹 결과의 surge_score 를 video_score.trend_score 로 한 번에 upsert 한다. 실패해도 랭킹 응답은 막지 않는다.
+        """
+        if not items:
+            return
+        updated_at = datetime.utcnow()
+        try:
+            self.db.execute(
+                text(
+                    """
+                    INSERT INTO video_score (video_id, platform, trend_score, updated_at)
+                    VALUES (:video_id, :platform, :trend_score, :updated_at)
+                    ON CONFLICT (video_id) DO UPDATE SET
+                        trend_score = EXCLUDED.trend_score,
+                        updated_at = EXCLUDED.updated_at
+                    """
+                ),
+                [
+                    {
+                        "video_id": item["video_id"],
+                        "platform": item.get("platform") or "youtube",
+                        "trend_score": item["surge_score"],
+                        "updated_at": updated_at,
+                    }
+                    for item in items
+                ],
+            )
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            print(f"Error batch upserting trend_scores: {e}")
 
     def fetch_video_snapshot_history(
         self, video_id: str, platform: str = "youtube", days: int = 7
@@ -1325,17 +1907,17 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         """
         특정 영상의 스냅샷 히스토리를 조회하여 추이 차트 데이터를 제공한다.
         스냅샷이 없는 경우 현재 video 테이블 데이터를 반환한다.
+        - 보관 기간을 넘는 기간은 주/월 롤업을 읽으며, 이때 daily_* 증가량은 직전 구간 대비 증가량이다.
         """
-        try:
-            self.db.rollback()
-        except Exception:
-            pass
-
         since_date = (datetime.utcnow() - timedelta(days=days)).date()
+        series_sql = metrics_series_sql(
+            metrics_granularity(days),
+            "video_id = :video_id AND platform = :platform",
+        )
 
-        rows = self.db.execute(
+        rows = self.read_db.execute(
             text(
-                """
+                f"""
                 SELECT
                     vms.snapshot_date,
                     vms.view_count,
@@ -1345,10 +1927,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                     COALESCE(vms.view_count - LAG(vms.view_count) OVER (ORDER BY vms.snapshot_date), 0) as daily_view_increase,
                     COALESCE(vms.like_count - LAG(vms.like_count) OVER (ORDER BY vms.snapshot_date), 0) as daily_like_increase,
                     COALESCE(vms.comment_count - LAG(vms.comment_count) OVER (ORDER BY vms.snapshot_date), 0) as daily_comment_increase
-                FROM video_metrics_snapshot vms
-                WHERE vms.video_id = :video_id
-                  AND vms.platform = :platform
-                  AND vms.snapshot_date >= :since_date
+                FROM ({series_sql}) vms
                 ORDER BY vms.snapshot_date ASC
                 """
             ),
@@ -1363,7 +1942,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
 
         # 스냅샷이 없는 경우, video 테이블의 현재 데이터만 반환 (증가량 없음)
         if not result:
-            video_row = self.db.execute(
+            video_row = self.read_db.execute(
                 text(
                     """
                     SELECT
@@ -0,0 +1,57 @@
+"""
+keyword_cooccurrence(연관 키워드 행렬)를 갱신하는 SQL.
+
+keyword_cooccurrence 는 (tag_a, tag_b) 쌍마다 두 태그가 함께 달린 영상 수를 담는다.
+조회가 항상 tag_a 기준 상위 k 개이므로 두 방향(a->b, b->a)을 모두 저장하고,
+(tag_a, video_count DESC) 인덱스에서 앞부분만 읽는다.
+
+- 증분: video_tag.created_at 이 (:since, :until] 인 새 posting 이 만든 쌍만 더한다.
+  (새-기존, 새-새 쌍. 기존-기존 쌍은 이전 실행에서 이미 집계됨)
+- 전체 재계산: 태그 삭제/윈도우 만료를 반영하기 위해 주기적으로 처음부터 다시 만든다.
+- :window_days 가 주어지면 게시(없으면 수집) 시각이 최근 N일인 영상만 집계한다.
+"""
+
+_WINDOW_FILTER = """
+    (CAST(:window_days AS INTEGER) IS NULL
+     OR COALESCE(v.published_at, v.crawled_at) >= NOW() - make_interval(days => CAST(:window_days AS INTEGER)))
+"""
+
+INCREMENTAL_COOCCURRENCE_SQL = f"""
+    WITH touched AS (
+        SELECT DISTINCT video_id
+        FROM video_tag
+        WHERE created_at > :since
+          AND created_at <= :until
+    ),
+    pairs AS (
+        SELECT a.tag_id AS tag_a, b.tag_id AS tag_b, COUNT(*) AS video_count
+        FROM touched tv
+        JOIN video v ON v.video_id = tv.video_id
+        JOIN video_tag a ON a.video_id = tv.video_id
+        JOIN video_tag b ON b.video_id = tv.video_id AND b.tag_id <> a.tag_id
+        WHERE a.created_at <= :until
+          AND b.created_at <= :until
+          AND (a.created_at > :since OR b.created_at > :since)
+          AND {_WINDOW_FILTER}
+        GROUP BY a.tag_id, b.tag_id
+    )
+    INSERT INTO keyword_cooccurrence (tag_a, tag_b, video_count, updated_at)
+    SELECT tag_a, tag_b, video_count, NOW()
+    FROM pairs
+    ON CONFLICT (tag_a, tag_b)
+    DO UPDATE SET
+        video_count = keyword_cooccurrence.video_count + EXCLUDED.video_count,
+        updated_at = NOW()
+"""
+
+REBUILD_COOCCURRENCE_SQL = f"""
+    INSERT INTO keyword_cooccurrence (tag_a, tag_b, video_count, updated_at)
+    SELECT a.tag_id, b.tag_id, COUNT(*), NOW()
+    FROM video_tag a
+    JOIN video_tag b ON b.video_id = a.video_id AND b.tag_id <> a.tag_id
+    JOIN video v ON v.video_id = a.video_id
+    WHERE a.created_at <= :until
+      AND b.created_at <= :until
+      AND {_WINDOW_FILTER}
+    GROUP BY a.tag_id, b.tag_id
+"""
@@ -0,0 +1,48 @@
+"""
+점수순 영상 목록의 키셋(커서) 페이지네이션용 SQL 조각.
+
+목록 쿼리는 (sort_score, crawled_at, video_id) 내림차순으로 정렬하고, 다음 페이지는 OFFSET 대신
+마지막 행의 정렬 키보다 "뒤"인 행만 행 값 비교로 골라낸다. 앞 페이지 행을 세어 버리지 않으므로
+몇 번째 페이지든 첫 페이지와 같은 비용으로 조회된다.
+
+- 정렬 키는 모두 NOT NULL 이 되도록 COALESCE 한다. (행 값 비교에 NULL 이 끼면 행이 누락된다)
+- video_id 는 동점 행을 가르는 마지막 키이므로 정렬 순서가 항상 유일하다.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Mapping
+
+from content.utils.cursor import cursor_value, encode_cursor
+
+# v(video), sc(video_score) 별칭 기준 정렬 키
+VIDEO_SORT_SCORE_SQL = "COALESCE(sc.total_score, sc.sentiment_score, sc.trend_score, v.view_count, 0)"
+VIDEO_SORT_CRAWLED_AT_SQL = "COALESCE(v.crawled_at, TIMESTAMP 'epoch')"
+
+VIDEO_KEYSET_ORDER_SQL = f"{VIDEO_SORT_SCORE_SQL} DESC, {VIDEO_SORT_CRAWLED_AT_SQL} DESC, v.video_id DESC"
+
+VIDEO_KEYSET_SEEK_SQL = f"""(
+    CAST(:after_video_id AS VARCHAR) IS NULL
+    OR ({VIDEO_SORT_SCORE_SQL}, {VIDEO_SORT_CRAWLED_AT_SQL}, v.video_id)
+       < (CAST(:after_sort_score AS NUMERIC), CAST(:after_crawled_at AS TIMESTAMP), CAST(:after_video_id AS VARCHAR))
+)"""
+
+
+def video_keyset_params(after: Mapping[str, Any] | None) -> dict:
+    """
+    디코딩한 커서를 VIDEO_KEYSET_SEEK_SQL 바인드 파라미터로 바꾼다. 첫 페이지(None)면 모두 NULL.
+    """
+    if after is None:
+        return {"after_sort_score": None, "after_crawled_at": None, "after_video_id": None}
+    return {
+        "after_sort_score": cursor_value(after, "s", Decimal),
+        "after_crawled_at": cursor_value(after, "c", datetime.fromisoformat),
+        "after_video_id": cursor_value(after, "v", str),
+    }
+
+
+def video_row_cursor(row: Mapping[str, Any]) -> str:
+    """
+    sort_score / sort_crawled_at / video_id 컬럼을 가진 행에서 그 행 다음부터 읽는 커서를 만든다.
+    """
+    return encode_cursor({"s": row["sort_score"], "c": row["sort_crawled_at"], "v": row["video_id"]})
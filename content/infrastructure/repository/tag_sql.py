@@ -0,0 +1,83 @@
+"""
+tag / video_tag 를 다루는 공용 SQL 조각.
+
+tag 는 태그 문자열마다 정수 id 를 부여하는 사전이고, video_tag 는 (video_id, tag_id) 역색인이다.
+키워드 검색/연관 키워드/카테고리 태그 집계는 문자열을 다시 쪼개거나 비교하지 않고
+tag.name 유니크 인덱스로 id 를 한 번 찾은 뒤 정수 조인으로 처리한다.
+"""
+
+# 태그 이름 최대 길이 (keyword_mapping.keyword 와 동일)
+TAG_NAME_MAX_LENGTH = 100
+
+
+def replace_video_tags_sql(source_sql: str) -> str:
+    """
+    :target_video_ids 영상들의 video_tag 집합을 source_sql 결과로 통째로 교체하는 SQL.
+
+    source_sql 은 (video_id, platform, name, weight) 순서의 컬럼을 내는 SELECT 절이어야 한다.
+    - 사전에 없는 태그는 tag 에 추가한다. 이미 있는 태그는 쓰지 않으며, 동시에 다른 트랜잭션이
+      같은 태그를 넣은 경우에도 ON CONFLICT DO UPDATE 가 그 행의 id 를 돌려주므로 id 가 비지 않는다.
+    - 새 집합에 없는 기존 video_tag 행은 삭제하고, 새 행은 INSERT ... ON CONFLICT 로 반영한다.
+      이미 있는 행은 platform/weight 가 바뀐 경우에만 고치고 created_at 은 그대로 둔다.
+    - created_at 은 트랜잭션 시작 시각(CURRENT_TIMESTAMP)이 아니라 실제 기록 시각으로 남긴다.
+      연관 키워드 증분 배치가 이 값을 watermark 와 비교하므로, 긴 트랜잭션에서 기록된 행이
+      이미 지나간 watermark 보다 과거 시각으로 찍혀 누락되지 않게 하기 위함이다.
+    """
+    return f"""
+        WITH src AS (
+            SELECT DISTINCT ON (s.video_id, s.name) s.video_id, s.platform, s.name, s.weight
+            FROM (
+                SELECT video_id, platform, LEFT(TRIM(name), {TAG_NAME_MAX_LENGTH}) AS name, weight
+                FROM ({source_sql}) AS raw(video_id, platform, name, weight)
+            ) s
+            WHERE s.name <> ''
+            ORDER BY s.video_id, s.name
+        ),
+        new_tags AS (
+            INSERT INTO tag (name)
+            SELECT DISTINCT src.name
+            FROM src
+            WHERE NOT EXISTS (SELECT 1 FROM tag t WHERE t.name = src.name)
+            ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
+            RETURNING tag_id, name
+        ),
+        resolved AS (
+            SELECT src.video_id, src.platform, COALESCE(nt.tag_id, t.tag_id) AS tag_id, src.weight
+            FROM src
+            LEFT JOIN new_tags nt ON nt.name = src.name
+            LEFT JOIN tag t ON t.name = src.name
+        ),
+        removed AS (
+            DELETE FROM video_tag vt
+            WHERE vt.video_id = ANY(CAST(:target_video_ids AS VARCHAR[]))
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM resolved r
+                  WHERE r.video_id = vt.video_id
+                    AND r.tag_id = vt.tag_id
+              )
+        )
+        INSERT INTO video_tag (video_id, tag_id, platform, weight, created_at)
+        SELECT video_id, tag_id, platform, weight, CAST(clock_timestamp() AS TIMESTAMP)
+        FROM resolved
+        ON CONFLICT (video_id, tag_id)
+        DO UPDATE SET
+            platform = EXCLUDED.platform,
+            weight = EXCLUDED.weight
+        WHERE video_tag.platform IS DISTINCT FROM EXCLUDED.platform
+           OR video_tag.weight IS DISTINCT FROM EXCLUDED.weight
+    """
+
+
+# 수집한 영상의 태그(콤마 구분 문자열)를 video_tag 소스 형태로 펼치는 SELECT 절.
+# upsert_videos 와 replace_keyword_mappings_bulk 가 같은 수집 태그 목록으로 video_tag 를 교체하도록,
+# 저장된 video.tags(최초 적재 후 덮어쓰지 않음)가 아니라 이번에 받은 태그를 배열 파라미터로 넘긴다.
+INCOMING_TAGS_SOURCE_SQL = """
+    SELECT s.video_id, s.platform, x.tag, CAST(1.0 AS NUMERIC)
+    FROM unnest(
+        CAST(:video_ids AS VARCHAR[]),
+        CAST(:platforms AS VARCHAR[]),
+        CAST(:tag_lists AS TEXT[])
+    ) AS s(video_id, platform, tags)
+    CROSS JOIN LATERAL unnest(string_to_array(s.tags, ',')) AS x(tag)
+"""
@@ -0,0 +1,316 @@
+"""
+트렌드 집계(keyword_trend / category_trend)용 SQL 조각.
+
+윈도우 집계는 현재 기간과 직전 기간을 한 번의 스캔으로 함께 집계하고 증가율까지 SQL 에서 계산한다.
+
+증분 집계는 watermark 이후 집계 입력이 바뀐 영상만 찾아, 그 영상이 속한 키워드(tag)와 카테고리만
+윈도우 전체 기준으로 다시 집계한다. 영상이 바뀌었다고 보는 기준은 다음 시각 컬럼이 (:since, :until] 인 경우다.
+:until 은 DB 시계(NOW()) 기준이므로, 수집기/분석기가 준 crawled_at / analyzed_at 대신 적재 시 DB 가 찍은 시각을 쓴다.
+- video.updated_at: 재수집으로 조회/좋아요/댓글 수가 바뀜
+- video_tag.created_at: 새 태그가 달림
+- video_sentiment.updated_at: 감성/카테고리 분석 결과가 바뀜
+- video_score.updated_at: 점수가 바뀜
+- video_metrics_latest.updated_at: 스냅샷 값이 바뀜 (값이 같으면 갱신되지 않는다)
+
+태그가 빠지거나 감성 분석 카테고리가 다른 값으로 바뀐 경우처럼 "이전 값"이 남지 않는 변경은 잡지 못하므로,
+기준 일자가 바뀌는 첫 실행(watermark 없음)에서 전체 재계산으로 맞춘다.
+
+columnar_* / COLUMNAR_* 는 컬럼형(numpy) 집계 엔진(trend_columnar_engine)이 윈도우를 한 번에 읽는 적재 SQL 이다.
+"""
+
+# YouTube category_id -> 카테고리 이름. video_sentiment.category 가 없을 때 집계 키로 쓴다.
+YOUTUBE_CATEGORY_NAMES = {
+    1: "Film & Animation",
+    2: "Autos & Vehicles",
+    10: "Music",
+    15: "Pets & Animals",
+    17: "Sports",
+    19: "Travel & Events",
+    20: "Gaming",
+    22: "People & Blogs",
+    23: "Comedy",
+    24: "Entertainment",
+    25: "News",
+    26: "Howto & Style",
+    27: "Education",
+    28: "Science & Technology",
+    29: "Nonprofits & Activism",
+}
+
+
+def youtube_category_name_sql(column: str) -> str:
+    """category_id 컬럼을 카테고리 이름으로 바꾸는 CASE 식. 매핑에 없으면 'uncategorized'."""
+    whens = "\n".join(f"        WHEN {category_id} THEN '{name}'" for category_id, name in YOUTUBE_CATEGORY_NAMES.items())
+    return f"CASE {column}\n{whens}\n        ELSE 'uncategorized'\n    END"
+
+
+# watermark 이후 집계 입력이 바뀐 영상 (video_id, platform, category_id)
+CHANGED_VIDEOS_SQL = """
+    SELECT v.video_id, v.platform, v.category_id
+    FROM video v
+    WHERE v.video_id IN (
+        SELECT video_id FROM video WHERE updated_at > :since AND updated_at <= :until
+        UNION ALL
+        SELECT video_id FROM video_tag WHERE created_at > :since AND created_at <= :until
+        UNION ALL
+        SELECT video_id FROM video_sentiment WHERE updated_at > :since AND updated_at <= :until
+        UNION ALL
+        SELECT video_id FROM video_score WHERE updated_at > :since AND updated_at <= :until
+        UNION ALL
+        SELECT video_id FROM video_metrics_latest WHERE updated_at > :since AND updated_at <= :until
+    )
+      AND (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
+"""
+
+HAS_CHANGED_VIDEOS_SQL = f"SELECT EXISTS ({CHANGED_VIDEOS_SQL})"
+
+# 바뀐 영상이 달고 있는 키워드. tag_id 는 재집계 필터, keyword 는 사라진 키워드 행 정리에 쓴다.
+AFFECTED_KEYWORDS_SQL = f"""
+    WITH changed AS ({CHANGED_VIDEOS_SQL})
+    SELECT DISTINCT vt.tag_id, t.name AS keyword, ch.platform
+    FROM changed ch
+    JOIN video_tag vt ON vt.video_id = ch.video_id
+    JOIN tag t ON t.tag_id = vt.tag_id
+"""
+
+# 바뀐 영상이 속할 수 있는 카테고리. 감성 분석 카테고리가 새로 생기면 category_id 기반 카테고리에서
+# 빠지므로 두 후보를 모두 영향 범위에 넣는다.
+AFFECTED_CATEGORIES_SQL = f"""
+    WITH changed AS ({CHANGED_VIDEOS_SQL})
+    SELECT DISTINCT x.category, ch.platform
+    FROM changed ch
+    LEFT JOIN video_sentiment vs ON vs.video_id = ch.video_id
+    CROSS JOIN LATERAL (
+        VALUES (vs.category), ({youtube_category_name_sql("ch.category_id")})
+    ) AS x(category)
+    WHERE x.category IS NOT NULL
+"""
+
+# 재순위 대상 플랫폼의 현재 저장된 순위
+CURRENT_KEYWORD_TRENDS_SQL = """
+    SELECT keyword, platform, search_volume, search_volume_prev, video_count, video_count_prev,
+           avg_sentiment, avg_trend, avg_total_score, growth_rate, view_velocity, rank
+    FROM keyword_trend
+    WHERE date = :as_of
+      AND platform = ANY(CAST(:platforms AS VARCHAR[]))
+"""
+
+CURRENT_CATEGORY_TRENDS_SQL = """
+    SELECT category, platform, search_volume, search_volume_prev, video_count, video_count_prev,
+           avg_sentiment, avg_trend, avg_total_score, growth_rate, view_velocity, rank
+    FROM category_trend
+    WHERE date = :as_of
+      AND platform = ANY(CAST(:platforms AS VARCHAR[]))
+"""
+
+
+# 현재 기간 [:from_date, :to_date] 과 직전 기간 [:prev_from, :prev_to] 의 영상을 한 번에 읽고,
+# 영상마다 어느 기간에 속하는지(w.is_curr)를 붙여 FILTER 로 두 기간을 같은 GROUP BY 에서 집계한다.
+# 영상의 기준 일자는 COALESCE(published_at, crawled_at) 이며 한 영상은 한 기간에만 속한다.
+def window_bucket_join(video_alias: str) -> str:
+    return f"""
+        CROSS JOIN LATERAL (
+            SELECT COALESCE({video_alias}.published_at::date, {video_alias}.crawled_at::date) >= :from_date AS is_curr
+        ) w
+    """
+
+
+def window_range_sql(video_alias: str) -> str:
+    return f"COALESCE({video_alias}.published_at::date, {video_alias}.crawled_at::date) BETWEEN :prev_from AND :to_date"
+
+
+# 기간별 스냅샷 기준일. 현재 기간은 :to_date 의 값과 :prev_anchor(속도 기준점) 대비 증가분을 쓰고,
+# 직전 기간은 :prev_to 시점 조회수만 쓰므로 속도 기준점 스냅샷은 조회하지 않는다(NULL 기준일 -> 빈 결과).
+CURR_SNAPSHOT_ANCHOR_SQL = "CASE WHEN w.is_curr THEN CAST(:to_date AS DATE) ELSE CAST(:prev_to AS DATE) END"
+PREV_SNAPSHOT_ANCHOR_SQL = "CASE WHEN w.is_curr THEN CAST(:prev_anchor AS DATE) END"
+
+
+def window_aggregates_sql(video_alias: str, count_expr: str) -> str:
+    """
+    현재/직전 기간 지표를 한 번의 GROUP BY 에서 내는 집계 컬럼 목록.
+    curr / prev 는 snapshot_as_of_join 으로 붙인 스냅샷, vs / sc 는 video_sentiment / video_score 별칭이다.
+    - search_volume_prev / video_count_prev 는 직전 기간의 조회수 합 / 영상 수다.
+    - 속도와 평균 점수는 현재 기간 영상만으로 계산한다.
+    """
+    v = video_alias
+    views = f"COALESCE(curr.view_count, {v}.view_count, 0)"
+    return f"""
+        {count_expr} FILTER (WHERE w.is_curr) AS video_count,
+        {count_expr} FILTER (WHERE NOT w.is_curr) AS video_count_prev,
+        SUM({views}) FILTER (WHERE w.is_curr) AS search_volume,
+        SUM({views}) FILTER (WHERE NOT w.is_curr) AS search_volume_prev,
+        SUM(GREATEST({views} - COALESCE(prev.view_count, 0), 0)) FILTER (WHERE w.is_curr) / :velocity_days AS view_velocity,
+        SUM(GREATEST(COALESCE(curr.like_count, {v}.like_count, 0) - COALESCE(prev.like_count, 0), 0)) FILTER (WHERE w.is_curr) / :velocity_days AS like_velocity,
+        SUM(GREATEST(COALESCE(curr.comment_count, {v}.comment_count, 0) - COALESCE(prev.comment_count, 0), 0)) FILTER (WHERE w.is_curr) / :velocity_days AS comment_velocity,
+        AVG(COALESCE(vs.sentiment_score, 0)) FILTER (WHERE w.is_curr) AS avg_sentiment,
+        AVG(COALESCE(vs.trend_score, 0)) FILTER (WHERE w.is_curr) AS avg_trend,
+        AVG(COALESCE(sc.total_score, 0)) FILTER (WHERE w.is_curr) AS avg_total_score
+    """
+
+
+# 현재 기간에 영상이 있는 키만 남긴다. (직전 기간에만 있는 키는 순위 대상이 아니다)
+CURRENT_WINDOW_HAVING_SQL = "HAVING COUNT(*) FILTER (WHERE w.is_curr) > 0"
+
+# 직전 기간 대비 조회수 증가율. 직전 기간 조회수가 0 이면 1 로 나눈다.
+GROWTH_RATE_SQL = (
+    "CAST(COALESCE(agg.search_volume, 0) - COALESCE(agg.search_volume_prev, 0) AS DOUBLE PRECISION)"
+    " / GREATEST(COALESCE(agg.search_volume_prev, 0), 1)"
+)
+
+
+# keyword_trend / category_trend 일괄 저장.
+# 하루치 순위를 임시 테이블에 COPY 로 적재한 뒤 한 트랜잭션에서 병합(INSERT ... ON CONFLICT)과 정리(DELETE)를
+# 수행한다. 조회 측은 commit 전/후 중 한 상태만 보므로 순위가 절반만 바뀐 상태를 읽지 않는다.
+TREND_VALUE_COLUMNS = (
+    "search_volume",
+    "search_volume_prev",
+    "video_count",
+    "video_count_prev",
+    "avg_sentiment",
+    "avg_trend",
+    "avg_total_score",
+    "growth_rate",
+    "view_velocity",
+    "rank",
+)
+
+
+def trend_columns(key_column: str) -> tuple[str, ...]:
+    return (key_column, "date", "platform", *TREND_VALUE_COLUMNS)
+
+
+def trend_stage_table(table: str) -> str:
+    return f"_{table}_stage"
+
+
+def create_trend_stage_sql(table: str) -> str:
+    return f"CREATE TEMP TABLE {trend_stage_table(table)} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+
+
+def copy_trend_stage_sql(table: str, key_column: str) -> str:
+    # 값이 없는 칸은 \N 으로 적어 NULL 로 읽는다. (빈 문자열 키워드와 구분)
+    return (
+        f"COPY {trend_stage_table(table)} ({', '.join(trend_columns(key_column))}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+
+
+def insert_trend_stage_sql(table: str, key_column: str) -> str:
+    """COPY 를 쓸 수 없는 드라이버용 적재 SQL (executemany)."""
+    columns = trend_columns(key_column)
+    return (
+        f"INSERT INTO {trend_stage_table(table)} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(':' + c for c in columns)})"
+    )
+
+
+def merge_trend_stage_sql(table: str, key_column: str) -> str:
+    """임시 테이블 행을 본 테이블에 병합한다. 값이 그대로인 행은 다시 쓰지 않는다."""
+    columns = ", ".join(trend_columns(key_column))
+    updates = ",\n            ".join(f"{c} = EXCLUDED.{c}" for c in TREND_VALUE_COLUMNS)
+    current = ", ".join(f"t.{c}" for c in TREND_VALUE_COLUMNS)
+    excluded = ", ".join(f"EXCLUDED.{c}" for c in TREND_VALUE_COLUMNS)
+    return f"""
+        INSERT INTO {table} AS t ({columns})
+        SELECT {columns} FROM {trend_stage_table(table)}
+        ON CONFLICT ({key_column}, date, platform)
+        DO UPDATE SET
+            {updates}
+        WHERE ({current}) IS DISTINCT FROM ({excluded})
+    """
+
+
+def delete_unstaged_trends_sql(table: str, key_column: str) -> str:
+    """:as_of 일자(:platform 이 있으면 그 플랫폼만)의 행 중 이번 순위에 없는 행을 지운다."""
+    return f"""
+        DELETE FROM {table} t
+        WHERE t.date = :as_of
+          AND (CAST(:platform AS VARCHAR) IS NULL OR t.platform = :platform)
+          AND NOT EXISTS (
+              SELECT 1
+              FROM {trend_stage_table(table)} s
+              WHERE s.{key_column} = t.{key_column}
+                AND s.date = t.date
+                AND s.platform = t.platform
+          )
+    """
+
+
+def delete_trend_keys_sql(table: str, key_column: str) -> str:
+    """:as_of 일자의 (:names[i], :platforms[i]) 행을 지운다."""
+    return f"""
+        DELETE FROM {table} t
+        USING unnest(CAST(:names AS VARCHAR[]), CAST(:platforms AS VARCHAR[])) AS d(name, platform)
+        WHERE t.date = :as_of
+          AND t.{key_column} = d.name
+          AND t.platform = d.platform
+    """
+
+
+# 컬럼형(numpy) 집계 엔진의 적재 SQL. 스냅샷 기준일 선택과 합계/평균은 엔진이 배열 연산으로 처리하고,
+# DB 에서는 윈도우 영상 행과 태그 매핑, 요약 테이블로 풀리지 않는 과거 스냅샷만 한 번씩 읽는다.
+def columnar_window_videos_sql() -> str:
+    """
+    윈도우 [:prev_from, :to_date] 영상마다 집계 입력을 한 행으로 읽는다.
+    """
+    return f"""
+        SELECT
+            v.video_id,
+            v.platform,
+            COALESCE(v.published_at::date, v.crawled_at::date) >= :from_date AS is_curr,
+            v.view_count,
+            v.like_count,
+            v.comment_count,
+            COALESCE(vs.category, {youtube_category_name_sql("v.category_id")}) AS category,
+            vs.sentiment_score,
+            vs.trend_score,
+            sc.total_score,
+            ml.curr_date,
+            ml.curr_view_count,
+            ml.curr_like_count,
+            ml.curr_comment_count,
+            ml.prev_date,
+            ml.prev_view_count,
+            ml.prev_like_count,
+            ml.prev_comment_count
+        FROM video v
+        LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
+        LEFT JOIN video_score sc ON sc.video_id = v.video_id
+        LEFT JOIN video_metrics_latest ml ON ml.video_id = v.video_id AND ml.platform = v.platform
+        WHERE {window_range_sql("v")}
+          AND (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
+    """
+
+
+def columnar_window_tags_sql() -> str:
+    """윈도우 영상의 (video_id, tag_id) 매핑."""
+    return f"""
+        SELECT vt.video_id, vt.tag_id
+        FROM video_tag vt
+        JOIN video v ON v.video_id = vt.video_id
+        WHERE {window_range_sql("v")}
+          AND (CAST(:platform AS VARCHAR) IS NULL OR v.platform = :platform)
+    """
+
+
+COLUMNAR_TAG_NAMES_SQL = """
+    SELECT tag_id, name
+    FROM tag
+    WHERE tag_id = ANY(CAST(:tag_ids AS INTEGER[]))
+"""
+
+# 기준일이 video_metrics_latest 의 prev_date 보다도 과거인 영상의 기준일 이전 마지막 스냅샷.
+# snapshot_as_of_join 의 세 번째 갈래와 같은 조회를 필요한 영상만 모아 한 번에 실행한다.
+COLUMNAR_SNAPSHOTS_AS_OF_SQL = """
+    SELECT k.video_id, s.view_count, s.like_count, s.comment_count
+    FROM unnest(CAST(:video_ids AS VARCHAR[]), CAST(:platforms AS VARCHAR[])) AS k(video_id, platform)
+    JOIN LATERAL (
+        SELECT s.view_count, s.like_count, s.comment_count
+        FROM video_metrics_snapshot s
+        WHERE s.video_id = k.video_id
+          AND s.platform = k.platform
+          AND s.snapshot_date <= :anchor
+        ORDER BY s.snapshot_date DESC
+        LIMIT 1
+    ) s ON true
+"""
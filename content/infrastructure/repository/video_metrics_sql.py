@@ -0,0 +1,361 @@
+"""
+video_metrics_latest 를 다루는 공용 SQL 조각.
+
+video_metrics_latest 는 (video_id, platform) 마다 가장 최근 스냅샷(curr_*)과 그 직전 스냅샷(prev_*)을
+들고 있는 요약 테이블이다. 스냅샷을 적재하는 쪽(upsert_video_metrics_snapshot, snapshot_video_metrics)이
+같은 문장에서 함께 갱신하므로, 조회 쿼리는 video_metrics_snapshot 을 DISTINCT ON / LATERAL 로
+다시 뒤지지 않고 PK 조인 한 번으로 현재/이전 지표를 얻는다.
+
+정기 스냅샷(snapshot_video_metrics)은 카운터가 직전 스냅샷과 달라진 영상만 적재하므로, curr_date 는 "마지막으로
+값이 바뀐 날"이고 prev_* 는 그 직전에 관측된 다른 값이다. 어떤 시점의 값은 그 시점 이전의 가장 최근 스냅샷이다.
+
+video_metrics_snapshot 은 snapshot_date 기준 월 파티션이며, 보관 기간(SNAPSHOT_RETENTION_DAYS)이 지난
+구간은 video_metrics_weekly / video_metrics_monthly 롤업으로만 남는다. 긴 기간의 추이는
+metrics_series_sql 로 기간에 맞는 단위를 골라 읽는다.
+
+video_metrics_intraday 는 최근 게시 영상의 분/시간 단위 조회수 표본(급등 피처의 10분~6시간 윈도우용)이다.
+수집 배치가 통계를 읽을 때마다 (video_id, platform, ts) 로 추가만 하고, INTRADAY_RAW_HOURS 가 지난 구간은
+시간당 마지막 표본 하나로 줄이며, INTRADAY_TRACK_DAYS 가 지난 표본은 지운다. (그 이후는 일별 스냅샷으로 충분하다)
+"""
+
+import os
+
+# 일 단위 스냅샷을 보관하는 기간. 이보다 오래된 월 파티션은 롤업 후 삭제된다.
+SNAPSHOT_RETENTION_DAYS = int(os.getenv("VIDEO_METRICS_RETENTION_DAYS", "90"))
+# 이 기간까지는 주 단위, 그보다 긴 기간은 월 단위 롤업으로 추이를 조회한다.
+WEEKLY_ROLLUP_MAX_DAYS = int(os.getenv("VIDEO_METRICS_WEEKLY_MAX_DAYS", "365"))
+
+# 게시 후 이 기간까지 intraday 표본을 쌓고, 이보다 오래된 표본은 지운다.
+INTRADAY_TRACK_DAYS = int(os.getenv("VIDEO_METRICS_INTRADAY_DAYS", "7"))
+# 수집한 그대로 두는 기간. 이보다 오래된 구간은 시간당 표본 하나로 줄인다.
+INTRADAY_RAW_HOURS = int(os.getenv("VIDEO_METRICS_INTRADAY_RAW_HOURS", "48"))
+
+# 롤업 단위별 (테이블, date_trunc 단위)
+ROLLUP_TABLES = {
+    "weekly": ("video_metrics_weekly", "week"),
+    "monthly": ("video_metrics_monthly", "month"),
+}
+
+# 스냅샷 적재 결과(video_id, platform, curr_date, curr_view_count, curr_like_count, curr_comment_count)를
+# video_metrics_latest 에 병합하는 ON CONFLICT 절.
+# - 더 최신 날짜가 들어오면 기존 curr 를 prev 로 밀어낸다.
+# - 같은 날짜면 curr 값만 갱신한다.
+# - 더 과거 날짜(백필 등)가 들어오면 prev 보다 새롭거나 같은 경우에만 prev 를 교체한다.
+# - updated_at 은 값이 실제로 바뀐 경우에만 갱신한다. 증분 트렌드 집계가 이 값으로 지표가 바뀐 영상을 찾으므로,
+#   같은 날 같은 값으로 다시 적재된 영상은 변경분으로 잡히지 않게 한다.
+LATEST_MERGE_ON_CONFLICT = """
+ON CONFLICT (video_id, platform)
+DO UPDATE SET
+    prev_date = CASE
+        WHEN EXCLUDED.curr_date > video_metrics_latest.curr_date THEN video_metrics_latest.curr_date
+        WHEN EXCLUDED.curr_date = video_metrics_latest.curr_date THEN video_metrics_latest.prev_date
+        WHEN video_metrics_latest.prev_date IS NULL OR EXCLUDED.curr_date >= video_metrics_latest.prev_date
+            THEN EXCLUDED.curr_date
+        ELSE video_metrics_latest.prev_date
+    END,
+    prev_view_count = CASE
+        WHEN EXCLUDED.curr_date > video_metrics_latest.curr_date THEN video_metrics_latest.curr_view_count
+        WHEN EXCLUDED.curr_date = video_metrics_latest.curr_date THEN video_metrics_latest.prev_view_count
+        WHEN video_metrics_latest.prev_date IS NULL OR EXCLUDED.curr_date >= video_metrics_latest.prev_date
+            THEN EXCLUDED.curr_view_count
+        ELSE video_metrics_latest.prev_view_count
+    END,
+    prev_like_count = CASE
+        WHEN EXCLUDED.curr_date > video_metrics_latest.curr_date THEN video_metrics_latest.curr_like_count
+        WHEN EXCLUDED.curr_date = video_metrics_latest.curr_date THEN video_metrics_latest.prev_like_count
+        WHEN video_metrics_latest.prev_date IS NULL OR EXCLUDED.curr_date >= video_metrics_latest.prev_date
+            THEN EXCLUDED.curr_like_count
+        ELSE video_metrics_latest.prev_like_count
+    END,
+    prev_comment_count = CASE
+        WHEN EXCLUDED.curr_date > video_metrics_latest.curr_date THEN video_metrics_latest.curr_comment_count
+        WHEN EXCLUDED.curr_date = video_metrics_latest.curr_date THEN video_metrics_latest.prev_comment_count
+        WHEN video_metrics_latest.prev_date IS NULL OR EXCLUDED.curr_date >= video_metrics_latest.prev_date
+            THEN EXCLUDED.curr_comment_count
+        ELSE video_metrics_latest.prev_comment_count
+    END,
+    curr_view_count = CASE
+        WHEN EXCLUDED.curr_date >= video_metrics_latest.curr_date THEN EXCLUDED.curr_view_count
+        ELSE video_metrics_latest.curr_view_count
+    END,
+    curr_like_count = CASE
+        WHEN EXCLUDED.curr_date >= video_metrics_latest.curr_date THEN EXCLUDED.curr_like_count
+        ELSE video_metrics_latest.curr_like_count
+    END,
+    curr_comment_count = CASE
+        WHEN EXCLUDED.curr_date >= video_metrics_latest.curr_date THEN EXCLUDED.curr_comment_count
+        ELSE video_metrics_latest.curr_comment_count
+    END,
+    curr_date = GREATEST(video_metrics_latest.curr_date, EXCLUDED.curr_date),
+    updated_at = CASE
+        WHEN EXCLUDED.curr_date = video_metrics_latest.curr_date
+         AND (EXCLUDED.curr_view_count, EXCLUDED.curr_like_count, EXCLUDED.curr_comment_count)
+             IS NOT DISTINCT FROM
+             (video_metrics_latest.curr_view_count, video_metrics_latest.curr_like_count, video_metrics_latest.curr_comment_count)
+            THEN video_metrics_latest.updated_at
+        ELSE NOW()
+    END
+"""
+
+
+def upsert_snapshots_with_latest_sql(source_sql: str) -> str:
+    """
+    source_sql 이 만들어 내는 스냅샷 행을 video_metrics_snapshot 에 upsert 하고,
+    RETURNING 결과로 video_metrics_latest 까지 한 문장에서 갱신하는 SQL 을 만든다.
+
+    source_sql 은 (video_id, platform, snapshot_date, view_count, like_count, comment_count)
+    순서의 컬럼을 내는 SELECT/VALUES 절이어야 한다.
+    """
+    return f"""
+        WITH written AS (
+            INSERT INTO video_metrics_snapshot (video_id, platform, snapshot_date, view_count, like_count, comment_count)
+            {source_sql}
+            ON CONFLICT (video_id, snapshot_date, platform)
+            DO UPDATE SET
+                view_count = EXCLUDED.view_count,
+                like_count = EXCLUDED.like_count,
+                comment_count = EXCLUDED.comment_count
+            RETURNING video_id, platform, snapshot_date, view_count, like_count, comment_count
+        )
+        INSERT INTO video_metrics_latest (
+            video_id, platform,
+            curr_date, curr_view_count, curr_like_count, curr_comment_count,
+            updated_at
+        )
+        SELECT video_id, platform, snapshot_date, view_count, like_count, comment_count, NOW()
+        FROM written
+        {LATEST_MERGE_ON_CONFLICT}
+    """
+
+
+def latest_metrics_join(video_alias: str = "v", alias: str = "ml") -> str:
+    """
+    video_metrics_latest 를 (video_id, platform) PK 로 붙이는 LEFT JOIN 절.
+    """
+    return (
+        f"LEFT JOIN video_metrics_latest {alias} "
+        f"ON {alias}.video_id = {video_alias}.video_id AND {alias}.platform = {video_alias}.platform"
+    )
+
+
+def snapshot_as_of_join(alias: str, anchor: str, latest_alias: str = "ml") -> str:
+    """
+    anchor 시점(포함) 이전의 가장 최근 스냅샷을 {alias}.view_count/like_count/comment_count/snapshot_date 로
+    노출하는 LEFT JOIN LATERAL 절. latest_metrics_join 으로 붙인 latest_alias 가 먼저 있어야 한다.
+
+    - curr_date <= anchor 이면 curr, prev_date <= anchor 이면 prev 를 그대로 쓴다 (테이블 조회 없음).
+    - anchor 가 prev_date 보다도 과거일 때만 video_metrics_snapshot 을 인덱스로 한 번 조회한다.
+      이 조건은 바깥 행 값에만 의존하므로 플래너가 one-time filter 로 처리해, 해당하지 않는 행에서는
+      서브쿼리를 실행하지 않는다.
+    """
+    ml = latest_alias
+    return f"""
+        LEFT JOIN LATERAL (
+            SELECT x.snapshot_date, x.view_count, x.like_count, x.comment_count
+            FROM (
+                SELECT {ml}.curr_date AS snapshot_date,
+                       {ml}.curr_view_count AS view_count,
+                       {ml}.curr_like_count AS like_count,
+                       {ml}.curr_comment_count AS comment_count
+                WHERE {ml}.curr_date <= {anchor}
+                UNION ALL
+                SELECT {ml}.prev_date, {ml}.prev_view_count, {ml}.prev_like_count, {ml}.prev_comment_count
+                WHERE {ml}.prev_date <= {anchor}
+                UNION ALL
+                (
+                    SELECT s.snapshot_date, s.view_count, s.like_count, s.comment_count
+                    FROM video_metrics_snapshot s
+                    WHERE {ml}.prev_date > {anchor}
+                      AND s.video_id = {ml}.video_id
+                      AND s.platform = {ml}.platform
+                      AND s.snapshot_date <= {anchor}
+                    ORDER BY s.snapshot_date DESC
+                    LIMIT 1
+                )
+            ) x
+            ORDER BY x.snapshot_date DESC
+            LIMIT 1
+        ) {alias} ON true
+    """
+
+
+def changed_snapshot_join(alias: str, row_alias: str, anchor: str) -> str:
+    """
+    row_alias 의 view_count_prev 가 현재 view_count 와 같을 때(=직전 스냅샷 이후 변화 없음),
+    anchor 시점 이전에서 조회수가 현재와 달랐던 마지막 스냅샷을 {alias}.* 로 노출하는 LEFT JOIN LATERAL 절.
+
+    row_alias 에는 video_id, platform, view_count, view_count_prev 컬럼이 있어야 한다.
+    조건이 바깥 행 값에만 의존하는 one-time filter 이므로, 변화가 있는 행에서는 스냅샷을 조회하지 않는다.
+    LIMIT 이 걸린 결과 집합(CTE)에 붙여 목록 크기와 무관하게 쿼리 한 번으로 처리하는 용도다.
+    """
+    r = row_alias
+    return f"""
+        LEFT JOIN LATERAL (
+            SELECT s.snapshot_date, s.view_count, s.like_count, s.comment_count
+            FROM video_metrics_snapshot s
+            WHERE {r}.view_count_prev = {r}.view_count
+              AND {r}.view_count_prev > 0
+              AND s.video_id = {r}.video_id
+              AND s.platform = {r}.platform
+              AND s.snapshot_date <= {anchor}
+              AND s.view_count <> {r}.view_count
+            ORDER BY s.snapshot_date DESC
+            LIMIT 1
+        ) {alias} ON true
+    """
+
+
+def rollup_snapshots_sql(granularity: str, source_table: str = "video_metrics_snapshot") -> str:
+    """
+    source_table(부모 테이블 또는 특정 파티션)의 [:from_date, :to_date) 구간 스냅샷을
+    주/월 롤업 테이블에 병합하는 SQL.
+
+    같은 주/월이 두 파티션에 걸쳐 있으면 나눠서 두 번 병합되므로, ON CONFLICT 에서
+    기존 행과 합쳐 첫/마지막 스냅샷과 표본 수를 유지한다.
+    """
+    table, unit = ROLLUP_TABLES[granularity]
+    return f"""
+        INSERT INTO {table} (
+            video_id, platform, period_start,
+            first_date, first_view_count,
+            last_date, view_count, like_count, comment_count,
+            sample_count
+        )
+        SELECT
+            video_id,
+            platform,
+            CAST(date_trunc('{unit}', snapshot_date) AS DATE) AS period_start,
+            MIN(snapshot_date),
+            (ARRAY_AGG(view_count ORDER BY snapshot_date ASC))[1],
+            MAX(snapshot_date),
+            (ARRAY_AGG(view_count ORDER BY snapshot_date DESC))[1],
+            (ARRAY_AGG(like_count ORDER BY snapshot_date DESC))[1],
+            (ARRAY_AGG(comment_count ORDER BY snapshot_date DESC))[1],
+            COUNT(*)
+        FROM {source_table}
+        WHERE snapshot_date >= CAST(:from_date AS DATE)
+          AND snapshot_date < CAST(:to_date AS DATE)
+        GROUP BY video_id, platform, CAST(date_trunc('{unit}', snapshot_date) AS DATE)
+        ON CONFLICT (video_id, platform, period_start)
+        DO UPDATE SET
+            first_view_count = CASE
+                WHEN EXCLUDED.first_date < {table}.first_date THEN EXCLUDED.first_view_count
+                ELSE {table}.first_view_count
+            END,
+            first_date = LEAST({table}.first_date, EXCLUDED.first_date),
+            view_count = CASE
+                WHEN EXCLUDED.last_date >= {table}.last_date THEN EXCLUDED.view_count
+                ELSE {table}.view_count
+            END,
+            like_count = CASE
+                WHEN EXCLUDED.last_date >= {table}.last_date THEN EXCLUDED.like_count
+                ELSE {table}.like_count
+            END,
+            comment_count = CASE
+                WHEN EXCLUDED.last_date >= {table}.last_date THEN EXCLUDED.comment_count
+                ELSE {table}.comment_count
+            END,
+            last_date = GREATEST({table}.last_date, EXCLUDED.last_date),
+            sample_count = {table}.sample_count + EXCLUDED.sample_count
+    """
+
+
+def metrics_granularity(days: int) -> str:
+    """
+    조회 기간(days)에 맞는 지표 단위를 고른다.
+    - 보관 기간 이내: daily (파티션된 video_metrics_snapshot)
+    - WEEKLY_ROLLUP_MAX_DAYS 이내: weekly
+    - 그 이상: monthly
+    """
+    if days <= SNAPSHOT_RETENTION_DAYS:
+        return "daily"
+    if days <= WEEKLY_ROLLUP_MAX_DAYS:
+        return "weekly"
+    return "monthly"
+
+
+def metrics_series_sql(granularity: str, where: str = "TRUE") -> str:
+    """
+    :since_date 이후의 지표 시계열을 (video_id, platform, snapshot_date, view_count, like_count, comment_count)
+    형태로 내는 SELECT 절. where 는 두 소스 테이블에 공통으로 쓸 수 있는 조건이어야 한다
+    (예: "video_id = :video_id AND platform = :platform").
+
+    - daily: video_metrics_snapshot 만 읽는다. snapshot_date 범위 조건으로 필요한 파티션만 스캔한다.
+    - weekly/monthly: 롤업 테이블과 아직 보관 중인 일 단위 스냅샷을 같은 단위로 묶고,
+      기간마다 마지막으로 관측된 값 한 행을 남긴다. snapshot_date 는 그 값의 실제 관측일이다.
+    """
+    if granularity == "daily":
+        return f"""
+            SELECT video_id, platform, snapshot_date, view_count, like_count, comment_count
+            FROM video_metrics_snapshot
+            WHERE snapshot_date >= CAST(:since_date AS DATE)
+              AND {where}
+        """
+
+    table, unit = ROLLUP_TABLES[granularity]
+    return f"""
+        SELECT DISTINCT ON (x.video_id, x.platform, x.period_start)
+            x.video_id, x.platform, x.snapshot_date, x.view_count, x.like_count, x.comment_count
+        FROM (
+            SELECT video_id, platform, period_start, last_date AS snapshot_date,
+                   view_count, like_count, comment_count
+            FROM {table}
+            WHERE period_start >= CAST(date_trunc('{unit}', CAST(:since_date AS DATE)) AS DATE)
+              AND {where}
+            UNION ALL
+            SELECT video_id, platform, CAST(date_trunc('{unit}', snapshot_date) AS DATE),
+                   snapshot_date, view_count, like_count, comment_count
+            FROM video_metrics_snapshot
+            WHERE snapshot_date >= CAST(:since_date AS DATE)
+              AND {where}
+        ) x
+        ORDER BY x.video_id, x.platform, x.period_start, x.snapshot_date DESC
+    """
+
+
+# 수집 시점(:sampled_at)의 조회/좋아요/댓글 수를 intraday 표본으로 추가한다. 배열 파라미터로 한 문장에 넣으며,
+# 게시 후 INTRADAY_TRACK_DAYS 이내인 영상만 남긴다. 같은 시각의 표본이 이미 있으면 그대로 둔다.
+APPEND_INTRADAY_SAMPLES_SQL = """
+    INSERT INTO video_metrics_intraday (video_id, platform, ts, view_count, like_count, comment_count)
+    SELECT s.video_id, s.platform, CAST(:sampled_at AS TIMESTAMP), s.view_count, s.like_count, s.comment_count
+    FROM unnest(
+        CAST(:video_ids AS VARCHAR[]),
+        CAST(:platforms AS VARCHAR[]),
+        CAST(:view_counts AS BIGINT[]),
+        CAST(:like_counts AS BIGINT[]),
+        CAST(:comment_counts AS BIGINT[])
+    ) AS s(video_id, platform, view_count, like_count, comment_count)
+    JOIN video v ON v.video_id = s.video_id
+    WHERE s.view_count IS NOT NULL
+      AND v.published_at >= CAST(:sampled_at AS TIMESTAMP) - make_interval(days => :track_days)
+    ON CONFLICT (video_id, ts, platform) DO NOTHING
+"""
+
+# [:from_ts, :to_ts) 구간(시 단위로 맞춘 경계)에서 영상별 시간당 마지막 표본만 남기고 지운다.
+DOWNSAMPLE_INTRADAY_SQL = """
+    DELETE FROM video_metrics_intraday i
+    USING (
+        SELECT video_id, platform, ts,
+               ROW_NUMBER() OVER (
+                   PARTITION BY video_id, platform, date_trunc('hour', ts)
+                   ORDER BY ts DESC
+               ) AS rn
+        FROM video_metrics_intraday
+        WHERE ts >= :from_ts AND ts < :to_ts
+    ) d
+    WHERE d.rn > 1
+      AND i.video_id = d.video_id
+      AND i.platform = d.platform
+      AND i.ts = d.ts
+"""
+
+PURGE_INTRADAY_SQL = "DELETE FROM video_metrics_intraday WHERE ts < :cutoff"
+
+# 여러 영상의 표본을 한 번에 읽는다. (video_id, ts) 순으로 정렬되어 영상별 시계열로 바로 묶을 수 있다.
+INTRADAY_SAMPLES_SQL = """
+    SELECT video_id, ts, view_count
+    FROM video_metrics_intraday
+    WHERE video_id = ANY(CAST(:video_ids AS VARCHAR[]))
+      AND (CAST(:since AS TIMESTAMP) IS NULL OR ts >= :since)
+    ORDER BY video_id, ts
+"""
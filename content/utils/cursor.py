@@ -0,0 +1,74 @@
+"""
+목록 API 의 키셋(커서) 페이지네이션 도구.
+
+커서는 마지막 행의 정렬 키를 JSON 으로 담아 URL-safe base64 로 인코딩한 불투명 문자열이다.
+저장소는 행마다 자신의 정렬 키로 만든 커서를 "cursor" 키에 담아 반환하고,
+유스케이스는 limit + 1 개를 조회해 다음 페이지 존재 여부를 판단한 뒤 paginate 로 한 페이지를 잘라낸다.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Mapping
+
+CURSOR_KEY = "cursor"
+
+
+class InvalidCursorError(ValueError):
+    """손상되었거나 다른 목록에서 발급된 커서."""
+
+
+def _json_default(value: Any) -> Any:
+    # NUMERIC 정렬 키는 float 로 바꾸면 경계 행이 어긋날 수 있으므로 문자열로 보존한다.
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"커서에 담을 수 없는 값입니다: {type(value).__name__}")
+
+
+def encode_cursor(values: Mapping[str, Any]) -> str:
+    payload = json.dumps(dict(values), default=_json_default, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> dict | None:
+    """
+    커서 문자열을 정렬 키 dict 로 되돌린다. None/빈 문자열이면 첫 페이지로 보고 None 을 반환한다.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("잘못된 커서입니다.") from exc
+    if not isinstance(values, dict):
+        raise InvalidCursorError("잘못된 커서입니다.")
+    return values
+
+
+def cursor_value(after: Mapping[str, Any], key: str, parse) -> Any:
+    """
+    디코딩한 커서에서 정렬 키 하나를 꺼내 SQL 파라미터 타입으로 변환한다. 키가 없거나 형식이 맞지 않으면 InvalidCursorError.
+    """
+    if key not in after:
+        raise InvalidCursorError("잘못된 커서입니다.")
+    try:
+        return parse(after[key])
+    except (TypeError, ValueError, ArithmeticError) as exc:
+        raise InvalidCursorError("잘못된 커서입니다.") from exc
+
+
+def paginate(rows: list[dict], limit: int) -> tuple[list[dict], str | None]:
+    """
+    limit + 1 개로 조회한 행에서 한 페이지를 잘라내고 다음 페이지 커서를 반환한다. (마지막 페이지면 None)
+    행마다 붙어 있던 "cursor" 키는 응답에서 제거한다.
+    """
+    page = rows[:limit]
+    next_cursor = page[-1].get(CURSOR_KEY) if len(rows) > limit and page else None
+    for row in page:
+        row.pop(CURSOR_KEY, None)
+    return page, next_cursor
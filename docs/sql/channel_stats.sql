@@ -0,0 +1,21 @@
+-- channel_stats 도입 마이그레이션
+--
+-- 인기/급상승 목록의 채널 평균 조회수와 급등 피처의 채널 베이스라인을 요청마다 계산하지 않도록
+-- 채널 단위 통계를 롤업 테이블로 분리한다. 테이블을 만든 뒤 아래 명령으로 초기 값을 채운다.
+-- 이후에는 스케줄러(ENABLE_CHANNEL_STATS_BATCH=true)가 CHANNEL_STATS_INTERVAL_MINUTES 마다 다시 계산한다.
+--   python -m app.batch.channel_stats_batch
+
+CREATE TABLE IF NOT EXISTS channel_stats (
+    channel_id VARCHAR(100) PRIMARY KEY,
+    platform VARCHAR(50) DEFAULT 'youtube',
+    video_count INTEGER NOT NULL DEFAULT 0,
+    avg_view_count NUMERIC,
+    median_view_count NUMERIC,
+    baseline_early_velocity DOUBLE PRECISION,
+    baseline_sample_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- baseline_early_velocity 를 일 단위 첫 스냅샷(하루 평균 속도) 대신 intraday 표본의 게시 직후 10분 속도로 잰다.
+-- 배치는 새로 잴 수 있는 영상이 없는 채널의 베이스라인을 유지하므로, 이전 방식으로 채워진 값은 비워 둔다.
+UPDATE channel_stats SET baseline_early_velocity = NULL, baseline_sample_count = 0;
@@ -0,0 +1,26 @@
+-- keyword_cooccurrence / batch_watermark 도입 마이그레이션 (tag_dictionary.sql 적용 후 실행)
+--
+-- 테이블을 만든 뒤 아래 명령으로 초기 행렬을 채운다. 이후에는 스케줄러
+-- (ENABLE_KEYWORD_COOCCURRENCE_BATCH=true)가 video_tag.created_at 기준으로 증분 갱신하고,
+-- KEYWORD_COOCCURRENCE_REBUILD_HOURS 마다 전체 재계산한다.
+--   python -m app.batch.keyword_cooccurrence_batch --full
+
+CREATE TABLE IF NOT EXISTS keyword_cooccurrence (
+    tag_a INTEGER,
+    tag_b INTEGER,
+    video_count INTEGER NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT pk_keyword_cooccurrence PRIMARY KEY (tag_a, tag_b)
+);
+
+CREATE INDEX IF NOT EXISTS ix_keyword_cooccurrence_top
+ON keyword_cooccurrence (tag_a, video_count DESC, tag_b);
+
+CREATE TABLE IF NOT EXISTS batch_watermark (
+    job_name VARCHAR(100) PRIMARY KEY,
+    watermark TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 증분 배치가 created_at 범위로 새 posting 을 찾는다.
+CREATE INDEX IF NOT EXISTS ix_video_tag_created_at ON video_tag (created_at);
@@ -1,6 +1,17 @@
 DROP TABLE IF EXISTS crawl_log CASCADE;
 DROP TABLE IF EXISTS video_score CASCADE;
 DROP TABLE IF EXISTS keyword_mapping CASCADE;
+DROP TABLE IF EXISTS channel_stats CASCADE;
+DROP TABLE IF EXISTS keyword_cooccurrence CASCADE;
+DROP TABLE IF EXISTS batch_watermark CASCADE;
+DROP TABLE IF EXISTS video_tag CASCADE;
+DROP TABLE IF EXISTS tag CASCADE;
+DROP TABLE IF EXISTS video_metrics_latest CASCADE;
+DROP TABLE IF EXISTS video_surge_feature CASCADE;
+DROP TABLE IF EXISTS video_co_movement CASCADE;
+DROP TABLE IF EXISTS video_metrics_intraday CASCADE;
+DROP TABLE IF EXISTS video_metrics_weekly CASCADE;
+DROP TABLE IF EXISTS video_metrics_monthly CASCADE;
 DROP TABLE IF EXISTS video_metrics_snapshot CASCADE;
 DROP TABLE IF EXISTS keyword_trend CASCADE;
 DROP TABLE IF EXISTS category_trend CASCADE;
@@ -44,6 +55,19 @@ CREATE TABLE channel (
     crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 채널 단위 통계 롤업. app/batch/channel_stats_batch.py 가 주기적으로 다시 계산한다.
+-- baseline_early_velocity: 최근 영상들의 게시 직후 10분 조회 속도 평균 (조회수/분, video_metrics_intraday 기준)
+CREATE TABLE channel_stats (
+    channel_id VARCHAR(100) PRIMARY KEY,
+    platform VARCHAR(50) DEFAULT 'youtube',
+    video_count INTEGER NOT NULL DEFAULT 0,
+    avg_view_count NUMERIC,
+    median_view_count NUMERIC,
+    baseline_early_velocity DOUBLE PRECISION,
+    baseline_sample_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE creator_account (
     account_id VARCHAR(100),
     platform VARCHAR(50),
@@ -73,9 +97,14 @@ CREATE TABLE video (
     like_count BIGINT,
     comment_count BIGINT,
     thumbnail_url VARCHAR(500),
-    crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- DB 시계 기준 마지막 적재 시각 (upsert_videos 가 clock_timestamp() 로 기록)
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 증분 트렌드 집계와 스냅샷 적재가 watermark 이후 다시 적재된 영상을 찾는다.
+CREATE INDEX ix_video_updated_at ON video (updated_at);
+
 CREATE TABLE video_comment (
     comment_id VARCHAR(100) PRIMARY KEY,
     video_id VARCHAR(100),
@@ -95,9 +124,13 @@ CREATE TABLE video_sentiment (
     sentiment_score DECIMAL(5,4),
     keywords TEXT,
     summary TEXT,
-    analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- DB 시계 기준 마지막 적재 시각 (upsert_video_sentiments 가 clock_timestamp() 로 기록)
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX ix_video_sentiment_updated_at ON video_sentiment (updated_at);
+
 CREATE TABLE comment_sentiment (
     comment_id VARCHAR(100) PRIMARY KEY,
     platform VARCHAR(50) DEFAULT 'youtube',
@@ -118,10 +151,14 @@ CREATE TABLE keyword_trend (
     avg_trend DECIMAL(5,4),
     avg_total_score DECIMAL(6,3),
     growth_rate DECIMAL(18,4),
+    view_velocity DOUBLE PRECISION,
     rank INT,
     PRIMARY KEY(keyword, date, platform)
 );
 
+-- 증분 트렌드 집계가 같은 일자/플랫폼의 저장된 순위를 읽는다.
+CREATE INDEX ix_keyword_trend_date_platform ON keyword_trend (date, platform);
+
 CREATE TABLE category_trend (
     category VARCHAR(100),
     date DATE,
@@ -134,10 +171,13 @@ CREATE TABLE category_trend (
     search_volume BIGINT,
     search_volume_prev BIGINT,
     growth_rate DECIMAL(18,4),
+    view_velocity DOUBLE PRECISION,
     rank INT,
     PRIMARY KEY(category, date, platform)
 );
 
+CREATE INDEX ix_category_trend_date_platform ON category_trend (date, platform);
+
 CREATE TABLE keyword_mapping (
     mapping_id BIGINT GENERATED BY DEFAULT AS IDENTITY,
     video_id VARCHAR(100),
@@ -148,6 +188,50 @@ CREATE TABLE keyword_mapping (
     CONSTRAINT pk_keyword_mapping PRIMARY KEY (video_id, keyword, platform)
 );
 
+-- 태그 사전: 태그 문자열마다 정수 id 를 부여한다.
+CREATE TABLE tag (
+    tag_id INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT ux_tag_name UNIQUE (name)
+);
+
+-- 영상-태그 역색인. 수집 시점(upsert_videos / replace_keyword_mappings_bulk)에 함께 갱신된다.
+CREATE TABLE video_tag (
+    video_id VARCHAR(100),
+    tag_id INTEGER NOT NULL,
+    platform VARCHAR(50) DEFAULT 'youtube',
+    weight DECIMAL(5,4),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT pk_video_tag PRIMARY KEY (video_id, tag_id)
+);
+
+-- 태그 -> 영상 방향 조회(키워드 검색, 연관 키워드)용
+CREATE INDEX ix_video_tag_tag_video ON video_tag (tag_id, video_id);
+
+-- 연관 키워드 행렬: 두 태그가 함께 달린 영상 수. 두 방향(a->b, b->a)을 모두 저장한다.
+-- app/batch/keyword_cooccurrence_batch.py 가 video_tag.created_at 기준으로 증분 갱신한다.
+CREATE TABLE keyword_cooccurrence (
+    tag_a INTEGER,
+    tag_b INTEGER,
+    video_count INTEGER NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT pk_keyword_cooccurrence PRIMARY KEY (tag_a, tag_b)
+);
+
+-- tag_a 기준 상위 k 개 연관 키워드 조회용
+CREATE INDEX ix_keyword_cooccurrence_top ON keyword_cooccurrence (tag_a, video_count DESC, tag_b);
+
+-- 연관 키워드 증분 배치가 created_at 범위로 새 posting 을 찾는다.
+CREATE INDEX ix_video_tag_created_at ON video_tag (created_at);
+
+-- 증분 배치별 마지막 처리 시점
+CREATE TABLE batch_watermark (
+    job_name VARCHAR(100) PRIMARY KEY,
+    watermark TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE video_score (
     video_id VARCHAR(100) PRIMARY KEY,
     platform VARCHAR(50) DEFAULT 'youtube',
@@ -158,6 +242,10 @@ CREATE TABLE video_score (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX ix_video_score_updated_at ON video_score (updated_at);
+
+-- snapshot_date 기준 월 단위 RANGE 파티션. 월별 파티션은 app/batch/snapshot_retention_batch.py 가
+-- 미리 만들어 두고, 보관 기간이 지난 파티션은 주/월 롤업으로 요약한 뒤 삭제한다.
 CREATE TABLE video_metrics_snapshot (
     video_id VARCHAR(100),
     platform VARCHAR(50) DEFAULT 'youtube',
@@ -166,8 +254,115 @@ CREATE TABLE video_metrics_snapshot (
     like_count BIGINT,
     comment_count BIGINT,
     PRIMARY KEY (video_id, snapshot_date, platform)
+) PARTITION BY RANGE (snapshot_date);
+
+-- 아직 월 파티션이 없는 날짜가 들어와도 적재가 실패하지 않도록 받아 두는 DEFAULT 파티션.
+CREATE TABLE video_metrics_snapshot_default PARTITION OF video_metrics_snapshot DEFAULT;
+
+-- 보관 기간이 지난 스냅샷의 주/월 단위 요약. first_* 는 기간 내 첫 스냅샷, 나머지는 마지막 스냅샷 값이다.
+CREATE TABLE video_metrics_weekly (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    period_start DATE,
+    first_date DATE NOT NULL,
+    first_view_count BIGINT,
+    last_date DATE NOT NULL,
+    view_count BIGINT,
+    like_count BIGINT,
+    comment_count BIGINT,
+    sample_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (video_id, platform, period_start)
+);
+
+CREATE TABLE video_metrics_monthly (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    period_start DATE,
+    first_date DATE NOT NULL,
+    first_view_count BIGINT,
+    last_date DATE NOT NULL,
+    view_count BIGINT,
+    like_count BIGINT,
+    comment_count BIGINT,
+    sample_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (video_id, platform, period_start)
+);
+
+-- 영상별 최신(curr)/직전(prev) 스냅샷 요약. 스냅샷 적재 시 함께 갱신된다.
+CREATE TABLE video_metrics_latest (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    curr_date DATE NOT NULL,
+    curr_view_count BIGINT,
+    curr_like_count BIGINT,
+    curr_comment_count BIGINT,
+    prev_date DATE,
+    prev_view_count BIGINT,
+    prev_like_count BIGINT,
+    prev_comment_count BIGINT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (video_id, platform)
+);
+
+-- 스냅샷 값이 바뀐 경우에만 updated_at 이 갱신되며, 증분 트렌드 집계가 이 값으로 변경분을 찾는다.
+CREATE INDEX ix_video_metrics_latest_updated_at ON video_metrics_latest (updated_at);
+
+-- 최근 게시 영상의 분/시간 단위 조회수 표본 (급등 피처용). 수집 배치가 추가만 하고,
+-- 48시간이 지난 구간은 시간당 마지막 표본 하나로 줄이며 7일이 지난 표본은 지운다.
+CREATE TABLE video_metrics_intraday (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    ts TIMESTAMP,
+    view_count BIGINT,
+    like_count BIGINT,
+    comment_count BIGINT,
+    PRIMARY KEY (video_id, ts, platform)
 );
 
+-- ts 는 수집 순서대로 쌓이므로 BRIN 으로 축소/삭제 구간을 찾는다.
+CREATE INDEX ix_video_metrics_intraday_ts ON video_metrics_intraday USING BRIN (ts);
+
+-- 영상별 최근 급등 피처. 급상승 수집 배치가 수집한 영상마다 다시 계산해 덮어쓴다.
+-- 단기 조회수 변화/증가율은 video_metrics_intraday, 베이스라인 배수는 channel_stats, co_movement_score 는 video_co_movement 에서 온다.
+CREATE TABLE video_surge_feature (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    delta_views_10m DOUBLE PRECISION,
+    delta_views_30m DOUBLE PRECISION,
+    delta_views_1h DOUBLE PRECISION,
+    delta_views_6h DOUBLE PRECISION,
+    growth_rate_10m DOUBLE PRECISION,
+    growth_rate_30m DOUBLE PRECISION,
+    growth_rate_1h DOUBLE PRECISION,
+    growth_rate_6h DOUBLE PRECISION,
+    acceleration_10m_vs_30m DOUBLE PRECISION,
+    age_minutes DOUBLE PRECISION,
+    age_hours DOUBLE PRECISION,
+    baseline_velocity_10m_per_min DOUBLE PRECISION,
+    velocity_10m_per_min DOUBLE PRECISION,
+    ratio_velocity_10m_to_baseline DOUBLE PRECISION,
+    co_movement_score DOUBLE PRECISION,
+    computed_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (video_id, platform)
+);
+
+CREATE INDEX ix_video_surge_feature_computed_at ON video_surge_feature (computed_at);
+
+-- 영상별 동시 상승(트렌드 웨이브) 점수. app/batch/co_movement_batch.py 가 주기마다 다시 계산한다.
+-- score: 같은 키워드/카테고리 영상들과의 단기 조회 속도 상관(-1 ~ 1)을 그룹 크기로 가중 평균한 값
+CREATE TABLE video_co_movement (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    score DOUBLE PRECISION NOT NULL,
+    group_count INTEGER NOT NULL,
+    top_group VARCHAR(120),
+    top_group_score DOUBLE PRECISION,
+    computed_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (video_id, platform)
+);
+
+CREATE INDEX ix_video_co_movement_computed_at ON video_co_movement (computed_at);
+
 CREATE TABLE crawl_log (
     id BIGSERIAL PRIMARY KEY,
     target_type VARCHAR(50),
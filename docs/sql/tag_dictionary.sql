@@ -0,0 +1,52 @@
+-- tag / video_tag 도입 마이그레이션
+--
+-- video.tags(콤마 구분 문자열)와 keyword_mapping.keyword(문자열)를 정수 id 기반 태그 사전과
+-- (video_id, tag_id) 역색인으로 정규화한다. 이후 갱신은 upsert_videos / replace_keyword_mappings_bulk 가
+-- 같은 트랜잭션에서 수행한다. 여러 번 실행해도 안전하다.
+
+CREATE TABLE IF NOT EXISTS tag (
+    tag_id INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT ux_tag_name UNIQUE (name)
+);
+
+CREATE TABLE IF NOT EXISTS video_tag (
+    video_id VARCHAR(100),
+    tag_id INTEGER NOT NULL,
+    platform VARCHAR(50) DEFAULT 'youtube',
+    weight DECIMAL(5,4),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT pk_video_tag PRIMARY KEY (video_id, tag_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_video_tag_tag_video ON video_tag (tag_id, video_id);
+
+-- 백필 소스: keyword_mapping 이 있는 영상은 그 키워드를, 없는 영상은 video.tags 를 쓴다.
+CREATE TEMP TABLE tag_backfill_source AS
+SELECT km.video_id, km.platform, LEFT(TRIM(km.keyword), 100) AS name, km.weight
+FROM keyword_mapping km
+WHERE TRIM(COALESCE(km.keyword, '')) <> ''
+UNION ALL
+SELECT v.video_id, v.platform, LEFT(TRIM(x.tag), 100), 1.0
+FROM video v
+CROSS JOIN LATERAL unnest(string_to_array(COALESCE(v.tags, ''), ',')) AS x(tag)
+WHERE TRIM(x.tag) <> ''
+  AND NOT EXISTS (SELECT 1 FROM keyword_mapping km WHERE km.video_id = v.video_id);
+
+INSERT INTO tag (name)
+SELECT DISTINCT name
+FROM tag_backfill_source
+ON CONFLICT (name) DO NOTHING;
+
+INSERT INTO video_tag (video_id, tag_id, platform, weight)
+SELECT DISTINCT ON (s.video_id, t.tag_id) s.video_id, t.tag_id, s.platform, s.weight
+FROM tag_backfill_source s
+JOIN tag t ON t.name = s.name
+ORDER BY s.video_id, t.tag_id, s.weight DESC NULLS LAST
+ON CONFLICT (video_id, tag_id) DO NOTHING;
+
+DROP TABLE tag_backfill_source;
+
+ANALYZE tag;
+ANALYZE video_tag;
@@ -0,0 +1,26 @@
+-- 증분 트렌드 집계 도입 마이그레이션 (keyword_cooccurrence.sql, video_metrics_latest.sql 적용 후 실행)
+--
+-- app/batch/trend_batch.py 는 TREND_AGGREGATION_INCREMENTAL=true(기본)이면 같은 기준 일자의 직전 실행 이후
+-- 바뀐 영상이 속한 키워드/카테고리만 다시 집계한다. 기준 일자마다 첫 실행은 전체 집계다.
+-- 기존 행은 view_velocity 가 비어 있으므로, 적용 후 첫 실행이 전체 집계로 채울 때까지 증분 재순위가 정확하지 않다.
+
+-- 바뀌지 않은 행과 함께 다시 순위를 매기기 위해 순위 기준(view_velocity)을 저장한다.
+ALTER TABLE keyword_trend ADD COLUMN IF NOT EXISTS view_velocity DOUBLE PRECISION;
+ALTER TABLE category_trend ADD COLUMN IF NOT EXISTS view_velocity DOUBLE PRECISION;
+
+CREATE INDEX IF NOT EXISTS ix_keyword_trend_date_platform ON keyword_trend (date, platform);
+CREATE INDEX IF NOT EXISTS ix_category_trend_date_platform ON category_trend (date, platform);
+
+-- watermark 이후 집계 입력이 바뀐 영상을 찾는 시각 컬럼.
+-- crawled_at / analyzed_at 은 수집기/분석기가 준 값이라 DB 시계 기준 watermark 와 비교할 수 없으므로,
+-- 적재 시 DB 가 clock_timestamp() 로 찍는 updated_at 을 둔다. 기존 행은 적용 시각으로 채워지므로
+-- 적용 직후의 증분 실행은 모든 영상을 바뀐 것으로 보고 전체를 다시 집계한다.
+ALTER TABLE video ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE video_sentiment ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+
+DROP INDEX IF EXISTS ix_video_crawled_at;
+DROP INDEX IF EXISTS ix_video_sentiment_analyzed_at;
+CREATE INDEX IF NOT EXISTS ix_video_updated_at ON video (updated_at);
+CREATE INDEX IF NOT EXISTS ix_video_sentiment_updated_at ON video_sentiment (updated_at);
+CREATE INDEX IF NOT EXISTS ix_video_score_updated_at ON video_score (updated_at);
+CREATE INDEX IF NOT EXISTS ix_video_metrics_latest_updated_at ON video_metrics_latest (updated_at);
@@ -0,0 +1,20 @@
+-- video_co_movement 도입 마이그레이션
+--
+-- 급등 피처의 co_movement_score 를 채우기 위해, 같은 키워드(keyword_mapping)/카테고리(video_sentiment) 영상들과
+-- 단기 조회 속도가 함께 움직이는 정도를 영상별로 저장한다. 입력은 video_metrics_intraday 표본이다.
+-- 테이블을 만든 뒤 아래 명령으로 초기 값을 채운다. 이후에는 스케줄러(ENABLE_CO_MOVEMENT_BATCH=true)가
+-- CO_MOVEMENT_INTERVAL_MINUTES 마다 다시 계산하고, 표본이 끊긴 영상의 행은 지운다.
+--   python -m app.batch.co_movement_batch
+
+CREATE TABLE IF NOT EXISTS video_co_movement (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    score DOUBLE PRECISION NOT NULL,
+    group_count INTEGER NOT NULL,
+    top_group VARCHAR(120),
+    top_group_score DOUBLE PRECISION,
+    computed_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (video_id, platform)
+);
+
+CREATE INDEX IF NOT EXISTS ix_video_co_movement_computed_at ON video_co_movement (computed_at);
@@ -0,0 +1,20 @@
+-- video_metrics_intraday 도입 마이그레이션
+--
+-- 급등 피처(compute_surge_features)의 10분/30분/1시간/6시간 윈도우는 일별 스냅샷으로 계산할 수 없으므로,
+-- 최근 게시 영상의 조회수를 수집할 때마다 표본으로 쌓는다. 기존 데이터는 없으므로 테이블만 만든다.
+-- - 급상승 수집 배치(ENABLE_TRENDING_BATCH=true)가 통계를 읽을 때마다 게시 후 VIDEO_METRICS_INTRADAY_DAYS(기본 7일)
+--   이내 영상의 표본을 추가한다.
+-- - 같은 배치가 VIDEO_METRICS_INTRADAY_RAW_HOURS(기본 48시간)가 지난 구간을 시간당 마지막 표본 하나로 줄이고,
+--   VIDEO_METRICS_INTRADAY_DAYS 가 지난 표본은 지운다.
+
+CREATE TABLE IF NOT EXISTS video_metrics_intraday (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    ts TIMESTAMP,
+    view_count BIGINT,
+    like_count BIGINT,
+    comment_count BIGINT,
+    PRIMARY KEY (video_id, ts, platform)
+);
+
+CREATE INDEX IF NOT EXISTS ix_video_metrics_intraday_ts ON video_metrics_intraday USING BRIN (ts);
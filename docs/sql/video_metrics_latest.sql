@@ -0,0 +1,67 @@
+-- video_metrics_latest 도입 마이그레이션
+--
+-- 영상별 최신(curr)/직전(prev) 스냅샷을 한 행으로 유지해, 조회 쿼리가
+-- video_metrics_snapshot 을 DISTINCT ON / LATERAL 로 매번 다시 찾지 않도록 한다.
+-- 이후 갱신은 upsert_video_metrics_snapshot / snapshot_video_metrics 가 같은 문장에서 수행한다.
+
+CREATE TABLE IF NOT EXISTS video_metrics_latest (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    curr_date DATE NOT NULL,
+    curr_view_count BIGINT,
+    curr_like_count BIGINT,
+    curr_comment_count BIGINT,
+    prev_date DATE,
+    prev_view_count BIGINT,
+    prev_like_count BIGINT,
+    prev_comment_count BIGINT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (video_id, platform)
+);
+
+-- 백필: 기존 스냅샷에서 영상별 최근 2개를 골라 curr/prev 로 채운다. 여러 번 실행해도 안전하다.
+WITH ranked AS (
+    SELECT
+        video_id,
+        platform,
+        snapshot_date,
+        view_count,
+        like_count,
+        comment_count,
+        ROW_NUMBER() OVER (PARTITION BY video_id, platform ORDER BY snapshot_date DESC) AS rn
+    FROM video_metrics_snapshot
+)
+INSERT INTO video_metrics_latest (
+    video_id, platform,
+    curr_date, curr_view_count, curr_like_count, curr_comment_count,
+    prev_date, prev_view_count, prev_like_count, prev_comment_count,
+    updated_at
+)
+SELECT
+    video_id,
+    platform,
+    MAX(snapshot_date) FILTER (WHERE rn = 1),
+    MAX(view_count) FILTER (WHERE rn = 1),
+    MAX(like_count) FILTER (WHERE rn = 1),
+    MAX(comment_count) FILTER (WHERE rn = 1),
+    MAX(snapshot_date) FILTER (WHERE rn = 2),
+    MAX(view_count) FILTER (WHERE rn = 2),
+    MAX(like_count) FILTER (WHERE rn = 2),
+    MAX(comment_count) FILTER (WHERE rn = 2),
+    NOW()
+FROM ranked
+WHERE rn <= 2
+GROUP BY video_id, platform
+ON CONFLICT (video_id, platform)
+DO UPDATE SET
+    curr_date = EXCLUDED.curr_date,
+    curr_view_count = EXCLUDED.curr_view_count,
+    curr_like_count = EXCLUDED.curr_like_count,
+    curr_comment_count = EXCLUDED.curr_comment_count,
+    prev_date = EXCLUDED.prev_date,
+    prev_view_count = EXCLUDED.prev_view_count,
+    prev_like_count = EXCLUDED.prev_like_count,
+    prev_comment_count = EXCLUDED.prev_comment_count,
+    updated_at = NOW();
+
+ANALYZE video_metrics_latest;
@@ -0,0 +1,111 @@
+-- video_metrics_snapshot 월 단위 RANGE 파티션 전환 마이그레이션 (PostgreSQL 11+)
+--
+-- 1) 기존 테이블을 video_metrics_snapshot_legacy 로 이름을 바꾸고, 같은 컬럼/PK 의 파티션 테이블을 만든다.
+-- 2) 기존 데이터가 걸친 달마다 월 파티션(video_metrics_snapshot_pYYYYMM)과 DEFAULT 파티션을 만든다.
+-- 3) 데이터를 옮긴 뒤 legacy 테이블을 삭제한다.
+-- 4) 보관 기간이 지난 구간을 요약해 둘 주/월 롤업 테이블을 만든다.
+--
+-- 이후 미래 월 파티션 생성과 보관 기간 정리(롤업 후 파티션 삭제)는
+-- app/batch/snapshot_retention_batch.py 가 수행한다. 정리를 바로 한 번 돌리려면
+--   python -m app.batch.snapshot_retention_batch
+-- 를 실행한다.
+--
+-- performance_indexes.sql 의 idx_vms_video_platform_date / idx_vms_snapshot_date 는 부모 테이블에
+-- 다시 만들면 모든 파티션에 자동으로 생성된다.
+
+BEGIN;
+
+ALTER TABLE video_metrics_snapshot RENAME TO video_metrics_snapshot_legacy;
+
+-- 새 테이블과 이름이 겹치지 않도록 기존 PK 이름을 바꾸고, 부모 테이블에 다시 만들 인덱스는 지운다.
+DO $$
+DECLARE
+    pk_name TEXT;
+BEGIN
+    SELECT conname INTO pk_name
+    FROM pg_constraint
+    WHERE conrelid = 'video_metrics_snapshot_legacy'::regclass AND contype = 'p';
+    IF pk_name IS NOT NULL THEN
+        EXECUTE format('ALTER TABLE video_metrics_snapshot_legacy RENAME CONSTRAINT %I TO %I',
+                       pk_name, 'video_metrics_snapshot_legacy_pkey');
+    END IF;
+END $$;
+
+DROP INDEX IF EXISTS idx_vms_video_platform_date;
+DROP INDEX IF EXISTS idx_vms_snapshot_date;
+
+CREATE TABLE video_metrics_snapshot (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    snapshot_date DATE,
+    view_count BIGINT,
+    like_count BIGINT,
+    comment_count BIGINT,
+    PRIMARY KEY (video_id, snapshot_date, platform)
+) PARTITION BY RANGE (snapshot_date);
+
+CREATE TABLE video_metrics_snapshot_default PARTITION OF video_metrics_snapshot DEFAULT;
+
+-- 기존 데이터의 첫 달부터 다음 달까지 월 파티션 생성
+DO $$
+DECLARE
+    m DATE;
+    last_month DATE;
+BEGIN
+    SELECT COALESCE(date_trunc('month', MIN(snapshot_date)), date_trunc('month', CURRENT_DATE))::date
+    INTO m
+    FROM video_metrics_snapshot_legacy;
+    last_month := (date_trunc('month', CURRENT_DATE) + INTERVAL '1 month')::date;
+
+    WHILE m <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF video_metrics_snapshot FOR VALUES FROM (%L) TO (%L)',
+            'video_metrics_snapshot_p' || to_char(m, 'YYYYMM'),
+            m,
+            (m + INTERVAL '1 month')::date
+        );
+        m := (m + INTERVAL '1 month')::date;
+    END LOOP;
+END $$;
+
+INSERT INTO video_metrics_snapshot (video_id, platform, snapshot_date, view_count, like_count, comment_count)
+SELECT video_id, platform, snapshot_date, view_count, like_count, comment_count
+FROM video_metrics_snapshot_legacy;
+
+DROP TABLE video_metrics_snapshot_legacy;
+
+CREATE INDEX IF NOT EXISTS idx_vms_video_platform_date
+ON video_metrics_snapshot (video_id, platform, snapshot_date DESC);
+
+-- 보관 기간이 지난 스냅샷의 주/월 단위 요약
+CREATE TABLE IF NOT EXISTS video_metrics_weekly (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    period_start DATE,
+    first_date DATE NOT NULL,
+    first_view_count BIGINT,
+    last_date DATE NOT NULL,
+    view_count BIGINT,
+    like_count BIGINT,
+    comment_count BIGINT,
+    sample_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (video_id, platform, period_start)
+);
+
+CREATE TABLE IF NOT EXISTS video_metrics_monthly (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    period_start DATE,
+    first_date DATE NOT NULL,
+    first_view_count BIGINT,
+    last_date DATE NOT NULL,
+    view_count BIGINT,
+    like_count BIGINT,
+    comment_count BIGINT,
+    sample_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (video_id, platform, period_start)
+);
+
+COMMIT;
+
+ANALYZE video_metrics_snapshot;
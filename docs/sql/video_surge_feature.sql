@@ -0,0 +1,31 @@
+-- video_surge_feature 도입 마이그레이션
+--
+-- 급등 피처(SurgeFeatures)를 요청마다 계산하지 않도록, 급상승 수집 배치(ENABLE_TRENDING_BATCH=true)가
+-- 수집할 때마다 수집한 영상의 피처를 계산해 이 테이블에 덮어쓴다. 기존 데이터는 없으므로 테이블만 만든다.
+-- - 단기 조회수 변화/증가율: video_metrics_intraday
+-- - 채널 베이스라인 배수: channel_stats.baseline_early_velocity
+-- - co_movement_score: video_co_movement
+
+CREATE TABLE IF NOT EXISTS video_surge_feature (
+    video_id VARCHAR(100),
+    platform VARCHAR(50) DEFAULT 'youtube',
+    delta_views_10m DOUBLE PRECISION,
+    delta_views_30m DOUBLE PRECISION,
+    delta_views_1h DOUBLE PRECISION,
+    delta_views_6h DOUBLE PRECISION,
+    growth_rate_10m DOUBLE PRECISION,
+    growth_rate_30m DOUBLE PRECISION,
+    growth_rate_1h DOUBLE PRECISION,
+    growth_rate_6h DOUBLE PRECISION,
+    acceleration_10m_vs_30m DOUBLE PRECISION,
+    age_minutes DOUBLE PRECISION,
+    age_hours DOUBLE PRECISION,
+    baseline_velocity_10m_per_min DOUBLE PRECISION,
+    velocity_10m_per_min DOUBLE PRECISION,
+    ratio_velocity_10m_to_baseline DOUBLE PRECISION,
+    co_movement_score DOUBLE PRECISION,
+    computed_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (video_id, platform)
+);
+
+CREATE INDEX IF NOT EXISTS ix_video_surge_feature_computed_at ON video_surge_feature (computed_at);